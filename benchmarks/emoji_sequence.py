@@ -0,0 +1,58 @@
+"""
+Compares the vectorized gen_emoji_sequence against the original per-pixel
+implementation on a random 79x79 image (the widest image |show accepts).
+
+    python -m benchmarks.emoji_sequence
+"""
+
+import timeit
+
+import numpy as np
+from PIL import Image
+
+from mosaic_bot.emojis import get_emoji_by_rgb
+from mosaic_bot.image import gen_emoji_sequence
+
+
+def per_pixel_emoji_sequence(img: Image.Image, large = False, with_space = False):
+    # the implementation gen_emoji_sequence replaced. the channels are
+    # converted to int because Color.approx_12bit overflows on np.uint8
+    res = ''
+    arr = np.array(img)
+    for row in arr:
+        for col in row:
+            r, g, b, a = map(int, col)
+            if a == 0:
+                emoji = get_emoji_by_rgb(-1, -1, -1)
+            else:
+                emoji = get_emoji_by_rgb(r, g, b)
+            res += emoji
+            if with_space:
+                res += ' '
+        if not large:
+            res += '\u200b'
+        res += '\n'
+    return res
+
+
+def main():
+    rng = np.random.default_rng(0)
+    arr = rng.integers(0, 256, (79, 79, 4), dtype = np.uint8)
+    arr[..., 3] = np.where(arr[..., 3] < 64, 0, 255)
+    img = Image.fromarray(arr, 'RGBA')
+
+    for large in (False, True):
+        for with_space in (False, True):
+            assert gen_emoji_sequence(img, large, with_space) == per_pixel_emoji_sequence(img, large, with_space), \
+                f'output mismatch for large={large}, with_space={with_space}'
+
+    n = 20
+    old = min(timeit.repeat(lambda: per_pixel_emoji_sequence(img), number = n, repeat = 3)) / n
+    new = min(timeit.repeat(lambda: gen_emoji_sequence(img), number = n, repeat = 3)) / n
+    print(f'per pixel:  {old * 1000:8.2f} ms')
+    print(f'vectorized: {new * 1000:8.2f} ms')
+    print(f'speedup:    {old / new:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Compares the accuracy and latency of the scale detection engines of
+cv.find_scale on the same corpus: pixel arts of random shapes scaled up by a
+known scale, cropped at a random offset and saved as JPEG at a few qualities,
+plus the examples of docs/auto_scaling whose scale is known. Lossless images
+are left out as the exact scale check settles them before either engine runs.
+
+It then checks that image.preprocess gets the whole art back out of exact
+upscales that went through lossy compression, which takes both the scale and
+where the grid starts, and that an upload too large to be searched whole
+gets the same scale and offset on a tile as it does whole.
+
+    python -m benchmarks.scale_engines [--images N]
+"""
+
+import argparse
+import io
+import pathlib
+import time
+
+import numpy as np
+from PIL import Image
+
+from mosaic_bot.cv import ENGINES, SCALE_MEMORY_LIMIT, SEARCH_BYTES_PER_PIXEL, NoScaleFound, find_scale
+from mosaic_bot.image import preprocess
+
+DOCS = pathlib.Path(__file__).resolve().parent.parent / 'docs' / 'auto_scaling'
+DOC_SCALES = {
+    'cherry.png': 32,
+}
+QUALITIES = (95, 75, 50, 30)
+# scales the art is upscaled by for the downsampling check, and its size
+DOWNSAMPLE_SCALES = (7, 12, 20)
+DOWNSAMPLE_SIZE = 24
+
+
+def random_art(rng: np.random.Generator, shape: tuple[int, int] = None) -> np.ndarray:
+    # a few colors in blobs on a transparent background, so that it has
+    # shapes of many sizes like a real pixel art
+    h, w = rng.integers(16, 64, 2) if shape is None else shape
+    noise = rng.random((h // 4 + 2, w // 4 + 2))
+    blobs = np.asarray(Image.fromarray((noise * 255).astype(np.uint8)).resize((w, h), Image.BICUBIC))
+    levels = np.digitize(blobs, np.sort(rng.integers(40, 220, 4)))
+    colors = rng.integers(0, 256, (5, 4), dtype = np.uint8)
+    colors[:, 3] = 255
+    colors[0, 3] = 0
+    return colors[levels]
+
+
+def _flatten(art: np.ndarray) -> Image.Image:
+    # JPEG has no alpha, so the background is flattened to white
+    return Image.alpha_composite(Image.new('RGBA', art.shape[1::-1], 'white'), Image.fromarray(art)).convert('RGB')
+
+
+def corpus(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        scale = int(rng.integers(4, 48))
+        art = random_art(rng)
+        big = np.repeat(np.repeat(art, scale, 0), scale, 1)
+        big = big[rng.integers(0, scale):, rng.integers(0, scale):]
+        buf = io.BytesIO()
+        _flatten(big).save(buf, 'jpeg', quality = QUALITIES[i % len(QUALITIES)])
+        yield f'random {i} q{QUALITIES[i % len(QUALITIES)]}', Image.open(buf), scale
+    for name, scale in DOC_SCALES.items():
+        yield name, Image.open(DOCS / name), scale
+
+
+def check_downsample(n: int, seed: int = 0):
+    """
+    upscales n arts of DOWNSAMPLE_SIZE pixels by each of DOWNSAMPLE_SCALES
+    exactly, saves them as JPEG and prints how many of them preprocess
+    brings back at the size of the art, and how many of their pixels match
+    """
+    rng = np.random.default_rng(seed)
+    sized = matched = total = 0
+    for i in range(n):
+        art = random_art(rng, (DOWNSAMPLE_SIZE, DOWNSAMPLE_SIZE))
+        for scale in DOWNSAMPLE_SCALES:
+            buf = io.BytesIO()
+            _flatten(np.repeat(np.repeat(art, scale, 0), scale, 1)).save(buf, 'jpeg', quality = 80)
+            small = np.asarray(preprocess(Image.open(buf)))
+            total += 1
+            if small.shape[:2] != art.shape[:2]:
+                print(f'art {i} at {scale}x came back {small.shape[1]}x{small.shape[0]}')
+                continue
+            sized += 1
+            # within JPEG noise of the color of every pixel
+            diff = np.abs(small[..., :3].astype(int) - np.asarray(_flatten(art), dtype = int))
+            matched += np.mean(diff.max(axis = -1) < 40) > 0.97
+    print(f'downsampling: {sized}/{total} at the size of the art, {matched}/{total} matching it')
+
+
+def check_tiling(seed: int = 0):
+    """
+    prints whether a 40x upscale cropped at (23, 17), large enough to be
+    searched on a tile, gets the scale and offset it gets searched whole
+    """
+    rng = np.random.default_rng(seed)
+    art = random_art(rng, (75, 75))
+    big = np.repeat(np.repeat(art, 40, 0), 40, 1)[17:17 + 2983, 23:23 + 2977]
+    buf = io.BytesIO()
+    _flatten(big).save(buf, 'jpeg', quality = 80)
+    img = Image.open(buf)
+    assert big.shape[0] * big.shape[1] * SEARCH_BYTES_PER_PIXEL > SCALE_MEMORY_LIMIT, 'the upscale would not be tiled'
+    tiled = find_scale(img, True, cache = False)
+    whole = find_scale(img, True, cache = False, memory_limit = 1 << 40)
+    print(f'tiling: {tiled[0]}x at {tiled[1].offset} on a tile, {whole[0]}x at {whole[1].offset} whole, '
+          f'{"same" if (tiled[0], tiled[1].offset) == (whole[0], whole[1].offset) else "DIFFERENT"}')
+
+
+def main():
+    parser = argparse.ArgumentParser(prog = 'benchmarks.scale_engines')
+    parser.add_argument('--images', type = int, default = 60, help = 'number of random images')
+    args = parser.parse_args()
+
+    images = list(corpus(args.images))
+    for _, img, _ in images:
+        img.load()
+
+    print(f'{len(images)} images')
+    print(f'{"engine":10}{"exact":>8}{"±1":>8}{"mean ms":>10}{"p95 ms":>10}')
+    for engine in ENGINES:
+        exact = near = 0
+        times = []
+        for name, img, scale in images:
+            start = time.perf_counter()
+            try:
+                found = find_scale(img, cache = False, engine = engine)
+            except NoScaleFound:
+                found = None
+            times.append(time.perf_counter() - start)
+            exact += found == scale
+            near += found is not None and abs(found - scale) <= 1
+        times = np.array(times) * 1000
+        print(f'{engine:10}{exact / len(images):8.1%}{near / len(images):8.1%}'
+              f'{times.mean():10.1f}{np.percentile(times, 95):10.1f}')
+
+    check_downsample(max(1, args.images // 6))
+    check_tiling()
+
+
+if __name__ == '__main__':
+    main()
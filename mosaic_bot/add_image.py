@@ -1,6 +1,6 @@
 import os
 from mosaic_bot import DATA_PATH
-from PIL import Image
+from PIL import Image, ImageSequence
 from mosaic_bot import db
 import shutil
 from mosaic_bot.hash import hash_image
@@ -11,7 +11,7 @@ if os.path.exists(DATA_PATH / 'images'):
     shutil.rmtree(DATA_PATH / 'images')
 os.mkdir(DATA_PATH / 'images')
 for file in os.listdir(DATA_PATH / 'all_images'):
-    if not file.endswith('.png'):
+    if not file.endswith(('.png', '.gif')):
         continue
     path=DATA_PATH / 'all_images' / file
     img = Image.open(path)
@@ -22,7 +22,12 @@ for file in os.listdir(DATA_PATH / 'all_images'):
         conflicts.append(e.args[0])
     else:
         name = db.get_image_path(hash_image(img))
-        shutil.copy(DATA_PATH / 'all_images' / file, DATA_PATH / name)
+        if file.endswith('.gif'):
+            # every image is stored as png, animated ones as APNG
+            durations = [f.info.get('duration', 100) for f in ImageSequence.Iterator(img)]
+            img.save(DATA_PATH / name, 'png', save_all = True, duration = durations, loop = 0)
+        else:
+            shutil.copy(DATA_PATH / 'all_images' / file, DATA_PATH / name)
 print('Conflicts: ')
 for c in conflicts:
     print(c)
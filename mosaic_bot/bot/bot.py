@@ -6,8 +6,11 @@ import sys
 import re
 import time
 from asyncio import sleep
-from dataclasses import dataclass
-from typing import List, Union
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import chain, islice
+from operator import length_hint
+from typing import Iterable, List, Optional, Union
 
 import traceback
 import aiohttp
@@ -17,8 +20,14 @@ from discord.ext import commands
 
 from mosaic_bot import DATA_PATH, db, __version__, __build_type__, __build_hash__, __build_time__
 from mosaic_bot.credentials import MOSAIC_BOT_TOKEN
-from mosaic_bot.emojis import get_emoji_by_rgb
+from mosaic_bot.emojis import get_emoji_table
 from mosaic_bot.image import gen_emoji_sequence, gen_gradient, gen_pride_flag
+from mosaic_bot.lut import load_lut
+from mosaic_bot.render import (MAX_WIDTH, MAX_WIDTH_LARGE, MAX_WIDTH_WITH_SPACE, EmojiSequenceTooLong,
+                               Animation, MessageStream, gen_animation, gen_render_artifacts, iter_embeds,
+                               load_render_artifacts, pack_lines, save_render_artifacts)
+from mosaic_bot.bot.render_cache import RenderCache
+from mosaic_bot.bot.send_plan import BURST_SIZE, RateLimitState, SendPlan, plan_send
 
 DISCORD_API_ENDPOINT = "https://discord.com/api/v8"
 
@@ -69,24 +78,30 @@ Available commands (parentheses denote required arguments, square brackets denot
 |show help
 |show version
 |show (image_name|image_id) [img_opts]
+|batch (image_name|image_id), (image_name|image_id)... [img_opts]
 |gradient (r|g|b|red|green|blue)=value [x=(+|-)] [y=(+|-)] [img_opts]
 |pride [name_of_pride_flag] [img_opts]
 |delete (message_id|message_link)
 |stop
 ```
-`img_opts` is a comma-separated list beginning with a colon, followed by any or all of `with space, multiline, irc, large`, where `irc` is an alias of `multiline`
+`img_opts` is a comma-separated list beginning with a colon, followed by any or all of `with space, multiline, irc, large, perceptual, dither, ordered dither, vga, embed`, where `irc` is an alias of `multiline`. `perceptual` picks the emojis by perceived color difference, the two dithering options smooth out gradients and `vga` draws with the 256 colors of VGA mode 13h, these four only work with `|show`. `embed` sends the image in embeds, which fit about three times more of it in each message
 
 Examples:
 ```
 |show cat: large
 |show fireball: large, with space
+|show sunset: dither
+|show doom: vga, dither
 |show diamond
+|batch cat, diamond, sunset: with space
 |show minecraft painting creebet
 |gradient g=12 x=-
 |pride ace
 |delete 811485105436360744
 ```
 Note that if you reply to a specific message, you don't have to provide an ID or link. 
+`|batch` sends all the images together in as few messages as possible, `|show cat, diamond` does the same thing.
+Animated images are played by editing the messages after they are sent.
 
 For a complete list of images, please refer to <https://bemosaic.art/gallery>
 """
@@ -96,6 +111,21 @@ VERSION_TEXT = f'Mosaic bot v{__version__}, {__build_type__} build `{__build_has
 ICON = (f := open(DATA_PATH / 'icon.png', 'br')).read()
 f.close()
 
+# requests that are planned to take longer than this to send, in seconds, are rejected
+SEND_TIME_BUDGET = float(os.environ.get('SEND_TIME_BUDGET', 900))
+
+# the maximum number of images in one |batch
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 10))
+
+# animations are played by editing messages, and discord allows
+# about 5 edits in 5 seconds in a channel
+MAX_ANIMATION_FRAMES = int(os.environ.get('MAX_ANIMATION_FRAMES', 60))
+EDIT_INTERVAL = 1
+
+# rendered messages of |show, see RenderCache
+render_cache = RenderCache(int(os.environ.get('RENDER_CACHE_SIZE', 32 * 1024 * 1024)))
+db.on_image_changed(render_cache.invalidate)
+
 
 async def get_webhook(channel_id: int) -> discord.Webhook:
     channel: discord.TextChannel = await bot.fetch_channel(channel_id)
@@ -114,10 +144,10 @@ async def get_webhook(channel_id: int) -> discord.Webhook:
 class RequestInterrupted(Exception): pass
 
 
-class EmojiSequenceTooLong(Exception): pass
+class WebhookCreationError(Exception): pass
 
 
-class WebhookCreationError(Exception): pass
+class SendTooSlow(Exception): pass
 
 
 class MessageLogger:
@@ -142,6 +172,7 @@ class MessageManager:
     channel_locks = {}
     active_managers = {}
     channel_type_cache = {}
+    rate_limits: dict[int, RateLimitState] = {}
 
     def __init__(self, ctx: commands.Context):
         self.channel: int = ctx.channel.id
@@ -151,6 +182,11 @@ class MessageManager:
         self.requester: int = ctx.message.author.id
         self.is_interrupted = False
         self._queue: list[tuple[tuple, dict]] = []
+        self._streams: list[tuple[Iterable, bool, bool]] = []
+        self._expected = 0  # expected number of messages, streams included
+        self.sent_messages = []  # the queued messages once sent, in order
+        self.rate_limit = self.rate_limits.setdefault(self.channel, RateLimitState())
+        self.plan: Optional[SendPlan] = None
         self.rtt = []  # round trip time
         self.show_confirmation = False
         self.image_hash = None
@@ -204,7 +240,7 @@ class MessageManager:
                 confirmation = await self.destination.send(f'<@{self.requester}> Request interrupted')
             await confirmation.delete(delay = 5)
 
-        if exc_type and exc_type not in (RequestInterrupted, WebhookCreationError):
+        if exc_type and exc_type not in (RequestInterrupted, WebhookCreationError, SendTooSlow):
             await self.send(
                 f'Unexpected error (`{exc_type.__name__}: {exc_val}`) occurred while processing your request, please try again later. '
                 'If this error persists, please consider submitting a bug report in my '
@@ -231,6 +267,11 @@ class MessageManager:
             ))
             self.logger.debug('Unable to create a webhook. Requester notified')
             return True
+        elif exc_type == SendTooSlow:
+            await self.send(f"Hmm, sending that would take me about {round(self.plan.duration / 60, 1)} minutes. "
+                            f"That's a bit too long, can you try something smaller?")
+            self.logger.debug('Send plan exceeds the time budget. Requester notified')
+            return True
         if self.message_ids:
             db.request_completed(self.requester, self.image_hash, self.requesting_message, self.destination.channel.id,
                                  self.message_ids)
@@ -240,19 +281,30 @@ class MessageManager:
     def queue(self, *args, use_webhook = False, **kwargs):
         self._queue.append((args, {"use_webhook": use_webhook, **kwargs}))
 
-    def get_embed(self, current, url):
-        total = len(self._queue)
-        if not self.rtt:
-            rtt = 0
-            avg_rtt = 0
-        else:
-            rtt = self.rtt[-1]
-            avg_rtt = sum(self.rtt) / len(self.rtt)
+    def queue_stream(self, messages: Iterable, use_webhook = False, as_embeds = False, expected: int = None):
+        """
+        queues messages that are produced while the queue is being committed,
+        e.g. a MessageStream. If as_embeds is True, every message is a list of
+        embed descriptions, see render.iter_embeds. expected defaults to the
+        length hint of messages and is used for the progress
+        """
+        self._streams.append((messages, use_webhook, as_embeds))
+        self._expected += length_hint(messages) if expected is None else expected
+
+    def _iter_queue(self):
+        # everything queued, with the streams pulled lazily
+        yield from self._queue
+        for stream, use_webhook, as_embeds in self._streams:
+            for m in stream:
+                if as_embeds:
+                    yield (), {'embeds': [discord.Embed(description = d) for d in m], 'use_webhook': use_webhook}
+                else:
+                    yield (m,), {'use_webhook': use_webhook}
 
-        if total > 30:
-            delay = 1.5
-        else:
-            delay = 1
+    def get_embed(self, current, url):
+        # streams might produce more messages than expected
+        total = max(self.plan.messages + 1, current + 1)
+        rtt = self.rtt[-1] if self.rtt else 0
 
         return discord.Embed.from_dict(
             {
@@ -260,7 +312,7 @@ class MessageManager:
                 'fields'     : [
                     {
                         'name'  : 'ETA',
-                        'value' : f'{round((total - current) * delay + avg_rtt, 2)}s',
+                        'value' : f'{round(self.plan.remaining(current), 2)}s',
                         'inline': 'true'
                     },
                     {
@@ -279,8 +331,19 @@ class MessageManager:
 
     async def commit_queue(self):
         await sleep(0)  # return control back to the event loop for any pending tasks
-        self.logger.info(f'Committing message queue, queue size is {len(self._queue)}')
-        if len(self._queue) < 5:
+        self._expected += len(self._queue)
+        queue = self._iter_queue()
+        # only as much as needed to plan the sending is rendered up front
+        head = list(islice(queue, BURST_SIZE))
+        if not head:
+            return
+        count = len(head) if len(head) < BURST_SIZE else max(self._expected, len(head))
+        size = sum(map(payload_size, head)) * count // len(head)
+        self.plan = plan_send(count, size, self.rate_limit)
+        self.logger.info(f'Committing message queue, {self.plan}')
+        if self.plan.duration > SEND_TIME_BUDGET:
+            raise SendTooSlow
+        if self.plan.strategy == 'burst':
             # send messages faster as this will not trip the rate limit.
             # this shouldn't cause messages to deliver out of
             # order...i think
@@ -288,12 +351,12 @@ class MessageManager:
             self.show_confirmation = False
             fut = [self.send(f'from <@{self.requester}>',
                              allowed_mentions = discord.AllowedMentions.none(),
-                             use_webhook = self._queue[0][1]['use_webhook'])]
-            for msg in self._queue:
+                             use_webhook = head[0][1]['use_webhook'])]
+            for msg in head:
                 fut.append(self.send(*msg[0], **msg[1]))
             # this will send all messages at the same time
             # while not triggering __aexit__
-            await asyncio.gather(*fut)
+            self.sent_messages.extend((await asyncio.gather(*fut))[1:])
             if self.cleanup:
                 self.logger.debug('Completed. Deleting request message')
                 asyncio.ensure_future(self.destination.message.delete())
@@ -308,36 +371,40 @@ class MessageManager:
             self.rtt.append(time.time() - start)
             # apparently webhook shares the same rate limit???
 
-            self._queue.insert(0, ((f'from <@{self.requester}>',), {
+            header = ((f'from <@{self.requester}>',), {
                 'allowed_mentions': discord.AllowedMentions.none(),
-                'use_webhook'     : self._queue[0][1]['use_webhook']}))
+                'use_webhook'     : head[0][1]['use_webhook']})
+            queue = chain([header], head, queue)
 
-            if len(self._queue) > 30:
-                self.logger.debug('Queue is too long. Increasing delay')
-                delay = 1.5
-            else:
-                delay = 1
+            delay = self.plan.delay
             try:
-                for i, msg in enumerate(self._queue[:-1]):
-                    self.logger.debug(f'Sending message {i}/{len(self._queue)}')
+                msg = next(queue)
+                i = 0
+                while True:
+                    self.logger.debug(f'Sending message {i}/{self.plan.messages + 1}')
                     start = time.time()
-                    await self.send(*msg[0], **msg[1], trigger_typing = True)
-
+                    sent = await self.send(*msg[0], **msg[1])
+                    if i:
+                        self.sent_messages.append(sent)
                     rtt = time.time() - start
+                    # the next message is rendered while waiting for the rate limit
+                    msg = next(queue, None)
+                    if msg is None:
+                        break
+                    await self.destination.trigger_typing()
                     self.rtt.append(rtt)
+                    i += 1
 
                     asyncio.ensure_future(
-                        status.edit(embed = self.get_embed(i + 1, ''))
+                        status.edit(embed = self.get_embed(i, ''))
                     )
                     self.logger.debug(f'Status message update scheduled')
                     # don't use await since this can be executed while sleeping
                     self.logger.debug(f'RTT is {round(rtt, 3)}s')
-                    await sleep(delay - rtt)
+                    await sleep(delay - (time.time() - start))
                     # while discord.py handles all the rate limits
                     # it looks better to have a uniformed speed
 
-                msg = self._queue[-1]
-                await self.send(*msg[0], **msg[1])
                 if self.cleanup:
                     self.logger.debug('Completed. Deleting request message')
                     asyncio.ensure_future(
@@ -352,6 +419,7 @@ class MessageManager:
     async def send(self, *args, trigger_typing = False, use_webhook = False, **kwargs):
         if self.is_interrupted:
             raise RequestInterrupted
+        start = time.time()
         if use_webhook:
             if self.channel_type == 0:
                 self.logger.debug('Sending message with webhook')
@@ -365,12 +433,21 @@ class MessageManager:
                 raise WebhookCreationError
         else:
             msg = await self.destination.send(*args, **kwargs)
+        self.rate_limit.record(time.time() - start)
         self.message_ids.append(msg.id)
 
         if trigger_typing:
             await self.destination.trigger_typing()
         return msg
 
+    async def edit(self, i: int, content: str):
+        """
+        edits the ith queued message after it has been sent
+        """
+        if self.is_interrupted:
+            raise RequestInterrupted
+        await self.sent_messages[i].edit(content = content)
+
     def interrupt(self, cleanup = True):
         self.logger.info('Request interrupted')
         self.is_interrupted = True
@@ -405,6 +482,14 @@ class MessageManager:
         return False
 
 
+def payload_size(msg: tuple[tuple, dict]) -> int:
+    # the size of a queued message in bytes
+    args, kwargs = msg
+    if args:
+        return len(str(args[0]).encode('utf8'))
+    return sum(len(e.description.encode('utf8')) for e in kwargs.get('embeds', ()))
+
+
 async def delete_messages(cid: int, msgs: List[int], bulk = True):
     # the implementation in discord.py requires gateway intent
     # which makes it easier to just implement the API call myself
@@ -460,35 +545,22 @@ async def delete_messages(cid: int, msgs: List[int], bulk = True):
                 await sleep(1.5)
 
 
-def split_minimal(seq: str):
-    res = []
-    msg = ''
-    for line in seq.splitlines():
-        if len(line) > 2000:
-            raise EmojiSequenceTooLong
-        line = re.sub(f'({get_emoji_by_rgb(-1, -1, -1)})+\u200b?$', '\u200b', line)
-        if len(msg) + len(line) < 2000:
-            msg += line + '\n'
-        else:
-            res.append(msg)
-            msg = line + '\n'
-    if msg:
-        res.append(msg)
-    return res
-
-
 @dataclass
 class ShowOptions:
     name: str = None
     large: bool = False
     with_space: bool = False
     multiline: bool = False
+    perceptual: bool = False
+    dither: str = None
+    palette: str = '12bit'
+    embed: bool = False
 
 
 def parse_opt(s: str):
     """
     syntax:
-    |show image_name [: [with space] [multiline|irc] [large]]
+    |show image_name [: [with space] [multiline|irc] [large] [perceptual] [dither|ordered dither] [vga] [embed]]
     """
     l = s.replace('_', ' ').split(':')
     opts = ShowOptions()
@@ -498,6 +570,14 @@ def parse_opt(s: str):
         opts.large = 'large' in args
         opts.with_space = 'with space' in args
         opts.multiline = 'multiline' in args or 'irc' in args
+        opts.perceptual = 'perceptual' in args
+        if 'dither' in args or 'floyd-steinberg' in args:
+            opts.dither = 'floyd-steinberg'
+        elif 'ordered dither' in args or 'bayer' in args:
+            opts.dither = 'ordered'
+        if 'vga' in args:
+            opts.palette = 'vga'
+        opts.embed = 'embed' in args
     return opts
 
 
@@ -515,6 +595,125 @@ async def help(ctx: commands.Context, *args):
         await manager.send(HELP_TEXT)
 
 
+async def render_image(manager: MessageManager, opts: ShowOptions,
+                       animate = True) -> Optional[Union[Iterable[str], Animation]]:
+    """
+    looks up and renders the image requested by opts
+
+    :return: the messages of the image, the Animation of an animated image
+        if animate is True, or None if the request can't be fulfilled, in
+        which case the requester has already been told why. Images that
+        aren't precomputed are rendered while being sent and might raise
+        EmojiSequenceTooLong halfway. Without animate, animated images are
+        rendered from their first frame
+    """
+    try:
+        try:
+            h = int(opts.name, 0)
+        except ValueError:
+            h = db.get_image_hash(opts.name)
+        path = db.get_image_path(h)
+        manager.logger.info(f'Hash look up succeeded. Image file path is {path}')
+    except db.NoResultFound:
+        manager.logger.info(f'Hash not found, aborting')
+        if opts.name:
+            await manager.send(f"Huh, I've never seen an image of `{opts.name}`. I wonder what it looks like")
+        else:
+            await manager.send('huh??')  # triggered by |show :something
+        return
+    manager.image_hash = h
+    if opts.perceptual:
+        try:
+            load_lut()
+        except FileNotFoundError:
+            manager.logger.warning('Perceptual lookup table not found, aborting')
+            await manager.send("Sorry, my eyes aren't working well enough to do perceptual matching right now")
+            return
+    if opts.palette != '12bit':
+        try:
+            get_emoji_table(palette = opts.palette)
+        except FileNotFoundError:
+            manager.logger.warning(f'Emojis of the {opts.palette} palette not found, aborting')
+            await manager.send(f"Sorry, I don't have the paint for `{opts.palette}` right now")
+            return
+    key = (h, opts.large, opts.with_space, opts.multiline, opts.perceptual, opts.dither, opts.palette)
+    mtime = os.stat(DATA_PATH / path).st_mtime_ns
+    cached = render_cache.get(key, mtime)
+    if cached is None:
+        if opts.perceptual or opts.dither or opts.palette != '12bit':
+            # only the default palette and quantizer are precomputed,
+            # anything else is rendered while being sent
+            manager.logger.info(f'Rendering with perceptual={opts.perceptual}, dither={opts.dither}, '
+                                f'palette={opts.palette}')
+            artifacts = MessageStream(Image.open(DATA_PATH / path), opts.large, opts.with_space, opts.multiline,
+                                      opts.palette, lambda m: render_cache.put(key, m, mtime, artifacts.n_frames),
+                                      perceptual = opts.perceptual, dither = opts.dither)
+        else:
+            artifacts = load_render_artifacts(h)
+            if artifacts is None:
+                manager.logger.info('Render artifacts missing or outdated, rendering')
+                artifacts = gen_render_artifacts(Image.open(DATA_PATH / path))
+                save_render_artifacts(h, artifacts)
+        width = artifacts.width
+        if opts.large and not artifacts.flags['large']:
+            manager.logger.info(f'Image size check for large image failed. Width is {width}, aborting')
+            await manager.send(
+                f"Umm it seems that an image of `{opts.name}`is {width - MAX_WIDTH_LARGE} pixels too wide to be sent as large")
+            return
+
+        if not artifacts.flags['sendable']:
+            manager.logger.info(f'Image size check failed. Width is {width}, aborting')
+            await manager.send(
+                f"Well, it seems like an image of `{opts.name}` is {width - MAX_WIDTH} pixels too wide to be sent. "
+                r"Nice job on whoever managed to upload this I guess ¯\_(ツ)_/¯")
+            return
+        elif opts.with_space and not artifacts.flags['with_space']:
+            manager.logger.info(f'Image size check (with space) failed. Width is {width}, aborting')
+            await manager.send(
+                f"Well, it seems like an image of `{opts.name}` is {width - MAX_WIDTH_WITH_SPACE} pixels too wide to be sent, "
+                r"but you can probably get 3 more pixels of it if you don't request the space")
+            return
+
+        if animate and artifacts.n_frames > 1:
+            # the first frame is never rendered on its own
+            return await render_animation(manager, opts, path)
+        if isinstance(artifacts, MessageStream):
+            return artifacts
+        messages = artifacts.get_messages(opts.large, opts.with_space, opts.multiline)
+        if messages is None:
+            await message_too_long(manager, opts)
+            return
+        render_cache.put(key, messages, mtime, artifacts.n_frames)
+    else:
+        messages, n_frames = cached
+        if animate and n_frames > 1:
+            return await render_animation(manager, opts, path)
+    manager.logger.debug(f'{render_cache}')
+    return messages
+
+
+async def render_animation(manager: MessageManager, opts: ShowOptions, path: str) -> Optional[Animation]:
+    """
+    renders every frame of the animated image at path, or returns None if
+    they produce a message that is too long, in which case the requester has
+    already been told
+    """
+    img = Image.open(DATA_PATH / path)
+    manager.logger.info(f'Image has {img.n_frames} frames, rendering the animation')
+    try:
+        return gen_animation(img, opts.large, opts.with_space, opts.multiline, opts.palette,
+                             MAX_ANIMATION_FRAMES, perceptual = opts.perceptual, dither = opts.dither)
+    except EmojiSequenceTooLong:
+        await message_too_long(manager, opts)
+
+
+async def message_too_long(manager: MessageManager, opts: ShowOptions):
+    manager.logger.info(f'Message size check failed, aborting')
+    await manager.send(
+        f"Well, it seems like an image of `{opts.name}` produced a really long message. "
+        r"Nice job on whoever managed to upload this I guess ¯\_(ツ)_/¯")
+
+
 @bot.command()
 async def show(ctx: commands.Context, *, raw_or_parsed_args: Union[str, ShowOptions] = ''):
     async with MessageManager(ctx) as manager:
@@ -536,63 +735,153 @@ async def show(ctx: commands.Context, *, raw_or_parsed_args: Union[str, ShowOpti
         else:
             opts = raw_or_parsed_args
 
-        try:
-            try:
-                h = int(opts.name, 0)
-            except ValueError:
-                h = db.get_image_hash(opts.name)
-            path = db.get_image_path(h)
-            manager.logger.info(f'Hash look up succeeded. Image file path is {path}')
-        except db.NoResultFound:
-            manager.logger.info(f'Hash not found, aborting')
-            if opts.name:
-                await manager.send(f"Huh, I've never seen an image of `{opts.name}`. I wonder what it looks like")
-            else:
-                await manager.send('huh??')  # triggered by |show :something
-            return
-        manager.image_hash = h
-        img = Image.open(DATA_PATH / path)
-        if opts.large and img.width > 27:
-            # discord displays all lines above 27 emojis as inline, according
-            # to trial and error.
-            manager.logger.info(f'Image size check for large image failed. Width is {img.width}, aborting')
-            await manager.send(
-                f"Umm it seems that an image of `{opts.name}`is {img.width - 27} pixels too wide to be sent as large")
+        if ',' in opts.name:
+            await show_batch(manager, opts)
             return
 
-        if img.width > 79:
-            manager.logger.info(f'Image size check failed. Width is {img.width}, aborting')
-            await manager.send(
-                f"Well, it seems like an image of `{opts.name}` is {img.width - 79} pixels too wide to be sent. "
-                r"Nice job on whoever managed to upload this I guess ¯\_(ツ)_/¯")
+        rendered = await render_image(manager, opts)
+        if rendered is None:
             return
-        elif img.width > 76 and opts.with_space:
-            manager.logger.info(f'Image size check (with space) failed. Width is {img.width}, aborting')
-            await manager.send(
-                f"Well, it seems like an image of `{opts.name}` is {img.width - 76} pixels too wide to be sent, "
-                r"but you can probably get 3 more pixels of it if you don't request the space")
+        if isinstance(rendered, Animation):
+            animation = rendered
+            # the first frame has to be split the same way as the others
+            messages = animation.messages()
+        else:
+            animation = None
+            messages = rendered
+        manager.logger.info(f'Emoji sequence ready')
+        if opts.embed and not (opts.large or opts.multiline) and animation is None:
+            # embeds only render inline emojis, and an animation edits the messages as they are.
+            # all embeds of a message share 6000 characters, about 3 plain messages
+            lines = (line for m in messages for line in m.split('\n'))
+            manager.queue_stream(iter_embeds(lines), use_webhook = True, as_embeds = True,
+                                 expected = -(-length_hint(messages) // 3))
+        else:
+            manager.queue_stream(messages, use_webhook = True)
+        try:
+            await manager.commit_queue()
+        except EmojiSequenceTooLong:
+            await message_too_long(manager, opts)
             return
+        if animation is not None:
+            await play_animation(manager, animation)
 
-        emojis = gen_emoji_sequence(img, opts.large, opts.with_space)
-        try:
-            if opts.large or opts.multiline:
-                messages = emojis.splitlines()
-                for m in messages:
-                    if len(m) > 2000:
-                        raise EmojiSequenceTooLong
-            else:
-                messages = split_minimal(emojis)
 
+async def play_animation(manager: MessageManager, animation: Animation):
+    """
+    plays the animation by editing the messages of the first frame that
+    change from one frame to the next
+    """
+    manager.logger.info(f'Playing {animation}')
+    edited = 0
+    for delay, edits in animation.deltas():
+        # the last edits have to get through the rate limit before the next ones
+        await sleep(max(delay / 1000, edited * EDIT_INTERVAL))
+        manager.logger.debug(f'Editing {len(edits)} messages')
+        await asyncio.gather(*(manager.edit(i, m) for i, m in edits))
+        edited = len(edits)
+
+
+async def show_batch(manager: MessageManager, opts: ShowOptions):
+    names = [n.strip() for n in opts.name.split(',') if n.strip()]
+    if len(names) > MAX_BATCH_SIZE:
+        manager.logger.info(f'Batch of {len(names)} images is too large, aborting')
+        await manager.send(f"That's a lot of images. I can only show {MAX_BATCH_SIZE} of them at once")
+        return
+
+    rendered = []
+    hashes = []
+    for name in names:
+        image_opts = replace(opts, name = name)
+        # a batch only shows the first frame of animated images
+        messages = await render_image(manager, image_opts, animate = False)
+        if messages is None:
+            continue
+        try:
+            rendered.append(list(messages))
         except EmojiSequenceTooLong:
-            manager.logger.info(f'Message size check failed, aborting')
-            await manager.send(
-                f"Well, it seems like an image of `{opts.name}` produced a really long message. "
-                r"Nice job on whoever managed to upload this I guess ¯\_(ツ)_/¯")
+            await message_too_long(manager, image_opts)
+            continue
+        hashes.append(manager.image_hash)
+    if not rendered:
+        return
+    # a request only records one image
+    manager.image_hash = hashes[0]
+    manager.logger.info(f'Emoji sequences of {len(rendered)} images generated')
+
+    if opts.large or opts.multiline:
+        # every line has to be a message on its own
+        messages = [m for image in rendered for m in image]
+    else:
+        # pack the rows of all images together, with an empty line between images
+        lines = []
+        for image in rendered:
+            if lines:
+                lines.append('\u200b')
+            for m in image:
+                lines.extend(m.splitlines())
+        if opts.embed:
+            messages = list(iter_embeds(lines))
+            manager.logger.info(f'Batch packed into {len(messages)} messages of embeds')
+            manager.queue_stream(messages, use_webhook = True, as_embeds = True)
+            await manager.commit_queue()
             return
-        manager.logger.info(f'Emoji sequence generated')
-        for i in range(len(messages)):
-            manager.queue(messages[i], use_webhook = True)
-        await manager.commit_queue()
+        messages = pack_lines(lines)
+    manager.logger.info(f'Batch packed into {len(messages)} messages')
+    for m in messages:
+        manager.queue(m, use_webhook = True)
+    await manager.commit_queue()
+
+
+@bot.command()
+async def batch(ctx: commands.Context, *, raw_args = ''):
+    async with MessageManager(ctx) as manager:
+        raw_args = raw_args.lower().strip()
+        log_command_enter(manager.logger, ctx, 'batch', raw_args)
+        if not raw_args:
+            return
+        await show_batch(manager, parse_opt(raw_args))
+
+
+# the payloads of |pride and of the most used |gradient options are kept once
+# they have been rendered. the options of |gradient go into the key, so the
+# cache is bounded
+@lru_cache(256)
+def gradient_messages(large: bool, with_space: bool, multiline: bool, **gradient_opts) -> tuple[str, ...]:
+    emojis = gen_emoji_sequence(gen_gradient(**gradient_opts), large, with_space)
+    if large or multiline:
+        return tuple(emojis.splitlines())
+    # custom splitting to ensure that each chunk is 4 lines
+    lines = emojis.splitlines()
+    return tuple('\n'.join(lines[i * 4:i * 4 + 4]) for i in range(4))
+
+
+PRIDE_FLAGS = {
+    ('ace', 'asexual')                      : (
+        (0, 0, 0), (163, 163, 163), (255, 255, 255), (128, 0, 128)),
+    ('trans', 'transgender', 'trans-gender'): (
+        (91, 206, 250), (245, 169, 184), (255, 255, 255), (245, 169, 184), (91, 206, 250)),
+    ('rainbow', 'gay')                      : (
+        (255, 0, 24), (255, 165, 44), (255, 255, 65), (0, 128, 24), (0, 0, 249), (134, 0, 125)),
+    ('bi', 'bisexual')                      : (
+        (214, 2, 112), (155, 79, 150), (0, 56, 168)),
+    ('pan', 'pan-sexual', 'pansexual')      : (
+        (255, 33, 140), (255, 216, 0), (33, 177, 255)),
+    ('nonbinary', 'nb', 'non-binary')       : (
+        (255, 244, 48), (255, 255, 255), (156, 89, 209), (0, 0, 0)),
+    ('aro', 'aromantic')                    : (
+        (61, 165, 66), (167, 211, 121), (255, 255, 255), (169, 169, 169), (0, 0, 0)),
+    ('lesbian', 'les')                      : (
+        (214, 41, 0), (255, 155, 85), (255, 255, 255), (212, 97, 166), (165, 0, 98)),
+}
+
+
+@lru_cache(None)
+def pride_messages(colors: tuple, large: bool, with_space: bool, multiline: bool) -> tuple[str, ...]:
+    emojis = gen_emoji_sequence(gen_pride_flag(*colors), large, with_space)
+    if large or multiline:
+        return tuple(emojis.splitlines())
+    return emojis,
 
 
 @bot.command()
@@ -630,6 +919,7 @@ async def gradient(ctx: commands.Context, *, raw_args = ''):
                     if v not in ('+', '-'):
                         await manager.send("The direction can only be either + or -, there's nothing in between")
                         manager.logger.info('Invalid gradient direction, aborting')
+                        return
                     gradient_opts[k] = v
                 else:
                     raise ValueError
@@ -645,16 +935,8 @@ async def gradient(ctx: commands.Context, *, raw_args = ''):
             return
         manager.logger.info('Generating gradient, options:')
         manager.logger.info(gradient_opts)
-        img = gen_gradient(**gradient_opts)
-        emojis = gen_emoji_sequence(img, opts.large, opts.with_space)
-        if opts.large or opts.multiline:
-            seq = emojis.splitlines()
-            for msg in seq:
-                manager.queue(msg, use_webhook = True)
-        else:
-            for i in range(4):
-                # custom splitting to ensure that each chunk is 4 lines
-                manager.queue('\n'.join(emojis.splitlines()[i * 4:i * 4 + 4]), use_webhook = True)
+        for msg in gradient_messages(opts.large, opts.with_space, opts.multiline, **gradient_opts):
+            manager.queue(msg, use_webhook = True)
         await manager.commit_queue()
 
 
@@ -716,22 +998,9 @@ async def pride(ctx: commands.Context, *, raw_args = ''):
         if not opts.name:
             manager.logger.info('No pride flag name supplied. Using random')
             opts.name = random.choice('ace trans gay bi pan nb aro les'.split())
-        if opts.name in ('ace', 'asexual'):
-            img = gen_pride_flag((0, 0, 0), (163, 163, 163), (255, 255, 255), (128, 0, 128))
-        elif opts.name in ('trans', 'transgender', 'trans-gender'):
-            img = gen_pride_flag((91, 206, 250), (245, 169, 184), (255, 255, 255), (245, 169, 184), (91, 206, 250))
-        elif opts.name in ('rainbow', 'gay'):
-            img = gen_pride_flag((255, 0, 24), (255, 165, 44), (255, 255, 65), (0, 128, 24), (0, 0, 249), (134, 0, 125))
-        elif opts.name in ('bi', 'bisexual'):
-            img = gen_pride_flag((214, 2, 112), (155, 79, 150), (0, 56, 168))
-        elif opts.name in ('pan', 'pan-sexual', 'pansexual'):
-            img = gen_pride_flag((255, 33, 140), (255, 216, 0), (33, 177, 255))
-        elif opts.name in ('nonbinary', 'nb', 'non-binary'):
-            img = gen_pride_flag((255, 244, 48), (255, 255, 255), (156, 89, 209), (0, 0, 0))
-        elif opts.name in ('aro', 'aromantic'):
-            img = gen_pride_flag((61, 165, 66), (167, 211, 121), (255, 255, 255), (169, 169, 169), (0, 0, 0))
-        elif opts.name in ('lesbian', 'les'):
-            img = gen_pride_flag((214, 41, 0), (255, 155, 85), (255, 255, 255), (212, 97, 166), (165, 0, 98))
+        for names, colors in PRIDE_FLAGS.items():
+            if opts.name in names:
+                break
         else:
             manager.logger.info('Cannot match pride flag name. Aborting')
             await manager.send(
@@ -739,11 +1008,7 @@ async def pride(ctx: commands.Context, *, raw_args = ''):
             return
         manager.logger.info('Pride flag name matched. Proceeding')
 
-        emojis = gen_emoji_sequence(img, opts.large, opts.with_space)
-        if opts.large or opts.multiline:
-            messages = emojis.splitlines()
-        else:
-            messages = (emojis,)
+        messages = pride_messages(colors, opts.large, opts.with_space, opts.multiline)
         for m in messages:
             manager.queue(m, use_webhook = True)
         await manager.commit_queue()
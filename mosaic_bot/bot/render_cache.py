@@ -0,0 +1,68 @@
+import sys
+from collections import OrderedDict
+from typing import Optional
+
+
+class RenderCache:
+    """
+    LRU cache of rendered message payloads, keyed by the image hash followed
+    by the render options, e.g. (hash, large, with_space, multiline). The
+    cache is bounded by the total size of the cached messages instead of the
+    number of entries.
+    Each entry also remembers the mtime of the image file it was rendered
+    from, so an image replaced by another process is never served stale,
+    and the number of frames of the image, so that an animated one is known
+    without opening it
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[list[str], int, int, int]] = OrderedDict()
+
+    def get(self, key: tuple, mtime: int) -> Optional[tuple[list[str], int]]:
+        """
+        the messages and the number of frames of an entry, or None if there
+        isn't one for this mtime
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[1] != mtime:
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[3]
+
+    def put(self, key: tuple, messages: list[str], mtime: int, n_frames: int = 1) -> None:
+        if key in self._entries:
+            self._remove(key)
+        size = sum(map(sys.getsizeof, messages))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (messages, mtime, size, n_frames)
+        self.size += size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, hash: int) -> None:
+        for key in [k for k in self._entries if k[0] == hash]:
+            self._remove(key)
+
+    def _remove(self, key: tuple) -> None:
+        self.size -= self._entries.pop(key)[2]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (f'<RenderCache {len(self)} entries, {self.size}/{self.max_bytes} bytes, '
+                f'hits: {self.hits}, misses: {self.misses}, evictions: {self.evictions}>')
+
+
+__all__ = ['RenderCache']
@@ -0,0 +1,87 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+
+# discord lets a channel take a burst of about 5 messages in 5 seconds
+# before it starts to rate limit
+BURST_SIZE = 5
+BURST_WINDOW = 5
+
+# delays between paced messages. longer queues are paced slower so that
+# they don't run into the rate limit halfway
+PACED_DELAY = 1
+PACED_DELAY_LONG = 1.5
+LONG_QUEUE = 30
+
+# round trip time assumed before a channel has been sent anything
+DEFAULT_RTT = 0.3
+
+
+class RateLimitState:
+    """
+    recent sends and the average round trip time of a channel
+    """
+
+    def __init__(self):
+        self.sends: deque[float] = deque()
+        self.rtt = DEFAULT_RTT
+
+    def record(self, rtt: float = None, now: float = None) -> None:
+        self.sends.append(time.monotonic() if now is None else now)
+        if rtt is not None:
+            # exponential moving average so that the latest sends count the most
+            self.rtt = 0.8 * self.rtt + 0.2 * rtt
+
+    def recent(self, now: float = None) -> int:
+        """
+        the number of sends in the current burst window
+        """
+        now = time.monotonic() if now is None else now
+        while self.sends and self.sends[0] < now - BURST_WINDOW:
+            self.sends.popleft()
+        return len(self.sends)
+
+    def __repr__(self):
+        return f'<RateLimitState {len(self.sends)} recent sends, rtt {round(self.rtt, 3)}s>'
+
+
+@dataclass
+class SendPlan:
+    """
+    how a queue of messages will be sent. api_calls includes the header,
+    and for paced sending the status message with its edits and deletion
+    """
+    messages: int
+    bytes: int
+    strategy: str  # burst or paced
+    api_calls: int
+    delay: float  # between two paced messages
+    rtt: float
+    duration: float  # predicted, in seconds
+
+    def remaining(self, sent: int) -> float:
+        """
+        predicted time left after sent messages, the header included, are sent
+        """
+        if self.strategy == 'burst':
+            return 0 if sent else self.rtt
+        return max(self.messages + 1 - sent, 0) * max(self.delay, self.rtt)
+
+
+def plan_send(messages: int, size: int, state: RateLimitState) -> SendPlan:
+    """
+    plans sending messages of size bytes in total, plus the header, to a
+    channel with the given rate limit state
+    """
+    sends = messages + 1
+    if sends <= BURST_SIZE - state.recent():
+        # everything is sent at once
+        return SendPlan(messages, size, 'burst', sends, 0, state.rtt, state.rtt)
+    delay = PACED_DELAY_LONG if sends > LONG_QUEUE else PACED_DELAY
+    # every message waits for the delay or its own round trip, whichever is
+    # longer, and the status message is sent before and deleted after them
+    duration = 2 * state.rtt + (sends - 1) * max(delay, state.rtt) + state.rtt
+    return SendPlan(messages, size, 'paced', 2 * sends + 1, delay, state.rtt, duration)
+
+
+__all__ = ['RateLimitState', 'SendPlan', 'plan_send']
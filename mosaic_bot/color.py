@@ -1,5 +1,7 @@
 from typing import Tuple
 
+import numpy as np
+
 
 def int_to_rgb(color: int) -> Tuple[int, int, int]:
     return color >> 16, (color >> 8) % 256, color % 256
@@ -10,6 +12,51 @@ def rgb_to_int(r: int, g: int, b: int) -> int:
     return int((r << 16) + (g << 8) + b)
 
 
+def approx_12bit_code(r: int, g: int, b: int) -> int:
+    """
+    The 12-bit code (r >> 4) << 8 | (g >> 4) << 4 | b >> 4 of the color
+    Color(r, g, b).approx_12bit() would return
+    """
+    code = 0
+    for c in (r, g, b):
+        c = int(c)
+        hbits = c >> 4
+        comp = (hbits << 4) + hbits - c
+        if comp < -9:
+            hbits += 1
+        elif comp > 8:
+            hbits -= 1
+        code = (code << 4) | hbits
+    return code
+
+
+def _approx_12bit_levels() -> np.ndarray:
+    # the 4-bit level approx_12bit rounds each of the 256 channel values to
+    channel = np.arange(256, dtype = np.int16)
+    hbits = channel >> 4
+    comp = (hbits << 4) + hbits - channel
+    # there's 17 difference between each color, same thresholds as approx_12bit
+    return hbits + (comp < -9) - (comp > 8)
+
+
+APPROX_12BIT_LEVELS = _approx_12bit_levels()
+
+
+def approx_12bit_array(arr: np.ndarray, codes: bool = False) -> np.ndarray:
+    """
+    Color.approx_12bit applied to every pixel of an HxWx3 or HxWx4 uint8
+    array at once. Returns a new array of the same shape with the alpha
+    channel, if any, left untouched, or the HxW array of 12-bit codes
+    if codes is True
+    """
+    levels = APPROX_12BIT_LEVELS[arr[..., :3]]
+    if codes:
+        return (levels[..., 0] << 8) | (levels[..., 1] << 4) | levels[..., 2]
+    res = np.array(arr, dtype = np.uint8)
+    res[..., :3] = levels * 17
+    return res
+
+
 class Color:
     def __init__(self, r: int, g: int, b: int):
         self.r = r
@@ -21,8 +68,9 @@ class Color:
         tmp = [0, 0, 0]
         
         for i in range(3):
-            hbits = self[i] >> 4
-            comp = (hbits << 4) + hbits - self[i]
+            c = int(self[i])  # np.uint8 would wrap around in the subtraction
+            hbits = c >> 4
+            comp = (hbits << 4) + hbits - c
             # there's 17 difference between each color
             if comp < -9:
                 tmp[i] = ((hbits + 1) << 4) + hbits + 1
@@ -74,4 +122,4 @@ class Color:
         return rgb_to_int(*self)
 
 
-__all__ = ['rgb_to_int', 'int_to_rgb', 'Color']
+__all__ = ['rgb_to_int', 'int_to_rgb', 'approx_12bit_code', 'approx_12bit_array', 'Color']
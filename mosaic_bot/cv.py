@@ -1,9 +1,39 @@
+import os
+import time
 import cv2
 from PIL import Image
 import numpy as np
-from collections import Counter
-from math import log2
-from typing import Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from math import gcd, log2
+from typing import Callable, Iterator, Optional, Union
+
+from mosaic_bot import scale_cache
+
+# candidates evaluated at once by find_scale. most of the work is done by
+# opencv and numpy, which release the GIL, so threads are enough
+SCALE_WORKERS = int(os.environ.get('SCALE_WORKERS', 1))
+
+# revision of find_scale the persistent cache is keyed by. bump it whenever
+# a change makes find_scale choose differently or changes what is stored
+SCALE_REVISION = 2
+
+# ways find_scale can come up with candidates
+ENGINES = ('contour', 'fft')
+
+# rough seconds per pixel of the edge detection and contour search, used to
+# give up before them when they can't finish within the budget
+EDGE_COST = 1e-8
+
+# bytes of working memory find_scale may use on top of the image itself.
+# the candidates of larger images are searched for and evaluated on a tile
+# from their center, at full resolution
+SCALE_MEMORY_LIMIT = int(os.environ.get('SCALE_MEMORY_LIMIT', 256 * 1024 * 1024))
+# rough peak bytes per pixel of the edge detection, contour search and
+# alignment scoring, the integral images being the most of it
+SEARCH_BYTES_PER_PIXEL = 32
 
 
 class ScaleCandidate:
@@ -11,6 +41,8 @@ class ScaleCandidate:
         self.scale = scale
         self.score = score
         self.align = -1
+        # where the grid of the scale starts in the cropped image, within a block
+        self.offset = (0, 0)
         self.shade: Union[np.array, Image.Image] = None
     
     def __str__(self):
@@ -27,43 +59,265 @@ class DebugData:
     def __init__(self):
         self.candidates: list[ScaleCandidate] = []
         self.labeled: Union[Image.Image, np.ndarray] = None
+        # the offset of the candidate found, see ScaleCandidate
+        self.offset = (0, 0)
+        # whether all the candidates were evaluated, which may not be the
+        # case when there is a budget, and how much the scale can be trusted
+        self.complete = True
+        self.confidence = 1.0
     
     def __repr__(self):
         return f'<{self.candidates}>'
 
 
+@dataclass(frozen=True)
+class Grid:
+    """
+    the pixel grid of a scaled up pixel art. each of its pixels is scale_x
+    by scale_y pixels of the image, and the first whole one starts at
+    offset_x, offset_y
+    """
+    scale_x: float
+    scale_y: float
+    offset_x: float = 0
+    offset_y: float = 0
+
+
 class NoScaleFound(Exception):pass
 
-def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False) \
-        -> Union[int, tuple[int, DebugData]]:
-    cropped = PIL_image.crop(PIL_image.getbbox())
-    debug_data = DebugData()
-    cropped = cropped.convert('RGBA')
-    color_img = np.asarray(cropped)
+
+class ScaleBudgetExceeded(NoScaleFound): pass
+
+
+# pixels processed at a time by exact_scale and the alignment scoring
+CHUNK_PIXELS = 1 << 20
+
+
+def _boundaries(changed: np.ndarray) -> tuple[int, int, int]:
+    # the gcd of the distances between the positions where the color changes,
+    # the first of those positions and how many there are. the runs at both
+    # ends may be cut short by cropping so they don't count
+    pos = np.flatnonzero(changed) + 1
+    if not len(pos):
+        return 0, 0, 0
+    return int(np.gcd.reduce(np.diff(pos))) if len(pos) > 1 else 0, int(pos[0]), len(pos)
+
+
+def _exact_runs(color_img: np.ndarray) -> tuple[int, int, int, int, int, int]:
+    # the gcd of the runs of each axis, where their first boundary is and the
+    # number of boundaries, as sx, x, nx, sy, y, ny. a gcd is 0 if there is no
+    # more than one boundary
+    color_img = np.ascontiguousarray(color_img)
+    h, w = color_img.shape[:2]
+    changed_x = np.zeros(w - 1, dtype=bool)
+    changed_y = np.zeros(h - 1, dtype=bool)
+    rows = max(1, CHUNK_PIXELS // w)
+    last = None
+    for y in range(0, h, rows):
+        # a band of rows at a time, with the pixels packed into one number
+        band = color_img[y:y + rows]
+        packed = band.view(np.uint32)[..., 0]
+        # fully transparent pixels are the same whatever their color channels are
+        packed = np.where(band[..., 3] == 0, 0, packed)
+        changed_x |= np.any(packed[:, 1:] != packed[:, :-1], axis=0)
+        changed_y[y:y + len(band) - 1] = np.any(packed[1:] != packed[:-1], axis=1)
+        if last is not None:
+            changed_y[y - 1] = np.any(packed[0] != last)
+        last = packed[-1]
+    return (*_boundaries(changed_x), *_boundaries(changed_y))
+
+
+def exact_scale(color_img: np.ndarray) -> Optional[tuple[int, tuple[int, int]]]:
+    """
+    the scale and the (x, y) offset of the block grid of an HxWx4 image that
+    is an exact nearest neighbor upscale, or None if there isn't one. Every
+    color change is at a multiple of the scale from the offset, so each block
+    has a single color and no further check is needed
+    """
+    sx, x, _, sy, y, _ = _exact_runs(color_img)
+    scale = gcd(sx, sy)
+    if scale < 2:
+        return None
+    return scale, (x % scale, y % scale)
+
+
+def _match_corner(integrals: tuple[np.ndarray, np.ndarray], small_gray: np.ndarray, scale: int) -> tuple[int, int]:
+    # the top left corner where the small gray image scaled up fits the gray
+    # image with the least squared difference, which is what template matching
+    # does, but worked out from the integral images of the gray image.
+    # the difference at a corner is the sum of the squares under the template,
+    # minus twice the sum of each block times its color, plus a constant
+    sums, sq_sums = integrals
+    nh, nw = small_gray.shape
+    h = nh * scale
+    w = nw * scale
+    dy = sums.shape[0] - 1 - h
+    dx = sums.shape[1] - 1 - w
+    window = (sq_sums[h:h + dy + 1, w:w + dx + 1] - sq_sums[:dy + 1, w:w + dx + 1]
+              - sq_sums[h:h + dy + 1, :dx + 1] + sq_sums[:dy + 1, :dx + 1]).astype(np.int64)
+    # the sum of the blocks times their colors is the sum of the integral
+    # image at the block corners times the weights of the corners
+    padded = np.pad(small_gray.astype(np.int64), 1)
+    weights = padded[:-1, :-1] - padded[1:, :-1] - padded[:-1, 1:] + padded[1:, 1:]
+    cross = np.empty(window.shape, dtype=np.int64)
+    for y in range(dy + 1):
+        rows = sums[y:y + h + 1:scale]
+        # the block corners of every horizontal shift at once
+        corners = np.lib.stride_tricks.as_strided(
+                rows, (dx + 1, nh + 1, nw + 1),
+                (rows.strides[1], rows.strides[0], rows.strides[1] * scale)
+        ).astype(np.int64)
+        cross[y] = np.einsum('xji,ji->x', corners, weights)
+    y, x = np.unravel_index(np.argmin(window - 2 * cross), window.shape)
+    return int(x), int(y)
+
+
+def _block_diff(source: np.ndarray, small: np.ndarray, scale: int, shade: np.ndarray = None) -> int:
+    # the total absolute difference between source and small scaled up,
+    # a few rows of blocks at a time. the per pixel average of the
+    # channels is written to shade if given
+    nh, nw = small.shape[:2]
+    rows = max(1, CHUNK_PIXELS // (nw * scale * scale))
+    total = 0
+    for j in range(0, nh, rows):
+        k = min(j + rows, nh)
+        blocks = source[j * scale:k * scale].reshape(k - j, scale, nw, scale, 4)
+        diff = np.abs(blocks.astype(np.int16) - small[j:k, None, :, None].astype(np.int16))
+        total += int(np.sum(diff))
+        if shade is not None:
+            shade[j * scale:k * scale] = (np.sum(diff, axis=4) // 3).reshape((k - j) * scale, nw * scale)
+    return total
+
+
+def _evaluate(color_img: np.ndarray, integrals: Optional[tuple[np.ndarray, np.ndarray]], scale: int,
+              debug: bool) -> tuple[float, tuple[int, int], Optional[np.ndarray]]:
+    # the alignment of a candidate scale, the corner it is aligned at and,
+    # when debugging, the per pixel difference
+    nw = color_img.shape[1] // scale
+    nh = color_img.shape[0] // scale
     
-    gray_img = cv2.cvtColor(color_img, cv2.COLOR_RGBA2GRAY)
-    # color_img = cv2.cvtColor(color_img, cv2.COLOR_RGBA2BGRA)
+    small = cv2.resize(color_img, (nw, nh), interpolation=cv2.INTER_NEAREST_EXACT)
+    # the image is compared with the small one scaled up by the computed
+    # scale, in case of some cropping issues which causes non-integer
+    # ratios. the scaled up image is never made, only the small one
+    # is compared block by block
     
+    if nh * scale < color_img.shape[0] or nw * scale < color_img.shape[1]:
+        corner = _match_corner(integrals, cv2.cvtColor(small, cv2.COLOR_RGBA2GRAY), scale)
+    else:
+        corner = (0, 0)
+    
+    h = nh * scale
+    w = nw * scale
+    aligned_source = color_img[corner[1]:corner[1] + h, corner[0]:corner[0] + w]
+    
+    shade = np.empty((h, w), dtype=np.uint8) if debug else None
+    total_diff = _block_diff(aligned_source, small, scale, shade)
+    total_values = np.sum(aligned_source)
+    return (total_values - total_diff) / total_values, corner, shade
+
+
+def _evaluate_all(scales: list[int], evaluate: Callable, workers: int) -> Iterator:
+    # the evaluations of the scales in order, with up to workers of them
+    # running ahead on threads of their own. those not yet started are
+    # cancelled when closed, and the threads go away with the ones running
+    if workers <= 1:
+        yield from map(evaluate, scales)
+        return
+    scales = iter(scales)
+    with ThreadPoolExecutor(workers, thread_name_prefix='find_scale') as pool:
+        pending = deque(pool.submit(evaluate, scale) for scale in islice(scales, workers))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(pool.submit(evaluate, scale) for scale in islice(scales, 1))
+                yield result
+        finally:
+            for f in pending:
+                f.cancel()
+
+
+def _bounding_boxes(contours: tuple[np.ndarray, ...], min_area: float) -> np.ndarray:
+    # the x, y, w, h of the bounding boxes of all the contours with an area
+    # of at least min_area, worked out from all the points at once
+    if not contours:
+        return np.empty((0, 4), dtype=np.int64)
+    lengths = np.fromiter(map(len, contours), dtype=np.int64, count=len(contours))
+    starts = np.cumsum(lengths) - lengths
+    points = np.concatenate(contours)[:, 0].astype(np.int64)
+    x = points[:, 0]
+    y = points[:, 1]
+    # the next point of each point along its contour, which wraps around
+    following = np.arange(1, len(points) + 1)
+    following[starts + lengths - 1] = starts
+    # twice the area enclosed by each contour with the shoelace formula,
+    # the same area contourArea gives
+    area = np.abs(np.add.reduceat(x * y[following] - x[following] * y, starts))
+    left = np.minimum.reduceat(x, starts)
+    top = np.minimum.reduceat(y, starts)
+    boxes = np.stack((left, top,
+                      np.maximum.reduceat(x, starts) - left + 1,
+                      np.maximum.reduceat(y, starts) - top + 1), axis=1)
+    return boxes[area >= 2 * min_area]
+
+
+def _most_common(values: np.ndarray, n: int) -> list[tuple[int, int]]:
+    # Counter(values).most_common(n), ties going to the value seen first
+    unique, first, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.lexsort((first, -counts))[:n]
+    return [(int(v), int(c)) for v, c in zip(unique[order], counts[order])]
+
+
+def _search_area(shape: tuple[int, ...], memory_limit: int) -> tuple[int, int, int, int]:
+    # the y, x, h, w of the whole image if it can be searched within the
+    # memory limit, otherwise of the largest tile of the same shape from its
+    # center that can. the tile is never smaller than a quarter of each side
+    # so that it holds a few blocks of even the largest candidates
+    h, w = shape[:2]
+    f = min(1, max(0.25, (memory_limit / SEARCH_BYTES_PER_PIXEL / (h * w)) ** 0.5))
+    th = int(h * f)
+    tw = int(w * f)
+    return (h - th) // 2, (w - tw) // 2, th, tw
+
+
+def _evaluate_tile(color_img: np.ndarray, area: tuple[int, int, int, int], scale: int,
+                   debug: bool) -> tuple[float, tuple[int, int], Optional[np.ndarray]]:
+    # _evaluate on the search area grown to a block less a pixel more than
+    # the blocks it holds, so that the corner is searched for at every phase
+    # of the block grid. the tile is moved back if it would run past the
+    # image. the corner is relative to the search area
+    y, x, h, w = area
+    th = min(h // scale * scale + scale - 1, color_img.shape[0])
+    tw = min(w // scale * scale + scale - 1, color_img.shape[1])
+    top = min(y, color_img.shape[0] - th)
+    left = min(x, color_img.shape[1] - tw)
+    tile = color_img[top:top + th, left:left + tw]
+    integrals = None
+    if th % scale or tw % scale:
+        integrals = cv2.integral2(cv2.cvtColor(tile, cv2.COLOR_RGBA2GRAY), sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+    align, corner, shade = _evaluate(tile, integrals, scale, debug)
+    return align, (corner[0] + left - x, corner[1] + top - y), shade
+
+
+def _contour_candidates(search_img: np.ndarray, gray_img: np.ndarray, width: int, height: int,
+                        debug_data: DebugData, debug: bool) -> list[ScaleCandidate]:
+    # candidates from the sizes of the bounding boxes of the contours
     edges = cv2.Canny(gray_img, 50, 150)
     cnt, hierarchy = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
     if debug:
         debug_data.labeled = cv2.drawContours(
-                cv2.cvtColor(color_img, cv2.COLOR_RGBA2BGRA),
+                cv2.cvtColor(search_img, cv2.COLOR_RGBA2BGRA),
                 cnt, -1, (255, 0, 0, 255), 1
         )
-    l = []  # for all the bbox dimensions
-    for c in cnt:
-        if cv2.contourArea(c) < 4 and cropped.width > 64:
-            continue
-        x, y, w, h = cv2.boundingRect(c)
-        if debug:
+    boxes = _bounding_boxes(cnt, 4 if width > 64 else 0)
+    if debug:
+        for x, y, w, h in boxes:
             cv2.rectangle(debug_data.labeled, (x, y), (x + w, y + h), (0, 255, 0, 255), 1)
-        l.extend((w, h))
     
     candidates = []
-    for n, occ in Counter(l).most_common(10):
+    for n, occ in _most_common(boxes[:, 2:].ravel(), 10):
         # add all candidates
-        if cropped.width / n > 80 or cropped.width / n < 8:
+        if width / n > 80 or width / n < 8:
             # noise
             continue
         
@@ -92,15 +346,332 @@ def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False)
             # artists tend to choose some "normal" looking numbers, this
             # might be tie breakers for some ridiculously compressed images
             c.score += 5
-        c.score += (cropped.width / c.scale).is_integer() * 2
-        c.score += (cropped.height / c.scale).is_integer()
+        c.score += (width / c.scale).is_integer() * 2
+        c.score += (height / c.scale).is_integer()
         for d in candidates:
             # deduce the relationships between candidates.
             # there should be larger blocks of pixels that are multiples
             # of the correct scale due to the nature of pixel arts
             c.score += (d.scale / c.scale).is_integer()
+    return candidates
+
+
+def _autocorrelation(signal: np.ndarray) -> np.ndarray:
+    # normalized autocorrelation of a 1-D signal through the FFT, zero padded
+    # so that it doesn't wrap around
+    signal = signal - signal.mean()
+    f = np.fft.rfft(signal, 2 * len(signal))
+    ac = np.fft.irfft(f.real ** 2 + f.imag ** 2, 2 * len(signal))[:len(signal)]
+    return ac / ac[0] if ac[0] > 0 else ac
+
+
+def _edge_projections(gray_img: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # the edges between every two neighboring columns and rows added up.
+    # the i-th value is of the boundary before column or row i + 1
+    x = cv2.absdiff(gray_img[:, 1:], gray_img[:, :-1]).sum(axis=0, dtype=np.float64)
+    y = cv2.absdiff(gray_img[1:], gray_img[:-1]).sum(axis=1, dtype=np.float64)
+    return x, y
+
+
+def _banded_projections(color_img: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # _edge_projections of the gray version of an HxWx4 image, a band of
+    # rows at a time so that no full size copy of it is made
+    h, w = color_img.shape[:2]
+    x = np.zeros(w - 1)
+    y = np.zeros(h - 1)
+    rows = max(2, CHUNK_PIXELS // w)
+    # every band after the first starts with the last row of the one before,
+    # whose edges between columns have been added up already
+    for top in range(0, h - 1, rows - 1):
+        gray = cv2.cvtColor(color_img[top:top + rows], cv2.COLOR_RGBA2GRAY)
+        first = int(top > 0)
+        x += cv2.absdiff(gray[first:, 1:], gray[first:, :-1]).sum(axis=0, dtype=np.float64)
+        y[top:top + len(gray) - 1] = cv2.absdiff(gray[1:], gray[:-1]).sum(axis=1, dtype=np.float64)
+    return x, y
+
+
+def _grid_phase(projection: np.ndarray, scale: int) -> int:
+    # where the grid lines of a scale fall on the most edges, as the first line
+    return int(np.argmax([projection[i::scale].sum() for i in range(scale)])) + 1
+
+
+def _fft_candidates(search_img: np.ndarray, gray_img: np.ndarray, width: int,
+                    debug_data: DebugData, debug: bool) -> list[ScaleCandidate]:
+    # candidates from the pitch of the edges. the edges of each column and
+    # row are added up into two 1-D projections, which are periodic with the
+    # scale, and the periods are read from the peaks of their autocorrelation
+    if debug:
+        debug_data.labeled = cv2.cvtColor(search_img, cv2.COLOR_RGBA2BGRA)
+    
+    if min(gray_img.shape) < 3:
+        # too small to have a period
+        return []
+    
+    x, y = _edge_projections(gray_img)
+    n = min(len(x), len(y))
+    ac = (_autocorrelation(x)[:n] + _autocorrelation(y)[:n]) / 2
+    
+    # the same bounds candidates of the contour engine are filtered with
+    lags = np.arange(max(2, -(-width // 80)), min(width // 8, n - 2) + 1)
+    peaks = lags[(ac[lags] >= ac[lags - 1]) & (ac[lags] >= ac[lags + 1]) & (ac[lags] > 0)]
+    if not len(peaks):
+        return []
+    
+    # the multiples of the period are about as strong as the period itself,
+    # so the first strong peak is the period and those near its multiples
+    # are left out. a few fundamentals are kept for images with more than one
+    periods = []
+    for p in peaks[ac[peaks] >= 0.8 * ac[peaks].max()]:
+        if not any(abs(p - round(p / q) * q) <= 1 for q in periods):
+            periods.append(int(p))
+    
+    candidates = []
+    for p in periods[:3]:
+        # the peak can be off by one on compressed images or fractional
+        # scales, which the alignment check settles
+        for scale in (p - 1, p, p + 1):
+            if scale > 1 and all(c.scale != scale for c in candidates):
+                candidates.append(ScaleCandidate(scale, round(float(ac[scale]) * 100, 2)))
+    candidates.sort(key=lambda c: c.scale)
     
-    if cropped.width <= 64:
+    if debug:
+        # the grid of the strongest period
+        h, w = gray_img.shape
+        for i in range(_grid_phase(x, periods[0]), w, periods[0]):
+            cv2.line(debug_data.labeled, (i, 0), (i, h - 1), (0, 255, 0, 255), 1)
+        for i in range(_grid_phase(y, periods[0]), h, periods[0]):
+            cv2.line(debug_data.labeled, (0, i), (w - 1, i), (0, 255, 0, 255), 1)
+    return candidates
+
+
+def _centroid(ac: np.ndarray, lag: int) -> tuple[float, float]:
+    # where the peak of the autocorrelation nearest to lag is to a fraction
+    # of a lag, and how strong it is. a period that isn't a whole number of
+    # pixels splits its peak between the two lags around it
+    lags = np.arange(max(lag - 1, 0), min(lag + 2, len(ac)))
+    weights = np.maximum(ac[lags], 0)
+    total = weights.sum()
+    if total <= 0:
+        return float(lag), 0.0
+    return float(np.dot(lags, weights) / total), float(total)
+
+
+def _period(projection: np.ndarray, low: float, high: float) -> Optional[float]:
+    # the period between low and high of the edges along an axis, from the
+    # first strong peak of the autocorrelation of its projection, refined to
+    # a fraction of a pixel with the harmonics of the peak
+    n = len(projection)
+    lags = np.arange(max(2, int(low)), min(int(high), n - 3) + 1)
+    if not len(lags):
+        return None
+    ac = _autocorrelation(projection)
+    # each lag together with the next one, so that split peaks count in full
+    pairs = ac[:-1] + ac[1:]
+    peaks = lags[(pairs[lags] >= pairs[lags - 1]) & (pairs[lags] >= pairs[lags + 1]) & (pairs[lags] > 0)]
+    if not len(peaks) or pairs[peaks].max() < 0.4:
+        # the edges aren't regular enough along this axis to be a grid
+        return None
+    first = peaks[pairs[peaks] >= 0.8 * pairs[peaks].max()][0]
+    for k in range(first // lags[0], 1, -1):
+        # lines that are all a few pixels apart but line up the most every
+        # few of them are of the shorter period
+        near = peaks[np.abs(peaks - first / k) <= 1]
+        if len(near) and pairs[near].max() >= 0.5 * pairs[first]:
+            first = near[np.argmax(pairs[near])]
+            break
+    period, strength = _centroid(ac, first + int(ac[first + 1] > ac[first]))
+    k = 2
+    while round(k * period) + 2 < n:
+        # the k-th harmonic is within a pixel of where the period so far puts it
+        lag, harmonic = _centroid(ac, round(k * period))
+        if harmonic < 0.5 * strength:
+            break
+        period = lag / k
+        k += 1
+    if abs(period - round(period)) * n / period < 0.5:
+        # a whole number of pixels if that's off by less than half a pixel
+        # across the whole image
+        period = float(round(period))
+    return period
+
+
+def _phase(projection: np.ndarray, period: float) -> float:
+    # where the first grid line of a period falls, from the phase of the
+    # component of the projection at the frequency of the grid
+    lines = np.arange(1, len(projection) + 1)
+    c = np.sum(projection * np.exp(-2j * np.pi * lines / period))
+    return float(-np.angle(c) / (2 * np.pi) * period % period)
+
+
+def _first_pixel(offset: float, scale: float) -> float:
+    # offsets are kept within half a pixel before the first grid line, so
+    # that a line found just before the edge of the image doesn't cost a
+    # whole pixel
+    offset %= scale
+    return offset - scale if offset > scale - 0.5 else offset
+
+
+def _exact_grid(color_img: np.ndarray) -> Optional[Grid]:
+    # the grid of a lossless upscale from the color runs of each axis, or
+    # None if it isn't one
+    sx, x, nx, sy, y, ny = _exact_runs(color_img)
+    sx, sy = sx or sy, sy or sx
+    if sx != sy and max(sx, sy) % min(sx, sy) == 0 and (nx if sx > sy else ny) < 8:
+        # with only a few runs on one axis, them all being multiples of
+        # the other's is more likely square pixels in shapes that happen
+        # to be of even sizes than stretched pixels
+        sx = sy = min(sx, sy)
+    # the lower bound is the one exact_scale is held to in find_scale
+    if sx > 1 and sy > 1 and color_img.shape[1] / sx >= 8:
+        return Grid(sx, sy, x % sx, y % sy)
+    return None
+
+
+def _projected_grid(color_img: np.ndarray) -> Optional[Grid]:
+    # the grid from the period and phase of the edges of each axis, or None
+    # if neither axis has a period. an axis without one is taken to have
+    # the period of the other
+    h, w = color_img.shape[:2]
+    if min(h, w) < 3:
+        return None
+    projection_x, projection_y = _banded_projections(color_img)
+    # the same bounds the candidates of find_scale are filtered with
+    scale_x = _period(projection_x, w / 80, w / 8)
+    scale_y = _period(projection_y, h / 80, h / 8)
+    if scale_x is None and scale_y is None:
+        return None
+    scale_x = scale_x or scale_y
+    scale_y = scale_y or scale_x
+    return Grid(scale_x, scale_y,
+                _first_pixel(_phase(projection_x, scale_x), scale_x),
+                _first_pixel(_phase(projection_y, scale_y), scale_y))
+
+
+def _draw_grid(color_img: np.ndarray, grid: Grid) -> Image.Image:
+    # the image with the first row and column of every pixel of the grid in green
+    labeled = color_img.copy()
+    h, w = labeled.shape[:2]
+    xs = np.ceil(np.arange(grid.offset_x, w, grid.scale_x)).astype(int)
+    ys = np.ceil(np.arange(grid.offset_y, h, grid.scale_y)).astype(int)
+    labeled[:, xs[(xs >= 0) & (xs < w)]] = (0, 255, 0, 255)
+    labeled[ys[(ys >= 0) & (ys < h)]] = (0, 255, 0, 255)
+    return Image.fromarray(labeled)
+
+
+def _best_scale(candidates: list[ScaleCandidate], prioritize_alignment: bool) -> int:
+    if prioritize_alignment:
+        candidates.sort(key=lambda c: c.align, reverse=True)
+    else:
+        candidates.sort(key=lambda c: c.score, reverse=True)
+    return candidates[0].scale
+
+
+def _confidence(candidates: list[ScaleCandidate]) -> float:
+    # the alignment of the best candidate, or if it hasn't been evaluated,
+    # its share of the scores of all the candidates
+    if candidates[0].align >= 0:
+        return float(candidates[0].align)
+    return float(candidates[0].score / sum(c.score for c in candidates))
+
+
+def _out_of_time(deadline: Optional[float], cost: float = 0) -> bool:
+    return deadline is not None and time.monotonic() + cost > deadline
+
+
+def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False, workers: int = None,
+               cache=True, budget_ms: float = None, memory_limit: int = None, engine='contour') \
+        -> Union[int, tuple[int, DebugData]]:
+    """
+    finds the scale a pixel art has been scaled up by.
+    
+    Images too large to be searched within memory_limit bytes, which
+    defaults to SCALE_MEMORY_LIMIT, are searched on a tile from the center.
+    The debug images are of the tile then.
+    
+    engine is one of ENGINES. The contour engine looks for the sizes of
+    shapes, the fft engine for the period of the edges. The fft engine only
+    looks at 1-D projections of the edges so it is a lot cheaper, but it
+    needs the grid to be seen along most of the image
+    
+    With budget_ms, the candidates are evaluated from the most likely one
+    until time runs out, and the best one so far is returned. How much it
+    can be trusted is in the confidence of the debug data
+    
+    :raises: NoScaleFound, or ScaleBudgetExceeded if the budget runs out
+        before there is any candidate
+    """
+    scale, debug_data = _find_scale(_crop(PIL_image)[0], debug, prioritize_alignment, workers, cache,
+                                    budget_ms, memory_limit, engine)
+    return (scale, debug_data) if debug else scale
+
+
+def _crop(PIL_image: Image.Image) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+    # the RGBA pixels of the image cropped to its bounding box, and the box
+    bbox = PIL_image.getbbox() or (0, 0, *PIL_image.size)
+    # the array is a copy of the cropped image, which goes away right after
+    return np.asarray(PIL_image.crop(bbox).convert('RGBA')), bbox
+
+
+def _find_scale(color_img: np.ndarray, debug: bool, prioritize_alignment: bool, workers: Optional[int],
+                cache: bool, budget_ms: Optional[float], memory_limit: Optional[int],
+                engine: str) -> tuple[int, DebugData]:
+    # find_scale on the cropped pixels, with the debug data filled in whether
+    # debugging or not. debug only decides whether the debug images are drawn
+    if engine not in ENGINES:
+        raise ValueError(f'unknown engine {engine}')
+    deadline = None if budget_ms is None else time.monotonic() + budget_ms / 1000
+    anytime = deadline is not None
+    debug_data = DebugData()
+    height, width = color_img.shape[:2]
+    
+    area = _search_area(color_img.shape, SCALE_MEMORY_LIMIT if memory_limit is None else memory_limit)
+    # what is found on a tile isn't always what the whole image would give
+    digest = scale_cache.image_digest(color_img, engine, area) if cache else None
+    if digest and not debug and (cached := scale_cache.get_scale(digest, SCALE_REVISION)):
+        # seen before. debugging always runs the pipeline for the images
+        candidates = []
+        for scale, score, align, *offset in cached:
+            candidates.append(ScaleCandidate(scale, score))
+            candidates[-1].align = align
+            candidates[-1].offset = tuple(offset)
+        scale = _best_scale(candidates, prioritize_alignment)
+        debug_data.offset = candidates[0].offset
+        debug_data.confidence = _confidence(candidates)
+        return scale, debug_data
+    
+    exact = exact_scale(color_img)
+    if exact and width / exact[0] >= 8:
+        # a lossless upscale, which most uploads are. the lower bound is the
+        # same one candidates are filtered with below, so that a sprite made
+        # of only a few large shapes isn't taken for a larger scale
+        scale, debug_data.offset = exact
+        c = ScaleCandidate(scale)
+        c.align = 1
+        c.offset = debug_data.offset
+        if digest:
+            scale_cache.save_scale(digest, SCALE_REVISION, [(scale, 0, 1, *c.offset)])
+        if debug:
+            c.shade = debug_data.labeled = Image.fromarray(color_img)
+            debug_data.candidates = [c]
+        return scale, debug_data
+    
+    # the sizes of the whole image still decide which candidates are
+    # considered and how they are scored
+    search_img = color_img[area[0]:area[0] + area[2], area[1]:area[1] + area[3]]
+    tiled = search_img.shape != color_img.shape
+    
+    if _out_of_time(deadline, search_img.shape[0] * search_img.shape[1] * EDGE_COST):
+        raise ScaleBudgetExceeded
+    
+    gray_img = cv2.cvtColor(search_img, cv2.COLOR_RGBA2GRAY)
+    # color_img = cv2.cvtColor(color_img, cv2.COLOR_RGBA2BGRA)
+    
+    if engine == 'fft':
+        candidates = _fft_candidates(search_img, gray_img, width, debug_data, debug)
+    else:
+        candidates = _contour_candidates(search_img, gray_img, width, height, debug_data, debug)
+    
+    if width <= 64:
         # adds a scale of 1 if not exist already
         for c in candidates:
             if c.scale == 1: break
@@ -112,6 +683,26 @@ def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False)
     
     align_factor = max(candidates, key=lambda c: c.score).score * 5
     
+    integrals = None
+    if tiled:
+        evaluate = lambda scale: _evaluate_tile(color_img, area, scale, debug)
+    else:
+        if any(color_img.shape[0] % c.scale or color_img.shape[1] % c.scale for c in candidates):
+            # shared by all the candidates
+            integrals = cv2.integral2(gray_img, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        evaluate = lambda scale: _evaluate(color_img, integrals, scale, debug)
+    
+    if anytime:
+        # the most likely candidates first so that the best ones are
+        # evaluated by the time the budget runs out
+        candidates.sort(key=lambda c: c.score, reverse=True)
+    
+    evaluations = _evaluate_all(
+            [c.scale for c in candidates if c.scale > 1],
+            evaluate,
+            SCALE_WORKERS if workers is None else workers
+    )
+    
     for c in candidates:
         # calculate the alignment score
         
@@ -124,42 +715,13 @@ def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False)
                 c.shade = debug_data.labeled  # of course no shading can happen
             continue
         
-        nw = color_img.shape[1] // c.scale
-        nh = color_img.shape[0] // c.scale
-        
-        resized = cv2.resize(color_img, (nw, nh), interpolation=cv2.INTER_NEAREST_EXACT)
-        # use the computed scale in case of some cropping issues which causes non-integer ratios
-        resized = cv2.resize(resized, None, fx=c.scale, fy=c.scale, interpolation=cv2.INTER_NEAREST_EXACT)
-        
-        rh = resized.shape[0]
-        ah = color_img.shape[0]
-        rw = resized.shape[1]
-        aw = color_img.shape[1]
-        if (rh < ah or rw < aw) and not (rh > ah or rw > aw):
-            # if the resized image is somehow larger than the source this is
-            # probably the wrong scale anyway, so whatever
-            
-            template = cv2.cvtColor(resized, cv2.COLOR_RGBA2GRAY)
-            match = cv2.matchTemplate(gray_img, template, cv2.TM_SQDIFF)
-            # using grayscale for faster matching
-            
-            corner = cv2.minMaxLoc(match)[2]
-            aligned_source = color_img[corner[1]:corner[1] + nh * c.scale, corner[0]:corner[0] + nw * c.scale]
-        else:
-            corner = (0, 0)
-            aligned_source = color_img
-        
-        h = min(aligned_source.shape[0], resized.shape[0])
-        w = min(aligned_source.shape[1], resized.shape[1])
-        
-        aligned_source = aligned_source[:h, :w]
-        resized = resized[:h, :w]
-        
-        diff = cv2.absdiff(resized, aligned_source)
-        total_diff = np.sum(diff)
-        total_values = np.sum(aligned_source)
+        if _out_of_time(deadline):
+            debug_data.complete = False
+            break
         
-        c.align = (total_values - total_diff) / total_values
+        c.align, corner, shade = next(evaluations)
+        # the corner is of the search area, which may not start on the grid
+        c.offset = ((area[1] + corner[0]) % c.scale, (area[0] + corner[1]) % c.scale)
         # using colored diff instead of binary because the feathered pixels
         # around each "pixel" in the source file should have similar color
         # to the resized ones, therefore should incur less alignment penalty
@@ -167,8 +729,8 @@ def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False)
         c.score += round(c.align * align_factor, 2)
         
         if debug:
-            shade = np.sum(diff, axis=2) // 3
-            shade = cv2.cvtColor(shade.astype(np.uint8), cv2.COLOR_GRAY2RGBA)
+            h, w = shade.shape
+            shade = cv2.cvtColor(shade, cv2.COLOR_GRAY2RGBA)
             
             # set the non-shaded pixels to transparent
             shade[:, :, 3] = np.where(shade[:, :, 0] > 0,
@@ -178,8 +740,12 @@ def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False)
             shade[:, :, 1] = 0  # set it to magenta
             
             container = np.zeros(debug_data.labeled.shape, dtype=np.uint8)
-            container[corner[1]:h + corner[1], corner[0]:w + corner[0]] = \
-                shade[:h, :w]
+            # the shade of a tile may stick out of the search area by less than a block
+            top, left = max(corner[1], 0), max(corner[0], 0)
+            bottom = min(corner[1] + h, container.shape[0])
+            right = min(corner[0] + w, container.shape[1])
+            container[top:bottom, left:right] = shade[top - corner[1]:bottom - corner[1],
+                                                      left - corner[0]:right - corner[0]]
             
             c.shade = Image.fromarray(
                     cv2.cvtColor(
@@ -193,18 +759,59 @@ def find_scale(PIL_image: Image.Image, debug=False, prioritize_alignment=False)
             # its victory
             break
     
-    if prioritize_alignment:
-        candidates.sort(key=lambda c: c.align, reverse=True)
-    else:
-        candidates.sort(key=lambda c: c.score, reverse=True)
+    # the candidates after a conclusive one are never evaluated
+    evaluations.close()
+    
+    if digest and debug_data.complete:
+        scale_cache.save_scale(digest, SCALE_REVISION,
+                               [(c.scale, float(c.score), float(c.align), *c.offset) for c in candidates])
     
+    scale = _best_scale(candidates, prioritize_alignment)
+    debug_data.offset = candidates[0].offset
+    debug_data.confidence = _confidence(candidates)
     if debug:
         debug_data.candidates = candidates
         debug_data.labeled = Image.fromarray(
                 cv2.cvtColor(debug_data.labeled, cv2.COLOR_BGRA2RGBA)
         )
-        return candidates[0].scale, debug_data
-    return candidates[0].scale
+    return scale, debug_data
+
+
+def find_grid(PIL_image: Image.Image, debug=False, prioritize_alignment=False, workers: int = None,
+              cache=True, budget_ms: float = None, memory_limit: int = None, engine='contour') \
+        -> Union[Grid, tuple[Grid, DebugData]]:
+    """
+    finds the pixel grid of a scaled up pixel art: the scale of each axis and
+    where the first whole pixel starts in the image. Pixels don't have to be
+    square or start at the edge of the image.
+    
+    The color runs of a lossless upscale give the grid of each axis exactly.
+    Otherwise the period of the edges of each axis is read from the 1-D
+    projection of its edges, to a fraction of a pixel, and where the grid
+    starts from the phase of the edges. The projections are worked out a band
+    of rows at a time. Only if neither axis has a period is find_scale run,
+    with the rest of the arguments, for a grid of square pixels.
+    
+    With debug, the debug data is that of find_scale if it was run, or else
+    holds the image with the grid drawn on it as labeled
+    
+    :raises: NoScaleFound, or ScaleBudgetExceeded if find_scale is run and
+        the budget runs out before there is any candidate
+    """
+    color_img, bbox = _crop(PIL_image)
+    grid = _exact_grid(color_img) or _projected_grid(color_img)
+    if grid is None:
+        scale, debug_data = _find_scale(color_img, debug, prioritize_alignment, workers, cache, budget_ms,
+                                        memory_limit, engine)
+        grid = Grid(scale, scale, *debug_data.offset)
+    else:
+        debug_data = DebugData()
+        debug_data.offset = (grid.offset_x, grid.offset_y)
+        if debug:
+            debug_data.labeled = _draw_grid(color_img, grid)
+    grid = Grid(grid.scale_x, grid.scale_y, bbox[0] + grid.offset_x, bbox[1] + grid.offset_y)
+    return (grid, debug_data) if debug else grid
 
 
-__all__ = ['find_scale', 'DebugData']
+__all__ = ['SCALE_WORKERS', 'SCALE_REVISION', 'SCALE_MEMORY_LIMIT', 'ENGINES', 'find_scale', 'find_grid',
+           'exact_scale', 'Grid', 'DebugData', 'NoScaleFound', 'ScaleBudgetExceeded']
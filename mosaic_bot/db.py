@@ -4,15 +4,17 @@ from functools import lru_cache
 from typing import Optional
 
 import PIL.Image
-from sqlalchemy import Column, String, Integer, create_engine, DateTime, ForeignKey, or_
+from sqlalchemy import Column, String, Integer, create_engine, DateTime, ForeignKey, event, or_
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import object_session, sessionmaker
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.types import TypeDecorator
 
 from mosaic_bot import DATA_PATH
 from mosaic_bot.hash import compute_image_path_from_hash, diff_hash
 from mosaic_bot.hash import hash_image
+from mosaic_bot.render import (delete_render_artifacts, gen_render_artifacts, save_emoji_preview,
+                               save_render_artifacts)
 
 Base = declarative_base()
 
@@ -101,6 +103,45 @@ User.metadata.create_all(engine)
 Response.metadata.create_all(engine)
 
 
+image_listeners = []
+
+
+def on_image_changed(callback):
+    """
+    registers callback(hash) to be called whenever the deletion or
+    replacement of an image in the images table is committed. can be used
+    as a decorator
+    """
+    image_listeners.append(callback)
+    return callback
+
+
+@event.listens_for(Image, 'after_delete')
+@event.listens_for(Image, 'after_update')
+def _image_changed(mapper, connection, target: Image):
+    # this is inside the flush, the change is only acted on once it is
+    # committed so that a rolled back one keeps the render artifacts
+    object_session(target).info.setdefault('changed_images', set()).add(target.hash)
+
+
+@event.listens_for(Session, 'after_commit')
+def _images_committed(session):
+    changed = session.info.pop('changed_images', ())
+    if not changed:
+        return
+    get_image_path.cache_clear()
+    get_image_hash.cache_clear()
+    for hash in changed:
+        delete_render_artifacts(hash)
+        for callback in image_listeners:
+            callback(hash)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _images_rolled_back(session):
+    session.info.pop('changed_images', None)
+
+
 def check_hash_conflict(hash: int, min_allowed_diff = 6, s: Session = None):
     if s is None:
         s = Session()
@@ -118,6 +159,11 @@ def add_image(img: PIL.Image.Image, name: str, min_allowed_diff: int = 6, time_u
         raise ImageExists(f'Hash of {name} is in conflict with {conflict.name}: {conflict.hash}.')
     s.add(Image(name = name, hash = hash, width = img.width, height = img.height, time_uploaded = time_uploaded))
     s.commit()
+    # precompute everything |show needs so that it doesn't have to render the image,
+    # and the preview the gallery shows
+    artifacts = gen_render_artifacts(img)
+    save_render_artifacts(hash, artifacts)
+    save_emoji_preview(hash, artifacts.codes)
 
 
 def response_deleted(request: int):
@@ -212,5 +258,6 @@ __all__ = [
     'get_image_path',
     'get_image_hash',
     'get_request',
-    'ImageExists'
+    'ImageExists',
+    'on_image_changed'
 ]
@@ -0,0 +1,74 @@
+"""
+Dithering toward the emoji palette.
+
+Both functions take an HxWx3 array of colors and a quantizer, which maps an
+Nx3 uint8 array of colors to the N codes of their nearest emojis, and
+return the HxW code array of the dithered image.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+Quantizer = Callable[[np.ndarray], np.ndarray]
+
+BAYER_4X4 = np.array([[0, 8, 2, 10],
+                      [12, 4, 14, 6],
+                      [3, 11, 1, 9],
+                      [15, 7, 13, 5]])
+
+
+def _to_uint8(arr: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(arr), 0, 255).astype(np.uint8)
+
+
+def floyd_steinberg(rgb: np.ndarray, quantize: Quantizer, palette: np.ndarray,
+                    mask: np.ndarray = None) -> np.ndarray:
+    """
+    Floyd-Steinberg error diffusion. palette is the Kx3 array of the colors of
+    the codes returned by quantize. Pixels where mask is False neither receive
+    nor spread any error.
+
+    A pixel only depends on its left, upper left, upper and upper right
+    neighbors, so all pixels on the same line x + 2y = t can be quantized at
+    once, giving w + 2h vectorized steps instead of w * h scalar ones
+    """
+    h, w = rgb.shape[:2]
+    if mask is None:
+        mask = np.ones((h, w), dtype = bool)
+    steps = w + 2 * (h - 1)
+    y, x = np.indices((h, w))
+    # skewed copies indexed by [x + 2y, y], so that each line and the
+    # neighbors its error goes to are all contiguous slices. the extra
+    # cells receive the errors pushed outside and are never read
+    skewed = np.zeros((steps + 3, h + 1, 3))
+    skewed[x + 2 * y, y] = rgb
+    skewed_mask = np.zeros((steps, h, 1))
+    skewed_mask[x + 2 * y, y, 0] = mask
+    skewed_codes = np.zeros((steps, h), dtype = np.int16)
+    for t in range(steps):
+        start = max(0, (t - w + 2) // 2)
+        end = min(h - 1, t // 2) + 1
+        values = skewed[t, start:end]
+        c = quantize(_to_uint8(values))
+        skewed_codes[t, start:end] = c
+        err = (values - palette[c]) * skewed_mask[t, start:end]
+        skewed[t + 1, start:end] += err * (7 / 16)  # right
+        skewed[t + 1, start + 1:end + 1] += err * (3 / 16)  # below left
+        skewed[t + 2, start + 1:end + 1] += err * (5 / 16)  # below
+        skewed[t + 3, start + 1:end + 1] += err * (1 / 16)  # below right
+    return skewed_codes[x + 2 * y, y]
+
+
+def ordered(rgb: np.ndarray, quantize: Quantizer, spread: float) -> np.ndarray:
+    """
+    ordered dithering with a 4x4 Bayer matrix. spread is the distance
+    between neighboring colors of the palette in each channel
+    """
+    h, w = rgb.shape[:2]
+    threshold = (BAYER_4X4 + 0.5) / 16 - 0.5
+    offset = np.tile(threshold, (h // 4 + 1, w // 4 + 1))[:h, :w, None] * spread
+    return quantize(_to_uint8(rgb + offset).reshape(-1, 3)).reshape(h, w)
+
+
+__all__ = ['floyd_steinberg', 'ordered']
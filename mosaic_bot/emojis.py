@@ -1,4103 +1,33 @@
-from mosaic_bot.color import Color
+import pathlib
+from functools import lru_cache
 
-EMOJIS = {
-        Color(0, 0, 0):         "<:000:764291621311217664>",
-        Color(0, 0, 17):        "<:001:764291621217894441>",
-        Color(0, 0, 34):        "<:002:764291621314756638>",
-        Color(0, 0, 51):        "<:003:764291621197709333>",
-        Color(0, 0, 68):        "<:004:764291621143052309>",
-        Color(0, 0, 85):        "<:005:764291621285527582>",
-        Color(0, 0, 102):       "<:006:764291621340184587>",
-        Color(0, 0, 119):       "<:007:764291620962959390>",
-        Color(0, 0, 136):       "<:008:764291620963090472>",
-        Color(0, 0, 153):       "<:009:764291620916559973>",
-        Color(0, 0, 170):       "<:00a:764291620568694815>",
-        Color(0, 0, 187):       "<:00b:764291620978819082>",
-        Color(0, 0, 204):       "<:00c:764291620698456065>",
-        Color(0, 0, 221):       "<:00d:764291621071880202>",
-        Color(0, 0, 238):       "<:00e:764291620556242965>",
-        Color(0, 0, 255):       "<:00f:764291620580491295>",
-        Color(0, 17, 0):        "<:010:764291621088657438>",
-        Color(0, 17, 17):       "<:011:764291620916559923>",
-        Color(0, 17, 34):       "<:012:764291620543004673>",
-        Color(0, 17, 51):       "<:013:764291620904239154>",
-        Color(0, 17, 68):       "<:014:764291620786012212>",
-        Color(0, 17, 85):       "<:015:764291620882350090>",
-        Color(0, 17, 102):      "<:016:764291620849844264>",
-        Color(0, 17, 119):      "<:017:764291620484939778>",
-        Color(0, 17, 136):      "<:018:764291620483891223>",
-        Color(0, 17, 153):      "<:019:764291620882874398>",
-        Color(0, 17, 170):      "<:01a:764291620811833384>",
-        Color(0, 17, 187):      "<:01b:764291620778409985>",
-        Color(0, 17, 204):      "<:01c:764291620899651625>",
-        Color(0, 17, 221):      "<:01d:764291620660838400>",
-        Color(0, 17, 238):      "<:01e:764291620773691412>",
-        Color(0, 17, 255):      "<:01f:764291620408655873>",
-        Color(0, 34, 0):        "<:020:764291620547067945>",
-        Color(0, 34, 17):       "<:021:764291620421107733>",
-        Color(0, 34, 34):       "<:022:764291620790861834>",
-        Color(0, 34, 51):       "<:023:764291620647731211>",
-        Color(0, 34, 68):       "<:024:764291620757307393>",
-        Color(0, 34, 85):       "<:025:764291620584554547>",
-        Color(0, 34, 102):      "<:026:764291620710383636>",
-        Color(0, 34, 119):      "<:027:764291620475633665>",
-        Color(0, 34, 136):      "<:028:764291620400398347>",
-        Color(0, 34, 153):      "<:029:764291620392665118>",
-        Color(0, 34, 170):      "<:02a:764291620128423938>",
-        Color(0, 34, 187):      "<:02b:764291620614045756>",
-        Color(0, 34, 204):      "<:02c:764291620061315084>",
-        Color(0, 34, 221):      "<:02d:764291619977297962>",
-        Color(0, 34, 238):      "<:02e:764291620320706580>",
-        Color(0, 34, 255):      "<:02f:764291620304453682>",
-        Color(0, 51, 0):        "<:030:764291620236558416>",
-        Color(0, 51, 17):       "<:031:764291620291084339>",
-        Color(0, 51, 34):       "<:032:764291812205658113>",
-        Color(0, 51, 51):       "<:033:764291812663492619>",
-        Color(0, 51, 68):       "<:034:764291812856692787>",
-        Color(0, 51, 85):       "<:035:764291812621680661>",
-        Color(0, 51, 102):      "<:036:764291812852105216>",
-        Color(0, 51, 119):      "<:037:764291812629938256>",
-        Color(0, 51, 136):      "<:038:764291813406146601>",
-        Color(0, 51, 153):      "<:039:764291812868227082>",
-        Color(0, 51, 170):      "<:03a:764291812860493834>",
-        Color(0, 51, 187):      "<:03b:764291812599922721>",
-        Color(0, 51, 204):      "<:03c:764291812785258497>",
-        Color(0, 51, 221):      "<:03d:764291812822483005>",
-        Color(0, 51, 238):      "<:03e:764291812801380372>",
-        Color(0, 51, 255):      "<:03f:764291812763762699>",
-        Color(0, 68, 0):        "<:040:764291812751048724>",
-        Color(0, 68, 17):       "<:041:764291812797055017>",
-        Color(0, 68, 34):       "<:042:764291812721557534>",
-        Color(0, 68, 51):       "<:043:764291812818944000>",
-        Color(0, 68, 68):       "<:044:764291812742922260>",
-        Color(0, 68, 85):       "<:045:764291812780671013>",
-        Color(0, 68, 102):      "<:046:764291812557979685>",
-        Color(0, 68, 119):      "<:047:764291813233393666>",
-        Color(0, 68, 136):      "<:048:764291812776738836>",
-        Color(0, 68, 153):      "<:049:764291812546052158>",
-        Color(0, 68, 170):      "<:04a:764291812771889172>",
-        Color(0, 68, 187):      "<:04b:764291812654579723>",
-        Color(0, 68, 204):      "<:04c:764291812792991754>",
-        Color(0, 68, 221):      "<:04d:764291812495720449>",
-        Color(0, 68, 238):      "<:04e:764291812709105674>",
-        Color(0, 68, 255):      "<:04f:764291812637802516>",
-        Color(0, 85, 0):        "<:050:764291812608704542>",
-        Color(0, 85, 17):       "<:051:764291812810031144>",
-        Color(0, 85, 34):       "<:052:764291812630069258>",
-        Color(0, 85, 51):       "<:053:764291812587733004>",
-        Color(0, 85, 68):       "<:054:764291812709236737>",
-        Color(0, 85, 85):       "<:055:764291812428873749>",
-        Color(0, 85, 102):      "<:056:764291812608573490>",
-        Color(0, 85, 119):      "<:057:764291812545527809>",
-        Color(0, 85, 136):      "<:058:764291812629151754>",
-        Color(0, 85, 153):      "<:059:764291812672012308>",
-        Color(0, 85, 170):      "<:05a:764291812273029141>",
-        Color(0, 85, 187):      "<:05b:764291812600315935>",
-        Color(0, 85, 204):      "<:05c:764291812525080586>",
-        Color(0, 85, 221):      "<:05d:764291812541857812>",
-        Color(0, 85, 238):      "<:05e:764291812482351126>",
-        Color(0, 85, 255):      "<:05f:764291812499521546>",
-        Color(0, 102, 0):       "<:060:764291812466360340>",
-        Color(0, 102, 17):      "<:061:764291812440932415>",
-        Color(0, 102, 34):      "<:062:764291812503453706>",
-        Color(0, 102, 51):      "<:063:764291812533207100>",
-        Color(0, 102, 68):      "<:064:764028718733590569>",
-        Color(0, 102, 85):      "<:065:764028722520915969>",
-        Color(0, 102, 102):     "<:066:764028725926297610>",
-        Color(0, 102, 119):     "<:067:764028729188941848>",
-        Color(0, 102, 136):     "<:068:764028732410167296>",
-        Color(0, 102, 153):     "<:069:764028736106397726>",
-        Color(0, 102, 170):     "<:06a:764028738794422324>",
-        Color(0, 102, 187):     "<:06b:764028742774292480>",
-        Color(0, 102, 204):     "<:06c:764028745304244285>",
-        Color(0, 102, 221):     "<:06d:764028748038144052>",
-        Color(0, 102, 238):     "<:06e:764028751565946896>",
-        Color(0, 102, 255):     "<:06f:764028754317148161>",
-        Color(0, 119, 0):       "<:070:764028759107043328>",
-        Color(0, 119, 17):      "<:071:764028763867447336>",
-        Color(0, 119, 34):      "<:072:764028768103825428>",
-        Color(0, 119, 51):      "<:073:764028771203678219>",
-        Color(0, 119, 68):      "<:074:764028774139428875>",
-        Color(0, 119, 85):      "<:075:764028778028204042>",
-        Color(0, 119, 102):     "<:076:764028780863553556>",
-        Color(0, 119, 119):     "<:077:764028784587309066>",
-        Color(0, 119, 136):     "<:078:764028787276513291>",
-        Color(0, 119, 153):     "<:079:764028790959243286>",
-        Color(0, 119, 170):     "<:07a:764028793945456651>",
-        Color(0, 119, 187):     "<:07b:764028797687169034>",
-        Color(0, 119, 204):     "<:07c:764028800504954900>",
-        Color(0, 119, 221):     "<:07d:764028803315007500>",
-        Color(0, 119, 238):     "<:07e:764028806587088907>",
-        Color(0, 119, 255):     "<:07f:764028809451274240>",
-        Color(0, 136, 0):       "<:080:764028813175947284>",
-        Color(0, 136, 17):      "<:081:764028816007888946>",
-        Color(0, 136, 34):      "<:082:764028819748814868>",
-        Color(0, 136, 51):      "<:083:764028822441295873>",
-        Color(0, 136, 68):      "<:084:764028826694057984>",
-        Color(0, 136, 85):      "<:085:764028829408034823>",
-        Color(0, 136, 102):     "<:086:764028833002684476>",
-        Color(0, 136, 119):     "<:087:764028836010262538>",
-        Color(0, 136, 136):     "<:088:764028839512768523>",
-        Color(0, 136, 153):     "<:089:764028842549313547>",
-        Color(0, 136, 170):     "<:08a:764028845879328769>",
-        Color(0, 136, 187):     "<:08b:764028849053892638>",
-        Color(0, 136, 204):     "<:08c:764028852624031755>",
-        Color(0, 136, 221):     "<:08d:764028855303536641>",
-        Color(0, 136, 238):     "<:08e:764028859334918155>",
-        Color(0, 136, 255):     "<:08f:764028861931323414>",
-        Color(0, 153, 0):       "<:090:764028865697284097>",
-        Color(0, 153, 17):      "<:091:764028868959928331>",
-        Color(0, 153, 34):      "<:092:764028872089272351>",
-        Color(0, 153, 51):      "<:093:764028875348115488>",
-        Color(0, 153, 68):      "<:094:764028879161131018>",
-        Color(0, 153, 85):      "<:095:764028881950474241>",
-        Color(0, 153, 102):     "<:096:764028885750644756>",
-        Color(0, 153, 119):     "<:097:764028888392138784>",
-        Color(0, 153, 136):     "<:098:764028892360081418>",
-        Color(0, 153, 153):     "<:099:764028894817812511>",
-        Color(0, 153, 170):     "<:09a:764028898693611532>",
-        Color(0, 153, 187):     "<:09b:764028901852446730>",
-        Color(0, 153, 204):     "<:09c:764028905623126016>",
-        Color(0, 153, 221):     "<:09d:764028908361613354>",
-        Color(0, 153, 238):     "<:09e:764028912031760424>",
-        Color(0, 153, 255):     "<:09f:764028915135152129>",
-        Color(0, 170, 0):       "<:0a0:764028918780264458>",
-        Color(0, 170, 17):      "<:0a1:764028921645367306>",
-        Color(0, 170, 34):      "<:0a2:764028925251944449>",
-        Color(0, 170, 51):      "<:0a3:764028928175243284>",
-        Color(0, 170, 68):      "<:0a4:764028931963224085>",
-        Color(0, 170, 85):      "<:0a5:764028934760300544>",
-        Color(0, 170, 102):     "<:0a6:764028938489692161>",
-        Color(0, 170, 119):     "<:0a7:764028941392281600>",
-        Color(0, 170, 136):     "<:0a8:764028945070030858>",
-        Color(0, 170, 153):     "<:0a9:764028947544932363>",
-        Color(0, 170, 170):     "<:0aa:764028951621271572>",
-        Color(0, 170, 187):     "<:0ab:764028954553483274>",
-        Color(0, 170, 204):     "<:0ac:764028958282088488>",
-        Color(0, 170, 221):     "<:0ad:764028961134608435>",
-        Color(0, 170, 238):     "<:0ae:764028964876320788>",
-        Color(0, 170, 255):     "<:0af:764028967794507806>",
-        Color(0, 187, 0):       "<:0b0:764028971503321098>",
-        Color(0, 187, 17):      "<:0b1:764028974438416384>",
-        Color(0, 187, 34):      "<:0b2:764028978083790848>",
-        Color(0, 187, 51):      "<:0b3:764028981082456064>",
-        Color(0, 187, 68):      "<:0b4:764028984337104897>",
-        Color(0, 187, 85):      "<:0b5:764028987034173473>",
-        Color(0, 187, 102):     "<:0b6:764028990272307220>",
-        Color(0, 187, 119):     "<:0b7:764028993309245441>",
-        Color(0, 187, 136):     "<:0b8:764028996132143106>",
-        Color(0, 187, 153):     "<:0b9:764028999662960661>",
-        Color(0, 187, 170):     "<:0ba:764029002532388875>",
-        Color(0, 187, 187):     "<:0bb:764029005770784778>",
-        Color(0, 187, 204):     "<:0bc:764029008685563945>",
-        Color(0, 187, 221):     "<:0bd:764029011687899136>",
-        Color(0, 187, 238):     "<:0be:764029015522279434>",
-        Color(0, 187, 255):     "<:0bf:764029018311360523>",
-        Color(0, 204, 0):       "<:0c0:764029022015324160>",
-        Color(0, 204, 17):      "<:0c1:764029024979779594>",
-        Color(0, 204, 34):      "<:0c2:764029028528422933>",
-        Color(0, 204, 51):      "<:0c3:764029031334150165>",
-        Color(0, 204, 68):      "<:0c4:764029035847614464>",
-        Color(0, 204, 85):      "<:0c5:764029038716518400>",
-        Color(0, 204, 102):     "<:0c6:764029041921097739>",
-        Color(0, 204, 119):     "<:0c7:764029044881752075>",
-        Color(0, 204, 136):     "<:0c8:764029048443633691>",
-        Color(0, 204, 153):     "<:0c9:764029051262205993>",
-        Color(0, 204, 170):     "<:0ca:764029055053332510>",
-        Color(0, 204, 187):     "<:0cb:764029057435697163>",
-        Color(0, 204, 204):     "<:0cc:764029061319229442>",
-        Color(0, 204, 221):     "<:0cd:764029064394047498>",
-        Color(0, 204, 238):     "<:0ce:764029067355750440>",
-        Color(0, 204, 255):     "<:0cf:764029070395834368>",
-        Color(0, 221, 0):       "<:0d0:764029073495293973>",
-        Color(0, 221, 17):      "<:0d1:764029076833828875>",
-        Color(0, 221, 34):      "<:0d2:764029079929356299>",
-        Color(0, 221, 51):      "<:0d3:764029083709210624>",
-        Color(0, 221, 68):      "<:0d4:764029086460411925>",
-        Color(0, 221, 85):      "<:0d5:764029090255601694>",
-        Color(0, 221, 102):     "<:0d6:764029093066178560>",
-        Color(0, 221, 119):     "<:0d7:764029096770404372>",
-        Color(0, 221, 136):     "<:0d8:764029099647565824>",
-        Color(0, 221, 153):     "<:0d9:764029103187034145>",
-        Color(0, 221, 170):     "<:0da:764029107604160553>",
-        Color(0, 221, 187):     "<:0db:764029110459564043>",
-        Color(0, 221, 204):     "<:0dc:764029114407059476>",
-        Color(0, 221, 221):     "<:0dd:764029117045014529>",
-        Color(0, 221, 238):     "<:0de:764029121239973919>",
-        Color(0, 221, 255):     "<:0df:764029123768483841>",
-        Color(0, 238, 0):       "<:0e0:764029127170588673>",
-        Color(0, 238, 17):      "<:0e1:764029130320248872>",
-        Color(0, 238, 34):      "<:0e2:764029133218775060>",
-        Color(0, 238, 51):      "<:0e3:764029136380624907>",
-        Color(0, 238, 68):      "<:0e4:764029139375095848>",
-        Color(0, 238, 85):      "<:0e5:764029143036854294>",
-        Color(0, 238, 102):     "<:0e6:764029146060816384>",
-        Color(0, 238, 119):     "<:0e7:764029149613522954>",
-        Color(0, 238, 136):     "<:0e8:764029152797917184>",
-        Color(0, 238, 153):     "<:0e9:764029156790239242>",
-        Color(0, 238, 170):     "<:0ea:764029160359591947>",
-        Color(0, 238, 187):     "<:0eb:764029163262443561>",
-        Color(0, 238, 204):     "<:0ec:764029167183593472>",
-        Color(0, 238, 221):     "<:0ed:764029170010292244>",
-        Color(0, 238, 238):     "<:0ee:764029173836152842>",
-        Color(0, 238, 255):     "<:0ef:764029176374099992>",
-        Color(0, 255, 0):       "<:0f0:764029180379136020>",
-        Color(0, 255, 17):      "<:0f1:764029183227592744>",
-        Color(0, 255, 34):      "<:0f2:764029186997485598>",
-        Color(0, 255, 51):      "<:0f3:764029189535039499>",
-        Color(0, 255, 68):      "<:0f4:764029193566158908>",
-        Color(0, 255, 85):      "<:0f5:764029196363759626>",
-        Color(0, 255, 102):     "<:0f6:764029200193552394>",
-        Color(0, 255, 119):     "<:0f7:764029202977914901>",
-        Color(0, 255, 136):     "<:0f8:764029205784166400>",
-        Color(0, 255, 153):     "<:0f9:764029208737349653>",
-        Color(0, 255, 170):     "<:0fa:764029211701805097>",
-        Color(0, 255, 187):     "<:0fb:764029215539462164>",
-        Color(0, 255, 204):     "<:0fc:764029218362359818>",
-        Color(0, 255, 221):     "<:0fd:764029221223661598>",
-        Color(0, 255, 238):     "<:0fe:764029224344223764>",
-        Color(0, 255, 255):     "<:0ff:764029227333844992>",
-        Color(17, 0, 0):        "<:100:764029230731624489>",
-        Color(17, 0, 17):       "<:101:764029233504059424>",
-        Color(17, 0, 34):       "<:102:764029237547237386>",
-        Color(17, 0, 51):       "<:103:764029240529780756>",
-        Color(17, 0, 68):       "<:104:764029244208185354>",
-        Color(17, 0, 85):       "<:105:764029247018500107>",
-        Color(17, 0, 102):      "<:106:764029250701099028>",
-        Color(17, 0, 119):      "<:107:764029253657559051>",
-        Color(17, 0, 136):      "<:108:764029257423912981>",
-        Color(17, 0, 153):      "<:109:764029259923718165>",
-        Color(17, 0, 170):      "<:10a:764029263913156618>",
-        Color(17, 0, 187):      "<:10b:764029266832654367>",
-        Color(17, 0, 204):      "<:10c:764029270396764171>",
-        Color(17, 0, 221):      "<:10d:764029273673433088>",
-        Color(17, 0, 238):      "<:10e:764029277322084382>",
-        Color(17, 0, 255):      "<:10f:764029280031997963>",
-        Color(17, 17, 0):       "<:110:764029283836231700>",
-        Color(17, 17, 17):      "<:111:764029286432505857>",
-        Color(17, 17, 34):      "<:112:764029290098327638>",
-        Color(17, 17, 51):      "<:113:764029293201588224>",
-        Color(17, 17, 68):      "<:114:764029296956014602>",
-        Color(17, 17, 85):      "<:115:764029299879444490>",
-        Color(17, 17, 102):     "<:116:764029303515643924>",
-        Color(17, 17, 119):     "<:117:764029306468827136>",
-        Color(17, 17, 136):     "<:118:764029309802905611>",
-        Color(17, 17, 153):     "<:119:764029313145765929>",
-        Color(17, 17, 170):     "<:11a:764029316937678870>",
-        Color(17, 17, 187):     "<:11b:764029321068544010>",
-        Color(17, 17, 204):     "<:11c:764029323962351637>",
-        Color(17, 17, 221):     "<:11d:764029327880355850>",
-        Color(17, 17, 238):     "<:11e:764029330874564618>",
-        Color(17, 17, 255):     "<:11f:764029334381133824>",
-        Color(17, 34, 0):       "<:120:764029337368133643>",
-        Color(17, 34, 17):      "<:121:764029340982706206>",
-        Color(17, 34, 34):      "<:122:764029344044548096>",
-        Color(17, 34, 51):      "<:123:764029347249782795>",
-        Color(17, 34, 68):      "<:124:764029350211092480>",
-        Color(17, 34, 85):      "<:125:764029353108832276>",
-        Color(17, 34, 102):     "<:126:764029356380127242>",
-        Color(17, 34, 119):     "<:127:764029358905360385>",
-        Color(17, 34, 136):     "<:128:764029362722570281>",
-        Color(17, 34, 153):     "<:129:764029366140272690>",
-        Color(17, 34, 170):     "<:12a:764029369508298762>",
-        Color(17, 34, 187):     "<:12b:764029372285321246>",
-        Color(17, 34, 204):     "<:12c:764029375720849409>",
-        Color(17, 34, 221):     "<:12d:764029379076161546>",
-        Color(17, 34, 238):     "<:12e:764029382427279382>",
-        Color(17, 34, 255):     "<:12f:764029385195651103>",
-        Color(17, 51, 0):       "<:130:764029389352337429>",
-        Color(17, 51, 17):      "<:131:764029392455335937>",
-        Color(17, 51, 34):      "<:132:764029396691451924>",
-        Color(17, 51, 51):      "<:133:764029401234931712>",
-        Color(17, 51, 68):      "<:134:764029405013213216>",
-        Color(17, 51, 85):      "<:135:764029409085751326>",
-        Color(17, 51, 102):     "<:136:764029412076290048>",
-        Color(17, 51, 119):     "<:137:764029415582728195>",
-        Color(17, 51, 136):     "<:138:764029418623729675>",
-        Color(17, 51, 153):     "<:139:764029422411841546>",
-        Color(17, 51, 170):     "<:13a:764029425209049108>",
-        Color(17, 51, 187):     "<:13b:764029428924809216>",
-        Color(17, 51, 204):     "<:13c:764029431844962305>",
-        Color(17, 51, 221):     "<:13d:764029435652472843>",
-        Color(17, 51, 238):     "<:13e:764029438996250634>",
-        Color(17, 51, 255):     "<:13f:764029442125201417>",
-        Color(17, 68, 0):       "<:140:764029445467930644>",
-        Color(17, 68, 17):      "<:141:764029448759934996>",
-        Color(17, 68, 34):      "<:142:764029451481776130>",
-        Color(17, 68, 51):      "<:143:764029455260712980>",
-        Color(17, 68, 68):      "<:144:764029458112970762>",
-        Color(17, 68, 85):      "<:145:764029461862547456>",
-        Color(17, 68, 102):     "<:146:764029464794366002>",
-        Color(17, 68, 119):     "<:147:764029468167241729>",
-        Color(17, 68, 136):     "<:148:764029471518490624>",
-        Color(17, 68, 153):     "<:149:764029475046293504>",
-        Color(17, 68, 170):     "<:14a:764029478191759370>",
-        Color(17, 68, 187):     "<:14b:764029482473357322>",
-        Color(17, 68, 204):     "<:14c:764029486941077544>",
-        Color(17, 68, 221):     "<:14d:764029491290701834>",
-        Color(17, 68, 238):     "<:14e:764029495405182987>",
-        Color(17, 68, 255):     "<:14f:764029499309817856>",
-        Color(17, 85, 0):       "<:150:764029502284103680>",
-        Color(17, 85, 17):      "<:151:764029505870233620>",
-        Color(17, 85, 34):      "<:152:764029508759453726>",
-        Color(17, 85, 51):      "<:153:764029512476262400>",
-        Color(17, 85, 68):      "<:154:764029515436523540>",
-        Color(17, 85, 85):      "<:155:764029519035236352>",
-        Color(17, 85, 102):     "<:156:764029522009260032>",
-        Color(17, 85, 119):     "<:157:764029525600239627>",
-        Color(17, 85, 136):     "<:158:764029528254447628>",
-        Color(17, 85, 153):     "<:159:764029532029976626>",
-        Color(17, 85, 170):     "<:15a:764029535292751882>",
-        Color(17, 85, 187):     "<:15b:764029538925150228>",
-        Color(17, 85, 204):     "<:15c:764029541806506024>",
-        Color(17, 85, 221):     "<:15d:764029544982118431>",
-        Color(17, 85, 238):     "<:15e:764029548177522688>",
-        Color(17, 85, 255):     "<:15f:764029551075786782>",
-        Color(17, 102, 0):      "<:160:764029554150342656>",
-        Color(17, 102, 17):     "<:161:764029556943749150>",
-        Color(17, 102, 34):     "<:162:764029561054298163>",
-        Color(17, 102, 51):     "<:163:764029564095430656>",
-        Color(17, 102, 68):     "<:164:764029567400411156>",
-        Color(17, 102, 85):     "<:165:764029570163933246>",
-        Color(17, 102, 102):    "<:166:764029573885067265>",
-        Color(17, 102, 119):    "<:167:764029576887271426>",
-        Color(17, 102, 136):    "<:168:764029580657950720>",
-        Color(17, 102, 153):    "<:169:764029583535505408>",
-        Color(17, 102, 170):    "<:16a:764029587248119808>",
-        Color(17, 102, 187):    "<:16b:764029589701525517>",
-        Color(17, 102, 204):    "<:16c:764029593757024276>",
-        Color(17, 102, 221):    "<:16d:764029596710338580>",
-        Color(17, 102, 238):    "<:16e:764029600119914498>",
-        Color(17, 102, 255):    "<:16f:764029603358048256>",
-        Color(17, 119, 0):      "<:170:764029606570491934>",
-        Color(17, 119, 17):     "<:171:764029609187475507>",
-        Color(17, 119, 34):     "<:172:764029612241977366>",
-        Color(17, 119, 51):     "<:173:764029615768993802>",
-        Color(17, 119, 68):     "<:174:764029618797412372>",
-        Color(17, 119, 85):     "<:175:764029622152331285>",
-        Color(17, 119, 102):    "<:176:764029625461374997>",
-        Color(17, 119, 119):    "<:177:764029629044359188>",
-        Color(17, 119, 136):    "<:178:764029631849955369>",
-        Color(17, 119, 153):    "<:179:764029635750264842>",
-        Color(17, 119, 170):    "<:17a:764029638522830868>",
-        Color(17, 119, 187):    "<:17b:764029641928605707>",
-        Color(17, 119, 204):    "<:17c:764029645044580382>",
-        Color(17, 119, 221):    "<:17d:764029648899276811>",
-        Color(17, 119, 238):    "<:17e:764029651751796757>",
-        Color(17, 119, 255):    "<:17f:764029655421419540>",
-        Color(17, 136, 0):      "<:180:764029658018086913>",
-        Color(17, 136, 17):     "<:181:764029662258266122>",
-        Color(17, 136, 34):     "<:182:764029664980369449>",
-        Color(17, 136, 51):     "<:183:764029668541595708>",
-        Color(17, 136, 68):     "<:184:764029671632797706>",
-        Color(17, 136, 85):     "<:185:764029675180654599>",
-        Color(17, 136, 102):    "<:186:764029678129381386>",
-        Color(17, 136, 119):    "<:187:764029681715904512>",
-        Color(17, 136, 136):    "<:188:764029684832796703>",
-        Color(17, 136, 153):    "<:189:764029688360075284>",
-        Color(17, 136, 170):    "<:18a:764029691333574656>",
-        Color(17, 136, 187):    "<:18b:764029694911447050>",
-        Color(17, 136, 204):    "<:18c:764029697436549144>",
-        Color(17, 136, 221):    "<:18d:764029700586471434>",
-        Color(17, 136, 238):    "<:18e:764029703442006027>",
-        Color(17, 136, 255):    "<:18f:764029706617356308>",
-        Color(17, 153, 0):      "<:190:764029710459863040>",
-        Color(17, 153, 17):     "<:191:764029712850354207>",
-        Color(17, 153, 34):     "<:192:764029717169831936>",
-        Color(17, 153, 51):     "<:193:764029720186060830>",
-        Color(17, 153, 68):     "<:194:764029723599699968>",
-        Color(17, 153, 85):     "<:195:764029725969481749>",
-        Color(17, 153, 102):    "<:196:764029730172174366>",
-        Color(17, 153, 119):    "<:197:764029733209243658>",
-        Color(17, 153, 136):    "<:198:764029736799305758>",
-        Color(17, 153, 153):    "<:199:764029739723128843>",
-        Color(17, 153, 170):    "<:19a:764029742977384464>",
-        Color(17, 153, 187):    "<:19b:764029745994137622>",
-        Color(17, 153, 204):    "<:19c:764029749936652298>",
-        Color(17, 153, 221):    "<:19d:764029752486002689>",
-        Color(17, 153, 238):    "<:19e:764029756474654770>",
-        Color(17, 153, 255):    "<:19f:764029759272779776>",
-        Color(17, 170, 0):      "<:1a0:764029763002040331>",
-        Color(17, 170, 17):     "<:1a1:764029766365216778>",
-        Color(17, 170, 34):     "<:1a2:764029769666789396>",
-        Color(17, 170, 51):     "<:1a3:764029772433981441>",
-        Color(17, 170, 68):     "<:1a4:764029776301391882>",
-        Color(17, 170, 85):     "<:1a5:764029779061506089>",
-        Color(17, 170, 102):    "<:1a6:764029781984673803>",
-        Color(17, 170, 119):    "<:1a7:764029785475121152>",
-        Color(17, 170, 136):    "<:1a8:764029788704735232>",
-        Color(17, 170, 153):    "<:1a9:764029791665258557>",
-        Color(17, 170, 170):    "<:1aa:764029794442018846>",
-        Color(17, 170, 187):    "<:1ab:764029797306204181>",
-        Color(17, 170, 204):    "<:1ac:764029800552726538>",
-        Color(17, 170, 221):    "<:1ad:764029803510497320>",
-        Color(17, 170, 238):    "<:1ae:764029807046426635>",
-        Color(17, 170, 255):    "<:1af:764029810200281108>",
-        Color(17, 187, 0):      "<:1b0:764029813744074822>",
-        Color(17, 187, 17):     "<:1b1:764029816931614730>",
-        Color(17, 187, 34):     "<:1b2:764029820014428173>",
-        Color(17, 187, 51):     "<:1b3:764029823277465601>",
-        Color(17, 187, 68):     "<:1b4:764029826939879434>",
-        Color(17, 187, 85):     "<:1b5:764029829896732682>",
-        Color(17, 187, 102):    "<:1b6:764029833750642698>",
-        Color(17, 187, 119):    "<:1b7:764029836548636683>",
-        Color(17, 187, 136):    "<:1b8:764029839651897346>",
-        Color(17, 187, 153):    "<:1b9:764029843025035265>",
-        Color(17, 187, 170):    "<:1ba:764029846489006101>",
-        Color(17, 187, 187):    "<:1bb:764029849907757076>",
-        Color(17, 187, 204):    "<:1bc:764029852893315094>",
-        Color(17, 187, 221):    "<:1bd:764029856257277963>",
-        Color(17, 187, 238):    "<:1be:764029859936206848>",
-        Color(17, 187, 255):    "<:1bf:764029862595526667>",
-        Color(17, 204, 0):      "<:1c0:764029866466869268>",
-        Color(17, 204, 17):     "<:1c1:764029869243629588>",
-        Color(17, 204, 34):     "<:1c2:764029872179642384>",
-        Color(17, 204, 51):     "<:1c3:764029874934775840>",
-        Color(17, 204, 68):     "<:1c4:764029878236217364>",
-        Color(17, 204, 85):     "<:1c5:764029881524551692>",
-        Color(17, 204, 102):    "<:1c6:764029884652584961>",
-        Color(17, 204, 119):    "<:1c7:764029888495222784>",
-        Color(17, 204, 136):    "<:1c8:764029891397156895>",
-        Color(17, 204, 153):    "<:1c9:764029894853132299>",
-        Color(17, 204, 170):    "<:1ca:764029898263363595>",
-        Color(17, 204, 187):    "<:1cb:764029901387857951>",
-        Color(17, 204, 204):    "<:1cc:764029904677240852>",
-        Color(17, 204, 221):    "<:1cd:764029908002275340>",
-        Color(17, 204, 238):    "<:1ce:764029910833954818>",
-        Color(17, 204, 255):    "<:1cf:764029914885521419>",
-        Color(17, 221, 0):      "<:1d0:764029917792043018>",
-        Color(17, 221, 17):     "<:1d1:764029921500594226>",
-        Color(17, 221, 34):     "<:1d2:764029924058333206>",
-        Color(17, 221, 51):     "<:1d3:764029928038858762>",
-        Color(17, 221, 68):     "<:1d4:764029930907893760>",
-        Color(17, 221, 85):     "<:1d5:764029934716846080>",
-        Color(17, 221, 102):    "<:1d6:764029937610129418>",
-        Color(17, 221, 119):    "<:1d7:764029941305966602>",
-        Color(17, 221, 136):    "<:1d8:764029944241061898>",
-        Color(17, 221, 153):    "<:1d9:764029947638710273>",
-        Color(17, 221, 170):    "<:1da:764029951053004820>",
-        Color(17, 221, 187):    "<:1db:764029954140667905>",
-        Color(17, 221, 204):    "<:1dc:764029957411700766>",
-        Color(17, 221, 221):    "<:1dd:764029960717074454>",
-        Color(17, 221, 238):    "<:1de:764029963833573376>",
-        Color(17, 221, 255):    "<:1df:764029966694219776>",
-        Color(17, 238, 0):      "<:1e0:764029969901813760>",
-        Color(17, 238, 17):     "<:1e1:764029973018312714>",
-        Color(17, 238, 34):     "<:1e2:764029976181473281>",
-        Color(17, 238, 51):     "<:1e3:764029979154972682>",
-        Color(17, 238, 68):     "<:1e4:764029983248744448>",
-        Color(17, 238, 85):     "<:1e5:764029985929297921>",
-        Color(17, 238, 102):    "<:1e6:764029989573492786>",
-        Color(17, 238, 119):    "<:1e7:764029992110915605>",
-        Color(17, 238, 136):    "<:1e8:764029996247285780>",
-        Color(17, 238, 153):    "<:1e9:764029999107538964>",
-        Color(17, 238, 170):    "<:1ea:764030002450006057>",
-        Color(17, 238, 187):    "<:1eb:764030005713043466>",
-        Color(17, 238, 204):    "<:1ec:764030009538248715>",
-        Color(17, 238, 221):    "<:1ed:764030012483305472>",
-        Color(17, 238, 238):    "<:1ee:764030015917785119>",
-        Color(17, 238, 255):    "<:1ef:764030026928226304>",
-        Color(17, 255, 0):      "<:1f0:764030051091087360>",
-        Color(17, 255, 17):     "<:1f1:764030053821710349>",
-        Color(17, 255, 34):     "<:1f2:764030057920069653>",
-        Color(17, 255, 51):     "<:1f3:764030060708888586>",
-        Color(17, 255, 68):     "<:1f4:764030064400269332>",
-        Color(17, 255, 85):     "<:1f5:764030067402735616>",
-        Color(17, 255, 102):    "<:1f6:764030071056498688>",
-        Color(17, 255, 119):    "<:1f7:764030073496928287>",
-        Color(17, 255, 136):    "<:1f8:764030077641818152>",
-        Color(17, 255, 153):    "<:1f9:764030080849805312>",
-        Color(17, 255, 170):    "<:1fa:764030084490592266>",
-        Color(17, 255, 187):    "<:1fb:764030087158562818>",
-        Color(17, 255, 204):    "<:1fc:764030090874322944>",
-        Color(17, 255, 221):    "<:1fd:764030093781631016>",
-        Color(17, 255, 238):    "<:1fe:764030097245208597>",
-        Color(17, 255, 255):    "<:1ff:764030100492255242>",
-        Color(34, 0, 0):        "<:200:764030104392826910>",
-        Color(34, 0, 17):       "<:201:764030107546943528>",
-        Color(34, 0, 34):       "<:202:764030110688870420>",
-        Color(34, 0, 51):       "<:203:764030113834598410>",
-        Color(34, 0, 68):       "<:204:764030117155438602>",
-        Color(34, 0, 85):       "<:205:764030119848706059>",
-        Color(34, 0, 102):      "<:206:764030123803541504>",
-        Color(34, 0, 119):      "<:207:764030126497202207>",
-        Color(34, 0, 136):      "<:208:764030130573279232>",
-        Color(34, 0, 153):      "<:209:764030133517418516>",
-        Color(34, 0, 170):      "<:20a:764030137066323998>",
-        Color(34, 0, 187):      "<:20b:764030140085829662>",
-        Color(34, 0, 204):      "<:20c:764030143302991903>",
-        Color(34, 0, 221):      "<:20d:764030146490662932>",
-        Color(34, 0, 238):      "<:20e:764030150190825512>",
-        Color(34, 0, 255):      "<:20f:764030153385836564>",
-        Color(34, 17, 0):       "<:210:764030157039337472>",
-        Color(34, 17, 17):      "<:211:764030160227139584>",
-        Color(34, 17, 34):      "<:212:764030163406553108>",
-        Color(34, 17, 51):      "<:213:764030166002434069>",
-        Color(34, 17, 68):      "<:214:764030169575981067>",
-        Color(34, 17, 85):      "<:215:764030172805988353>",
-        Color(34, 17, 102):     "<:216:764030176782712842>",
-        Color(34, 17, 119):     "<:217:764030179713744916>",
-        Color(34, 17, 136):     "<:218:764030182973243404>",
-        Color(34, 17, 153):     "<:219:764030186127360013>",
-        Color(34, 17, 170):     "<:21a:764030189763952640>",
-        Color(34, 17, 187):     "<:21b:764030192628662292>",
-        Color(34, 17, 204):     "<:21c:764030196436303872>",
-        Color(34, 17, 221):     "<:21d:764030200022827008>",
-        Color(34, 17, 238):     "<:21e:764030203315748864>",
-        Color(34, 17, 255):     "<:21f:764030206217682974>",
-        Color(34, 34, 0):       "<:220:764030209485045760>",
-        Color(34, 34, 17):      "<:221:764030212366532648>",
-        Color(34, 34, 34):      "<:222:764030216271429652>",
-        Color(34, 34, 51):      "<:223:764030219051991040>",
-        Color(34, 34, 68):      "<:224:764030222760411156>",
-        Color(34, 34, 85):      "<:225:764030225490116619>",
-        Color(34, 34, 102):     "<:226:764030229379022858>",
-        Color(34, 34, 119):     "<:227:764030232234688532>",
-        Color(34, 34, 136):     "<:228:764030236127657984>",
-        Color(34, 34, 153):     "<:229:764030239297765386>",
-        Color(34, 34, 170):     "<:22a:764030242531704862>",
-        Color(34, 34, 187):     "<:22b:764030245468372992>",
-        Color(34, 34, 204):     "<:22c:764030249091858442>",
-        Color(34, 34, 221):     "<:22d:764030251612241962>",
-        Color(34, 34, 238):     "<:22e:764030255483846668>",
-        Color(34, 34, 255):     "<:22f:764030258319065089>",
-        Color(34, 51, 0):       "<:230:764030262446784522>",
-        Color(34, 51, 17):      "<:231:764030265567477790>",
-        Color(34, 51, 34):      "<:232:764030268968271892>",
-        Color(34, 51, 51):      "<:233:764030271443435561>",
-        Color(34, 51, 68):      "<:234:764030275470098442>",
-        Color(34, 51, 85):      "<:235:764030278175162389>",
-        Color(34, 51, 102):     "<:236:764030282147168276>",
-        Color(34, 51, 119):     "<:237:764030285070467112>",
-        Color(34, 51, 136):     "<:238:764030288539025449>",
-        Color(34, 51, 153):     "<:239:764030291488145408>",
-        Color(34, 51, 170):     "<:23a:764030294084681739>",
-        Color(34, 51, 187):     "<:23b:764030297586139156>",
-        Color(34, 51, 204):     "<:23c:764030300077424661>",
-        Color(34, 51, 221):     "<:23d:764030304155336724>",
-        Color(34, 51, 238):     "<:23e:764030306847686657>",
-        Color(34, 51, 255):     "<:23f:764030310702383104>",
-        Color(34, 68, 0):       "<:240:764030313474424843>",
-        Color(34, 68, 17):      "<:241:764030317207879701>",
-        Color(34, 68, 34):      "<:242:764030320428449842>",
-        Color(34, 68, 51):      "<:243:764030323939737610>",
-        Color(34, 68, 68):      "<:244:764030327127277568>",
-        Color(34, 68, 85):      "<:245:764030330477740074>",
-        Color(34, 68, 102):     "<:246:764030333858742313>",
-        Color(34, 68, 119):     "<:247:764030353739612211>",
-        Color(34, 68, 136):     "<:248:764030359880466442>",
-        Color(34, 68, 153):     "<:249:764030363349286934>",
-        Color(34, 68, 170):     "<:24a:764030366549540864>",
-        Color(34, 68, 187):     "<:24b:764030369883226134>",
-        Color(34, 68, 204):     "<:24c:764030372987404399>",
-        Color(34, 68, 221):     "<:24d:764030376628191232>",
-        Color(34, 68, 238):     "<:24e:764030379429593098>",
-        Color(34, 68, 255):     "<:24f:764030383271706655>",
-        Color(34, 85, 0):       "<:250:764030386485198858>",
-        Color(34, 85, 17):      "<:251:764030390197026836>",
-        Color(34, 85, 34):      "<:252:764030394286604289>",
-        Color(34, 85, 51):      "<:253:764030397113040916>",
-        Color(34, 85, 68):      "<:254:764030401379303434>",
-        Color(34, 85, 85):      "<:255:764030405480677386>",
-        Color(34, 85, 102):     "<:256:764030408241184829>",
-        Color(34, 85, 119):     "<:257:764030411839635467>",
-        Color(34, 85, 136):     "<:258:764030414632779797>",
-        Color(34, 85, 153):     "<:259:764030418537545728>",
-        Color(34, 85, 170):     "<:25a:764030421184544790>",
-        Color(34, 85, 187):     "<:25b:764030425148424213>",
-        Color(34, 85, 204):     "<:25c:764030427841167391>",
-        Color(34, 85, 221):     "<:25d:764030431653658654>",
-        Color(34, 85, 238):     "<:25e:764030434493202482>",
-        Color(34, 85, 255):     "<:25f:764030438196903976>",
-        Color(34, 102, 0):      "<:260:764030440901836821>",
-        Color(34, 102, 17):     "<:261:764030444865585172>",
-        Color(34, 102, 34):     "<:262:764030447888891904>",
-        Color(34, 102, 51):     "<:263:764030451395461141>",
-        Color(34, 102, 68):     "<:264:764030453920825367>",
-        Color(34, 102, 85):     "<:265:764030456844648449>",
-        Color(34, 102, 102):    "<:266:764030460212805652>",
-        Color(34, 102, 119):    "<:267:764030462683250699>",
-        Color(34, 102, 136):    "<:268:764030466621308960>",
-        Color(34, 102, 153):    "<:269:764030470009782303>",
-        Color(34, 102, 170):    "<:26a:764030473395109888>",
-        Color(34, 102, 187):    "<:26b:764030475869618177>",
-        Color(34, 102, 204):    "<:26c:764030480068378654>",
-        Color(34, 102, 221):    "<:26d:764030482420858881>",
-        Color(34, 102, 238):    "<:26e:764030486547791892>",
-        Color(34, 102, 255):    "<:26f:764030489614483466>",
-        Color(34, 119, 0):      "<:270:764030493234298910>",
-        Color(34, 119, 17):     "<:271:764030496123387914>",
-        Color(34, 119, 34):     "<:272:764030499894591498>",
-        Color(34, 119, 51):     "<:273:764030502910558228>",
-        Color(34, 119, 68):     "<:274:764030506689888267>",
-        Color(34, 119, 85):     "<:275:764030509876641792>",
-        Color(34, 119, 102):    "<:276:764030513185816577>",
-        Color(34, 119, 119):    "<:277:764030516034535485>",
-        Color(34, 119, 136):    "<:278:764030519658283038>",
-        Color(34, 119, 153):    "<:279:764030522510671893>",
-        Color(34, 119, 170):    "<:27a:764030526239539221>",
-        Color(34, 119, 187):    "<:27b:764030529100054538>",
-        Color(34, 119, 204):    "<:27c:764030532886724628>",
-        Color(34, 119, 221):    "<:27d:764030535583924265>",
-        Color(34, 119, 238):    "<:27e:764030539345690654>",
-        Color(34, 119, 255):    "<:27f:764030542135033876>",
-        Color(34, 136, 0):      "<:280:764030544954261514>",
-        Color(34, 136, 17):     "<:281:764030547877036054>",
-        Color(34, 136, 34):     "<:282:764030550536486923>",
-        Color(34, 136, 51):     "<:283:764030554890829834>",
-        Color(34, 136, 68):     "<:284:764030557570596905>",
-        Color(34, 136, 85):     "<:285:764030561382563840>",
-        Color(34, 136, 102):    "<:286:764030564344397854>",
-        Color(34, 136, 119):    "<:287:764030568013889546>",
-        Color(34, 136, 136):    "<:288:764030570749231105>",
-        Color(34, 136, 153):    "<:289:764030574524235776>",
-        Color(34, 136, 170):    "<:28a:764030577543610388>",
-        Color(34, 136, 187):    "<:28b:764030582052880414>",
-        Color(34, 136, 204):    "<:28c:764030585273450508>",
-        Color(34, 136, 221):    "<:28d:764030588453257216>",
-        Color(34, 136, 238):    "<:28e:764030592114229258>",
-        Color(34, 136, 255):    "<:28f:764030594597912597>",
-        Color(34, 153, 0):      "<:290:764030598511198249>",
-        Color(34, 153, 17):     "<:291:764030601878831104>",
-        Color(34, 153, 34):     "<:292:764030605565362197>",
-        Color(34, 153, 51):     "<:293:764030608141320203>",
-        Color(34, 153, 68):     "<:294:764030611555090433>",
-        Color(34, 153, 85):     "<:295:764030615107928105>",
-        Color(34, 153, 102):    "<:296:764030618459045911>",
-        Color(34, 153, 119):    "<:297:764030621357047808>",
-        Color(34, 153, 136):    "<:298:764030625035583509>",
-        Color(34, 153, 153):    "<:299:764030627913269251>",
-        Color(34, 153, 170):    "<:29a:764030631700463646>",
-        Color(34, 153, 187):    "<:29b:764030634431610891>",
-        Color(34, 153, 204):    "<:29c:764030638160085033>",
-        Color(34, 153, 221):    "<:29d:764030641062150157>",
-        Color(34, 153, 238):    "<:29e:764030644639498242>",
-        Color(34, 153, 255):    "<:29f:764030648196268042>",
-        Color(34, 170, 0):      "<:2a0:764030651660763186>",
-        Color(34, 170, 17):     "<:2a1:764030654588518420>",
-        Color(34, 170, 34):     "<:2a2:764030658107801650>",
-        Color(34, 170, 51):     "<:2a3:764030661022711808>",
-        Color(34, 170, 68):     "<:2a4:764030664747909140>",
-        Color(34, 170, 85):     "<:2a5:764030667326619779>",
-        Color(34, 170, 102):    "<:2a6:764030671499821097>",
-        Color(34, 170, 119):    "<:2a7:764030674499272744>",
-        Color(34, 170, 136):    "<:2a8:764030677427159050>",
-        Color(34, 170, 153):    "<:2a9:764030680454922241>",
-        Color(34, 170, 170):    "<:2aa:764030683295121419>",
-        Color(34, 170, 187):    "<:2ab:764030686382129172>",
-        Color(34, 170, 204):    "<:2ac:764030689032011818>",
-        Color(34, 170, 221):    "<:2ad:764030692618797076>",
-        Color(34, 170, 238):    "<:2ae:764030695487176764>",
-        Color(34, 170, 255):    "<:2af:764030698461855764>",
-        Color(34, 187, 0):      "<:2b0:764030701297074227>",
-        Color(34, 187, 17):     "<:2b1:764030704182493226>",
-        Color(34, 187, 34):     "<:2b2:764030707860242433>",
-        Color(34, 187, 51):     "<:2b3:764030711233511434>",
-        Color(34, 187, 68):     "<:2b4:764030714475053076>",
-        Color(34, 187, 85):     "<:2b5:764030717046554635>",
-        Color(34, 187, 102):    "<:2b6:764030720166985729>",
-        Color(34, 187, 119):    "<:2b7:764030723375235084>",
-        Color(34, 187, 136):    "<:2b8:764030726752305152>",
-        Color(34, 187, 153):    "<:2b9:764030729566421003>",
-        Color(34, 187, 170):    "<:2ba:764030733013614602>",
-        Color(34, 187, 187):    "<:2bb:764030736025780224>",
-        Color(34, 187, 204):    "<:2bc:764030739137298432>",
-        Color(34, 187, 221):    "<:2bd:764030742099132416>",
-        Color(34, 187, 238):    "<:2be:764030745290473475>",
-        Color(34, 187, 255):    "<:2bf:764030748574875678>",
-        Color(34, 204, 0):      "<:2c0:764030751972130849>",
-        Color(34, 204, 17):     "<:2c1:764030754937765888>",
-        Color(34, 204, 34):     "<:2c2:764030758234095618>",
-        Color(34, 204, 51):     "<:2c3:764030761565028372>",
-        Color(34, 204, 68):     "<:2c4:764030765117341716>",
-        Color(34, 204, 85):     "<:2c5:764030767634317313>",
-        Color(34, 204, 102):    "<:2c6:764030770485657611>",
-        Color(34, 204, 119):    "<:2c7:764030773719990273>",
-        Color(34, 204, 136):    "<:2c8:764030776559665153>",
-        Color(34, 204, 153):    "<:2c9:764030780526952478>",
-        Color(34, 204, 170):    "<:2ca:764030783488655380>",
-        Color(34, 204, 187):    "<:2cb:764030787058139156>",
-        Color(34, 204, 204):    "<:2cc:764030790027313152>",
-        Color(34, 204, 221):    "<:2cd:764030793718562826>",
-        Color(34, 204, 238):    "<:2ce:764030796675153930>",
-        Color(34, 204, 255):    "<:2cf:764030800219078657>",
-        Color(34, 221, 0):      "<:2d0:764030803125731398>",
-        Color(34, 221, 17):     "<:2d1:764030806615523339>",
-        Color(34, 221, 34):     "<:2d2:764030809786679326>",
-        Color(34, 221, 51):     "<:2d3:764030813435199488>",
-        Color(34, 221, 68):     "<:2d4:764030816405291029>",
-        Color(34, 221, 85):     "<:2d5:764030820234821642>",
-        Color(34, 221, 102):    "<:2d6:764030822771720224>",
-        Color(34, 221, 119):    "<:2d7:764030826403987508>",
-        Color(34, 221, 136):    "<:2d8:764030829843447828>",
-        Color(34, 221, 153):    "<:2d9:764030833379639306>",
-        Color(34, 221, 170):    "<:2da:764030838358147148>",
-        Color(34, 221, 187):    "<:2db:764030841873104909>",
-        Color(34, 221, 204):    "<:2dc:764030847103664148>",
-        Color(34, 221, 221):    "<:2dd:764030851482517504>",
-        Color(34, 221, 238):    "<:2de:764030855848525854>",
-        Color(34, 221, 255):    "<:2df:764030860092506144>",
-        Color(34, 238, 0):      "<:2e0:764030864610557953>",
-        Color(34, 238, 17):     "<:2e1:764030868355416065>",
-        Color(34, 238, 34):     "<:2e2:764030871442685962>",
-        Color(34, 238, 51):     "<:2e3:764030874659717131>",
-        Color(34, 238, 68):     "<:2e4:764030877935992832>",
-        Color(34, 238, 85):     "<:2e5:764030882008399872>",
-        Color(34, 238, 102):    "<:2e6:764030885187420170>",
-        Color(34, 238, 119):    "<:2e7:764030888236548106>",
-        Color(34, 238, 136):    "<:2e8:764030891268767764>",
-        Color(34, 238, 153):    "<:2e9:764030894867742720>",
-        Color(34, 238, 170):    "<:2ea:764030897863262208>",
-        Color(34, 238, 187):    "<:2eb:764030901403254804>",
-        Color(34, 238, 204):    "<:2ec:764030904493801472>",
-        Color(34, 238, 221):    "<:2ed:764030907711488001>",
-        Color(34, 238, 238):    "<:2ee:764030910814224404>",
-        Color(34, 238, 255):    "<:2ef:764030913654292510>",
-        Color(34, 255, 0):      "<:2f0:764030916800413696>",
-        Color(34, 255, 17):     "<:2f1:764030920038154241>",
-        Color(34, 255, 34):     "<:2f2:764030923003396108>",
-        Color(34, 255, 51):     "<:2f3:764030927072395335>",
-        Color(34, 255, 68):     "<:2f4:764030929961615380>",
-        Color(34, 255, 85):     "<:2f5:764030933363064862>",
-        Color(34, 255, 102):    "<:2f6:764030935863132163>",
-        Color(34, 255, 119):    "<:2f7:764030940065824798>",
-        Color(34, 255, 136):    "<:2f8:764030943056756736>",
-        Color(34, 255, 153):    "<:2f9:764030946411544577>",
-        Color(34, 255, 170):    "<:2fa:764030949615861780>",
-        Color(34, 255, 187):    "<:2fb:764030953068560404>",
-        Color(34, 255, 204):    "<:2fc:764030955920556083>",
-        Color(34, 255, 221):    "<:2fd:764030958713438238>",
-        Color(34, 255, 238):    "<:2fe:764030962051842108>",
-        Color(34, 255, 255):    "<:2ff:764030964891648012>",
-        Color(51, 0, 0):        "<:300:764030968716984370>",
-        Color(51, 0, 17):       "<:301:764030971439087627>",
-        Color(51, 0, 34):       "<:302:764030975201378304>",
-        Color(51, 0, 51):       "<:303:764030978272133120>",
-        Color(51, 0, 68):       "<:304:764030981828378634>",
-        Color(51, 0, 85):       "<:305:764030984764653598>",
-        Color(51, 0, 102):      "<:306:764030988355108864>",
-        Color(51, 0, 119):      "<:307:764030991517745154>",
-        Color(51, 0, 136):      "<:308:764030994826526741>",
-        Color(51, 0, 153):      "<:309:764030997900951552>",
-        Color(51, 0, 170):      "<:30a:764031001462308874>",
-        Color(51, 0, 187):      "<:30b:764031004302114826>",
-        Color(51, 0, 204):      "<:30c:764031007363563520>",
-        Color(51, 0, 221):      "<:30d:764031010408235028>",
-        Color(51, 0, 238):      "<:30e:764031013181325323>",
-        Color(51, 0, 255):      "<:30f:764031016967995412>",
-        Color(51, 17, 0):       "<:310:764031020067586068>",
-        Color(51, 17, 17):      "<:311:764031023507308566>",
-        Color(51, 17, 34):      "<:312:764031026850562068>",
-        Color(51, 17, 51):      "<:313:764031030105473044>",
-        Color(51, 17, 68):      "<:314:764031033070845953>",
-        Color(51, 17, 85):      "<:315:764031036652257300>",
-        Color(51, 17, 102):     "<:316:764031039977816084>",
-        Color(51, 17, 119):     "<:317:764031043299704863>",
-        Color(51, 17, 136):     "<:318:764031046324846623>",
-        Color(51, 17, 153):     "<:319:764031049910714378>",
-        Color(51, 17, 170):     "<:31a:764031052607913985>",
-        Color(51, 17, 187):     "<:31b:764031056591716353>",
-        Color(51, 17, 204):     "<:31c:764031059905085440>",
-        Color(51, 17, 221):     "<:31d:764031062975840277>",
-        Color(51, 17, 238):     "<:31e:764031066137690112>",
-        Color(51, 17, 255):     "<:31f:764031069778608159>",
-        Color(51, 34, 0):       "<:320:764031072890781716>",
-        Color(51, 34, 17):      "<:321:764031076162076704>",
-        Color(51, 34, 34):      "<:322:764031080360574987>",
-        Color(51, 34, 51):      "<:323:764031083066687519>",
-        Color(51, 34, 68):      "<:324:764031087117991956>",
-        Color(51, 34, 85):      "<:325:764031089772724255>",
-        Color(51, 34, 102):     "<:326:764031093535932426>",
-        Color(51, 34, 119):     "<:327:764031096391204864>",
-        Color(51, 34, 136):     "<:328:764031099100725249>",
-        Color(51, 34, 153):     "<:329:764031102758420490>",
-        Color(51, 34, 170):     "<:32a:764031105748828200>",
-        Color(51, 34, 187):     "<:32b:764031108739498045>",
-        Color(51, 34, 204):     "<:32c:764031111889551360>",
-        Color(51, 34, 221):     "<:32d:764031115530600478>",
-        Color(51, 34, 238):     "<:32e:764031118386135042>",
-        Color(51, 34, 255):     "<:32f:764031122224709633>",
-        Color(51, 51, 0):       "<:330:764031125173174272>",
-        Color(51, 51, 17):      "<:331:764031128704647178>",
-        Color(51, 51, 34):      "<:332:764031131736866826>",
-        Color(51, 51, 51):      "<:333:764031135319326751>",
-        Color(51, 51, 68):      "<:334:764031138045100043>",
-        Color(51, 51, 85):      "<:335:764031141911986186>",
-        Color(51, 51, 102):     "<:336:764031144571830293>",
-        Color(51, 51, 119):     "<:337:764031148560220170>",
-        Color(51, 51, 136):     "<:338:764031151240904705>",
-        Color(51, 51, 153):     "<:339:764031153899831308>",
-        Color(51, 51, 170):     "<:33a:764031157330771998>",
-        Color(51, 51, 187):     "<:33b:764031160229298176>",
-        Color(51, 51, 204):     "<:33c:764031162892025907>",
-        Color(51, 51, 221):     "<:33d:764031165962780675>",
-        Color(51, 51, 238):     "<:33e:764031169301839872>",
-        Color(51, 51, 255):     "<:33f:764031171717758988>",
-        Color(51, 68, 0):       "<:340:764031174879215617>",
-        Color(51, 68, 17):      "<:341:764031178167549973>",
-        Color(51, 68, 34):      "<:342:764031181036847104>",
-        Color(51, 68, 51):      "<:343:764031183930785802>",
-        Color(51, 68, 68):      "<:344:764031186582372373>",
-        Color(51, 68, 85):      "<:345:764031189878308864>",
-        Color(51, 68, 102):     "<:346:764031192714444811>",
-        Color(51, 68, 119):     "<:347:764031195734212608>",
-        Color(51, 68, 136):     "<:348:764031199064227860>",
-        Color(51, 68, 153):     "<:349:764031201698119712>",
-        Color(51, 68, 170):     "<:34a:764031204722475009>",
-        Color(51, 68, 187):     "<:34b:764031208186707979>",
-        Color(51, 68, 204):     "<:34c:764031211281842186>",
-        Color(51, 68, 221):     "<:34d:764031214344339476>",
-        Color(51, 68, 238):     "<:34e:764031217203937281>",
-        Color(51, 68, 255):     "<:34f:764031220086341632>",
-        Color(51, 85, 0):       "<:350:764031222913171477>",
-        Color(51, 85, 17):      "<:351:764031225944997888>",
-        Color(51, 85, 34):      "<:352:764031228835004456>",
-        Color(51, 85, 51):      "<:353:764031231696175104>",
-        Color(51, 85, 68):      "<:354:764031234543321139>",
-        Color(51, 85, 85):      "<:355:764031237412880394>",
-        Color(51, 85, 102):     "<:356:764031240247967764>",
-        Color(51, 85, 119):     "<:357:764031243192631296>",
-        Color(51, 85, 136):     "<:358:764031245902020629>",
-        Color(51, 85, 153):     "<:359:764031248900423690>",
-        Color(51, 85, 170):     "<:35a:764031251639304233>",
-        Color(51, 85, 187):     "<:35b:764031254769041418>",
-        Color(51, 85, 204):     "<:35c:764031257599803422>",
-        Color(51, 85, 221):     "<:35d:764031260376563713>",
-        Color(51, 85, 238):     "<:35e:764031263371427870>",
-        Color(51, 85, 255):     "<:35f:764031266362097664>",
-        Color(51, 102, 0):      "<:360:764031269260492800>",
-        Color(51, 102, 17):     "<:361:764031273035235359>",
-        Color(51, 102, 34):     "<:362:764031276143083532>",
-        Color(51, 102, 51):     "<:363:764031279661318166>",
-        Color(51, 102, 68):     "<:364:764031282774409217>",
-        Color(51, 102, 85):     "<:365:764031286221602817>",
-        Color(51, 102, 102):    "<:366:764031288649711669>",
-        Color(51, 102, 119):    "<:367:764031292613459979>",
-        Color(51, 102, 136):    "<:368:764031295667568650>",
-        Color(51, 102, 153):    "<:369:764031299039920140>",
-        Color(51, 102, 170):    "<:36a:764031302235979796>",
-        Color(51, 102, 187):    "<:36b:764031305713188875>",
-        Color(51, 102, 204):    "<:36c:764031308669911051>",
-        Color(51, 102, 221):    "<:36d:764031312520413194>",
-        Color(51, 102, 238):    "<:36e:764031315442925588>",
-        Color(51, 102, 255):    "<:36f:764031319133913099>",
-        Color(51, 119, 0):      "<:370:764031322045808640>",
-        Color(51, 119, 17):     "<:371:764031325769826324>",
-        Color(51, 119, 34):     "<:372:764031328785924156>",
-        Color(51, 119, 51):     "<:373:764031332372185088>",
-        Color(51, 119, 68):     "<:374:764031335299153930>",
-        Color(51, 119, 85):     "<:375:764031338726555651>",
-        Color(51, 119, 102):    "<:376:764031342018297896>",
-        Color(51, 119, 119):    "<:377:764031345587650560>",
-        Color(51, 119, 136):    "<:378:764031348188250123>",
-        Color(51, 119, 153):    "<:379:764031351938351116>",
-        Color(51, 119, 170):    "<:37a:764031354887208970>",
-        Color(51, 119, 187):    "<:37b:764031357801332736>",
-        Color(51, 119, 204):    "<:37c:764031361132134420>",
-        Color(51, 119, 221):    "<:37d:764031364025679912>",
-        Color(51, 119, 238):    "<:37e:764031367397769227>",
-        Color(51, 119, 255):    "<:37f:764031370640752660>",
-        Color(51, 136, 0):      "<:380:764031374083620864>",
-        Color(51, 136, 17):     "<:381:764031377091854342>",
-        Color(51, 136, 34):     "<:382:764031380803682334>",
-        Color(51, 136, 51):     "<:383:764031383671930890>",
-        Color(51, 136, 68):     "<:384:764031387052408833>",
-        Color(51, 136, 85):     "<:385:764031390189617174>",
-        Color(51, 136, 102):    "<:386:764031394070265866>",
-        Color(51, 136, 119):    "<:387:764031396926455829>",
-        Color(51, 136, 136):    "<:388:764031400474181654>",
-        Color(51, 136, 153):    "<:389:764031402944888853>",
-        Color(51, 136, 170):    "<:38a:764031407244312596>",
-        Color(51, 136, 187):    "<:38b:764031410184519690>",
-        Color(51, 136, 204):    "<:38c:764031413757804554>",
-        Color(51, 136, 221):    "<:38d:764031416659869696>",
-        Color(51, 136, 238):    "<:38e:764031420024356905>",
-        Color(51, 136, 255):    "<:38f:764031423492915201>",
-        Color(51, 153, 0):      "<:390:764031426538242059>",
-        Color(51, 153, 17):     "<:391:764031429691965461>",
-        Color(51, 153, 34):     "<:392:764031432967323669>",
-        Color(51, 153, 51):     "<:393:764031436168495104>",
-        Color(51, 153, 68):     "<:394:764031439204646927>",
-        Color(51, 153, 85):     "<:395:764031442077614110>",
-        Color(51, 153, 102):    "<:396:764031444883603456>",
-        Color(51, 153, 119):    "<:397:764031447652237325>",
-        Color(51, 153, 136):    "<:398:764031450780532737>",
-        Color(51, 153, 153):    "<:399:764031453977378826>",
-        Color(51, 153, 170):    "<:39a:764031456862797824>",
-        Color(51, 153, 187):    "<:39b:764031459764862998>",
-        Color(51, 153, 204):    "<:39c:764031462961840148>",
-        Color(51, 153, 221):    "<:39d:764031465951592448>",
-        Color(51, 153, 238):    "<:39e:764031469596442654>",
-        Color(51, 153, 255):    "<:39f:764031472105029663>",
-        Color(51, 170, 0):      "<:3a0:764031475812794368>",
-        Color(51, 170, 17):     "<:3a1:764031478665052170>",
-        Color(51, 170, 34):     "<:3a2:764031482066763807>",
-        Color(51, 170, 51):     "<:3a3:764031485316694017>",
-        Color(51, 170, 68):     "<:3a4:764031488915406879>",
-        Color(51, 170, 85):     "<:3a5:764031492006608906>",
-        Color(51, 170, 102):    "<:3a6:764031494829899817>",
-        Color(51, 170, 119):    "<:3a7:764031497911926796>",
-        Color(51, 170, 136):    "<:3a8:764031501036683265>",
-        Color(51, 170, 153):    "<:3a9:764031504816537600>",
-        Color(51, 170, 170):    "<:3aa:764031507797901322>",
-        Color(51, 170, 187):    "<:3ab:764031511367647252>",
-        Color(51, 170, 204):    "<:3ac:764031514181894174>",
-        Color(51, 170, 221):    "<:3ad:764031517122756618>",
-        Color(51, 170, 238):    "<:3ae:764031519928614924>",
-        Color(51, 170, 255):    "<:3af:764031523224944700>",
-        Color(51, 187, 0):      "<:3b0:764031527121453066>",
-        Color(51, 187, 17):     "<:3b1:764031529981837312>",
-        Color(51, 187, 34):     "<:3b2:764031533362446346>",
-        Color(51, 187, 51):     "<:3b3:764031536168828938>",
-        Color(51, 187, 68):     "<:3b4:764031540136247297>",
-        Color(51, 187, 85):     "<:3b5:764031543010131968>",
-        Color(51, 187, 102):    "<:3b6:764031546457587714>",
-        Color(51, 187, 119):    "<:3b7:764031549501865985>",
-        Color(51, 187, 136):    "<:3b8:764031553038188547>",
-        Color(51, 187, 153):    "<:3b9:764031556003168266>",
-        Color(51, 187, 170):    "<:3ba:764031559740948491>",
-        Color(51, 187, 187):    "<:3bb:764031562223714306>",
-        Color(51, 187, 204):    "<:3bc:764031566107639820>",
-        Color(51, 187, 221):    "<:3bd:764031569601495050>",
-        Color(51, 187, 238):    "<:3be:764031573020246017>",
-        Color(51, 187, 255):    "<:3bf:764031575926767616>",
-        Color(51, 204, 0):      "<:3c0:764031579676082196>",
-        Color(51, 204, 17):     "<:3c1:764031583987564544>",
-        Color(51, 204, 34):     "<:3c2:764031587011657738>",
-        Color(51, 204, 51):     "<:3c3:764031590560563200>",
-        Color(51, 204, 68):     "<:3c4:764031593769074698>",
-        Color(51, 204, 85):     "<:3c5:764031596894355458>",
-        Color(51, 204, 102):    "<:3c6:764031600090021928>",
-        Color(51, 204, 119):    "<:3c7:764031603806175243>",
-        Color(51, 204, 136):    "<:3c8:764031606641393665>",
-        Color(51, 204, 153):    "<:3c9:764031610479575080>",
-        Color(51, 204, 170):    "<:3ca:764031613361192960>",
-        Color(51, 204, 187):    "<:3cb:764031617278410783>",
-        Color(51, 204, 204):    "<:3cc:764031621639831602>",
-        Color(51, 204, 221):    "<:3cd:764031624568242176>",
-        Color(51, 204, 238):    "<:3ce:764031627964973076>",
-        Color(51, 204, 255):    "<:3cf:764031630905442335>",
-        Color(51, 221, 0):      "<:3d0:764031634613338112>",
-        Color(51, 221, 17):     "<:3d1:764031637582774282>",
-        Color(51, 221, 34):     "<:3d2:764031641135218688>",
-        Color(51, 221, 51):     "<:3d3:764031643949334529>",
-        Color(51, 221, 68):     "<:3d4:764031647489720331>",
-        Color(51, 221, 85):     "<:3d5:764031650647506944>",
-        Color(51, 221, 102):    "<:3d6:764031654377029643>",
-        Color(51, 221, 119):    "<:3d7:764031657270575109>",
-        Color(51, 221, 136):    "<:3d8:764031660898910228>",
-        Color(51, 221, 153):    "<:3d9:764031663755493376>",
-        Color(51, 221, 170):    "<:3da:764031667642826752>",
-        Color(51, 221, 187):    "<:3db:764031670105538582>",
-        Color(51, 221, 204):    "<:3dc:764031674127745034>",
-        Color(51, 221, 221):    "<:3dd:764031677235462175>",
-        Color(51, 221, 238):    "<:3de:764031680679247903>",
-        Color(51, 221, 255):    "<:3df:764031683648815114>",
-        Color(51, 238, 0):      "<:3e0:764031687737999389>",
-        Color(51, 238, 17):     "<:3e1:764031690716348426>",
-        Color(51, 238, 34):     "<:3e2:764031693794705480>",
-        Color(51, 238, 51):     "<:3e3:764031697036509207>",
-        Color(51, 238, 68):     "<:3e4:764031700128366615>",
-        Color(51, 238, 85):     "<:3e5:764031703236476940>",
-        Color(51, 238, 102):    "<:3e6:764031707136786463>",
-        Color(51, 238, 119):    "<:3e7:764031709603037185>",
-        Color(51, 238, 136):    "<:3e8:764031713734295579>",
-        Color(51, 238, 153):    "<:3e9:764031718076186644>",
-        Color(51, 238, 170):    "<:3ea:764031721100148746>",
-        Color(51, 238, 187):    "<:3eb:764031725021822976>",
-        Color(51, 238, 204):    "<:3ec:764031727596208139>",
-        Color(51, 238, 221):    "<:3ed:764031731275268136>",
-        Color(51, 238, 238):    "<:3ee:764031734227402763>",
-        Color(51, 238, 255):    "<:3ef:764031737856000022>",
-        Color(51, 255, 0):      "<:3f0:764031740872097812>",
-        Color(51, 255, 17):     "<:3f1:764031744444858458>",
-        Color(51, 255, 34):     "<:3f2:764031747780247563>",
-        Color(51, 255, 51):     "<:3f3:764031751458390017>",
-        Color(51, 255, 68):     "<:3f4:764031755526209556>",
-        Color(51, 255, 85):     "<:3f5:764031758369816586>",
-        Color(51, 255, 102):    "<:3f6:764031762082037760>",
-        Color(51, 255, 119):    "<:3f7:764031765060124683>",
-        Color(51, 255, 136):    "<:3f8:764031768714018836>",
-        Color(51, 255, 153):    "<:3f9:764031771528003624>",
-        Color(51, 255, 170):    "<:3fa:764031775265521674>",
-        Color(51, 255, 187):    "<:3fb:764031778335621140>",
-        Color(51, 255, 204):    "<:3fc:764031782144180234>",
-        Color(51, 255, 221):    "<:3fd:764031784870084609>",
-        Color(51, 255, 238):    "<:3fe:764031788594626571>",
-        Color(51, 255, 255):    "<:3ff:764031791803007016>",
-        Color(68, 0, 0):        "<:400:764031794675712000>",
-        Color(68, 0, 17):       "<:401:764031797540814848>",
-        Color(68, 0, 34):       "<:402:764031800259248139>",
-        Color(68, 0, 51):       "<:403:764031804772319243>",
-        Color(68, 0, 68):       "<:404:764031809058373662>",
-        Color(68, 0, 85):       "<:405:764031811894378496>",
-        Color(68, 0, 102):      "<:406:764031815307755530>",
-        Color(68, 0, 119):      "<:407:764031817866543115>",
-        Color(68, 0, 136):      "<:408:764031821918240768>",
-        Color(68, 0, 153):      "<:409:764031824665509899>",
-        Color(68, 0, 170):      "<:40a:764031828205109281>",
-        Color(68, 0, 187):      "<:40b:764031831372201984>",
-        Color(68, 0, 204):      "<:40c:764031835084292126>",
-        Color(68, 0, 221):      "<:40d:764031837685153795>",
-        Color(68, 0, 238):      "<:40e:764031841703034910>",
-        Color(68, 0, 255):      "<:40f:764031844601561148>",
-        Color(68, 17, 0):       "<:410:764031848279834694>",
-        Color(68, 17, 17):      "<:411:764031851446665246>",
-        Color(68, 17, 34):      "<:412:764031854759116802>",
-        Color(68, 17, 51):      "<:413:764031858014420993>",
-        Color(68, 17, 68):      "<:414:764031861152153611>",
-        Color(68, 17, 85):      "<:415:764031864305877053>",
-        Color(68, 17, 102):     "<:416:764031867103870978>",
-        Color(68, 17, 119):     "<:417:764031870555389982>",
-        Color(68, 17, 136):     "<:418:764031874263285780>",
-        Color(68, 17, 153):     "<:419:764031877191041064>",
-        Color(68, 17, 170):     "<:41a:764031880827502622>",
-        Color(68, 17, 187):     "<:41b:764031883616321536>",
-        Color(68, 17, 204):     "<:41c:764031886418771968>",
-        Color(68, 17, 221):     "<:41d:764031889601462301>",
-        Color(68, 17, 238):     "<:41e:764031892437204992>",
-        Color(68, 17, 255):     "<:41f:764031895302176838>",
-        Color(68, 34, 0):       "<:420:764031898401243167>",
-        Color(68, 34, 17):      "<:421:764031901781983232>",
-        Color(68, 34, 34):      "<:422:764031905069793300>",
-        Color(68, 34, 51):      "<:423:764031907917987880>",
-        Color(68, 34, 68):      "<:424:764031911621296128>",
-        Color(68, 34, 85):      "<:425:764031914612097044>",
-        Color(68, 34, 102):     "<:426:764031918433370152>",
-        Color(68, 34, 119):     "<:427:764031922720342056>",
-        Color(68, 34, 136):     "<:428:764031925601042452>",
-        Color(68, 34, 153):     "<:429:764031929179439144>",
-        Color(68, 34, 170):     "<:42a:764031932132229120>",
-        Color(68, 34, 187):     "<:42b:764031935894126592>",
-        Color(68, 34, 204):     "<:42c:764031938771943455>",
-        Color(68, 34, 221):     "<:42d:764031941967478815>",
-        Color(68, 34, 238):     "<:42e:764031944891564034>",
-        Color(68, 34, 255):     "<:42f:764031949038682112>",
-        Color(68, 51, 0):       "<:430:764031951501000705>",
-        Color(68, 51, 17):      "<:431:764031955573801011>",
-        Color(68, 51, 34):      "<:432:764031958488580096>",
-        Color(68, 51, 51):      "<:433:764031961878102018>",
-        Color(68, 51, 68):      "<:434:764031965157392395>",
-        Color(68, 51, 85):      "<:435:764031968450707458>",
-        Color(68, 51, 102):     "<:436:764031971307159564>",
-        Color(68, 51, 119):     "<:437:764031975408926730>",
-        Color(68, 51, 136):     "<:438:764031978558586880>",
-        Color(68, 51, 153):     "<:439:764031982140129311>",
-        Color(68, 51, 170):     "<:43a:764031985399889921>",
-        Color(68, 51, 187):     "<:43b:764031988654538752>",
-        Color(68, 51, 204):     "<:43c:764031991532224512>",
-        Color(68, 51, 221):     "<:43d:764031994816102401>",
-        Color(68, 51, 238):     "<:43e:764031998045978644>",
-        Color(68, 51, 255):     "<:43f:764032001815871509>",
-        Color(68, 68, 0):       "<:440:764032004698013717>",
-        Color(68, 68, 17):      "<:441:764032008363048990>",
-        Color(68, 68, 34):      "<:442:764032013002604574>",
-        Color(68, 68, 51):      "<:443:764032015879897108>",
-        Color(68, 68, 68):      "<:444:764032019226951711>",
-        Color(68, 68, 85):      "<:445:764032022552903690>",
-        Color(68, 68, 102):     "<:446:764032026298023936>",
-        Color(68, 68, 119):     "<:447:764032029473374218>",
-        Color(68, 68, 136):     "<:448:764032032443334687>",
-        Color(68, 68, 153):     "<:449:764032035655516180>",
-        Color(68, 68, 170):     "<:44a:764032039204683776>",
-        Color(68, 68, 187):     "<:44b:764032042206887946>",
-        Color(68, 68, 204):     "<:44c:764032046506835978>",
-        Color(68, 68, 221):     "<:44d:764032050281054230>",
-        Color(68, 68, 238):     "<:44e:764032053300690964>",
-        Color(68, 68, 255):     "<:44f:764032056752996362>",
-        Color(68, 85, 0):       "<:450:764032059621900298>",
-        Color(68, 85, 17):      "<:451:764032063367675914>",
-        Color(68, 85, 34):      "<:452:764032065947303937>",
-        Color(68, 85, 51):      "<:453:764032069977899018>",
-        Color(68, 85, 68):      "<:454:764032072930164767>",
-        Color(68, 85, 85):      "<:455:764032076542115841>",
-        Color(68, 85, 102):     "<:456:764032079741714482>",
-        Color(68, 85, 119):     "<:457:764032082804473888>",
-        Color(68, 85, 136):     "<:458:764032085748875305>",
-        Color(68, 85, 153):     "<:459:764032089623494677>",
-        Color(68, 85, 170):     "<:45a:764032092911960064>",
-        Color(68, 85, 187):     "<:45b:764032096376586270>",
-        Color(68, 85, 204):     "<:45c:764032099509469185>",
-        Color(68, 85, 221):     "<:45d:764032102852198432>",
-        Color(68, 85, 238):     "<:45e:764032106044194817>",
-        Color(68, 85, 255):     "<:45f:764032109614333972>",
-        Color(68, 102, 0):      "<:460:764032112500146216>",
-        Color(68, 102, 17):     "<:461:764032115523452958>",
-        Color(68, 102, 34):     "<:462:764032118492758026>",
-        Color(68, 102, 51):     "<:463:764032120963989567>",
-        Color(68, 102, 68):     "<:464:764032124209594379>",
-        Color(68, 102, 85):     "<:465:764032126919245836>",
-        Color(68, 102, 102):    "<:466:764032130157379584>",
-        Color(68, 102, 119):    "<:467:764032133034672148>",
-        Color(68, 102, 136):    "<:468:764032135468023839>",
-        Color(68, 102, 153):    "<:469:764032138773135370>",
-        Color(68, 102, 170):    "<:46a:764032141830520863>",
-        Color(68, 102, 187):    "<:46b:764032144707944458>",
-        Color(68, 102, 204):    "<:46c:764032147606470656>",
-        Color(68, 102, 221):    "<:46d:764032150453354557>",
-        Color(68, 102, 238):    "<:46e:764032153293422593>",
-        Color(68, 102, 255):    "<:46f:764032155927445535>",
-        Color(68, 119, 0):      "<:470:764032158829641740>",
-        Color(68, 119, 17):     "<:471:764032161908785152>",
-        Color(68, 119, 34):     "<:472:764032164638883870>",
-        Color(68, 119, 51):     "<:473:764032167546060820>",
-        Color(68, 119, 68):     "<:474:764032170468573194>",
-        Color(68, 119, 85):     "<:475:764032173233274891>",
-        Color(68, 119, 102):    "<:476:764032176093528076>",
-        Color(68, 119, 119):    "<:477:764032179256426516>",
-        Color(68, 119, 136):    "<:478:764032182132932628>",
-        Color(68, 119, 153):    "<:479:764032185598476298>",
-        Color(68, 119, 170):    "<:47a:764032189549248512>",
-        Color(68, 119, 187):    "<:47b:764032192468484116>",
-        Color(68, 119, 204):    "<:47c:764032196574445588>",
-        Color(68, 119, 221):    "<:47d:764032199761723433>",
-        Color(68, 119, 238):    "<:47e:764032202778083339>",
-        Color(68, 119, 255):    "<:47f:764032206715748383>",
-        Color(68, 136, 0):      "<:480:764032209626726410>",
-        Color(68, 136, 17):     "<:481:764032213569241108>",
-        Color(68, 136, 34):     "<:482:764032216392400896>",
-        Color(68, 136, 51):     "<:483:764032220087320586>",
-        Color(68, 136, 68):     "<:484:764032222739038220>",
-        Color(68, 136, 85):     "<:485:764032226396078091>",
-        Color(68, 136, 102):    "<:486:764032229155667971>",
-        Color(68, 136, 119):    "<:487:764032233026879488>",
-        Color(68, 136, 136):    "<:488:764032235787255828>",
-        Color(68, 136, 153):    "<:489:764032238853423104>",
-        Color(68, 136, 170):    "<:48a:764032241617338389>",
-        Color(68, 136, 187):    "<:48b:764032244859666432>",
-        Color(68, 136, 204):    "<:48c:764032248512118784>",
-        Color(68, 136, 221):    "<:48d:764032251552989195>",
-        Color(68, 136, 238):    "<:48e:764032255131648030>",
-        Color(68, 136, 255):    "<:48f:764032257710620674>",
-        Color(68, 153, 0):      "<:490:764032261355470868>",
-        Color(68, 153, 17):     "<:491:764032264022917131>",
-        Color(68, 153, 34):     "<:492:764032267910643743>",
-        Color(68, 153, 51):     "<:493:764032272374169610>",
-        Color(68, 153, 68):     "<:494:764032275225509899>",
-        Color(68, 153, 85):     "<:495:764032278937600001>",
-        Color(68, 153, 102):    "<:496:764032281865093131>",
-        Color(68, 153, 119):    "<:497:764032285426450452>",
-        Color(68, 153, 136):    "<:498:764032288316194816>",
-        Color(68, 153, 153):    "<:499:764032292083335178>",
-        Color(68, 153, 170):    "<:49a:764032294658637825>",
-        Color(68, 153, 187):    "<:49b:764032298659479552>",
-        Color(68, 153, 204):    "<:49c:764032301230850049>",
-        Color(68, 153, 221):    "<:49d:764032305332355082>",
-        Color(68, 153, 238):    "<:49e:764032308034273321>",
-        Color(68, 153, 255):    "<:49f:764032311850303529>",
-        Color(68, 170, 0):      "<:4a0:764032314807418890>",
-        Color(68, 170, 17):     "<:4a1:764032319572541450>",
-        Color(68, 170, 34):     "<:4a2:764032323666051092>",
-        Color(68, 170, 51):     "<:4a3:764032327281541190>",
-        Color(68, 170, 68):     "<:4a4:764032330154377216>",
-        Color(68, 170, 85):     "<:4a5:764032333849952296>",
-        Color(68, 170, 102):    "<:4a6:764032336714792970>",
-        Color(68, 170, 119):    "<:4a7:764032340288471061>",
-        Color(68, 170, 136):    "<:4a8:764032343379804170>",
-        Color(68, 170, 153):    "<:4a9:764032347057291274>",
-        Color(68, 170, 170):    "<:4aa:764032349574529027>",
-        Color(68, 170, 187):    "<:4ab:764032353365655575>",
-        Color(68, 170, 204):    "<:4ac:764032356595924994>",
-        Color(68, 170, 221):    "<:4ad:764032360228061195>",
-        Color(68, 170, 238):    "<:4ae:764032363180720169>",
-        Color(68, 170, 255):    "<:4af:764032366829633546>",
-        Color(68, 187, 0):      "<:4b0:764032369668784148>",
-        Color(68, 187, 17):     "<:4b1:764032373401583656>",
-        Color(68, 187, 34):     "<:4b2:764032375881072641>",
-        Color(68, 187, 51):     "<:4b3:764032380049686538>",
-        Color(68, 187, 68):     "<:4b4:764032382960926730>",
-        Color(68, 187, 85):     "<:4b5:764032386593456128>",
-        Color(68, 187, 102):    "<:4b6:764032389177409537>",
-        Color(68, 187, 119):    "<:4b7:764032392293646336>",
-        Color(68, 187, 136):    "<:4b8:764032395602165760>",
-        Color(68, 187, 153):    "<:4b9:764032399826616350>",
-        Color(68, 187, 170):    "<:4ba:764032402442944554>",
-        Color(68, 187, 187):    "<:4bb:764032406499885076>",
-        Color(68, 187, 204):    "<:4bc:764032409313214474>",
-        Color(68, 187, 221):    "<:4bd:764032412979953684>",
-        Color(68, 187, 238):    "<:4be:764032415831425075>",
-        Color(68, 187, 255):    "<:4bf:764032419740254228>",
-        Color(68, 204, 0):      "<:4c0:764032422714146826>",
-        Color(68, 204, 17):     "<:4c1:764032426284285962>",
-        Color(68, 204, 34):     "<:4c2:764032429022511115>",
-        Color(68, 204, 51):     "<:4c3:764032432813899777>",
-        Color(68, 204, 68):     "<:4c4:764032435985186816>",
-        Color(68, 204, 85):     "<:4c5:764032439407738900>",
-        Color(68, 204, 102):    "<:4c6:764032442368786442>",
-        Color(68, 204, 119):    "<:4c7:764032446014423060>",
-        Color(68, 204, 136):    "<:4c8:764032448932610058>",
-        Color(68, 204, 153):    "<:4c9:764032452552294400>",
-        Color(68, 204, 170):    "<:4ca:764032455207288843>",
-        Color(68, 204, 187):    "<:4cb:764032458906927146>",
-        Color(68, 204, 204):    "<:4cc:764032462237597706>",
-        Color(68, 204, 221):    "<:4cd:764032465886773248>",
-        Color(68, 204, 238):    "<:4ce:764032468491436073>",
-        Color(68, 204, 255):    "<:4cf:764032472580358164>",
-        Color(68, 221, 0):      "<:4d0:764032475072167937>",
-        Color(68, 221, 17):     "<:4d1:764032478729732127>",
-        Color(68, 221, 34):     "<:4d2:764032481946632232>",
-        Color(68, 221, 51):     "<:4d3:764032485393694721>",
-        Color(68, 221, 68):     "<:4d4:764032488157872140>",
-        Color(68, 221, 85):     "<:4d5:764032491869962261>",
-        Color(68, 221, 102):    "<:4d6:764032494705573909>",
-        Color(68, 221, 119):    "<:4d7:764032498778243083>",
-        Color(68, 221, 136):    "<:4d8:764032501773500426>",
-        Color(68, 221, 153):    "<:4d9:764032505531334659>",
-        Color(68, 221, 170):    "<:4da:764032509754605588>",
-        Color(68, 221, 187):    "<:4db:764032512666107904>",
-        Color(68, 221, 204):    "<:4dc:764032516121428009>",
-        Color(68, 221, 221):    "<:4dd:764032519024017439>",
-        Color(68, 221, 238):    "<:4de:764032523088691200>",
-        Color(68, 221, 255):    "<:4df:764032525953400842>",
-        Color(68, 238, 0):      "<:4e0:764032529250254859>",
-        Color(68, 238, 17):     "<:4e1:764032533985230848>",
-        Color(68, 238, 34):     "<:4e2:764032536803934208>",
-        Color(68, 238, 51):     "<:4e3:764032540570681364>",
-        Color(68, 238, 68):     "<:4e4:764032543313494027>",
-        Color(68, 238, 85):     "<:4e5:764032547281174528>",
-        Color(68, 238, 102):    "<:4e6:764032550112722954>",
-        Color(68, 238, 119):    "<:4e7:764032553908699146>",
-        Color(68, 238, 136):    "<:4e8:764032556365774849>",
-        Color(68, 238, 153):    "<:4e9:764032560422060032>",
-        Color(68, 238, 170):    "<:4ea:764032562922127371>",
-        Color(68, 238, 187):    "<:4eb:764032567014850560>",
-        Color(68, 238, 204):    "<:4ec:764032569981272095>",
-        Color(68, 238, 221):    "<:4ed:764032573285859339>",
-        Color(68, 238, 238):    "<:4ee:764032576201424898>",
-        Color(68, 238, 255):    "<:4ef:764032580169105438>",
-        Color(68, 255, 0):      "<:4f0:764032583054393345>",
-        Color(68, 255, 17):     "<:4f1:764032586728341515>",
-        Color(68, 255, 34):     "<:4f2:764032589534461982>",
-        Color(68, 255, 51):     "<:4f3:764032592634314772>",
-        Color(68, 255, 68):     "<:4f4:764032595591299102>",
-        Color(68, 255, 85):     "<:4f5:764032598606741514>",
-        Color(68, 255, 102):    "<:4f6:764032602070843402>",
-        Color(68, 255, 119):    "<:4f7:764032604667904011>",
-        Color(68, 255, 136):    "<:4f8:764032608643842058>",
-        Color(68, 255, 153):    "<:4f9:764032611508420620>",
-        Color(68, 255, 170):    "<:4fa:764032614482444310>",
-        Color(68, 255, 187):    "<:4fb:764032617447555093>",
-        Color(68, 255, 204):    "<:4fc:764032620627492904>",
-        Color(68, 255, 221):    "<:4fd:764032624183345182>",
-        Color(68, 255, 238):    "<:4fe:764032626796527627>",
-        Color(68, 255, 255):    "<:4ff:764032630005694464>",
-        Color(85, 0, 0):        "<:500:764032633117081600>",
-        Color(85, 0, 17):       "<:501:764032636170928149>",
-        Color(85, 0, 34):       "<:502:764032640117768192>",
-        Color(85, 0, 51):       "<:503:764032643934322699>",
-        Color(85, 0, 68):       "<:504:764032646694043659>",
-        Color(85, 0, 85):       "<:505:764032650573774889>",
-        Color(85, 0, 102):      "<:506:764032653573226526>",
-        Color(85, 0, 119):      "<:507:764032657137991700>",
-        Color(85, 0, 136):      "<:508:764032659944243200>",
-        Color(85, 0, 153):      "<:509:764032663429709835>",
-        Color(85, 0, 170):      "<:50a:764032666634813460>",
-        Color(85, 0, 187):      "<:50b:764032670379409408>",
-        Color(85, 0, 204):      "<:50c:764032672946716723>",
-        Color(85, 0, 221):      "<:50d:764032676763664395>",
-        Color(85, 0, 238):      "<:50e:764032679795752980>",
-        Color(85, 0, 255):      "<:50f:764032683516493855>",
-        Color(85, 17, 0):       "<:510:764032686595112990>",
-        Color(85, 17, 17):      "<:511:764032690042175488>",
-        Color(85, 17, 34):      "<:512:764032693334704138>",
-        Color(85, 17, 51):      "<:513:764032696279105547>",
-        Color(85, 17, 68):      "<:514:764032699693531146>",
-        Color(85, 17, 85):      "<:515:764032703330123806>",
-        Color(85, 17, 102):     "<:516:764032705809219585>",
-        Color(85, 17, 119):     "<:517:764032709865373698>",
-        Color(85, 17, 136):     "<:518:764032712549466114>",
-        Color(85, 17, 153):     "<:519:764032716458688523>",
-        Color(85, 17, 170):     "<:51a:764032719037792278>",
-        Color(85, 17, 187):     "<:51b:764032723127107584>",
-        Color(85, 17, 204):     "<:51c:764032725992603658>",
-        Color(85, 17, 221):     "<:51d:764032729137807371>",
-        Color(85, 17, 238):     "<:51e:764032732774662144>",
-        Color(85, 17, 255):     "<:51f:764032736058540034>",
-        Color(85, 34, 0):       "<:520:764032739241492510>",
-        Color(85, 34, 17):      "<:521:764032742907314186>",
-        Color(85, 34, 34):      "<:522:764032745478553621>",
-        Color(85, 34, 51):      "<:523:764032749107281941>",
-        Color(85, 34, 68):      "<:524:764032752814260234>",
-        Color(85, 34, 85):      "<:525:764032755888685059>",
-        Color(85, 34, 102):     "<:526:764032758942138398>",
-        Color(85, 34, 119):     "<:527:764032762708623411>",
-        Color(85, 34, 136):     "<:528:764032765875716116>",
-        Color(85, 34, 153):     "<:529:764032768827981836>",
-        Color(85, 34, 170):     "<:52a:764032772112252928>",
-        Color(85, 34, 187):     "<:52b:764032775904428053>",
-        Color(85, 34, 204):     "<:52c:764032778790371338>",
-        Color(85, 34, 221):     "<:52d:764032782396817459>",
-        Color(85, 34, 238):     "<:52e:764032784981164054>",
-        Color(85, 34, 255):     "<:52f:764032789183201280>",
-        Color(85, 51, 0):       "<:530:764032792148967444>",
-        Color(85, 51, 17):      "<:531:764032795764850699>",
-        Color(85, 51, 34):      "<:532:764032800256819250>",
-        Color(85, 51, 51):      "<:533:764032802769207317>",
-        Color(85, 51, 68):      "<:534:764032806288359435>",
-        Color(85, 51, 85):      "<:535:764032809601466368>",
-        Color(85, 51, 102):     "<:536:764032813195460639>",
-        Color(85, 51, 119):     "<:537:764032816228859914>",
-        Color(85, 51, 136):     "<:538:764032819491897385>",
-        Color(85, 51, 153):     "<:539:764032822826237952>",
-        Color(85, 51, 170):     "<:53a:764032826407518268>",
-        Color(85, 51, 187):     "<:53b:764032829314301982>",
-        Color(85, 51, 204):     "<:53c:764032833051820052>",
-        Color(85, 51, 221):     "<:53d:764032835786506281>",
-        Color(85, 51, 238):     "<:53e:764032839586676757>",
-        Color(85, 51, 255):     "<:53f:764032842505256968>",
-        Color(85, 68, 0):       "<:540:764032846041841665>",
-        Color(85, 68, 17):      "<:541:764032849246027776>",
-        Color(85, 68, 34):      "<:542:764032852446150657>",
-        Color(85, 68, 51):      "<:543:764032855872503808>",
-        Color(85, 68, 68):      "<:544:764032859555627018>",
-        Color(85, 68, 85):      "<:545:764032862642896896>",
-        Color(85, 68, 102):     "<:546:764032865876443157>",
-        Color(85, 68, 119):     "<:547:764032868845748254>",
-        Color(85, 68, 136):     "<:548:764032871723696139>",
-        Color(85, 68, 153):     "<:549:764032874851991582>",
-        Color(85, 68, 170):     "<:54a:764032877448790027>",
-        Color(85, 68, 187):     "<:54b:764032881420795934>",
-        Color(85, 68, 204):     "<:54c:764032884108558337>",
-        Color(85, 68, 221):     "<:54d:764032888026562560>",
-        Color(85, 68, 238):     "<:54e:764032890869907456>",
-        Color(85, 68, 255):     "<:54f:764032894657232896>",
-        Color(85, 85, 0):       "<:550:764032897245773855>",
-        Color(85, 85, 17):      "<:551:764032901209391124>",
-        Color(85, 85, 34):      "<:552:764032904329166868>",
-        Color(85, 85, 51):      "<:553:764032907840847882>",
-        Color(85, 85, 68):      "<:554:764032910730592316>",
-        Color(85, 85, 85):      "<:555:764032914400215041>",
-        Color(85, 85, 102):     "<:556:764032921601703957>",
-        Color(85, 85, 119):     "<:557:764032925464920074>",
-        Color(85, 85, 136):     "<:558:764032928384155669>",
-        Color(85, 85, 153):     "<:559:764032931672096809>",
-        Color(85, 85, 170):     "<:55a:764032934939852811>",
-        Color(85, 85, 187):     "<:55b:764032938646962196>",
-        Color(85, 85, 204):     "<:55c:764032941570392074>",
-        Color(85, 85, 221):     "<:55d:764032945135943681>",
-        Color(85, 85, 238):     "<:55e:764032948080869398>",
-        Color(85, 85, 255):     "<:55f:764032951821271041>",
-        Color(85, 102, 0):      "<:560:764032954539573270>",
-        Color(85, 102, 17):     "<:561:764032958423629824>",
-        Color(85, 102, 34):     "<:562:764032960831684609>",
-        Color(85, 102, 51):     "<:563:764032965062950913>",
-        Color(85, 102, 68):     "<:564:764032968305672192>",
-        Color(85, 102, 85):     "<:565:764032971279564803>",
-        Color(85, 102, 102):    "<:566:764032974622425089>",
-        Color(85, 102, 119):    "<:567:764032978178932756>",
-        Color(85, 102, 136):    "<:568:764032981064351754>",
-        Color(85, 102, 153):    "<:569:764032984864915499>",
-        Color(85, 102, 170):    "<:56a:764032988375416892>",
-        Color(85, 102, 187):    "<:56b:764032991407636520>",
-        Color(85, 102, 204):    "<:56c:764032994251374603>",
-        Color(85, 102, 221):    "<:56d:764032997950226452>",
-        Color(85, 102, 238):    "<:56e:764033000861204480>",
-        Color(85, 102, 255):    "<:56f:764033004745523210>",
-        Color(85, 119, 0):      "<:570:764033007655976960>",
-        Color(85, 119, 17):     "<:571:764033011179978782>",
-        Color(85, 119, 34):     "<:572:764033014127788033>",
-        Color(85, 119, 51):     "<:573:764033017206931456>",
-        Color(85, 119, 68):     "<:574:764033020033368124>",
-        Color(85, 119, 85):     "<:575:764033023015649291>",
-        Color(85, 119, 102):    "<:576:764033025645608962>",
-        Color(85, 119, 119):    "<:577:764033028880072705>",
-        Color(85, 119, 136):    "<:578:764033031794327582>",
-        Color(85, 119, 153):    "<:579:764033035195908116>",
-        Color(85, 119, 170):    "<:57a:764033038148698122>",
-        Color(85, 119, 187):    "<:57b:764033041022320661>",
-        Color(85, 119, 204):    "<:57c:764033043924910101>",
-        Color(85, 119, 221):    "<:57d:764033047108517888>",
-        Color(85, 119, 238):    "<:57e:764033049921847346>",
-        Color(85, 119, 255):    "<:57f:764033052380495873>",
-        Color(85, 136, 0):      "<:580:764033055551389706>",
-        Color(85, 136, 17):     "<:581:764033058159460353>",
-        Color(85, 136, 34):     "<:582:764033062932971531>",
-        Color(85, 136, 51):     "<:583:764033066036625428>",
-        Color(85, 136, 68):     "<:584:764033069035814942>",
-        Color(85, 136, 85):     "<:585:764033071929753611>",
-        Color(85, 136, 102):    "<:586:764033074840731668>",
-        Color(85, 136, 119):    "<:587:764033077336604674>",
-        Color(85, 136, 136):    "<:588:764033080515493888>",
-        Color(85, 136, 153):    "<:589:764033083330002954>",
-        Color(85, 136, 170):    "<:58a:764033085791535135>",
-        Color(85, 136, 187):    "<:58b:764033088959283210>",
-        Color(85, 136, 204):    "<:58c:764033092062543883>",
-        Color(85, 136, 221):    "<:58d:764033095141556234>",
-        Color(85, 136, 238):    "<:58e:764033099091804180>",
-        Color(85, 136, 255):    "<:58f:764033102095056926>",
-        Color(85, 153, 0):      "<:590:764033105689837569>",
-        Color(85, 153, 17):     "<:591:764033109540208671>",
-        Color(85, 153, 34):     "<:592:764033112186421289>",
-        Color(85, 153, 51):     "<:593:764033116246376469>",
-        Color(85, 153, 68):     "<:594:764033118993907734>",
-        Color(85, 153, 85):     "<:595:764033122621849612>",
-        Color(85, 153, 102):    "<:596:764033125742280704>",
-        Color(85, 153, 119):    "<:597:764033129240592407>",
-        Color(85, 153, 136):    "<:598:764033132562481154>",
-        Color(85, 153, 153):    "<:599:764033135905996801>",
-        Color(85, 153, 170):    "<:59a:764033139105464340>",
-        Color(85, 153, 187):    "<:59b:764033142205054987>",
-        Color(85, 153, 204):    "<:59c:764033145074221068>",
-        Color(85, 153, 221):    "<:59d:764033149227237376>",
-        Color(85, 153, 238):    "<:59e:764033152263258112>",
-        Color(85, 153, 255):    "<:59f:764033155824746506>",
-        Color(85, 170, 0):      "<:5a0:764033158739394600>",
-        Color(85, 170, 17):     "<:5a1:764033162111090699>",
-        Color(85, 170, 34):     "<:5a2:764033165693550612>",
-        Color(85, 170, 51):     "<:5a3:764033168675831839>",
-        Color(85, 170, 68):     "<:5a4:764033171708313641>",
-        Color(85, 170, 85):     "<:5a5:764033175366139905>",
-        Color(85, 170, 102):    "<:5a6:764033178700087307>",
-        Color(85, 170, 119):    "<:5a7:764033182168907786>",
-        Color(85, 170, 136):    "<:5a8:764033186899820564>",
-        Color(85, 170, 153):    "<:5a9:764033189965725716>",
-        Color(85, 170, 170):    "<:5aa:764033194072342538>",
-        Color(85, 170, 187):    "<:5ab:764033197025525780>",
-        Color(85, 170, 204):    "<:5ac:764033200376381440>",
-        Color(85, 170, 221):    "<:5ad:764033203236896770>",
-        Color(85, 170, 238):    "<:5ae:764033206907174912>",
-        Color(85, 170, 255):    "<:5af:764033209913704459>",
-        Color(85, 187, 0):      "<:5b0:764033213504946206>",
-        Color(85, 187, 17):     "<:5b1:764033216398884914>",
-        Color(85, 187, 34):     "<:5b2:764033220085547018>",
-        Color(85, 187, 51):     "<:5b3:764033222635421728>",
-        Color(85, 187, 68):     "<:5b4:764033226607951882>",
-        Color(85, 187, 85):     "<:5b5:764033229476069387>",
-        Color(85, 187, 102):    "<:5b6:764033233296818177>",
-        Color(85, 187, 119):    "<:5b7:764033236250394654>",
-        Color(85, 187, 136):    "<:5b8:764033239886725140>",
-        Color(85, 187, 153):    "<:5b9:764033242730856449>",
-        Color(85, 187, 170):    "<:5ba:764033246185914369>",
-        Color(85, 187, 187):    "<:5bb:764033249416183808>",
-        Color(85, 187, 204):    "<:5bc:764033253039407114>",
-        Color(85, 187, 221):    "<:5bd:764033255925088257>",
-        Color(85, 187, 238):    "<:5be:764033259708612628>",
-        Color(85, 187, 255):    "<:5bf:764033262610808853>",
-        Color(85, 204, 0):      "<:5c0:764033266105319435>",
-        Color(85, 204, 17):     "<:5c1:764033269137801217>",
-        Color(85, 204, 34):     "<:5c2:764033272967462942>",
-        Color(85, 204, 51):     "<:5c3:764033275903475732>",
-        Color(85, 204, 68):     "<:5c4:764033279451201546>",
-        Color(85, 204, 85):     "<:5c5:764033282555117608>",
-        Color(85, 204, 102):    "<:5c6:764033285902565388>",
-        Color(85, 204, 119):    "<:5c7:764033288590721035>",
-        Color(85, 204, 136):    "<:5c8:764033292604801055>",
-        Color(85, 204, 153):    "<:5c9:764033295540813865>",
-        Color(85, 204, 170):    "<:5ca:764033301493055498>",
-        Color(85, 204, 187):    "<:5cb:764033304512954378>",
-        Color(85, 204, 204):    "<:5cc:764033308304080916>",
-        Color(85, 204, 221):    "<:5cd:764033312879673354>",
-        Color(85, 204, 238):    "<:5ce:764033315933388810>",
-        Color(85, 204, 255):    "<:5cf:764033318773063702>",
-        Color(85, 221, 0):      "<:5d0:764033321860595722>",
-        Color(85, 221, 17):     "<:5d1:764033325773094925>",
-        Color(85, 221, 34):     "<:5d2:764033328646324254>",
-        Color(85, 221, 51):     "<:5d3:764033332236517386>",
-        Color(85, 221, 68):     "<:5d4:764033335243964457>",
-        Color(85, 221, 85):     "<:5d5:764033338511851524>",
-        Color(85, 221, 102):    "<:5d6:764033341682221057>",
-        Color(85, 221, 119):    "<:5d7:764033345130332191>",
-        Color(85, 221, 136):    "<:5d8:764033348598366218>",
-        Color(85, 221, 153):    "<:5d9:764033351535165440>",
-        Color(85, 221, 170):    "<:5da:764033354382704681>",
-        Color(85, 221, 187):    "<:5db:764033357599866912>",
-        Color(85, 221, 204):    "<:5dc:764033360997122079>",
-        Color(85, 221, 221):    "<:5dd:764033364037599252>",
-        Color(85, 221, 238):    "<:5de:764033366692593685>",
-        Color(85, 221, 255):    "<:5df:764033369947897856>",
-        Color(85, 238, 0):      "<:5e0:764033373521707038>",
-        Color(85, 238, 17):     "<:5e1:764033376524697650>",
-        Color(85, 238, 34):     "<:5e2:764033379451797534>",
-        Color(85, 238, 51):     "<:5e3:764033382333546506>",
-        Color(85, 238, 68):     "<:5e4:764033385223946240>",
-        Color(85, 238, 85):     "<:5e5:764033388986236949>",
-        Color(85, 238, 102):    "<:5e6:764033392290562068>",
-        Color(85, 238, 119):    "<:5e7:764033396123893801>",
-        Color(85, 238, 136):    "<:5e8:764033399189930004>",
-        Color(85, 238, 153):    "<:5e9:764033401686327306>",
-        Color(85, 238, 170):    "<:5ea:764033404588785665>",
-        Color(85, 238, 187):    "<:5eb:764033407821938688>",
-        Color(85, 238, 204):    "<:5ec:764033410770665522>",
-        Color(85, 238, 221):    "<:5ed:764033413756747796>",
-        Color(85, 238, 238):    "<:5ee:764033416584757268>",
-        Color(85, 238, 255):    "<:5ef:764033419381309450>",
-        Color(85, 255, 0):      "<:5f0:764033422170783745>",
-        Color(85, 255, 17):     "<:5f1:764033429083127818>",
-        Color(85, 255, 34):     "<:5f2:764033431939317800>",
-        Color(85, 255, 51):     "<:5f3:764033434783318026>",
-        Color(85, 255, 68):     "<:5f4:764033437509091330>",
-        Color(85, 255, 85):     "<:5f5:764033440961658880>",
-        Color(85, 255, 102):    "<:5f6:764033443860316170>",
-        Color(85, 255, 119):    "<:5f7:764033446720569354>",
-        Color(85, 255, 136):    "<:5f8:764033449391947777>",
-        Color(85, 255, 153):    "<:5f9:764033452521291776>",
-        Color(85, 255, 170):    "<:5fa:764033455369486336>",
-        Color(85, 255, 187):    "<:5fb:764033458325422080>",
-        Color(85, 255, 204):    "<:5fc:764033461283323944>",
-        Color(85, 255, 221):    "<:5fd:764033464114348033>",
-        Color(85, 255, 238):    "<:5fe:764033466949042187>",
-        Color(85, 255, 255):    "<:5ff:764033469717413910>",
-        Color(102, 0, 0):       "<:600:764033474126151720>",
-        Color(102, 0, 17):      "<:601:764033476999512074>",
-        Color(102, 0, 34):      "<:602:764033480417345536>",
-        Color(102, 0, 51):      "<:603:764033482959355916>",
-        Color(102, 0, 68):      "<:604:764033486998470656>",
-        Color(102, 0, 85):      "<:605:764033490064506900>",
-        Color(102, 0, 102):     "<:606:764033493322694698>",
-        Color(102, 0, 119):     "<:607:764033496494505994>",
-        Color(102, 0, 136):     "<:608:764033500143157258>",
-        Color(102, 0, 153):     "<:609:764033502991220736>",
-        Color(102, 0, 170):     "<:60a:764033506833596448>",
-        Color(102, 0, 187):     "<:60b:764033509865160715>",
-        Color(102, 0, 204):     "<:60c:764033513313009675>",
-        Color(102, 0, 221):     "<:60d:764033516010209282>",
-        Color(102, 0, 238):     "<:60e:764033520003579904>",
-        Color(102, 0, 255):     "<:60f:764033522863964179>",
-        Color(102, 17, 0):      "<:610:764033526596763679>",
-        Color(102, 17, 17):     "<:611:764033529196838943>",
-        Color(102, 17, 34):     "<:612:764033533562978314>",
-        Color(102, 17, 51):     "<:613:764033536440664064>",
-        Color(102, 17, 68):     "<:614:764033539770548234>",
-        Color(102, 17, 85):     "<:615:764033542623068160>",
-        Color(102, 17, 102):    "<:616:764033546435690516>",
-        Color(102, 17, 119):    "<:617:764033549388742686>",
-        Color(102, 17, 136):    "<:618:764033552916021258>",
-        Color(102, 17, 153):    "<:619:764033555629473804>",
-        Color(102, 17, 170):    "<:61a:764033559581032448>",
-        Color(102, 17, 187):    "<:61b:764033562462519306>",
-        Color(102, 17, 204):    "<:61c:764033566128472075>",
-        Color(102, 17, 221):    "<:61d:764033569101316116>",
-        Color(102, 17, 238):    "<:61e:764033572633313281>",
-        Color(102, 17, 255):    "<:61f:764033577226600458>",
-        Color(102, 34, 0):      "<:620:764033580112019486>",
-        Color(102, 34, 17):     "<:621:764033583722790912>",
-        Color(102, 34, 34):     "<:622:764033586361401345>",
-        Color(102, 34, 51):     "<:623:764033590388195328>",
-        Color(102, 34, 68):     "<:624:764033593219350578>",
-        Color(102, 34, 85):     "<:625:764033596964601886>",
-        Color(102, 34, 102):    "<:626:764033599983976498>",
-        Color(102, 34, 119):    "<:627:764033603570761748>",
-        Color(102, 34, 136):    "<:628:764033606393004032>",
-        Color(102, 34, 153):    "<:629:764033609870344193>",
-        Color(102, 34, 170):    "<:62a:764033613511393280>",
-        Color(102, 34, 187):    "<:62b:764033616791470080>",
-        Color(102, 34, 204):    "<:62c:764033619886211082>",
-        Color(102, 34, 221):    "<:62d:764033623241523201>",
-        Color(102, 34, 238):    "<:62e:764033626169278475>",
-        Color(102, 34, 255):    "<:62f:764033629940219934>",
-        Color(102, 51, 0):      "<:630:764033632498876418>",
-        Color(102, 51, 17):     "<:631:764033635413655553>",
-        Color(102, 51, 34):     "<:632:764033638278496267>",
-        Color(102, 51, 51):     "<:633:764033642615144449>",
-        Color(102, 51, 68):     "<:634:764033645609615370>",
-        Color(102, 51, 85):     "<:635:764033649192337419>",
-        Color(102, 51, 102):    "<:636:764033651955990591>",
-        Color(102, 51, 119):    "<:637:764033655487201280>",
-        Color(102, 51, 136):    "<:638:764033658272350209>",
-        Color(102, 51, 153):    "<:639:764033662379360256>",
-        Color(102, 51, 170):    "<:63a:764033666220818452>",
-        Color(102, 51, 187):    "<:63b:764033669081726987>",
-        Color(102, 51, 204):    "<:63c:764033673104195624>",
-        Color(102, 51, 221):    "<:63d:764033675728781323>",
-        Color(102, 51, 238):    "<:63e:764033679629746196>",
-        Color(102, 51, 255):    "<:63f:764033682246991884>",
-        Color(102, 68, 0):      "<:640:764033685011431506>",
-        Color(102, 68, 17):     "<:641:764033688257429525>",
-        Color(102, 68, 34):     "<:642:764033691705671680>",
-        Color(102, 68, 51):     "<:643:764033695065440276>",
-        Color(102, 68, 68):     "<:644:764033698198323240>",
-        Color(102, 68, 85):     "<:645:764033701369610261>",
-        Color(102, 68, 102):    "<:646:764033704200634369>",
-        Color(102, 68, 119):    "<:647:764033708390744084>",
-        Color(102, 68, 136):    "<:648:764033711292809246>",
-        Color(102, 68, 153):    "<:649:764033714850103306>",
-        Color(102, 68, 170):    "<:64a:764033717756231680>",
-        Color(102, 68, 187):    "<:64b:764033721576718337>",
-        Color(102, 68, 204):    "<:64c:764033724467380235>",
-        Color(102, 68, 221):    "<:64d:764033728350912532>",
-        Color(102, 68, 238):    "<:64e:764033731341975584>",
-        Color(102, 68, 255):    "<:64f:764033734746832898>",
-        Color(102, 85, 0):      "<:650:764033737808674816>",
-        Color(102, 85, 17):     "<:651:764033741789200424>",
-        Color(102, 85, 34):     "<:652:764033745677451294>",
-        Color(102, 85, 51):     "<:653:764033748483178506>",
-        Color(102, 85, 68):     "<:654:764033752342331402>",
-        Color(102, 85, 85):     "<:655:764033755282145280>",
-        Color(102, 85, 102):    "<:656:764033758592368662>",
-        Color(102, 85, 119):    "<:657:764033762458861598>",
-        Color(102, 85, 136):    "<:658:764033765692932116>",
-        Color(102, 85, 153):    "<:659:764033768537063424>",
-        Color(102, 85, 170):    "<:65a:764033771988058132>",
-        Color(102, 85, 187):    "<:65b:764033774655635478>",
-        Color(102, 85, 204):    "<:65c:764033778607194113>",
-        Color(102, 85, 221):    "<:65d:764033781774286848>",
-        Color(102, 85, 238):    "<:65e:764033785209159700>",
-        Color(102, 85, 255):    "<:65f:764033788488843274>",
-        Color(102, 102, 0):     "<:660:764033791970508800>",
-        Color(102, 102, 17):    "<:661:764033794775842816>",
-        Color(102, 102, 34):    "<:662:764033798455164938>",
-        Color(102, 102, 51):    "<:663:764033801373614110>",
-        Color(102, 102, 68):    "<:664:764033805048610846>",
-        Color(102, 102, 85):    "<:665:764033807963652096>",
-        Color(102, 102, 102):   "<:666:764033811792134144>",
-        Color(102, 102, 119):   "<:667:764033814724870195>",
-        Color(102, 102, 136):   "<:668:764033818256080917>",
-        Color(102, 102, 153):   "<:669:764033821167058974>",
-        Color(102, 102, 170):   "<:66a:764033824605601803>",
-        Color(102, 102, 187):   "<:66b:764033827487350785>",
-        Color(102, 102, 204):   "<:66c:764033831296434207>",
-        Color(102, 102, 221):   "<:66d:764033834936172544>",
-        Color(102, 102, 238):   "<:66e:764033838015184906>",
-        Color(102, 102, 255):   "<:66f:764033840569253889>",
-        Color(102, 119, 0):     "<:670:764033843631226900>",
-        Color(102, 119, 17):    "<:671:764033846941319178>",
-        Color(102, 119, 34):    "<:672:764033850015219723>",
-        Color(102, 119, 51):    "<:673:764033853425582081>",
-        Color(102, 119, 68):    "<:674:764033856193036329>",
-        Color(102, 119, 85):    "<:675:764033859833823244>",
-        Color(102, 119, 102):   "<:676:764033862997114880>",
-        Color(102, 119, 119):   "<:677:764033866611556362>",
-        Color(102, 119, 136):   "<:678:764033869493960704>",
-        Color(102, 119, 153):   "<:679:764033872991223819>",
-        Color(102, 119, 170):   "<:67a:764033876041007126>",
-        Color(102, 119, 187):   "<:67b:764033879614160907>",
-        Color(102, 119, 204):   "<:67c:764033882785185822>",
-        Color(102, 119, 221):   "<:67d:764033886334222336>",
-        Color(102, 119, 238):   "<:67e:764033889261715456>",
-        Color(102, 119, 255):   "<:67f:764033893048516619>",
-        Color(102, 136, 0):     "<:680:764033896291368970>",
-        Color(102, 136, 17):    "<:681:764033899402625055>",
-        Color(102, 136, 34):    "<:682:764033902414266398>",
-        Color(102, 136, 51):    "<:683:764033906202378250>",
-        Color(102, 136, 68):    "<:684:764033908945190933>",
-        Color(102, 136, 85):    "<:685:764033912783110154>",
-        Color(102, 136, 102):   "<:686:764033915668791336>",
-        Color(102, 136, 119):   "<:687:764033919447990272>",
-        Color(102, 136, 136):   "<:688:764033922089877525>",
-        Color(102, 136, 153):   "<:689:764033925751242753>",
-        Color(102, 136, 170):   "<:68a:764033928553693186>",
-        Color(102, 136, 187):   "<:68b:764033932399214633>",
-        Color(102, 136, 204):   "<:68c:764033935897395200>",
-        Color(102, 136, 221):   "<:68d:764033939169083402>",
-        Color(102, 136, 238):   "<:68e:764033941840855051>",
-        Color(102, 136, 255):   "<:68f:764033946001342476>",
-        Color(102, 153, 0):     "<:690:764033950288445460>",
-        Color(102, 153, 17):    "<:691:764033953228128276>",
-        Color(102, 153, 34):    "<:692:764033956734828564>",
-        Color(102, 153, 51):    "<:693:764033959612252210>",
-        Color(102, 153, 68):    "<:694:764033963395907605>",
-        Color(102, 153, 85):    "<:695:764033966180270101>",
-        Color(102, 153, 102):   "<:696:764033970316509194>",
-        Color(102, 153, 119):   "<:697:764033973483339776>",
-        Color(102, 153, 136):   "<:698:764033976562089984>",
-        Color(102, 153, 153):   "<:699:764033979460222976>",
-        Color(102, 153, 170):   "<:69a:764033983150292992>",
-        Color(102, 153, 187):   "<:69b:764033986053013514>",
-        Color(102, 153, 204):   "<:69c:764033989919899648>",
-        Color(102, 153, 221):   "<:69d:764033992827338763>",
-        Color(102, 153, 238):   "<:69e:764033996367200256>",
-        Color(102, 153, 255):   "<:69f:764033999084584971>",
-        Color(102, 170, 0):     "<:6a0:764034003018711070>",
-        Color(102, 170, 17):    "<:6a1:764034005804122132>",
-        Color(102, 170, 34):    "<:6a2:764034009327861781>",
-        Color(102, 170, 51):    "<:6a3:764034012363620362>",
-        Color(102, 170, 68):    "<:6a4:764034016252657665>",
-        Color(102, 170, 85):    "<:6a5:764034018970435605>",
-        Color(102, 170, 102):   "<:6a6:764034022652248064>",
-        Color(102, 170, 119):   "<:6a7:764034025467543583>",
-        Color(102, 170, 136):   "<:6a8:764034028323733514>",
-        Color(102, 170, 153):   "<:6a9:764034031171010562>",
-        Color(102, 170, 170):   "<:6aa:764034034304417833>",
-        Color(102, 170, 187):   "<:6ab:764034037144092682>",
-        Color(102, 170, 204):   "<:6ac:764034039665262604>",
-        Color(102, 170, 221):   "<:6ad:764034042927906816>",
-        Color(102, 170, 238):   "<:6ae:764034046027628564>",
-        Color(102, 170, 255):   "<:6af:764034048946470943>",
-        Color(102, 187, 0):     "<:6b0:764034051811049492>",
-        Color(102, 187, 17):    "<:6b1:764034054688997386>",
-        Color(102, 187, 34):    "<:6b2:764034058064756756>",
-        Color(102, 187, 51):    "<:6b3:764034061152288798>",
-        Color(102, 187, 68):    "<:6b4:764034064146759690>",
-        Color(102, 187, 85):    "<:6b5:764034066994954240>",
-        Color(102, 187, 102):   "<:6b6:764034069868314624>",
-        Color(102, 187, 119):   "<:6b7:764034072418451478>",
-        Color(102, 187, 136):   "<:6b8:764034075815837706>",
-        Color(102, 187, 153):   "<:6b9:764034078596136990>",
-        Color(102, 187, 170):   "<:6ba:764034081071300637>",
-        Color(102, 187, 187):   "<:6bb:764034084107976705>",
-        Color(102, 187, 204):   "<:6bc:764034087206912021>",
-        Color(102, 187, 221):   "<:6bd:764034090205708308>",
-        Color(102, 187, 238):   "<:6be:764034093032669214>",
-        Color(102, 187, 255):   "<:6bf:764034095746514977>",
-        Color(102, 204, 0):     "<:6c0:764034098971934740>",
-        Color(102, 204, 17):    "<:6c1:764034101635186720>",
-        Color(102, 204, 34):    "<:6c2:764034104681299969>",
-        Color(102, 204, 51):    "<:6c3:764034107512324137>",
-        Color(102, 204, 68):    "<:6c4:764034110465114112>",
-        Color(102, 204, 85):    "<:6c5:764034113509392385>",
-        Color(102, 204, 102):   "<:6c6:764034117816811530>",
-        Color(102, 204, 119):   "<:6c7:764034120874459147>",
-        Color(102, 204, 136):   "<:6c8:764034123886362634>",
-        Color(102, 204, 153):   "<:6c9:764034126755659796>",
-        Color(102, 204, 170):   "<:6ca:764034129532420097>",
-        Color(102, 204, 187):   "<:6cb:764034133008711717>",
-        Color(102, 204, 204):   "<:6cc:764034136301895690>",
-        Color(102, 204, 221):   "<:6cd:764034139086651402>",
-        Color(102, 204, 238):   "<:6ce:764034141951230002>",
-        Color(102, 204, 255):   "<:6cf:764034144950157343>",
-        Color(102, 221, 0):     "<:6d0:764034148183834624>",
-        Color(102, 221, 17):    "<:6d1:764034151795130399>",
-        Color(102, 221, 34):    "<:6d2:764034154605969429>",
-        Color(102, 221, 51):    "<:6d3:764034158405091329>",
-        Color(102, 221, 68):    "<:6d4:764034161227857931>",
-        Color(102, 221, 85):    "<:6d5:764034164982415370>",
-        Color(102, 221, 102):   "<:6d6:764034167943462962>",
-        Color(102, 221, 119):   "<:6d7:764034171626323989>",
-        Color(102, 221, 136):   "<:6d8:764034174817796096>",
-        Color(102, 221, 153):   "<:6d9:764034177913847819>",
-        Color(102, 221, 170):   "<:6da:764034181294063628>",
-        Color(102, 221, 187):   "<:6db:764034184654094356>",
-        Color(102, 221, 204):   "<:6dc:764034187576606720>",
-        Color(102, 221, 221):   "<:6dd:764034191033237505>",
-        Color(102, 221, 238):   "<:6de:764034194304663593>",
-        Color(102, 221, 255):   "<:6df:764034197874409482>",
-        Color(102, 238, 0):     "<:6e0:764034200676204554>",
-        Color(102, 238, 17):    "<:6e1:764034203566211093>",
-        Color(102, 238, 34):    "<:6e2:764034206757421096>",
-        Color(102, 238, 51):    "<:6e3:764034209760542730>",
-        Color(102, 238, 68):    "<:6e4:764034213150064641>",
-        Color(102, 238, 85):    "<:6e5:764034216462909490>",
-        Color(102, 238, 102):   "<:6e6:764034219839717396>",
-        Color(102, 238, 119):   "<:6e7:764034222637056011>",
-        Color(102, 238, 136):   "<:6e8:764034227301384222>",
-        Color(102, 238, 153):   "<:6e9:764034230887383081>",
-        Color(102, 238, 170):   "<:6ea:764034233361629197>",
-        Color(102, 238, 187):   "<:6eb:764034237695000607>",
-        Color(102, 238, 204):   "<:6ec:764034240471105538>",
-        Color(102, 238, 221):   "<:6ed:764034244405887006>",
-        Color(102, 238, 238):   "<:6ee:764034247417397300>",
-        Color(102, 238, 255):   "<:6ef:764034250315268107>",
-        Color(102, 255, 0):     "<:6f0:764034253184565250>",
-        Color(102, 255, 17):    "<:6f1:764034257156177921>",
-        Color(102, 255, 34):    "<:6f2:764034260309901322>",
-        Color(102, 255, 51):    "<:6f3:764034264085692426>",
-        Color(102, 255, 68):    "<:6f4:764034266916978688>",
-        Color(102, 255, 85):    "<:6f5:764034270552522752>",
-        Color(102, 255, 102):   "<:6f6:764034273543585812>",
-        Color(102, 255, 119):   "<:6f7:764034277213863968>",
-        Color(102, 255, 136):   "<:6f8:764034279831109653>",
-        Color(102, 255, 153):   "<:6f9:764034283651858482>",
-        Color(102, 255, 170):   "<:6fa:764034286487076875>",
-        Color(102, 255, 187):   "<:6fb:764034289917624341>",
-        Color(102, 255, 204):   "<:6fc:764034293164015656>",
-        Color(102, 255, 221):   "<:6fd:764034296485773345>",
-        Color(102, 255, 238):   "<:6fe:764034299677900802>",
-        Color(102, 255, 255):   "<:6ff:764034303491047464>",
-        Color(119, 0, 0):       "<:700:764034305944190987>",
-        Color(119, 0, 17):      "<:701:764034310177030144>",
-        Color(119, 0, 34):      "<:702:764034313083027456>",
-        Color(119, 0, 51):      "<:703:764034316627607562>",
-        Color(119, 0, 68):      "<:704:764034319542910997>",
-        Color(119, 0, 85):      "<:705:764034323233505310>",
-        Color(119, 0, 102):     "<:706:764034326156804116>",
-        Color(119, 0, 119):     "<:707:764034329801785354>",
-        Color(119, 0, 136):     "<:708:764034332850388993>",
-        Color(119, 0, 153):     "<:709:764034336432586752>",
-        Color(119, 0, 170):     "<:70a:764034339284713492>",
-        Color(119, 0, 187):     "<:70b:764034343299186688>",
-        Color(119, 0, 204):     "<:70c:764034346200858624>",
-        Color(119, 0, 221):     "<:70d:764034349623410688>",
-        Color(119, 0, 238):     "<:70e:764034352677519360>",
-        Color(119, 0, 255):     "<:70f:764034356238876712>",
-        Color(119, 17, 0):      "<:710:764034359116038145>",
-        Color(119, 17, 17):     "<:711:764034362848968714>",
-        Color(119, 17, 34):     "<:712:764034365750640650>",
-        Color(119, 17, 51):     "<:713:764034369371242546>",
-        Color(119, 17, 68):     "<:714:764034372306862110>",
-        Color(119, 17, 85):     "<:715:764034376039399434>",
-        Color(119, 17, 102):    "<:716:764034378921541642>",
-        Color(119, 17, 119):    "<:717:764034382557216768>",
-        Color(119, 17, 136):    "<:718:764034385488904192>",
-        Color(119, 17, 153):    "<:719:764034389121171457>",
-        Color(119, 17, 170):    "<:71a:764034392438996992>",
-        Color(119, 17, 187):    "<:71b:764034395803222016>",
-        Color(119, 17, 204):    "<:71c:764034398935973899>",
-        Color(119, 17, 221):    "<:71d:764034402669690880>",
-        Color(119, 17, 238):    "<:71e:764034405495865344>",
-        Color(119, 17, 255):    "<:71f:764034409053552670>",
-        Color(119, 34, 0):      "<:720:764034412052086845>",
-        Color(119, 34, 17):     "<:721:764034416455450625>",
-        Color(119, 34, 34):     "<:722:764034420163215372>",
-        Color(119, 34, 51):     "<:723:764034424420958239>",
-        Color(119, 34, 68):     "<:724:764034427412021280>",
-        Color(119, 34, 85):     "<:725:764034431098421248>",
-        Color(119, 34, 102):    "<:726:764034434189230090>",
-        Color(119, 34, 119):    "<:727:764034437390008380>",
-        Color(119, 34, 136):    "<:728:764034440577548299>",
-        Color(119, 34, 153):    "<:729:764034444197625856>",
-        Color(119, 34, 170):    "<:72a:764034447082651648>",
-        Color(119, 34, 187):    "<:72b:764034450857656330>",
-        Color(119, 34, 204):    "<:72c:764034453722628096>",
-        Color(119, 34, 221):    "<:72d:764034457354895370>",
-        Color(119, 34, 238):    "<:72e:764034460093251596>",
-        Color(119, 34, 255):    "<:72f:764034463780175914>",
-        Color(119, 51, 0):      "<:730:764034466410397699>",
-        Color(119, 51, 17):     "<:731:764034469681823744>",
-        Color(119, 51, 34):     "<:732:764034473607168010>",
-        Color(119, 51, 51):     "<:733:764034476674121739>",
-        Color(119, 51, 68):     "<:734:764034479836102677>",
-        Color(119, 51, 85):     "<:735:764034482931630081>",
-        Color(119, 51, 102):    "<:736:764034486760898571>",
-        Color(119, 51, 119):    "<:737:764034490174930944>",
-        Color(119, 51, 136):    "<:738:764034493371383858>",
-        Color(119, 51, 153):    "<:739:764034496361267230>",
-        Color(119, 51, 170):    "<:73a:764034499968237579>",
-        Color(119, 51, 187):    "<:73b:764034502841991179>",
-        Color(119, 51, 204):    "<:73c:764034506557882388>",
-        Color(119, 51, 221):    "<:73d:764034509430718474>",
-        Color(119, 51, 238):    "<:73e:764034513142677514>",
-        Color(119, 51, 255):    "<:73f:764034516028751913>",
-        Color(119, 68, 0):      "<:740:764034519535583254>",
-        Color(119, 68, 17):     "<:741:764034522937294858>",
-        Color(119, 68, 34):     "<:742:764034526375706625>",
-        Color(119, 68, 51):     "<:743:764034529471627264>",
-        Color(119, 68, 68):     "<:744:764034533229592596>",
-        Color(119, 68, 85):     "<:745:764034536198766592>",
-        Color(119, 68, 102):    "<:746:764034539906531328>",
-        Color(119, 68, 119):    "<:747:764034542683029505>",
-        Color(119, 68, 136):    "<:748:764034546106105856>",
-        Color(119, 68, 153):    "<:749:764034549238726666>",
-        Color(119, 68, 170):    "<:74a:764034552707678228>",
-        Color(119, 68, 187):    "<:74b:764034555656536074>",
-        Color(119, 68, 204):    "<:74c:764034559100321793>",
-        Color(119, 68, 221):    "<:74d:764034562166620190>",
-        Color(119, 68, 238):    "<:74e:764034565936644157>",
-        Color(119, 68, 255):    "<:74f:764034568978169857>",
-        Color(119, 85, 0):      "<:750:764034572551192576>",
-        Color(119, 85, 17):     "<:751:764034575521284117>",
-        Color(119, 85, 34):     "<:752:764034579086049291>",
-        Color(119, 85, 51):     "<:753:764034582362193950>",
-        Color(119, 85, 68):     "<:754:764034585834422292>",
-        Color(119, 85, 85):     "<:755:764034588813033503>",
-        Color(119, 85, 102):    "<:756:764034592314621952>",
-        Color(119, 85, 119):    "<:757:764034595174875146>",
-        Color(119, 85, 136):    "<:758:764034598874906655>",
-        Color(119, 85, 153):    "<:759:764034601726246912>",
-        Color(119, 85, 170):    "<:75a:764034605509509151>",
-        Color(119, 85, 187):    "<:75b:764034608445521950>",
-        Color(119, 85, 204):    "<:75c:764034612002947073>",
-        Color(119, 85, 221):    "<:75d:764034614536044617>",
-        Color(119, 85, 238):    "<:75e:764034618764558336>",
-        Color(119, 85, 255):    "<:75f:764034621746053180>",
-        Color(119, 102, 0):     "<:760:764034625261273098>",
-        Color(119, 102, 17):    "<:761:764034628394680331>",
-        Color(119, 102, 34):    "<:762:764034631976091648>",
-        Color(119, 102, 51):    "<:763:764034634719559681>",
-        Color(119, 102, 68):    "<:764:764034638402027531>",
-        Color(119, 102, 85):    "<:765:764034641182720010>",
-        Color(119, 102, 102):   "<:766:764034644172734464>",
-        Color(119, 102, 119):   "<:767:764034647255547914>",
-        Color(119, 102, 136):   "<:768:764034650095616000>",
-        Color(119, 102, 153):   "<:769:764034653564043285>",
-        Color(119, 102, 170):   "<:76a:764034656811089920>",
-        Color(119, 102, 187):   "<:76b:764034661277237249>",
-        Color(119, 102, 204):   "<:76c:764034665677848576>",
-        Color(119, 102, 221):   "<:76d:764034669036961824>",
-        Color(119, 102, 238):   "<:76e:764034672056991754>",
-        Color(119, 102, 255):   "<:76f:764034674942017556>",
-        Color(119, 119, 0):     "<:770:764034678050390016>",
-        Color(119, 119, 17):    "<:771:764034681158500388>",
-        Color(119, 119, 34):    "<:772:764034684316418050>",
-        Color(119, 119, 51):    "<:773:764034687685230592>",
-        Color(119, 119, 68):    "<:774:764034691350659072>",
-        Color(119, 119, 85):    "<:775:764034694282215424>",
-        Color(119, 119, 102):   "<:776:764034697625337878>",
-        Color(119, 119, 119):   "<:777:764034700842762300>",
-        Color(119, 119, 136):   "<:778:764034705333944350>",
-        Color(119, 119, 153):   "<:779:764034709645819934>",
-        Color(119, 119, 170):   "<:77a:764034714028867589>",
-        Color(119, 119, 187):   "<:77b:764034718307319809>",
-        Color(119, 119, 204):   "<:77c:764034721818214411>",
-        Color(119, 119, 221):   "<:77d:764034724988452885>",
-        Color(119, 119, 238):   "<:77e:764034729812688907>",
-        Color(119, 119, 255):   "<:77f:764034733507084310>",
-        Color(119, 136, 0):     "<:780:764034738171543563>",
-        Color(119, 136, 17):    "<:781:764034741443756033>",
-        Color(119, 136, 34):    "<:782:764034744828559362>",
-        Color(119, 136, 51):    "<:783:764034748259106848>",
-        Color(119, 136, 68):    "<:784:764034751811420170>",
-        Color(119, 136, 85):    "<:785:764034754919661579>",
-        Color(119, 136, 102):   "<:786:764034758182305812>",
-        Color(119, 136, 119):   "<:787:764034761819029504>",
-        Color(119, 136, 136):   "<:788:764034765937836072>",
-        Color(119, 136, 153):   "<:789:764034768794812427>",
-        Color(119, 136, 170):   "<:78a:764034772757512202>",
-        Color(119, 136, 187):   "<:78b:764034775635460127>",
-        Color(119, 136, 204):   "<:78c:764034779200356352>",
-        Color(119, 136, 221):   "<:78d:764034782035181608>",
-        Color(119, 136, 238):   "<:78e:764034785915830302>",
-        Color(119, 136, 255):   "<:78f:764034788717756416>",
-        Color(119, 153, 0):     "<:790:764034792844034048>",
-        Color(119, 153, 17):    "<:791:764034795729846274>",
-        Color(119, 153, 34):    "<:792:764034799047540766>",
-        Color(119, 153, 51):    "<:793:764034802013437972>",
-        Color(119, 153, 68):    "<:794:764034805595242506>",
-        Color(119, 153, 85):    "<:795:764034808363876382>",
-        Color(119, 153, 102):   "<:796:764034812650192906>",
-        Color(119, 153, 119):   "<:797:764034816781320212>",
-        Color(119, 153, 136):   "<:798:764034819775660032>",
-        Color(119, 153, 153):   "<:799:764034823173570580>",
-        Color(119, 153, 170):   "<:79a:764034826054402088>",
-        Color(119, 153, 187):   "<:79b:764034829830062090>",
-        Color(119, 153, 204):   "<:79c:764034832685727775>",
-        Color(119, 153, 221):   "<:79d:764034836331495464>",
-        Color(119, 153, 238):   "<:79e:764034838789226507>",
-        Color(119, 153, 255):   "<:79f:764034843016691712>",
-        Color(119, 170, 0):     "<:7a0:764034845927276544>",
-        Color(119, 170, 17):    "<:7a1:764034849262010380>",
-        Color(119, 170, 34):    "<:7a2:764034852521246720>",
-        Color(119, 170, 51):    "<:7a3:764034855779434507>",
-        Color(119, 170, 68):    "<:7a4:764034859161092126>",
-        Color(119, 170, 85):    "<:7a5:764034862859550720>",
-        Color(119, 170, 102):   "<:7a6:764034866005671956>",
-        Color(119, 170, 119):   "<:7a7:764034869423505438>",
-        Color(119, 170, 136):   "<:7a8:764034871970234370>",
-        Color(119, 170, 153):   "<:7a9:764034876139110420>",
-        Color(119, 170, 170):   "<:7aa:764034879067127831>",
-        Color(119, 170, 187):   "<:7ab:764034882610659358>",
-        Color(119, 170, 204):   "<:7ac:764034885509709874>",
-        Color(119, 170, 221):   "<:7ad:764034889204498432>",
-        Color(119, 170, 238):   "<:7ae:764034892106432543>",
-        Color(119, 170, 255):   "<:7af:764034896137027585>",
-        Color(119, 187, 0):     "<:7b0:764034899111051284>",
-        Color(119, 187, 17):    "<:7b1:764034902345121812>",
-        Color(119, 187, 34):    "<:7b2:764034905264750602>",
-        Color(119, 187, 51):    "<:7b3:764034908746154065>",
-        Color(119, 187, 68):    "<:7b4:764034911887687680>",
-        Color(119, 187, 85):    "<:7b5:764034915574218752>",
-        Color(119, 187, 102):   "<:7b6:764034918094864415>",
-        Color(119, 187, 119):   "<:7b7:764034922176053248>",
-        Color(119, 187, 136):   "<:7b8:764034924990038066>",
-        Color(119, 187, 153):   "<:7b9:764034928962306068>",
-        Color(119, 187, 170):   "<:7ba:764034932100038686>",
-        Color(119, 187, 187):   "<:7bb:764034935530192916>",
-        Color(119, 187, 204):   "<:7bc:764034938579714089>",
-        Color(119, 187, 221):   "<:7bd:764034941893738496>",
-        Color(119, 187, 238):   "<:7be:764034944774569984>",
-        Color(119, 187, 255):   "<:7bf:764034948549443594>",
-        Color(119, 204, 0):     "<:7c0:764034951447314432>",
-        Color(119, 204, 17):    "<:7c1:764034955323768882>",
-        Color(119, 204, 34):    "<:7c2:764034958259781632>",
-        Color(119, 204, 51):    "<:7c3:764034962068209704>",
-        Color(119, 204, 68):    "<:7c4:764034964916011008>",
-        Color(119, 204, 85):    "<:7c5:764034967914414121>",
-        Color(119, 204, 102):   "<:7c6:764034971353874442>",
-        Color(119, 204, 119):   "<:7c7:764034974960844800>",
-        Color(119, 204, 136):   "<:7c8:764034977662631958>",
-        Color(119, 204, 153):   "<:7c9:764034981516410880>",
-        Color(119, 204, 170):   "<:7ca:764034984340094987>",
-        Color(119, 204, 187):   "<:7cb:764034988147736596>",
-        Color(119, 204, 204):   "<:7cc:764034991075098624>",
-        Color(119, 204, 221):   "<:7cd:764034994506039317>",
-        Color(119, 204, 238):   "<:7ce:764034997253570571>",
-        Color(119, 204, 255):   "<:7cf:764035001406718012>",
-        Color(119, 221, 0):     "<:7d0:764035004253863946>",
-        Color(119, 221, 17):    "<:7d1:764035007932923904>",
-        Color(119, 221, 34):    "<:7d2:764035010784264202>",
-        Color(119, 221, 51):    "<:7d3:764035014554812426>",
-        Color(119, 221, 68):    "<:7d4:764035017567240243>",
-        Color(119, 221, 85):    "<:7d5:764035021035536384>",
-        Color(119, 221, 102):   "<:7d6:764035023942451210>",
-        Color(119, 221, 119):   "<:7d7:764035027578257420>",
-        Color(119, 221, 136):   "<:7d8:764035031084695552>",
-        Color(119, 221, 153):   "<:7d9:764035034256506880>",
-        Color(119, 221, 170):   "<:7da:764035037141532692>",
-        Color(119, 221, 187):   "<:7db:764035041055473674>",
-        Color(119, 221, 204):   "<:7dc:764035044024516608>",
-        Color(119, 221, 221):   "<:7dd:764035048889778187>",
-        Color(119, 221, 238):   "<:7de:764035052190826497>",
-        Color(119, 221, 255):   "<:7df:764035056351445002>",
-        Color(119, 238, 0):     "<:7e0:764035059086655519>",
-        Color(119, 238, 17):    "<:7e1:764035062702145547>",
-        Color(119, 238, 34):    "<:7e2:764035065687834645>",
-        Color(119, 238, 51):    "<:7e3:764035069261119509>",
-        Color(119, 238, 68):    "<:7e4:764035072260702218>",
-        Color(119, 238, 85):    "<:7e5:764035074840330292>",
-        Color(119, 238, 102):   "<:7e6:764035078236930078>",
-        Color(119, 238, 119):   "<:7e7:764035081231925279>",
-        Color(119, 238, 136):   "<:7e8:764035084927238145>",
-        Color(119, 238, 153):   "<:7e9:764035087708717076>",
-        Color(119, 238, 170):   "<:7ea:764035091415695390>",
-        Color(119, 238, 187):   "<:7eb:764035094502440970>",
-        Color(119, 238, 204):   "<:7ec:764035098118324244>",
-        Color(119, 238, 221):   "<:7ed:764035101025501194>",
-        Color(119, 238, 238):   "<:7ee:764035104800374794>",
-        Color(119, 238, 255):   "<:7ef:764035108486905857>",
-        Color(119, 255, 0):     "<:7f0:764035111544422423>",
-        Color(119, 255, 17):    "<:7f1:764035114350149643>",
-        Color(119, 255, 34):    "<:7f2:764035117294682133>",
-        Color(119, 255, 51):    "<:7f3:764035120524820480>",
-        Color(119, 255, 68):    "<:7f4:764035123851034635>",
-        Color(119, 255, 85):    "<:7f5:764035128179032084>",
-        Color(119, 255, 102):   "<:7f6:764035131232616448>",
-        Color(119, 255, 119):   "<:7f7:764035134911283210>",
-        Color(119, 255, 136):   "<:7f8:764035138933358612>",
-        Color(119, 255, 153):   "<:7f9:764035141705400332>",
-        Color(119, 255, 170):   "<:7fa:764035145476079616>",
-        Color(119, 255, 187):   "<:7fb:764035148286787606>",
-        Color(119, 255, 204):   "<:7fc:764035152203481098>",
-        Color(119, 255, 221):   "<:7fd:764035154758467585>",
-        Color(119, 255, 238):   "<:7fe:764035158705307669>",
-        Color(119, 255, 255):   "<:7ff:764035161570148383>",
-        Color(136, 0, 0):       "<:800:764035165307535361>",
-        Color(136, 0, 17):      "<:801:764035167991496735>",
-        Color(136, 0, 34):      "<:802:764035171526901771>",
-        Color(136, 0, 51):      "<:803:764035174349406220>",
-        Color(136, 0, 68):      "<:804:764035178594304021>",
-        Color(136, 0, 85):      "<:805:764035181581041664>",
-        Color(136, 0, 102):     "<:806:764035184999137300>",
-        Color(136, 0, 119):     "<:807:764035187796475914>",
-        Color(136, 0, 136):     "<:808:764035191740039168>",
-        Color(136, 0, 153):     "<:809:764035196265299968>",
-        Color(136, 0, 170):     "<:80a:764035199225823242>",
-        Color(136, 0, 187):     "<:80b:764035202250571787>",
-        Color(136, 0, 204):     "<:80c:764035205177671681>",
-        Color(136, 0, 221):     "<:80d:764035209690611722>",
-        Color(136, 0, 238):     "<:80e:764035213691977741>",
-        Color(136, 0, 255):     "<:80f:764035216829710366>",
-        Color(136, 17, 0):      "<:810:764035220169031720>",
-        Color(136, 17, 17):     "<:811:764035223137550336>",
-        Color(136, 17, 34):     "<:812:764035225902252064>",
-        Color(136, 17, 51):     "<:813:764035229064495114>",
-        Color(136, 17, 68):     "<:814:764035232004702228>",
-        Color(136, 17, 85):     "<:815:764035235201286145>",
-        Color(136, 17, 102):    "<:816:764035238040698890>",
-        Color(136, 17, 119):    "<:817:764035240867397662>",
-        Color(136, 17, 136):    "<:818:764035243791220766>",
-        Color(136, 17, 153):    "<:819:764035246340964403>",
-        Color(136, 17, 170):    "<:81a:764035250610765834>",
-        Color(136, 17, 187):    "<:81b:764035254289694720>",
-        Color(136, 17, 204):    "<:81c:764035256869060629>",
-        Color(136, 17, 221):    "<:81d:764035260790472704>",
-        Color(136, 17, 238):    "<:81e:764035263768690748>",
-        Color(136, 17, 255):    "<:81f:764035267530457118>",
-        Color(136, 34, 0):      "<:820:764035270433177600>",
-        Color(136, 34, 17):     "<:821:764035273801596949>",
-        Color(136, 34, 34):     "<:822:764035276980748308>",
-        Color(136, 34, 51):     "<:823:764035280973594674>",
-        Color(136, 34, 68):     "<:824:764035283955351552>",
-        Color(136, 34, 85):     "<:825:764035287255875595>",
-        Color(136, 34, 102):    "<:826:764035290481295360>",
-        Color(136, 34, 119):    "<:827:764035293611032597>",
-        Color(136, 34, 136):    "<:828:764035296954155048>",
-        Color(136, 34, 153):    "<:829:764035300455481394>",
-        Color(136, 34, 170):    "<:82a:764035303392280596>",
-        Color(136, 34, 187):    "<:82b:764035306965041152>",
-        Color(136, 34, 204):    "<:82c:764035309604175883>",
-        Color(136, 34, 221):    "<:82d:764035313621270528>",
-        Color(136, 34, 238):    "<:82e:764035316733706281>",
-        Color(136, 34, 255):    "<:82f:764035320085348393>",
-        Color(136, 51, 0):      "<:830:764035323142602782>",
-        Color(136, 51, 17):     "<:831:764035326707892228>",
-        Color(136, 51, 34):     "<:832:764035331225550878>",
-        Color(136, 51, 51):     "<:833:764035334237061140>",
-        Color(136, 51, 68):     "<:834:764035338120331276>",
-        Color(136, 51, 85):     "<:835:764035341232504863>",
-        Color(136, 51, 102):    "<:836:764035344177430550>",
-        Color(136, 51, 119):    "<:837:764035347494469642>",
-        Color(136, 51, 136):    "<:838:764035350732996639>",
-        Color(136, 51, 153):    "<:839:764035353874006056>",
-        Color(136, 51, 170):    "<:83a:764035357666705408>",
-        Color(136, 51, 187):    "<:83b:764035360493535233>",
-        Color(136, 51, 204):    "<:83c:764035364125278209>",
-        Color(136, 51, 221):    "<:83d:764035367040057364>",
-        Color(136, 51, 238):    "<:83e:764035370689101825>",
-        Color(136, 51, 255):    "<:83f:764035373780697098>",
-        Color(136, 68, 0):      "<:840:764035377295786004>",
-        Color(136, 68, 17):     "<:841:764035380340457472>",
-        Color(136, 68, 34):     "<:842:764035383909679105>",
-        Color(136, 68, 51):     "<:843:764035386892353536>",
-        Color(136, 68, 68):     "<:844:764035390491066388>",
-        Color(136, 68, 85):     "<:845:764035393523417129>",
-        Color(136, 68, 102):    "<:846:764035397276925952>",
-        Color(136, 68, 119):    "<:847:764035400188166154>",
-        Color(136, 68, 136):    "<:848:764035403698536469>",
-        Color(136, 68, 153):    "<:849:764035406579630081>",
-        Color(136, 68, 170):    "<:84a:764035410367610900>",
-        Color(136, 68, 187):    "<:84b:764035413223538698>",
-        Color(136, 68, 204):    "<:84c:764035416541233223>",
-        Color(136, 68, 221):    "<:84d:764035419791687710>",
-        Color(136, 68, 238):    "<:84e:764035423428935681>",
-        Color(136, 68, 255):    "<:84f:764035426599698452>",
-        Color(136, 85, 0):      "<:850:764035430340755456>",
-        Color(136, 85, 17):     "<:851:764035433343483914>",
-        Color(136, 85, 34):     "<:852:764035436867616768>",
-        Color(136, 85, 51):     "<:853:764035439769681920>",
-        Color(136, 85, 68):     "<:854:764035443259080704>",
-        Color(136, 85, 85):     "<:855:764035446262202380>",
-        Color(136, 85, 102):    "<:856:764035451337179136>",
-        Color(136, 85, 119):    "<:857:764035454462722059>",
-        Color(136, 85, 136):    "<:858:764035458858483724>",
-        Color(136, 85, 153):    "<:859:764035461936971786>",
-        Color(136, 85, 170):    "<:85a:764035465329508402>",
-        Color(136, 85, 187):    "<:85b:764035468286885898>",
-        Color(136, 85, 204):    "<:85c:764035472040787988>",
-        Color(136, 85, 221):    "<:85d:764035475190317056>",
-        Color(136, 85, 238):    "<:85e:764035478881828884>",
-        Color(136, 85, 255):    "<:85f:764035481977356299>",
-        Color(136, 102, 0):     "<:860:764035485190062090>",
-        Color(136, 102, 17):    "<:861:764035488272220170>",
-        Color(136, 102, 34):    "<:862:764035491708272650>",
-        Color(136, 102, 51):    "<:863:764035494777454592>",
-        Color(136, 102, 68):    "<:864:764035498322427904>",
-        Color(136, 102, 85):    "<:865:764035501120290836>",
-        Color(136, 102, 102):   "<:866:764035504857415681>",
-        Color(136, 102, 119):   "<:867:764035508061339648>",
-        Color(136, 102, 136):   "<:868:764035511672242186>",
-        Color(136, 102, 153):   "<:869:764035514688864256>",
-        Color(136, 102, 170):   "<:86a:764035518127407135>",
-        Color(136, 102, 187):   "<:86b:764035521080721428>",
-        Color(136, 102, 204):   "<:86c:764035524309811242>",
-        Color(136, 102, 221):   "<:86d:764035527254212639>",
-        Color(136, 102, 238):   "<:86e:764035531323080724>",
-        Color(136, 102, 255):   "<:86f:764035534246379550>",
-        Color(136, 119, 0):     "<:870:764035537966727188>",
-        Color(136, 119, 17):    "<:871:764035540881244171>",
-        Color(136, 119, 34):    "<:872:764035544350982145>",
-        Color(136, 119, 51):    "<:873:764035547638923284>",
-        Color(136, 119, 68):    "<:874:764035551115477012>",
-        Color(136, 119, 85):    "<:875:764035553967734804>",
-        Color(136, 119, 102):   "<:876:764035557432492063>",
-        Color(136, 119, 119):   "<:877:764035560720826407>",
-        Color(136, 119, 136):   "<:878:764035564324126740>",
-        Color(136, 119, 153):   "<:879:764035567150170152>",
-        Color(136, 119, 170):   "<:87a:764035570896338954>",
-        Color(136, 119, 187):   "<:87b:764035573832613918>",
-        Color(136, 119, 204):   "<:87c:764035577673678879>",
-        Color(136, 119, 221):   "<:87d:764035580568403988>",
-        Color(136, 119, 238):   "<:87e:764035584079167508>",
-        Color(136, 119, 255):   "<:87f:764035587052273665>",
-        Color(136, 136, 0):     "<:880:764035590818627584>",
-        Color(136, 136, 17):    "<:881:764035593864609804>",
-        Color(136, 136, 34):    "<:882:764035597199212614>",
-        Color(136, 136, 51):    "<:883:764035600030105630>",
-        Color(136, 136, 68):    "<:884:764035602537644043>",
-        Color(136, 136, 85):    "<:885:764035605674983435>",
-        Color(136, 136, 102):   "<:886:764035608855183384>",
-        Color(136, 136, 119):   "<:887:764035612524806145>",
-        Color(136, 136, 136):   "<:888:764035615607619594>",
-        Color(136, 136, 153):   "<:889:764035619198205972>",
-        Color(136, 136, 170):   "<:88a:764035622083100682>",
-        Color(136, 136, 187):   "<:88b:764035625933602826>",
-        Color(136, 136, 204):   "<:88c:764035629259685888>",
-        Color(136, 136, 221):   "<:88d:764035632137240577>",
-        Color(136, 136, 238):   "<:88e:764035635261603840>",
-        Color(136, 136, 255):   "<:88f:764035638776561685>",
-        Color(136, 153, 0):     "<:890:764035642077216799>",
-        Color(136, 153, 17):    "<:891:764035645588504586>",
-        Color(136, 153, 34):    "<:892:764035648428179486>",
-        Color(136, 153, 51):    "<:893:764035652411981854>",
-        Color(136, 153, 68):    "<:894:764035655382204416>",
-        Color(136, 153, 85):    "<:895:764035658900832256>",
-        Color(136, 153, 102):   "<:896:764035661887569941>",
-        Color(136, 153, 119):   "<:897:764035665532551168>",
-        Color(136, 153, 136):   "<:898:764035668523089950>",
-        Color(136, 153, 153):   "<:899:764035672041455656>",
-        Color(136, 153, 170):   "<:89a:764035674873528331>",
-        Color(136, 153, 187):   "<:89b:764035678651809822>",
-        Color(136, 153, 204):   "<:89c:764035681227767809>",
-        Color(136, 153, 221):   "<:89d:764035685195579412>",
-        Color(136, 153, 238):   "<:89e:764035688009039913>",
-        Color(136, 153, 255):   "<:89f:764035691813404672>",
-        Color(136, 170, 0):     "<:8a0:764035694414004255>",
-        Color(136, 170, 17):    "<:8a1:764035698251923489>",
-        Color(136, 170, 34):    "<:8a2:764035701325955072>",
-        Color(136, 170, 51):    "<:8a3:764035704711020575>",
-        Color(136, 170, 68):    "<:8a4:764035707894890496>",
-        Color(136, 170, 85):    "<:8a5:764035711635947520>",
-        Color(136, 170, 102):   "<:8a6:764035714533949440>",
-        Color(136, 170, 119):   "<:8a7:764035718347358228>",
-        Color(136, 170, 136):   "<:8a8:764035721358737408>",
-        Color(136, 170, 153):   "<:8a9:764035724823494656>",
-        Color(136, 170, 170):   "<:8aa:764035727737618433>",
-        Color(136, 170, 187):   "<:8ab:764035731529400330>",
-        Color(136, 170, 204):   "<:8ac:764035734410756116>",
-        Color(136, 170, 221):   "<:8ad:764035737996886016>",
-        Color(136, 170, 238):   "<:8ae:764035740865789962>",
-        Color(136, 170, 255):   "<:8af:764035743701139456>",
-        Color(136, 187, 0):     "<:8b0:764035746990260244>",
-        Color(136, 187, 17):    "<:8b1:764035749808570370>",
-        Color(136, 187, 34):    "<:8b2:764035753587769355>",
-        Color(136, 187, 51):    "<:8b3:764035756409749516>",
-        Color(136, 187, 68):    "<:8b4:764035759996796928>",
-        Color(136, 187, 85):    "<:8b5:764035762856919041>",
-        Color(136, 187, 102):   "<:8b6:764035766577004564>",
-        Color(136, 187, 119):   "<:8b7:764035769429655572>",
-        Color(136, 187, 136):   "<:8b8:764035773162586112>",
-        Color(136, 187, 153):   "<:8b9:764035776098336808>",
-        Color(136, 187, 170):   "<:8ba:764035779960766467>",
-        Color(136, 187, 187):   "<:8bb:764035783107411978>",
-        Color(136, 187, 204):   "<:8bc:764035786315137024>",
-        Color(136, 187, 221):   "<:8bd:764035788870516737>",
-        Color(136, 187, 238):   "<:8be:764035792845668364>",
-        Color(136, 187, 255):   "<:8bf:764035796126400514>",
-        Color(136, 204, 0):     "<:8c0:764035799712399360>",
-        Color(136, 204, 17):    "<:8c1:764035803089076224>",
-        Color(136, 204, 34):    "<:8c2:764035806691459082>",
-        Color(136, 204, 51):    "<:8c3:764035810655338496>",
-        Color(136, 204, 68):    "<:8c4:764035814220759060>",
-        Color(136, 204, 85):    "<:8c5:764035817395978240>",
-        Color(136, 204, 102):   "<:8c6:764035820305907752>",
-        Color(136, 204, 119):   "<:8c7:764035823686778881>",
-        Color(136, 204, 136):   "<:8c8:764035827280904203>",
-        Color(136, 204, 153):   "<:8c9:764035830943186975>",
-        Color(136, 204, 170):   "<:8ca:764035834864205825>",
-        Color(136, 204, 187):   "<:8cb:764035838278762556>",
-        Color(136, 204, 204):   "<:8cc:764035841655177247>",
-        Color(136, 204, 221):   "<:8cd:764035844586864640>",
-        Color(136, 204, 238):   "<:8ce:764035847703756821>",
-        Color(136, 204, 255):   "<:8cf:764035850844635156>",
-        Color(136, 221, 0):     "<:8d0:764035854359330817>",
-        Color(136, 221, 17):    "<:8d1:764035857631674378>",
-        Color(136, 221, 34):    "<:8d2:764035861091975178>",
-        Color(136, 221, 51):    "<:8d3:764035864061411328>",
-        Color(136, 221, 68):    "<:8d4:764035868561637376>",
-        Color(136, 221, 85):    "<:8d5:764035872063750145>",
-        Color(136, 221, 102):   "<:8d6:764035876854300672>",
-        Color(136, 221, 119):   "<:8d7:764035879600914443>",
-        Color(136, 221, 136):   "<:8d8:764035883921178664>",
-        Color(136, 221, 153):   "<:8d9:764035888388243456>",
-        Color(136, 221, 170):   "<:8da:764035891639353376>",
-        Color(136, 221, 187):   "<:8db:764035895245930516>",
-        Color(136, 221, 204):   "<:8dc:764035899192377345>",
-        Color(136, 221, 221):   "<:8dd:764035903256789004>",
-        Color(136, 221, 238):   "<:8de:764035907358949386>",
-        Color(136, 221, 255):   "<:8df:764035910567329802>",
-        Color(136, 238, 0):     "<:8e0:764035914413899797>",
-        Color(136, 238, 17):    "<:8e1:764035918243430410>",
-        Color(136, 238, 34):    "<:8e2:764035921217585152>",
-        Color(136, 238, 51):    "<:8e3:764035926275391518>",
-        Color(136, 238, 68):    "<:8e4:764035930343473152>",
-        Color(136, 238, 85):    "<:8e5:764035934634770453>",
-        Color(136, 238, 102):   "<:8e6:764035940309401600>",
-        Color(136, 238, 119):   "<:8e7:764035943278968833>",
-        Color(136, 238, 136):   "<:8e8:764035946907041803>",
-        Color(136, 238, 153):   "<:8e9:764035949864288256>",
-        Color(136, 238, 170):   "<:8ea:764035953483579423>",
-        Color(136, 238, 187):   "<:8eb:764035956575174657>",
-        Color(136, 238, 204):   "<:8ec:764035960127881237>",
-        Color(136, 238, 221):   "<:8ed:764035963055505408>",
-        Color(136, 238, 238):   "<:8ee:764035967081250829>",
-        Color(136, 238, 255):   "<:8ef:764035971687383040>",
-        Color(136, 255, 0):     "<:8f0:764035975797014528>",
-        Color(136, 255, 17):    "<:8f1:764035978666967042>",
-        Color(136, 255, 34):    "<:8f2:764035982222819378>",
-        Color(136, 255, 51):    "<:8f3:764035985096572949>",
-        Color(136, 255, 68):    "<:8f4:764035988879048714>",
-        Color(136, 255, 85):    "<:8f5:764035991597613057>",
-        Color(136, 255, 102):   "<:8f6:764035998299455508>",
-        Color(136, 255, 119):   "<:8f7:764036008941322240>",
-        Color(136, 255, 136):   "<:8f8:764036014326808587>",
-        Color(136, 255, 153):   "<:8f9:764036020353105930>",
-        Color(136, 255, 170):   "<:8fa:764036026011877389>",
-        Color(136, 255, 187):   "<:8fb:764036031451365376>",
-        Color(136, 255, 204):   "<:8fc:764036035772153860>",
-        Color(136, 255, 221):   "<:8fd:764036041530540032>",
-        Color(136, 255, 238):   "<:8fe:764036045599539210>",
-        Color(136, 255, 255):   "<:8ff:764036050241847329>",
-        Color(153, 0, 0):       "<:900:764036055498227716>",
-        Color(153, 0, 17):      "<:901:764036061281779712>",
-        Color(153, 0, 34):      "<:902:764036065182875648>",
-        Color(153, 0, 51):      "<:903:764036068936384512>",
-        Color(153, 0, 68):      "<:904:764036072258273320>",
-        Color(153, 0, 85):      "<:905:764036077018152972>",
-        Color(153, 0, 102):     "<:906:764036082336792587>",
-        Color(153, 0, 119):     "<:907:764036086015328297>",
-        Color(153, 0, 136):     "<:908:764036088842027028>",
-        Color(153, 0, 153):     "<:909:764036093087318016>",
-        Color(153, 0, 170):     "<:90a:764036097495007273>",
-        Color(153, 0, 187):     "<:90b:764036100955045899>",
-        Color(153, 0, 204):     "<:90c:764036104281128982>",
-        Color(153, 0, 221):     "<:90d:764036109692567582>",
-        Color(153, 0, 238):     "<:90e:764036112494231612>",
-        Color(153, 0, 255):     "<:90f:764036116319830027>",
-        Color(153, 17, 0):      "<:910:764036119599644692>",
-        Color(153, 17, 17):     "<:911:764036122984054785>",
-        Color(153, 17, 34):     "<:912:764036127082020915>",
-        Color(153, 17, 51):     "<:913:764036131850944545>",
-        Color(153, 17, 68):     "<:914:764036136019558462>",
-        Color(153, 17, 85):     "<:915:764036140420300811>",
-        Color(153, 17, 102):    "<:916:764036143619506177>",
-        Color(153, 17, 119):    "<:917:764036148804714516>",
-        Color(153, 17, 136):    "<:918:764036151538352129>",
-        Color(153, 17, 153):    "<:919:764036158857543711>",
-        Color(153, 17, 170):    "<:91a:764036163236266006>",
-        Color(153, 17, 187):    "<:91b:764036167065927701>",
-        Color(153, 17, 204):    "<:91c:764036170463182849>",
-        Color(153, 17, 221):    "<:91d:764036173664092171>",
-        Color(153, 17, 238):    "<:91e:764036178894127104>",
-        Color(153, 17, 255):    "<:91f:764036184468488192>",
-        Color(153, 34, 0):      "<:920:764036187575943188>",
-        Color(153, 34, 17):     "<:921:764036191514525698>",
-        Color(153, 34, 34):     "<:922:764036195449569291>",
-        Color(153, 34, 51):     "<:923:764036198384795648>",
-        Color(153, 34, 68):     "<:924:764036202281041941>",
-        Color(153, 34, 85):     "<:925:764036205200932894>",
-        Color(153, 34, 102):    "<:926:764036208580886529>",
-        Color(153, 34, 119):    "<:927:764036211773014046>",
-        Color(153, 34, 136):    "<:928:764036215409344512>",
-        Color(153, 34, 153):    "<:929:764036218580238366>",
-        Color(153, 34, 170):    "<:92a:764036221852057620>",
-        Color(153, 34, 187):    "<:92b:764036225106575360>",
-        Color(153, 34, 204):    "<:92c:764036228508286986>",
-        Color(153, 34, 221):    "<:92d:764036231306018837>",
-        Color(153, 34, 238):    "<:92e:764036236129337344>",
-        Color(153, 34, 255):    "<:92f:764036240458383380>",
-        Color(153, 51, 0):      "<:930:764036244002308117>",
-        Color(153, 51, 17):     "<:931:764036247928569856>",
-        Color(153, 51, 34):     "<:932:764036251057520651>",
-        Color(153, 51, 51):     "<:933:764036254643650562>",
-        Color(153, 51, 68):     "<:934:764036257654636555>",
-        Color(153, 51, 85):     "<:935:764036261639880704>",
-        Color(153, 51, 102):    "<:936:764036264600272916>",
-        Color(153, 51, 119):    "<:937:764036268362825748>",
-        Color(153, 51, 136):    "<:938:764036271353102346>",
-        Color(153, 51, 153):    "<:939:764036274620334120>",
-        Color(153, 51, 170):    "<:93a:764036277715730442>",
-        Color(153, 51, 187):    "<:93b:764036281285083166>",
-        Color(153, 51, 204):    "<:93c:764036284472623104>",
-        Color(153, 51, 221):    "<:93d:764036287816007691>",
-        Color(153, 51, 238):    "<:93e:764036290781904936>",
-        Color(153, 51, 255):    "<:93f:764036294476562492>",
-        Color(153, 68, 0):      "<:940:764036297026961439>",
-        Color(153, 68, 17):     "<:941:764036301259276288>",
-        Color(153, 68, 34):     "<:942:764036304450224129>",
-        Color(153, 68, 51):     "<:943:764036307798196224>",
-        Color(153, 68, 68):     "<:944:764036310754656257>",
-        Color(153, 68, 85):     "<:945:764036314034470933>",
-        Color(153, 68, 102):    "<:946:764036317289250816>",
-        Color(153, 68, 119):    "<:947:764036320824787014>",
-        Color(153, 68, 136):    "<:948:764036323841277982>",
-        Color(153, 68, 153):    "<:949:764036327401717770>",
-        Color(153, 68, 170):    "<:94a:764036330404708383>",
-        Color(153, 68, 187):    "<:94b:764036334049951744>",
-        Color(153, 68, 204):    "<:94c:764036337115332608>",
-        Color(153, 68, 221):    "<:94d:764036340521238538>",
-        Color(153, 68, 238):    "<:94e:764036343373627402>",
-        Color(153, 68, 255):    "<:94f:764036347157413899>",
-        Color(153, 85, 0):      "<:950:764036350449025034>",
-        Color(153, 85, 17):     "<:951:764036353847197716>",
-        Color(153, 85, 34):     "<:952:764036356774690856>",
-        Color(153, 85, 51):     "<:953:764036360117288981>",
-        Color(153, 85, 68):     "<:954:764036363288838174>",
-        Color(153, 85, 85):     "<:955:764036366815461397>",
-        Color(153, 85, 102):    "<:956:764036369928028160>",
-        Color(153, 85, 119):    "<:957:764036373568421918>",
-        Color(153, 85, 136):    "<:958:764036376533532712>",
-        Color(153, 85, 153):    "<:959:764036379776647169>",
-        Color(153, 85, 170):    "<:95a:764036382833770527>",
-        Color(153, 85, 187):    "<:95b:764036386889138177>",
-        Color(153, 85, 204):    "<:95c:764036390006030337>",
-        Color(153, 85, 221):    "<:95d:764036393352953867>",
-        Color(153, 85, 238):    "<:95e:764036396188565524>",
-        Color(153, 85, 255):    "<:95f:764036400009838602>",
-        Color(153, 102, 0):     "<:960:764036402899845120>",
-        Color(153, 102, 17):    "<:961:764036409802883083>",
-        Color(153, 102, 34):    "<:962:764036412776513579>",
-        Color(153, 102, 51):    "<:963:764036416090406932>",
-        Color(153, 102, 68):    "<:964:764036419827531786>",
-        Color(153, 102, 85):    "<:965:764036422666551306>",
-        Color(153, 102, 102):   "<:966:764036426391617556>",
-        Color(153, 102, 119):   "<:967:764036429055524865>",
-        Color(153, 102, 136):   "<:968:764036432867360798>",
-        Color(153, 102, 153):   "<:969:764036437355266058>",
-        Color(153, 102, 170):   "<:96a:764036440312774656>",
-        Color(153, 102, 187):   "<:96b:764036444083453982>",
-        Color(153, 102, 204):   "<:96c:764036446784454688>",
-        Color(153, 102, 221):   "<:96d:764036450164408323>",
-        Color(153, 102, 238):   "<:96e:764036453692080138>",
-        Color(153, 102, 255):   "<:96f:764036457375334411>",
-        Color(153, 119, 0):     "<:970:764036460038848553>",
-        Color(153, 119, 17):    "<:971:764036463347105833>",
-        Color(153, 119, 34):    "<:972:764036466698878996>",
-        Color(153, 119, 51):    "<:973:764036470276489216>",
-        Color(153, 119, 68):    "<:974:764036473061507073>",
-        Color(153, 119, 85):    "<:975:764036476845293599>",
-        Color(153, 119, 102):   "<:976:764036479558746145>",
-        Color(153, 119, 119):   "<:977:764036483651862548>",
-        Color(153, 119, 136):   "<:978:764036486583681044>",
-        Color(153, 119, 153):   "<:979:764036490095230976>",
-        Color(153, 119, 170):   "<:97a:764036493013680138>",
-        Color(153, 119, 187):   "<:97b:764036496436101121>",
-        Color(153, 119, 204):   "<:97c:764036499503054868>",
-        Color(153, 119, 221):   "<:97d:764036502341943296>",
-        Color(153, 119, 238):   "<:97e:764036505563299860>",
-        Color(153, 119, 255):   "<:97f:764036508524871700>",
-        Color(153, 136, 0):     "<:980:764036512501071912>",
-        Color(153, 136, 17):    "<:981:764036516586455060>",
-        Color(153, 136, 34):    "<:982:764036519555497984>",
-        Color(153, 136, 51):    "<:983:764036523275845642>",
-        Color(153, 136, 68):    "<:984:764036526463778826>",
-        Color(153, 136, 85):    "<:985:764036529672159253>",
-        Color(153, 136, 102):   "<:986:764036532977795112>",
-        Color(153, 136, 119):   "<:987:764036536635228160>",
-        Color(153, 136, 136):   "<:988:764036539386036265>",
-        Color(153, 136, 153):   "<:989:764036542897324042>",
-        Color(153, 136, 170):   "<:98a:764036545857454100>",
-        Color(153, 136, 187):   "<:98b:764036549473861644>",
-        Color(153, 136, 204):   "<:98c:764036552745287710>",
-        Color(153, 136, 221):   "<:98d:764036556394594365>",
-        Color(153, 136, 238):   "<:98e:764036559434547201>",
-        Color(153, 136, 255):   "<:98f:764036562941116457>",
-        Color(153, 153, 0):     "<:990:764036565734391809>",
-        Color(153, 153, 17):    "<:991:764036569417777162>",
-        Color(153, 153, 34):    "<:992:764036572450127903>",
-        Color(153, 153, 51):    "<:993:764036575872942080>",
-        Color(153, 153, 68):    "<:994:764036578648915989>",
-        Color(153, 153, 85):    "<:995:764036582126649375>",
-        Color(153, 153, 102):   "<:996:764036585322446890>",
-        Color(153, 153, 119):   "<:997:764036589076480000>",
-        Color(153, 153, 136):   "<:998:764036592171483156>",
-        Color(153, 153, 153):   "<:999:764036595547504642>",
-        Color(153, 153, 170):   "<:99a:764036598555475968>",
-        Color(153, 153, 187):   "<:99b:764036601990217740>",
-        Color(153, 153, 204):   "<:99c:764036605224157245>",
-        Color(153, 153, 221):   "<:99d:764036608482738207>",
-        Color(153, 153, 238):   "<:99e:764036611313762305>",
-        Color(153, 153, 255):   "<:99f:764036615545815041>",
-        Color(153, 170, 0):     "<:9a0:764036618536615996>",
-        Color(153, 170, 17):    "<:9a1:764036621686931497>",
-        Color(153, 170, 34):    "<:9a2:764036624698703874>",
-        Color(153, 170, 51):    "<:9a3:764036628615266334>",
-        Color(153, 170, 68):    "<:9a4:764036631291625473>",
-        Color(153, 170, 85):    "<:9a5:764036635435728927>",
-        Color(153, 170, 102):   "<:9a6:764036638120607756>",
-        Color(153, 170, 119):   "<:9a7:764036641923792906>",
-        Color(153, 170, 136):   "<:9a8:764036644864917504>",
-        Color(153, 170, 153):   "<:9a9:764036648085749761>",
-        Color(153, 170, 170):   "<:9aa:764036651440799754>",
-        Color(153, 170, 187):   "<:9ab:764036655023652875>",
-        Color(153, 170, 204):   "<:9ac:764036658127044619>",
-        Color(153, 170, 221):   "<:9ad:764036661272772629>",
-        Color(153, 170, 238):   "<:9ae:764036664523358248>",
-        Color(153, 170, 255):   "<:9af:764036667916156929>",
-        Color(153, 187, 0):     "<:9b0:764036671246827570>",
-        Color(153, 187, 17):    "<:9b1:764036674735964160>",
-        Color(153, 187, 34):    "<:9b2:764036677663457330>",
-        Color(153, 187, 51):    "<:9b3:764036681774923806>",
-        Color(153, 187, 68):    "<:9b4:764036684571738133>",
-        Color(153, 187, 85):    "<:9b5:764036687830712350>",
-        Color(153, 187, 102):   "<:9b6:764036690804998144>",
-        Color(153, 187, 119):   "<:9b7:764036694667427861>",
-        Color(153, 187, 136):   "<:9b8:764036697330810891>",
-        Color(153, 187, 153):   "<:9b9:764036701503881236>",
-        Color(153, 187, 170):   "<:9ba:764036704527974440>",
-        Color(153, 187, 187):   "<:9bb:764036707766501386>",
-        Color(153, 187, 204):   "<:9bc:764036710384271361>",
-        Color(153, 187, 221):   "<:9bd:764036714326523905>",
-        Color(153, 187, 238):   "<:9be:764036717287964692>",
-        Color(153, 187, 255):   "<:9bf:764036721130078238>",
-        Color(153, 204, 0):     "<:9c0:764036724002783232>",
-        Color(153, 204, 17):    "<:9c1:764036727127015435>",
-        Color(153, 204, 34):    "<:9c2:764036730394771477>",
-        Color(153, 204, 51):    "<:9c3:764036734228496394>",
-        Color(153, 204, 68):    "<:9c4:764036737499791390>",
-        Color(153, 204, 85):    "<:9c5:764036740818010112>",
-        Color(153, 204, 102):   "<:9c6:764036743401570305>",
-        Color(153, 204, 119):   "<:9c7:764036747465981962>",
-        Color(153, 204, 136):   "<:9c8:764036750406189127>",
-        Color(153, 204, 153):   "<:9c9:764036753907646474>",
-        Color(153, 204, 170):   "<:9ca:764036756953366528>",
-        Color(153, 204, 187):   "<:9cb:764036760300027905>",
-        Color(153, 204, 204):   "<:9cc:764036763319533589>",
-        Color(153, 204, 221):   "<:9cd:764036767137267752>",
-        Color(153, 204, 238):   "<:9ce:764036769967767583>",
-        Color(153, 204, 255):   "<:9cf:764036773571067915>",
-        Color(153, 221, 0):     "<:9d0:764036776645230602>",
-        Color(153, 221, 17):    "<:9d1:764036780601114634>",
-        Color(153, 221, 34):    "<:9d2:764036784765141022>",
-        Color(153, 221, 51):    "<:9d3:764036787877314561>",
-        Color(153, 221, 68):    "<:9d4:764036791372087304>",
-        Color(153, 221, 85):    "<:9d5:764036794450706433>",
-        Color(153, 221, 102):   "<:9d6:764036797712826389>",
-        Color(153, 221, 119):   "<:9d7:764036801022787624>",
-        Color(153, 221, 136):   "<:9d8:764036804390682654>",
-        Color(153, 221, 153):   "<:9d9:764036807104397323>",
-        Color(153, 221, 170):   "<:9da:764036810027827212>",
-        Color(153, 221, 187):   "<:9db:764036813102776360>",
-        Color(153, 221, 204):   "<:9dc:764036816000516116>",
-        Color(153, 221, 221):   "<:9dd:764036818894848012>",
-        Color(153, 221, 238):   "<:9de:764036822044377090>",
-        Color(153, 221, 255):   "<:9df:764036825026658335>",
-        Color(153, 238, 0):     "<:9e0:764036828159279106>",
-        Color(153, 238, 17):    "<:9e1:764036831561515008>",
-        Color(153, 238, 34):    "<:9e2:764036834858369044>",
-        Color(153, 238, 51):    "<:9e3:764036837659639849>",
-        Color(153, 238, 68):    "<:9e4:764036840759623730>",
-        Color(153, 238, 85):    "<:9e5:764036843758157854>",
-        Color(153, 238, 102):   "<:9e6:764036847713517568>",
-        Color(153, 238, 119):   "<:9e7:764036850594873374>",
-        Color(153, 238, 136):   "<:9e8:764036854352707584>",
-        Color(153, 238, 153):   "<:9e9:764036857481789460>",
-        Color(153, 238, 170):   "<:9ea:764036860837756959>",
-        Color(153, 238, 187):   "<:9eb:764036863577030677>",
-        Color(153, 238, 204):   "<:9ec:764036867204448256>",
-        Color(153, 238, 221):   "<:9ed:764036870052511775>",
-        Color(153, 238, 238):   "<:9ee:764036873709682700>",
-        Color(153, 238, 255):   "<:9ef:764036876737970208>",
-        Color(153, 255, 0):     "<:9f0:764036880055533590>",
-        Color(153, 255, 17):    "<:9f1:764036883415957516>",
-        Color(153, 255, 34):    "<:9f2:764036887110877194>",
-        Color(153, 255, 51):    "<:9f3:764036889966936074>",
-        Color(153, 255, 68):    "<:9f4:764036893314646037>",
-        Color(153, 255, 85):    "<:9f5:764036896539541514>",
-        Color(153, 255, 102):   "<:9f6:764036899731406860>",
-        Color(153, 255, 119):   "<:9f7:764036903192100874>",
-        Color(153, 255, 136):   "<:9f8:764036906539024406>",
-        Color(153, 255, 153):   "<:9f9:764036910263828500>",
-        Color(153, 255, 170):   "<:9fa:764036912834412565>",
-        Color(153, 255, 187):   "<:9fb:764036916650704917>",
-        Color(153, 255, 204):   "<:9fc:764036919629578240>",
-        Color(153, 255, 221):   "<:9fd:764036923437744148>",
-        Color(153, 255, 238):   "<:9fe:764036926432608256>",
-        Color(153, 255, 255):   "<:9ff:764036929876131841>",
-        Color(170, 0, 0):       "<:a00:764036933327781888>",
-        Color(170, 0, 17):      "<:a01:764036936893202432>",
-        Color(170, 0, 34):      "<:a02:764036939753193492>",
-        Color(170, 0, 51):      "<:a03:764036943632662539>",
-        Color(170, 0, 68):      "<:a04:764036947613450240>",
-        Color(170, 0, 85):      "<:a05:764036952256806912>",
-        Color(170, 0, 102):     "<:a06:764036956400254986>",
-        Color(170, 0, 119):     "<:a07:764036959290785792>",
-        Color(170, 0, 136):     "<:a08:764036962927378432>",
-        Color(170, 0, 153):     "<:a09:764036965652758530>",
-        Color(170, 0, 170):     "<:a0a:764036969251602443>",
-        Color(170, 0, 187):     "<:a0b:764036972485279754>",
-        Color(170, 0, 204):     "<:a0c:764036976088842260>",
-        Color(170, 0, 221):     "<:a0d:764036979121324042>",
-        Color(170, 0, 238):     "<:a0e:764036982644015145>",
-        Color(170, 0, 255):     "<:a0f:764036985601523713>",
-        Color(170, 17, 0):      "<:a10:764036989355556924>",
-        Color(170, 17, 17):     "<:a11:764036991901237250>",
-        Color(170, 17, 34):     "<:a12:764036995827367957>",
-        Color(170, 17, 51):     "<:a13:764036998901268530>",
-        Color(170, 17, 68):     "<:a14:764037002571546634>",
-        Color(170, 17, 85):     "<:a15:764037005398114344>",
-        Color(170, 17, 102):    "<:a16:764037009957847060>",
-        Color(170, 17, 119):    "<:a17:764037014345482261>",
-        Color(170, 17, 136):    "<:a18:764037018836664321>",
-        Color(170, 17, 153):    "<:a19:764037022432100362>",
-        Color(170, 17, 170):    "<:a1a:764037025384497174>",
-        Color(170, 17, 187):    "<:a1b:764037028945723422>",
-        Color(170, 17, 204):    "<:a1c:764037031973617664>",
-        Color(170, 17, 221):    "<:a1d:764037035446370344>",
-        Color(170, 17, 238):    "<:a1e:764037038495629322>",
-        Color(170, 17, 255):    "<:a1f:764037041981227009>",
-        Color(170, 34, 0):      "<:a20:764037044883685407>",
-        Color(170, 34, 17):     "<:a21:764037048608751616>",
-        Color(170, 34, 34):     "<:a22:764037051510816788>",
-        Color(170, 34, 51):     "<:a23:764037055268257802>",
-        Color(170, 34, 68):     "<:a24:764037058078441472>",
-        Color(170, 34, 85):     "<:a25:764037061988581387>",
-        Color(170, 34, 102):    "<:a26:764037064663498753>",
-        Color(170, 34, 119):    "<:a27:764037068400754689>",
-        Color(170, 34, 136):    "<:a28:764037071513190420>",
-        Color(170, 34, 153):    "<:a29:764037075083198494>",
-        Color(170, 34, 170):    "<:a2a:764037079209738252>",
-        Color(170, 34, 187):    "<:a2b:764037083416756236>",
-        Color(170, 34, 204):    "<:a2c:764037086662885406>",
-        Color(170, 34, 221):    "<:a2d:764037090060402719>",
-        Color(170, 34, 238):    "<:a2e:764037093310595102>",
-        Color(170, 34, 255):    "<:a2f:764037097048113212>",
-        Color(170, 51, 0):      "<:a30:764037100008898610>",
-        Color(170, 51, 17):     "<:a31:764037103709061130>",
-        Color(170, 51, 34):     "<:a32:764037106376900609>",
-        Color(170, 51, 51):     "<:a33:764037109853192194>",
-        Color(170, 51, 68):     "<:a34:764037113200377887>",
-        Color(170, 51, 85):     "<:a35:764037116886908928>",
-        Color(170, 51, 102):    "<:a36:764037119370461195>",
-        Color(170, 51, 119):    "<:a37:764037123438411776>",
-        Color(170, 51, 136):    "<:a38:764037125967839234>",
-        Color(170, 51, 153):    "<:a39:764037130044309504>",
-        Color(170, 51, 170):    "<:a3a:764037133093830696>",
-        Color(170, 51, 187):    "<:a3b:764037136763584513>",
-        Color(170, 51, 204):    "<:a3c:764037139973275678>",
-        Color(170, 51, 221):    "<:a3d:764037143391633408>",
-        Color(170, 51, 238):    "<:a3e:764037145995640833>",
-        Color(170, 51, 255):    "<:a3f:764037149737615360>",
-        Color(170, 68, 0):      "<:a40:764037152782024704>",
-        Color(170, 68, 17):     "<:a41:764037156481662976>",
-        Color(170, 68, 34):     "<:a42:764037159338246174>",
-        Color(170, 68, 51):     "<:a43:764037162987421696>",
-        Color(170, 68, 68):     "<:a44:764037165633372202>",
-        Color(170, 68, 85):     "<:a45:764037169391861761>",
-        Color(170, 68, 102):    "<:a46:764037174005858344>",
-        Color(170, 68, 119):    "<:a47:764037177121308682>",
-        Color(170, 68, 136):    "<:a48:764037180677947392>",
-        Color(170, 68, 153):    "<:a49:764037183555895296>",
-        Color(170, 68, 170):    "<:a4a:764037187284893726>",
-        Color(170, 68, 187):    "<:a4b:764037190187483166>",
-        Color(170, 68, 204):    "<:a4c:764037193802186772>",
-        Color(170, 68, 221):    "<:a4d:764037196821823488>",
-        Color(170, 68, 238):    "<:a4e:764037200425123860>",
-        Color(170, 68, 255):    "<:a4f:764037203323518996>",
-        Color(170, 85, 0):      "<:a50:764037207165108224>",
-        Color(170, 85, 17):     "<:a51:764037210064158740>",
-        Color(170, 85, 34):     "<:a52:764037213675454494>",
-        Color(170, 85, 51):     "<:a53:764037216480657408>",
-        Color(170, 85, 68):     "<:a54:764037220368777236>",
-        Color(170, 85, 85):     "<:a55:764037223376093184>",
-        Color(170, 85, 102):    "<:a56:764037226773872681>",
-        Color(170, 85, 119):    "<:a57:764037229701496852>",
-        Color(170, 85, 136):    "<:a58:764037233346609152>",
-        Color(170, 85, 153):    "<:a59:764037237717336064>",
-        Color(170, 85, 170):    "<:a5a:764037240657281034>",
-        Color(170, 85, 187):    "<:a5b:764037244573974528>",
-        Color(170, 85, 204):    "<:a5c:764037247363973121>",
-        Color(170, 85, 221):    "<:a5d:764037250563702787>",
-        Color(170, 85, 238):    "<:a5e:764037253441650751>",
-        Color(170, 85, 255):    "<:a5f:764037257665314826>",
-        Color(170, 102, 0):     "<:a60:764037260264865823>",
-        Color(170, 102, 17):    "<:a61:764037263968960555>",
-        Color(170, 102, 34):    "<:a62:764037267164758016>",
-        Color(170, 102, 51):    "<:a63:764037270490972212>",
-        Color(170, 102, 68):    "<:a64:764037273645219840>",
-        Color(170, 102, 85):    "<:a65:764037277349183538>",
-        Color(170, 102, 102):   "<:a66:764037280297779200>",
-        Color(170, 102, 119):   "<:a67:764037283678126101>",
-        Color(170, 102, 136):   "<:a68:764037286765133835>",
-        Color(170, 102, 153):   "<:a69:764037290284023819>",
-        Color(170, 102, 170):   "<:a6a:764037293417693204>",
-        Color(170, 102, 187):   "<:a6b:764037297502552064>",
-        Color(170, 102, 204):   "<:a6c:764037299976929291>",
-        Color(170, 102, 221):   "<:a6d:764037303668310026>",
-        Color(170, 102, 238):   "<:a6e:764037306541146114>",
-        Color(170, 102, 255):   "<:a6f:764037310442373170>",
-        Color(170, 119, 0):     "<:a70:764037313869119538>",
-        Color(170, 119, 17):    "<:a71:764037317185896449>",
-        Color(170, 119, 34):    "<:a72:764037321498558468>",
-        Color(170, 119, 51):    "<:a73:764037324517801984>",
-        Color(170, 119, 68):    "<:a74:764037328174841857>",
-        Color(170, 119, 85):    "<:a75:764037331211649044>",
-        Color(170, 119, 102):   "<:a76:764037334474817566>",
-        Color(170, 119, 119):   "<:a77:764037337331138601>",
-        Color(170, 119, 136):   "<:a78:764037341156212776>",
-        Color(170, 119, 153):   "<:a79:764037344125911060>",
-        Color(170, 119, 170):   "<:a7a:764037347880206396>",
-        Color(170, 119, 187):   "<:a7b:764037350812024833>",
-        Color(170, 119, 204):   "<:a7c:764037354380853268>",
-        Color(170, 119, 221):   "<:a7d:764037357321322496>",
-        Color(170, 119, 238):   "<:a7e:764037360605462571>",
-        Color(170, 119, 255):   "<:a7f:764037363726155777>",
-        Color(170, 136, 0):     "<:a80:764037367538515998>",
-        Color(170, 136, 17):    "<:a81:764037370147635212>",
-        Color(170, 136, 34):    "<:a82:764037374120296458>",
-        Color(170, 136, 51):    "<:a83:764037377164574721>",
-        Color(170, 136, 68):    "<:a84:764037380830134302>",
-        Color(170, 136, 85):    "<:a85:764037383670726656>",
-        Color(170, 136, 102):   "<:a86:764037387311120405>",
-        Color(170, 136, 119):   "<:a87:764037390061928469>",
-        Color(170, 136, 136):   "<:a88:764037394046386186>",
-        Color(170, 136, 153):   "<:a89:764037396559036437>",
-        Color(170, 136, 170):   "<:a8a:764037400094834709>",
-        Color(170, 136, 187):   "<:a8b:764037403194818601>",
-        Color(170, 136, 204):   "<:a8c:764037406785404929>",
-        Color(170, 136, 221):   "<:a8d:764037409993654272>",
-        Color(170, 136, 238):   "<:a8e:764037413823184896>",
-        Color(170, 136, 255):   "<:a8f:764037416667054090>",
-        Color(170, 153, 0):     "<:a90:764037420098125835>",
-        Color(170, 153, 17):    "<:a91:764037423566028820>",
-        Color(170, 153, 34):    "<:a92:764037426648711180>",
-        Color(170, 153, 51):    "<:a93:764037429279064115>",
-        Color(170, 153, 68):    "<:a94:764037433477562368>",
-        Color(170, 153, 85):    "<:a95:764037436082356256>",
-        Color(170, 153, 102):   "<:a96:764037440079003668>",
-        Color(170, 153, 119):   "<:a97:764037442969010206>",
-        Color(170, 153, 136):   "<:a98:764037446392086529>",
-        Color(170, 153, 153):   "<:a99:764037449704931339>",
-        Color(170, 153, 170):   "<:a9a:764037453253443594>",
-        Color(170, 153, 187):   "<:a9b:764037455863087125>",
-        Color(170, 153, 204):   "<:a9c:764037459880575006>",
-        Color(170, 153, 221):   "<:a9d:764037462833496074>",
-        Color(170, 153, 238):   "<:a9e:764037466398130176>",
-        Color(170, 153, 255):   "<:a9f:764037469237936138>",
-        Color(170, 170, 0):     "<:aa0:764037473197621258>",
-        Color(170, 170, 17):    "<:aa1:764037476204937237>",
-        Color(170, 170, 34):    "<:aa2:764037479404666901>",
-        Color(170, 170, 51):    "<:aa3:764037482676879370>",
-        Color(170, 170, 68):    "<:aa4:764037486635646986>",
-        Color(170, 170, 85):    "<:aa5:764037489560125461>",
-        Color(170, 170, 102):   "<:aa6:764037492936278058>",
-        Color(170, 170, 119):   "<:aa7:764037495834279938>",
-        Color(170, 170, 136):   "<:aa8:764037499462090772>",
-        Color(170, 170, 153):   "<:aa9:764037502327586826>",
-        Color(170, 170, 170):   "<:aaa:764037506089746462>",
-        Color(170, 170, 187):   "<:aab:764037508916314162>",
-        Color(170, 170, 204):   "<:aac:764037512712683562>",
-        Color(170, 170, 221):   "<:aad:764037515358502923>",
-        Color(170, 170, 238):   "<:aae:764037519342829578>",
-        Color(170, 170, 255):   "<:aaf:764037522262589440>",
-        Color(170, 187, 0):     "<:ab0:764037525907177472>",
-        Color(170, 187, 17):    "<:ab1:764037528901779468>",
-        Color(170, 187, 34):    "<:ab2:764037532593029140>",
-        Color(170, 187, 51):    "<:ab3:764037535198347305>",
-        Color(170, 187, 68):    "<:ab4:764037539140993034>",
-        Color(170, 187, 85):    "<:ab5:764037541988925440>",
-        Color(170, 187, 102):   "<:ab6:764037545574924318>",
-        Color(170, 187, 119):   "<:ab7:764037548535971900>",
-        Color(170, 187, 136):   "<:ab8:764037552293412874>",
-        Color(170, 187, 153):   "<:ab9:764037555162447883>",
-        Color(170, 187, 170):   "<:aba:764037558618947595>",
-        Color(170, 187, 187):   "<:abb:764037561978322964>",
-        Color(170, 187, 204):   "<:abc:764037565266919435>",
-        Color(170, 187, 221):   "<:abd:764037568446201856>",
-        Color(170, 187, 238):   "<:abe:764037571998646292>",
-        Color(170, 187, 255):   "<:abf:764037574926663700>",
-        Color(170, 204, 0):     "<:ac0:764037578704945152>",
-        Color(170, 204, 17):    "<:ac1:764037581229916171>",
-        Color(170, 204, 34):    "<:ac2:764037585236394014>",
-        Color(170, 204, 51):    "<:ac3:764037588352106516>",
-        Color(170, 204, 68):    "<:ac4:764037591632445451>",
-        Color(170, 204, 85):    "<:ac5:764037594894827530>",
-        Color(170, 204, 102):   "<:ac6:764037598380818432>",
-        Color(170, 204, 119):   "<:ac7:764037601358512128>",
-        Color(170, 204, 136):   "<:ac8:764037605179392020>",
-        Color(170, 204, 153):   "<:ac9:764037608157741056>",
-        Color(170, 204, 170):   "<:aca:764037611592351774>",
-        Color(170, 204, 187):   "<:acb:764037614461911061>",
-        Color(170, 204, 204):   "<:acc:764037618240454656>",
-        Color(170, 204, 221):   "<:acd:764037621046444032>",
-        Color(170, 204, 238):   "<:ace:764037624733368352>",
-        Color(170, 204, 255):   "<:acf:764037627715518464>",
-        Color(170, 221, 0):     "<:ad0:764037631754633216>",
-        Color(170, 221, 17):    "<:ad1:764037634652897290>",
-        Color(170, 221, 34):    "<:ad2:764037638042419240>",
-        Color(170, 221, 51):    "<:ad3:764037640609333259>",
-        Color(170, 221, 68):    "<:ad4:764037644665094145>",
-        Color(170, 221, 85):    "<:ad5:764037647491530772>",
-        Color(170, 221, 102):   "<:ad6:764037650822201356>",
-        Color(170, 221, 119):   "<:ad7:764037654102671390>",
-        Color(170, 221, 136):   "<:ad8:764037657843204136>",
-        Color(170, 221, 153):   "<:ad9:764037660514844673>",
-        Color(170, 221, 170):   "<:ada:764037664398639134>",
-        Color(170, 221, 187):   "<:adb:764037667842293761>",
-        Color(170, 221, 204):   "<:adc:764037671475347456>",
-        Color(170, 221, 221):   "<:add:764037674201120809>",
-        Color(170, 221, 238):   "<:ade:764037677581729802>",
-        Color(170, 221, 255):   "<:adf:764037680181805087>",
-        Color(170, 238, 0):     "<:ae0:764037683840024588>",
-        Color(170, 238, 17):    "<:ae1:764037687157325825>",
-        Color(170, 238, 34):    "<:ae2:764037690818560000>",
-        Color(170, 238, 51):    "<:ae3:764037693708566560>",
-        Color(170, 238, 68):    "<:ae4:764037697454473217>",
-        Color(170, 238, 85):    "<:ae5:764037700637556746>",
-        Color(170, 238, 102):   "<:ae6:764037703964033084>",
-        Color(170, 238, 119):   "<:ae7:764037706979213392>",
-        Color(170, 238, 136):   "<:ae8:764037710910193695>",
-        Color(170, 238, 153):   "<:ae9:764037713962991646>",
-        Color(170, 238, 170):   "<:aea:764037717121695764>",
-        Color(170, 238, 187):   "<:aeb:764037719936335872>",
-        Color(170, 238, 204):   "<:aec:764037722423296041>",
-        Color(170, 238, 221):   "<:aed:764037725916495892>",
-        Color(170, 238, 238):   "<:aee:764037728454049824>",
-        Color(170, 238, 255):   "<:aef:764037732644552724>",
-        Color(170, 255, 0):     "<:af0:764037735513194516>",
-        Color(170, 255, 17):    "<:af1:764037739107581962>",
-        Color(170, 255, 34):    "<:af2:764037741947387914>",
-        Color(170, 255, 51):    "<:af3:764037745777180702>",
-        Color(170, 255, 68):    "<:af4:764037748716732433>",
-        Color(170, 255, 85):    "<:af5:764037752253054977>",
-        Color(170, 255, 102):   "<:af6:764037755050786827>",
-        Color(170, 255, 119):   "<:af7:764037758599299074>",
-        Color(170, 255, 136):   "<:af8:764037761878851615>",
-        Color(170, 255, 153):   "<:af9:764037765264048150>",
-        Color(170, 255, 170):   "<:afa:764037768422227968>",
-        Color(170, 255, 187):   "<:afb:764037772176130049>",
-        Color(170, 255, 204):   "<:afc:764037775233646612>",
-        Color(170, 255, 221):   "<:afd:764037778672451584>",
-        Color(170, 255, 238):   "<:afe:764037781638610954>",
-        Color(170, 255, 255):   "<:aff:764037785409159188>",
-        Color(187, 0, 0):       "<:b00:764037788249096192>",
-        Color(187, 0, 17):      "<:b01:764037792140754954>",
-        Color(187, 0, 34):      "<:b02:764037795118448690>",
-        Color(187, 0, 51):      "<:b03:764037798546112562>",
-        Color(187, 0, 68):      "<:b04:764037801498771476>",
-        Color(187, 0, 85):      "<:b05:764037805122256926>",
-        Color(187, 0, 102):     "<:b06:764037808045424661>",
-        Color(187, 0, 119):     "<:b07:764037811740999680>",
-        Color(187, 0, 136):     "<:b08:764037814597451796>",
-        Color(187, 0, 153):     "<:b09:764037818321862656>",
-        Color(187, 0, 170):     "<:b0a:764037821261676604>",
-        Color(187, 0, 187):     "<:b0b:764037825112309790>",
-        Color(187, 0, 204):     "<:b0c:764037828140204043>",
-        Color(187, 0, 221):     "<:b0d:764037831189725185>",
-        Color(187, 0, 238):     "<:b0e:764037834503749642>",
-        Color(187, 0, 255):     "<:b0f:764037838122778654>",
-        Color(187, 17, 0):      "<:b10:764037840639885366>",
-        Color(187, 17, 17):     "<:b11:764037844661698572>",
-        Color(187, 17, 34):     "<:b12:764037847753687081>",
-        Color(187, 17, 51):     "<:b13:764037851469185064>",
-        Color(187, 17, 68):     "<:b14:764037854489477160>",
-        Color(187, 17, 85):     "<:b15:764037857584873493>",
-        Color(187, 17, 102):    "<:b16:764037860780146718>",
-        Color(187, 17, 119):    "<:b17:764037864630648833>",
-        Color(187, 17, 136):    "<:b18:764037869018677248>",
-        Color(187, 17, 153):    "<:b19:764037872281976862>",
-        Color(187, 17, 170):    "<:b1a:764037875519193118>",
-        Color(187, 17, 187):    "<:b1b:764037878401335296>",
-        Color(187, 17, 204):    "<:b1c:764037881546932276>",
-        Color(187, 17, 221):    "<:b1d:764037884407578625>",
-        Color(187, 17, 238):    "<:b1e:764037888274333698>",
-        Color(187, 17, 255):    "<:b1f:764037891453747210>",
-        Color(187, 34, 0):      "<:b20:764037894380847114>",
-        Color(187, 34, 17):     "<:b21:764037897791471636>",
-        Color(187, 34, 34):     "<:b22:764037900769689620>",
-        Color(187, 34, 51):     "<:b23:764037904431185940>",
-        Color(187, 34, 68):     "<:b24:764037907442565120>",
-        Color(187, 34, 85):     "<:b25:764037910286041099>",
-        Color(187, 34, 102):    "<:b26:764037913607929896>",
-        Color(187, 34, 119):    "<:b27:764037917407444993>",
-        Color(187, 34, 136):    "<:b28:764037920356827136>",
-        Color(187, 34, 153):    "<:b29:764037923426664478>",
-        Color(187, 34, 170):    "<:b2a:764037926337118268>",
-        Color(187, 34, 187):    "<:b2b:764037929319792640>",
-        Color(187, 34, 204):    "<:b2c:764037932629491712>",
-        Color(187, 34, 221):    "<:b2d:764037935292612619>",
-        Color(187, 34, 238):    "<:b2e:764037939670810624>",
-        Color(187, 34, 255):    "<:b2f:764037942175727638>",
-        Color(187, 51, 0):      "<:b30:764037946016923648>",
-        Color(187, 51, 17):     "<:b31:764037948999073802>",
-        Color(187, 51, 34):     "<:b32:764037952513900564>",
-        Color(187, 51, 51):     "<:b33:764037954992865321>",
-        Color(187, 51, 68):     "<:b34:764037958961463328>",
-        Color(187, 51, 85):     "<:b35:764037962224631838>",
-        Color(187, 51, 102):    "<:b36:764037965462503435>",
-        Color(187, 51, 119):    "<:b37:764037968889380894>",
-        Color(187, 51, 136):    "<:b38:764037972172603412>",
-        Color(187, 51, 153):    "<:b39:764037975130505226>",
-        Color(187, 51, 170):    "<:b3a:764037978720043009>",
-        Color(187, 51, 187):    "<:b3b:764037981912301598>",
-        Color(187, 51, 204):    "<:b3c:764037985460944906>",
-        Color(187, 51, 221):    "<:b3d:764037988207820802>",
-        Color(187, 51, 238):    "<:b3e:764037992054390794>",
-        Color(187, 51, 255):    "<:b3f:764037995074420746>",
-        Color(187, 68, 0):      "<:b40:764037998622015548>",
-        Color(187, 68, 17):     "<:b41:764038001180278815>",
-        Color(187, 68, 34):     "<:b42:764038005341945876>",
-        Color(187, 68, 51):     "<:b43:764038008164712458>",
-        Color(187, 68, 68):     "<:b44:764038011490795571>",
-        Color(187, 68, 85):     "<:b45:764038014582128641>",
-        Color(187, 68, 102):    "<:b46:764038018633302036>",
-        Color(187, 68, 119):    "<:b47:764038021665390602>",
-        Color(187, 68, 136):    "<:b48:764038024677425183>",
-        Color(187, 68, 153):    "<:b49:764038028040732672>",
-        Color(187, 68, 170):    "<:b4a:764038031828320267>",
-        Color(187, 68, 187):    "<:b4b:764038034785566743>",
-        Color(187, 68, 204):    "<:b4c:764038038472359967>",
-        Color(187, 68, 221):    "<:b4d:764038041177161739>",
-        Color(187, 68, 238):    "<:b4e:764038044831186944>",
-        Color(187, 68, 255):    "<:b4f:764038047666667530>",
-        Color(187, 85, 0):      "<:b50:764038051517038622>",
-        Color(187, 85, 17):     "<:b51:764038054436274176>",
-        Color(187, 85, 34):     "<:b52:764038058240507914>",
-        Color(187, 85, 51):     "<:b53:764038061197492234>",
-        Color(187, 85, 68):     "<:b54:764038064451485728>",
-        Color(187, 85, 85):     "<:b55:764038067534954506>",
-        Color(187, 85, 102):    "<:b56:764038071002857503>",
-        Color(187, 85, 119):    "<:b57:764038074077675560>",
-        Color(187, 85, 136):    "<:b58:764038077789372456>",
-        Color(187, 85, 153):    "<:b59:764038080629178378>",
-        Color(187, 85, 170):    "<:b5a:764038084420435978>",
-        Color(187, 85, 187):    "<:b5b:764038087298252810>",
-        Color(187, 85, 204):    "<:b5c:764038090758422549>",
-        Color(187, 85, 221):    "<:b5d:764038094348484618>",
-        Color(187, 85, 238):    "<:b5e:764038097620828160>",
-        Color(187, 85, 255):    "<:b5f:764038100375961631>",
-        Color(187, 102, 0):     "<:b60:764038104197496852>",
-        Color(187, 102, 17):    "<:b61:764038107107426344>",
-        Color(187, 102, 34):    "<:b62:764038110651744257>",
-        Color(187, 102, 51):    "<:b63:764038113306869761>",
-        Color(187, 102, 68):    "<:b64:764038117397102622>",
-        Color(187, 102, 85):    "<:b65:764038120369946655>",
-        Color(187, 102, 102):   "<:b66:764038123809144854>",
-        Color(187, 102, 119):   "<:b67:764038126858403842>",
-        Color(187, 102, 136):   "<:b68:764038130340069378>",
-        Color(187, 102, 153):   "<:b69:764038133313830964>",
-        Color(187, 102, 170):   "<:b6a:764038137223053372>",
-        Color(187, 102, 187):   "<:b6b:764038140209004574>",
-        Color(187, 102, 204):   "<:b6c:764038143582142466>",
-        Color(187, 102, 221):   "<:b6d:764038147070754826>",
-        Color(187, 102, 238):   "<:b6e:764038150443368478>",
-        Color(187, 102, 255):   "<:b6f:764038153400352798>",
-        Color(187, 119, 0):     "<:b70:764038157028425748>",
-        Color(187, 119, 17):    "<:b71:764038159922888714>",
-        Color(187, 119, 34):    "<:b72:764038163572195368>",
-        Color(187, 119, 51):    "<:b73:764038166393913349>",
-        Color(187, 119, 68):    "<:b74:764038169862864928>",
-        Color(187, 119, 85):    "<:b75:764038173029695499>",
-        Color(187, 119, 102):   "<:b76:764038176817152010>",
-        Color(187, 119, 119):   "<:b77:764038179669147649>",
-        Color(187, 119, 136):   "<:b78:764038183158677535>",
-        Color(187, 119, 153):   "<:b79:764038186237820939>",
-        Color(187, 119, 170):   "<:b7a:764038189954105364>",
-        Color(187, 119, 187):   "<:b7b:764038192906764328>",
-        Color(187, 119, 204):   "<:b7c:764038196727644160>",
-        Color(187, 119, 221):   "<:b7d:764038199785553920>",
-        Color(187, 119, 238):   "<:b7e:764038203153580042>",
-        Color(187, 119, 255):   "<:b7f:764038206097195029>",
-        Color(187, 136, 0):     "<:b80:764038209830780948>",
-        Color(187, 136, 17):    "<:b81:764038212753948703>",
-        Color(187, 136, 34):    "<:b82:764038216134819841>",
-        Color(187, 136, 51):    "<:b83:764038219775606784>",
-        Color(187, 136, 68):    "<:b84:764038222778466335>",
-        Color(187, 136, 85):    "<:b85:764038226175590450>",
-        Color(187, 136, 102):   "<:b86:764038229346484225>",
-        Color(187, 136, 119):   "<:b87:764038232631279627>",
-        Color(187, 136, 136):   "<:b88:764038235734671361>",
-        Color(187, 136, 153):   "<:b89:764038239035588618>",
-        Color(187, 136, 170):   "<:b8a:764038242403221525>",
-        Color(187, 136, 187):   "<:b8b:764038245289558027>",
-        Color(187, 136, 204):   "<:b8c:764038249257107476>",
-        Color(187, 136, 221):   "<:b8d:764038251732009001>",
-        Color(187, 136, 238):   "<:b8e:764038255007105035>",
-        Color(187, 136, 255):   "<:b8f:764038258329124884>",
-        Color(187, 153, 0):     "<:b90:764038261076918274>",
-        Color(187, 153, 17):    "<:b91:764038264666456075>",
-        Color(187, 153, 34):    "<:b92:764038267678621696>",
-        Color(187, 153, 51):    "<:b93:764038271193579561>",
-        Color(187, 153, 68):    "<:b94:764038274393571340>",
-        Color(187, 153, 85):    "<:b95:764038277937233940>",
-        Color(187, 153, 102):   "<:b96:764038280780972032>",
-        Color(187, 153, 119):   "<:b97:764038284472221696>",
-        Color(187, 153, 136):   "<:b98:764038287407972384>",
-        Color(187, 153, 153):   "<:b99:764038290726453269>",
-        Color(187, 153, 170):   "<:b9a:764038293955280898>",
-        Color(187, 153, 187):   "<:b9b:764038297709707314>",
-        Color(187, 153, 204):   "<:b9c:764038300746383370>",
-        Color(187, 153, 221):   "<:b9d:764038304361349130>",
-        Color(187, 153, 238):   "<:b9e:764038307402350592>",
-        Color(187, 153, 255):   "<:b9f:764038311014301706>",
-        Color(187, 170, 0):     "<:ba0:764038314071162890>",
-        Color(187, 170, 17):    "<:ba1:764038317557284884>",
-        Color(187, 170, 34):    "<:ba2:764038320484253716>",
-        Color(187, 170, 51):    "<:ba3:764038324062388254>",
-        Color(187, 170, 68):    "<:ba4:764038326944137227>",
-        Color(187, 170, 85):    "<:ba5:764038330849034270>",
-        Color(187, 170, 102):   "<:ba6:764038333550428181>",
-        Color(187, 170, 119):   "<:ba7:764038337077051433>",
-        Color(187, 170, 136):   "<:ba8:764038340625825792>",
-        Color(187, 170, 153):   "<:ba9:764038343713095721>",
-        Color(187, 170, 170):   "<:baa:764038346783064094>",
-        Color(187, 170, 187):   "<:bab:764038350482178058>",
-        Color(187, 170, 204):   "<:bac:764038353334042658>",
-        Color(187, 170, 221):   "<:bad:764038356971421707>",
-        Color(187, 170, 238):   "<:bae:764038359680155669>",
-        Color(187, 170, 255):   "<:baf:764038363623587880>",
-        Color(187, 187, 0):     "<:bb0:764038366505205770>",
-        Color(187, 187, 17):    "<:bb1:764038370342338570>",
-        Color(187, 187, 34):    "<:bb2:764038373282414602>",
-        Color(187, 187, 51):    "<:bb3:764038376868806666>",
-        Color(187, 187, 68):    "<:bb4:764038379426938891>",
-        Color(187, 187, 85):    "<:bb5:764038383252537365>",
-        Color(187, 187, 102):   "<:bb6:764038386457509908>",
-        Color(187, 187, 119):   "<:bb7:764038389888188457>",
-        Color(187, 187, 136):   "<:bb8:764038393604341790>",
-        Color(187, 187, 153):   "<:bb9:764038396922167307>",
-        Color(187, 187, 170):   "<:bba:764038401593966613>",
-        Color(187, 187, 187):   "<:bbb:764038406363545600>",
-        Color(187, 187, 204):   "<:bbc:764038410129244181>",
-        Color(187, 187, 221):   "<:bbd:764038414848753684>",
-        Color(187, 187, 238):   "<:bbe:764038419369820190>",
-        Color(187, 187, 255):   "<:bbf:764038423665049610>",
-        Color(187, 204, 0):     "<:bc0:764038426542342174>",
-        Color(187, 204, 17):    "<:bc1:764038429688070195>",
-        Color(187, 204, 34):    "<:bc2:764038432825409557>",
-        Color(187, 204, 51):    "<:bc3:764038436281122826>",
-        Color(187, 204, 68):    "<:bc4:764038439174668288>",
-        Color(187, 204, 85):    "<:bc5:764038442509664277>",
-        Color(187, 204, 102):   "<:bc6:764038445583564810>",
-        Color(187, 204, 119):   "<:bc7:764038448478289920>",
-        Color(187, 204, 136):   "<:bc8:764038451607240704>",
-        Color(187, 204, 153):   "<:bc9:764038454471688193>",
-        Color(187, 204, 170):   "<:bca:764038458237779968>",
-        Color(187, 204, 187):   "<:bcb:764038461279436810>",
-        Color(187, 204, 204):   "<:bcc:764038464635011103>",
-        Color(187, 204, 221):   "<:bcd:764038467767500820>",
-        Color(187, 204, 238):   "<:bce:764038471547093002>",
-        Color(187, 204, 255):   "<:bcf:764038474188849153>",
-        Color(187, 221, 0):     "<:bd0:764038477997539338>",
-        Color(187, 221, 17):    "<:bd1:764038480614522891>",
-        Color(187, 221, 34):    "<:bd2:764038484683784192>",
-        Color(187, 221, 51):    "<:bd3:764038487485448192>",
-        Color(187, 221, 68):    "<:bd4:764038491490746378>",
-        Color(187, 221, 85):    "<:bd5:764038494322163713>",
-        Color(187, 221, 102):   "<:bd6:764038497518354454>",
-        Color(187, 221, 119):   "<:bd7:764038500659626004>",
-        Color(187, 221, 136):   "<:bd8:764038504342224906>",
-        Color(187, 221, 153):   "<:bd9:764038506870997014>",
-        Color(187, 221, 170):   "<:bda:764038510805123083>",
-        Color(187, 221, 187):   "<:bdb:764038514077466624>",
-        Color(187, 221, 204):   "<:bdc:764038517566734346>",
-        Color(187, 221, 221):   "<:bdd:764038520129716228>",
-        Color(187, 221, 238):   "<:bde:764038524289679380>",
-        Color(187, 221, 255):   "<:bdf:764038527536988181>",
-        Color(187, 238, 0):     "<:be0:764038530565406741>",
-        Color(187, 238, 17):    "<:be1:764038533702221824>",
-        Color(187, 238, 34):    "<:be2:764038536575451136>",
-        Color(187, 238, 51):    "<:be3:764038539314593824>",
-        Color(187, 238, 68):    "<:be4:764038542467923978>",
-        Color(187, 238, 85):    "<:be5:764038545412849664>",
-        Color(187, 238, 102):   "<:be6:764038548155531265>",
-        Color(187, 238, 119):   "<:be7:764038551498129408>",
-        Color(187, 238, 136):   "<:be8:764038554598768670>",
-        Color(187, 238, 153):   "<:be9:764038558952456222>",
-        Color(187, 238, 170):   "<:bea:764038561318043670>",
-        Color(187, 238, 187):   "<:beb:764038565322555392>",
-        Color(187, 238, 204):   "<:bec:764038567873478677>",
-        Color(187, 238, 221):   "<:bed:764038571601690655>",
-        Color(187, 238, 238):   "<:bee:764038574890549288>",
-        Color(187, 238, 255):   "<:bef:764038578295668747>",
-        Color(187, 255, 0):     "<:bf0:764038581450178590>",
-        Color(187, 255, 17):    "<:bf1:764038585010618398>",
-        Color(187, 255, 34):    "<:bf2:764038587758018561>",
-        Color(187, 255, 51):    "<:bf3:764038591684018176>",
-        Color(187, 255, 68):    "<:bf4:764038594515435560>",
-        Color(187, 255, 85):    "<:bf5:764038598311149609>",
-        Color(187, 255, 102):   "<:bf6:764038601364471858>",
-        Color(187, 255, 119):   "<:bf7:764038604770377729>",
-        Color(187, 255, 136):   "<:bf8:764038608193060895>",
-        Color(187, 255, 153):   "<:bf9:764038611438927882>",
-        Color(187, 255, 170):   "<:bfa:764038614408888361>",
-        Color(187, 255, 187):   "<:bfb:764038617860407307>",
-        Color(187, 255, 204):   "<:bfc:764038621149397002>",
-        Color(187, 255, 221):   "<:bfd:764038624588333076>",
-        Color(187, 255, 238):   "<:bfe:764038627495378954>",
-        Color(187, 255, 255):   "<:bff:764038630884245515>",
-        Color(204, 0, 0):       "<:c00:764038633912008726>",
-        Color(204, 0, 17):      "<:c01:764038637951123456>",
-        Color(204, 0, 34):      "<:c02:764038640908107786>",
-        Color(204, 0, 51):      "<:c03:764038644431978506>",
-        Color(204, 0, 68):      "<:c04:764038647255007232>",
-        Color(204, 0, 85):      "<:c05:764038650132299786>",
-        Color(204, 0, 102):     "<:c06:764038653046947852>",
-        Color(204, 0, 119):     "<:c07:764038656133693450>",
-        Color(204, 0, 136):     "<:c08:764038659774742558>",
-        Color(204, 0, 153):     "<:c09:764038662517293088>",
-        Color(204, 0, 170):     "<:c0a:764038666435428362>",
-        Color(204, 0, 187):     "<:c0b:764038669471842312>",
-        Color(204, 0, 204):     "<:c0c:764038677084110860>",
-        Color(204, 0, 221):     "<:c0d:764038680649924628>",
-        Color(204, 0, 238):     "<:c0e:764038683790802945>",
-        Color(204, 0, 255):     "<:c0f:764038686811619379>",
-        Color(204, 17, 0):      "<:c10:764038690245836821>",
-        Color(204, 17, 17):     "<:c11:764038693425643530>",
-        Color(204, 17, 34):     "<:c12:764038697015836703>",
-        Color(204, 17, 51):     "<:c13:764038700043862016>",
-        Color(204, 17, 68):     "<:c14:764038703567601665>",
-        Color(204, 17, 85):     "<:c15:764038706456952873>",
-        Color(204, 17, 102):    "<:c16:764038710404317195>",
-        Color(204, 17, 119):    "<:c17:764038713113313292>",
-        Color(204, 17, 136):    "<:c18:764038716800237589>",
-        Color(204, 17, 153):    "<:c19:764038720058818600>",
-        Color(204, 17, 170):    "<:c1a:764038723791749150>",
-        Color(204, 17, 187):    "<:c1b:764038729286811658>",
-        Color(204, 17, 204):    "<:c1c:764038732395315201>",
-        Color(204, 17, 221):    "<:c1d:764038735834382366>",
-        Color(204, 17, 238):    "<:c1e:764038738946031646>",
-        Color(204, 17, 255):    "<:c1f:764038741853339679>",
-        Color(204, 34, 0):      "<:c20:764038745598984212>",
-        Color(204, 34, 17):     "<:c21:764038748727934976>",
-        Color(204, 34, 34):     "<:c22:764038752137904189>",
-        Color(204, 34, 51):     "<:c23:764038755366731806>",
-        Color(204, 34, 68):     "<:c24:764038758504595479>",
-        Color(204, 34, 85):     "<:c25:764038761930817566>",
-        Color(204, 34, 102):    "<:c26:764038765542113310>",
-        Color(204, 34, 119):    "<:c27:764038768654680064>",
-        Color(204, 34, 136):    "<:c28:764038771825704981>",
-        Color(204, 34, 153):    "<:c29:764038774828564520>",
-        Color(204, 34, 170):    "<:c2a:764038778368425995>",
-        Color(204, 34, 187):    "<:c2b:764038781438525460>",
-        Color(204, 34, 204):    "<:c2c:764038785088356363>",
-        Color(204, 34, 221):    "<:c2d:764038788200267806>",
-        Color(204, 34, 238):    "<:c2e:764038791852720168>",
-        Color(204, 34, 255):    "<:c2f:764038794982588416>",
-        Color(204, 51, 0):      "<:c30:764038798413266974>",
-        Color(204, 51, 17):     "<:c31:764038801332502538>",
-        Color(204, 51, 34):     "<:c32:764038804922826772>",
-        Color(204, 51, 51):     "<:c33:764038807699718184>",
-        Color(204, 51, 68):     "<:c34:764038810694451210>",
-        Color(204, 51, 85):     "<:c35:764038813471080461>",
-        Color(204, 51, 102):    "<:c36:764038816930594816>",
-        Color(204, 51, 119):    "<:c37:764038820370186240>",
-        Color(204, 51, 136):    "<:c38:764038823150747669>",
-        Color(204, 51, 153):    "<:c39:764038826934403082>",
-        Color(204, 51, 170):    "<:c3a:764038829568163851>",
-        Color(204, 51, 187):    "<:c3b:764038833636376596>",
-        Color(204, 51, 204):    "<:c3c:764038836480507954>",
-        Color(204, 51, 221):    "<:c3d:764038840088133653>",
-        Color(204, 51, 238):    "<:c3e:764038842889535518>",
-        Color(204, 51, 255):    "<:c3f:764038845796581386>",
-        Color(204, 68, 0):      "<:c40:764038848606371841>",
-        Color(204, 68, 17):     "<:c41:764038852007559168>",
-        Color(204, 68, 34):     "<:c42:764038855589363732>",
-        Color(204, 68, 51):     "<:c43:764038858438213632>",
-        Color(204, 68, 68):     "<:c44:764038862183333908>",
-        Color(204, 68, 85):     "<:c45:764038864822075394>",
-        Color(204, 68, 102):    "<:c46:764038868763934730>",
-        Color(204, 68, 119):    "<:c47:764038871536107561>",
-        Color(204, 68, 136):    "<:c48:764038875462107156>",
-        Color(204, 68, 153):    "<:c49:764038878293262336>",
-        Color(204, 68, 170):    "<:c4a:764038881791836202>",
-        Color(204, 68, 187):    "<:c4b:764038885117788160>",
-        Color(204, 68, 204):    "<:c4c:764038888154464288>",
-        Color(204, 68, 221):    "<:c4d:764038891173969932>",
-        Color(204, 68, 238):    "<:c4e:764038895192637440>",
-        Color(204, 68, 255):    "<:c4f:764038898053021697>",
-        Color(204, 85, 0):      "<:c50:764038901240823819>",
-        Color(204, 85, 17):     "<:c51:764038904675303424>",
-        Color(204, 85, 34):     "<:c52:764038907641724928>",
-        Color(204, 85, 51):     "<:c53:764038911264686080>",
-        Color(204, 85, 68):     "<:c54:764038914146041856>",
-        Color(204, 85, 85):     "<:c55:764038917926158336>",
-        Color(204, 85, 102):    "<:c56:764038920924823563>",
-        Color(204, 85, 119):    "<:c57:764038924326404107>",
-        Color(204, 85, 136):    "<:c58:764038927396896800>",
-        Color(204, 85, 153):    "<:c59:764038931016187905>",
-        Color(204, 85, 170):    "<:c5a:764038933809332245>",
-        Color(204, 85, 187):    "<:c5b:764038937618415627>",
-        Color(204, 85, 204):    "<:c5c:764038940566356009>",
-        Color(204, 85, 221):    "<:c5d:764038944190627840>",
-        Color(204, 85, 238):    "<:c5e:764038946958737439>",
-        Color(204, 85, 255):    "<:c5f:764038949588434956>",
-        Color(204, 102, 0):     "<:c60:764038953032220683>",
-        Color(204, 102, 17):    "<:c61:764038955925766154>",
-        Color(204, 102, 34):    "<:c62:764038959851503616>",
-        Color(204, 102, 51):    "<:c63:764038962553159691>",
-        Color(204, 102, 68):    "<:c64:764038966202597386>",
-        Color(204, 102, 85):    "<:c65:764038969167183882>",
-        Color(204, 102, 102):   "<:c66:764038972908371978>",
-        Color(204, 102, 119):   "<:c67:764038975878463488>",
-        Color(204, 102, 136):   "<:c68:764038979175186463>",
-        Color(204, 102, 153):   "<:c69:764038982500876338>",
-        Color(204, 102, 170):   "<:c6a:764038985755918337>",
-        Color(204, 102, 187):   "<:c6b:764038989232472074>",
-        Color(204, 102, 204):   "<:c6c:764038992579526686>",
-        Color(204, 102, 221):   "<:c6d:764038995524190229>",
-        Color(204, 102, 238):   "<:c6e:764038999277830154>",
-        Color(204, 102, 255):   "<:c6f:764039002482409512>",
-        Color(204, 119, 0):     "<:c70:764039005809147914>",
-        Color(204, 119, 17):    "<:c71:764039008229261323>",
-        Color(204, 119, 34):    "<:c72:764039012158537759>",
-        Color(204, 119, 51):    "<:c73:764039015401390100>",
-        Color(204, 119, 68):    "<:c74:764039019033001994>",
-        Color(204, 119, 85):    "<:c75:764039022020001812>",
-        Color(204, 119, 102):   "<:c76:764039025664983041>",
-        Color(204, 119, 119):   "<:c77:764039028679901186>",
-        Color(204, 119, 136):   "<:c78:764039032228937728>",
-        Color(204, 119, 153):   "<:c79:764039035341242378>",
-        Color(204, 119, 170):   "<:c7a:764039038851612672>",
-        Color(204, 119, 187):   "<:c7b:764039041775042580>",
-        Color(204, 119, 204):   "<:c7c:764039045495652352>",
-        Color(204, 119, 221):   "<:c7d:764039048473870396>",
-        Color(204, 119, 238):   "<:c7e:764039052009144320>",
-        Color(204, 119, 255):   "<:c7f:764039054848425994>",
-        Color(204, 136, 0):     "<:c80:764039058519228436>",
-        Color(204, 136, 17):    "<:c81:764039061311848488>",
-        Color(204, 136, 34):    "<:c82:764039064202248212>",
-        Color(204, 136, 51):    "<:c83:764039067342995486>",
-        Color(204, 136, 68):    "<:c84:764039070270750750>",
-        Color(204, 136, 85):    "<:c85:764039073971044352>",
-        Color(204, 136, 102):   "<:c86:764039076369137665>",
-        Color(204, 136, 119):   "<:c87:764039080522547200>",
-        Color(204, 136, 136):   "<:c88:764039083390533642>",
-        Color(204, 136, 153):   "<:c89:764039087212068894>",
-        Color(204, 136, 170):   "<:c8a:764039089871388713>",
-        Color(204, 136, 187):   "<:c8b:764039093810102322>",
-        Color(204, 136, 204):   "<:c8c:764039096300994592>",
-        Color(204, 136, 221):   "<:c8d:764039100432777217>",
-        Color(204, 136, 238):   "<:c8e:764039103410733067>",
-        Color(204, 136, 255):   "<:c8f:764039106673246229>",
-        Color(204, 153, 0):     "<:c90:764039109957124107>",
-        Color(204, 153, 17):    "<:c91:764039113346646018>",
-        Color(204, 153, 34):    "<:c92:764039116614402058>",
-        Color(204, 153, 51):    "<:c93:764039119960539177>",
-        Color(204, 153, 68):    "<:c94:764039122997477378>",
-        Color(204, 153, 85):    "<:c95:764039126760030208>",
-        Color(204, 153, 102):   "<:c96:764039129285001238>",
-        Color(204, 153, 119):   "<:c97:764039132217344001>",
-        Color(204, 153, 136):   "<:c98:764039135588777984>",
-        Color(204, 153, 153):   "<:c99:764039138218344471>",
-        Color(204, 153, 170):   "<:c9a:764039142173704203>",
-        Color(204, 153, 187):   "<:c9b:764039145051783168>",
-        Color(204, 153, 204):   "<:c9c:764039148755222548>",
-        Color(204, 153, 221):   "<:c9d:764039151636447232>",
-        Color(204, 153, 238):   "<:c9e:764039155264126996>",
-        Color(204, 153, 255):   "<:c9f:764039158225567744>",
-        Color(204, 170, 0):     "<:ca0:764039161962299392>",
-        Color(204, 170, 17):    "<:ca1:764039164701442067>",
-        Color(204, 170, 34):    "<:ca2:764039167566413825>",
-        Color(204, 170, 51):    "<:ca3:764039170771386388>",
-        Color(204, 170, 68):    "<:ca4:764039173756813312>",
-        Color(204, 170, 85):    "<:ca5:764039177326428210>",
-        Color(204, 170, 102):   "<:ca6:764039180187598879>",
-        Color(204, 170, 119):   "<:ca7:764039183835987979>",
-        Color(204, 170, 136):   "<:ca8:764039186591776769>",
-        Color(204, 170, 153):   "<:ca9:764039190153265183>",
-        Color(204, 170, 170):   "<:caa:764039193776750613>",
-        Color(204, 170, 187):   "<:cab:764039196930736129>",
-        Color(204, 170, 204):   "<:cac:764039199950110731>",
-        Color(204, 170, 221):   "<:cad:764039203385376779>",
-        Color(204, 170, 238):   "<:cae:764039206615777280>",
-        Color(204, 170, 255):   "<:caf:764039210343727124>",
-        Color(204, 187, 0):     "<:cb0:764039214181384192>",
-        Color(204, 187, 17):    "<:cb1:764039217332355082>",
-        Color(204, 187, 34):    "<:cb2:764039220146733067>",
-        Color(204, 187, 51):    "<:cb3:764039223589601300>",
-        Color(204, 187, 68):    "<:cb4:764039226454048778>",
-        Color(204, 187, 85):    "<:cb5:764039230149754880>",
-        Color(204, 187, 102):   "<:cb6:764039233173192734>",
-        Color(204, 187, 119):   "<:cb7:764039236764172288>",
-        Color(204, 187, 136):   "<:cb8:764039239578419200>",
-        Color(204, 187, 153):   "<:cb9:764039243261542420>",
-        Color(204, 187, 170):   "<:cba:764039246012743681>",
-        Color(204, 187, 187):   "<:cbb:764039250416762892>",
-        Color(204, 187, 204):   "<:cbc:764039254132654091>",
-        Color(204, 187, 221):   "<:cbd:764039257202753556>",
-        Color(204, 187, 238):   "<:cbe:764039260646277151>",
-        Color(204, 187, 255):   "<:cbf:764039263816908811>",
-        Color(204, 204, 0):     "<:cc0:764039267559014400>",
-        Color(204, 204, 17):    "<:cc1:764039270548635678>",
-        Color(204, 204, 34):    "<:cc2:764039273997008907>",
-        Color(204, 204, 51):    "<:cc3:764039278623588353>",
-        Color(204, 204, 68):    "<:cc4:764039281844420618>",
-        Color(204, 204, 85):    "<:cc5:764039285153202176>",
-        Color(204, 204, 102):   "<:cc6:764039287825891339>",
-        Color(204, 204, 119):   "<:cc7:764039291709292544>",
-        Color(204, 204, 136):   "<:cc8:764039294142119977>",
-        Color(204, 204, 153):   "<:cc9:764039298470772736>",
-        Color(204, 204, 170):   "<:cca:764039301301272596>",
-        Color(204, 204, 187):   "<:ccb:764039304824881162>",
-        Color(204, 204, 204):   "<:ccc:764039307408441355>",
-        Color(204, 204, 221):   "<:ccd:764039311401943072>",
-        Color(204, 204, 238):   "<:cce:764039314602328064>",
-        Color(204, 204, 255):   "<:ccf:764039318041788436>",
-        Color(204, 221, 0):     "<:cd0:764039320939397131>",
-        Color(204, 221, 17):    "<:cd1:764039324689498113>",
-        Color(204, 221, 34):    "<:cd2:764039327591432192>",
-        Color(204, 221, 51):    "<:cd3:764039331228549120>",
-        Color(204, 221, 68):    "<:cd4:764039334323814410>",
-        Color(204, 221, 85):    "<:cd5:764039337955819520>",
-        Color(204, 221, 102):   "<:cd6:764039340782256140>",
-        Color(204, 221, 119):   "<:cd7:764039344184098817>",
-        Color(204, 221, 136):   "<:cd8:764039347296141312>",
-        Color(204, 221, 153):   "<:cd9:764039351037460542>",
-        Color(204, 221, 170):   "<:cda:764039353893781534>",
-        Color(204, 221, 187):   "<:cdb:764039357941809212>",
-        Color(204, 221, 204):   "<:cdc:764039360814645248>",
-        Color(204, 221, 221):   "<:cdd:764039364317020171>",
-        Color(204, 221, 238):   "<:cde:764039367282655262>",
-        Color(204, 221, 255):   "<:cdf:764039370822647838>",
-        Color(204, 238, 0):     "<:ce0:764039375235055627>",
-        Color(204, 238, 17):    "<:ce1:764039378220613642>",
-        Color(204, 238, 34):    "<:ce2:764039382852173824>",
-        Color(204, 238, 51):    "<:ce3:764039386185596959>",
-        Color(204, 238, 68):    "<:ce4:764039389876977684>",
-        Color(204, 238, 85):    "<:ce5:764039393190739968>",
-        Color(204, 238, 102):   "<:ce6:764039395887808513>",
-        Color(204, 238, 119):   "<:ce7:764039399460831262>",
-        Color(204, 238, 136):   "<:ce8:764039402707484672>",
-        Color(204, 238, 153):   "<:ce9:764039406058864650>",
-        Color(204, 238, 170):   "<:cea:764039409128570900>",
-        Color(204, 238, 187):   "<:ceb:764039412430143499>",
-        Color(204, 238, 204):   "<:cec:764039415621484544>",
-        Color(204, 238, 221):   "<:ced:764039418968801281>",
-        Color(204, 238, 238):   "<:cee:764039421812670465>",
-        Color(204, 238, 255):   "<:cef:764039424564396033>",
-        Color(204, 255, 0):     "<:cf0:764039427977642004>",
-        Color(204, 255, 17):    "<:cf1:764039431136083979>",
-        Color(204, 255, 34):    "<:cf2:764039434646978580>",
-        Color(204, 255, 51):    "<:cf3:764039437533315082>",
-        Color(204, 255, 68):    "<:cf4:764039441319985172>",
-        Color(204, 255, 85):    "<:cf5:764039444386283531>",
-        Color(204, 255, 102):   "<:cf6:764039448664997928>",
-        Color(204, 255, 119):   "<:cf7:764039452305653760>",
-        Color(204, 255, 136):   "<:cf8:764039455106531328>",
-        Color(204, 255, 153):   "<:cf9:764039458835791873>",
-        Color(204, 255, 170):   "<:cfa:764039461944164412>",
-        Color(204, 255, 187):   "<:cfb:764039465038774273>",
-        Color(204, 255, 204):   "<:cfc:764039468222513152>",
-        Color(204, 255, 221):   "<:cfd:764039470709866497>",
-        Color(204, 255, 238):   "<:cfe:764039474271223828>",
-        Color(204, 255, 255):   "<:cff:764039477030420521>",
-        Color(221, 0, 0):       "<:d00:764039480788647956>",
-        Color(221, 0, 17):      "<:d01:764039483778924544>",
-        Color(221, 0, 34):      "<:d02:764039487402803200>",
-        Color(221, 0, 51):      "<:d03:764039490296610826>",
-        Color(221, 0, 68):      "<:d04:764039493678268438>",
-        Color(221, 0, 85):      "<:d05:764039497095577600>",
-        Color(221, 0, 102):     "<:d06:764039500657590272>",
-        Color(221, 0, 119):     "<:d07:764039503450472448>",
-        Color(221, 0, 136):     "<:d08:764039507112362035>",
-        Color(221, 0, 153):     "<:d09:764039510169354250>",
-        Color(221, 0, 170):     "<:d0a:764039513558351873>",
-        Color(221, 0, 187):     "<:d0b:764039516738420746>",
-        Color(221, 0, 204):     "<:d0c:764039520302661662>",
-        Color(221, 0, 221):     "<:d0d:764039522861318195>",
-        Color(221, 0, 238):     "<:d0e:764039525944393730>",
-        Color(221, 0, 255):     "<:d0f:764039529174007808>",
-        Color(221, 17, 0):      "<:d10:764039532139118602>",
-        Color(221, 17, 17):     "<:d11:764039535788687360>",
-        Color(221, 17, 34):     "<:d12:764039538649202738>",
-        Color(221, 17, 51):     "<:d13:764039542197452801>",
-        Color(221, 17, 68):     "<:d14:764039544957304843>",
-        Color(221, 17, 85):     "<:d15:764039548752887859>",
-        Color(221, 17, 102):    "<:d16:764039551970050048>",
-        Color(221, 17, 119):    "<:d17:764039555287744513>",
-        Color(221, 17, 136):    "<:d18:764039558580273192>",
-        Color(221, 17, 153):    "<:d19:764039561768599563>",
-        Color(221, 17, 170):    "<:d1a:764039564992970752>",
-        Color(221, 17, 187):    "<:d1b:764039568738877489>",
-        Color(221, 17, 204):    "<:d1c:764039571695468544>",
-        Color(221, 17, 221):    "<:d1d:764039575437443112>",
-        Color(221, 17, 238):    "<:d1e:764039578590904380>",
-        Color(221, 17, 255):    "<:d1f:764039581846601749>",
-        Color(221, 34, 0):      "<:d20:764039584799129600>",
-        Color(221, 34, 17):     "<:d21:764039588376215591>",
-        Color(221, 34, 34):     "<:d22:764039591786708992>",
-        Color(221, 34, 51):     "<:d23:764039595259461642>",
-        Color(221, 34, 68):     "<:d24:764039598359707668>",
-        Color(221, 34, 85):     "<:d25:764039601836785674>",
-        Color(221, 34, 102):    "<:d26:764039604579729419>",
-        Color(221, 34, 119):    "<:d27:764039608308465664>",
-        Color(221, 34, 136):    "<:d28:764039610946813963>",
-        Color(221, 34, 153):    "<:d29:764039614788403212>",
-        Color(221, 34, 170):    "<:d2a:764039618038857738>",
-        Color(221, 34, 187):    "<:d2b:764039621637439518>",
-        Color(221, 34, 204):    "<:d2c:764039624615919616>",
-        Color(221, 34, 221):    "<:d2d:764039628205326367>",
-        Color(221, 34, 238):    "<:d2e:764039631029141555>",
-        Color(221, 34, 255):    "<:d2f:764039634686050334>",
-        Color(221, 51, 0):      "<:d30:764039637542895636>",
-        Color(221, 51, 17):     "<:d31:764039641178570763>",
-        Color(221, 51, 34):     "<:d32:764039644433350656>",
-        Color(221, 51, 51):     "<:d33:764039647751176193>",
-        Color(221, 51, 68):     "<:d34:764039650834120724>",
-        Color(221, 51, 85):     "<:d35:764039655875149834>",
-        Color(221, 51, 102):    "<:d36:764039658753490945>",
-        Color(221, 51, 119):    "<:d37:764039661869858816>",
-        Color(221, 51, 136):    "<:d38:764039665144823810>",
-        Color(221, 51, 153):    "<:d39:764039668395933716>",
-        Color(221, 51, 170):    "<:d3a:764039672136728576>",
-        Color(221, 51, 187):    "<:d3b:764039675136442378>",
-        Color(221, 51, 204):    "<:d3c:764039678806196224>",
-        Color(221, 51, 221):    "<:d3d:764039681586364417>",
-        Color(221, 51, 238):    "<:d3e:764039685332664340>",
-        Color(221, 51, 255):    "<:d3f:764039688222539806>",
-        Color(221, 68, 0):      "<:d40:764039691829248021>",
-        Color(221, 68, 17):     "<:d41:764039694798946334>",
-        Color(221, 68, 34):     "<:d42:764039698720751626>",
-        Color(221, 68, 51):     "<:d43:764039702902341634>",
-        Color(221, 68, 68):     "<:d44:764039707364425728>",
-        Color(221, 68, 85):     "<:d45:764039710137909289>",
-        Color(221, 68, 102):    "<:d46:764039713622327307>",
-        Color(221, 68, 119):    "<:d47:764039716579966977>",
-        Color(221, 68, 136):    "<:d48:764039720543059998>",
-        Color(221, 68, 153):    "<:d49:764039722933813259>",
-        Color(221, 68, 170):    "<:d4a:764039727073460255>",
-        Color(221, 68, 187):    "<:d4b:764039729560813589>",
-        Color(221, 68, 204):    "<:d4c:764039732400226325>",
-        Color(221, 68, 221):    "<:d4d:764039735680303105>",
-        Color(221, 68, 238):    "<:d4e:764039738700464148>",
-        Color(221, 68, 255):    "<:d4f:764039741476962304>",
-        Color(221, 85, 0):      "<:d50:764039744672890880>",
-        Color(221, 85, 17):     "<:d51:764039747471409152>",
-        Color(221, 85, 34):     "<:d52:764039750210027561>",
-        Color(221, 85, 51):     "<:d53:764039753426403328>",
-        Color(221, 85, 68):     "<:d54:764039756282593281>",
-        Color(221, 85, 85):     "<:d55:764039760276619264>",
-        Color(221, 85, 102):    "<:d56:764039763237011477>",
-        Color(221, 85, 119):    "<:d57:764039766516957195>",
-        Color(221, 85, 136):    "<:d58:764039769263964172>",
-        Color(221, 85, 153):    "<:d59:764039773106077707>",
-        Color(221, 85, 170):    "<:d5a:764039775924650015>",
-        Color(221, 85, 187):    "<:d5b:764039780098113536>",
-        Color(221, 85, 204):    "<:d5c:764039784435023894>",
-        Color(221, 85, 221):    "<:d5d:764039788688048128>",
-        Color(221, 85, 238):    "<:d5e:764039791573860363>",
-        Color(221, 85, 255):    "<:d5f:764039796125073438>",
-        Color(221, 102, 0):     "<:d60:764039799677911040>",
-        Color(221, 102, 17):    "<:d61:764039802584563723>",
-        Color(221, 102, 34):    "<:d62:764039806274633729>",
-        Color(221, 102, 51):    "<:d63:764039809030291457>",
-        Color(221, 102, 68):    "<:d64:764039812960485386>",
-        Color(221, 102, 85):    "<:d65:764039815859142676>",
-        Color(221, 102, 102):   "<:d66:764039819432165376>",
-        Color(221, 102, 119):   "<:d67:764039823384117298>",
-        Color(221, 102, 136):   "<:d68:764039826294702080>",
-        Color(221, 102, 153):   "<:d69:764039829176188968>",
-        Color(221, 102, 170):   "<:d6a:764039832229511231>",
-        Color(221, 102, 187):   "<:d6b:764039835576958987>",
-        Color(221, 102, 204):   "<:d6c:764039839732989992>",
-        Color(221, 102, 221):   "<:d6d:764039842556018688>",
-        Color(221, 102, 238):   "<:d6e:764039845499895820>",
-        Color(221, 102, 255):   "<:d6f:764039848675508224>",
-        Color(221, 119, 0):     "<:d70:764039852240666625>",
-        Color(221, 119, 17):    "<:d71:764039855327281172>",
-        Color(221, 119, 34):    "<:d72:764039858770542603>",
-        Color(221, 119, 51):    "<:d73:764039861816262666>",
-        Color(221, 119, 68):    "<:d74:764039865498075167>",
-        Color(221, 119, 85):    "<:d75:764039868652584970>",
-        Color(221, 119, 102):   "<:d76:764039872238714880>",
-        Color(221, 119, 119):   "<:d77:764039875116662784>",
-        Color(221, 119, 136):   "<:d78:764039878907658260>",
-        Color(221, 119, 153):   "<:d79:764039881579429909>",
-        Color(221, 119, 170):   "<:d7a:764039885467418635>",
-        Color(221, 119, 187):   "<:d7b:764039888064217091>",
-        Color(221, 119, 204):   "<:d7c:764039892061388821>",
-        Color(221, 119, 221):   "<:d7d:764039894807871500>",
-        Color(221, 119, 238):   "<:d7e:764039898390200371>",
-        Color(221, 119, 255):   "<:d7f:764039901598580746>",
-        Color(221, 136, 0):     "<:d80:764039905348157440>",
-        Color(221, 136, 17):    "<:d81:764039908246945823>",
-        Color(221, 136, 34):    "<:d82:764039911757971476>",
-        Color(221, 136, 51):    "<:d83:764039914781278218>",
-        Color(221, 136, 68):    "<:d84:764039917809958963>",
-        Color(221, 136, 85):    "<:d85:764039920939302914>",
-        Color(221, 136, 102):   "<:d86:764039924177174559>",
-        Color(221, 136, 119):   "<:d87:764039927126032415>",
-        Color(221, 136, 136):   "<:d88:764039931043250196>",
-        Color(221, 136, 153):   "<:d89:764039934108500008>",
-        Color(221, 136, 170):   "<:d8a:764039937623719936>",
-        Color(221, 136, 187):   "<:d8b:764039940539023381>",
-        Color(221, 136, 204):   "<:d8c:764039944204320768>",
-        Color(221, 136, 221):   "<:d8d:764039947257774090>",
-        Color(221, 136, 238):   "<:d8e:764039951062269962>",
-        Color(221, 136, 255):   "<:d8f:764039955093127189>",
-        Color(221, 153, 0):     "<:d90:764039957953118239>",
-        Color(221, 153, 17):    "<:d91:764039961614745640>",
-        Color(221, 153, 34):    "<:d92:764039964563341313>",
-        Color(221, 153, 51):    "<:d93:764039968049725470>",
-        Color(221, 153, 68):    "<:d94:764039970549399563>",
-        Color(221, 153, 85):    "<:d95:764039974747111424>",
-        Color(221, 153, 102):   "<:d96:764039977616277545>",
-        Color(221, 153, 119):   "<:d97:764039981265059840>",
-        Color(221, 153, 136):   "<:d98:764039983799336962>",
-        Color(221, 153, 153):   "<:d99:764039987737264149>",
-        Color(221, 153, 170):   "<:d9a:764039990459498527>",
-        Color(221, 153, 187):   "<:d9b:764039994473578536>",
-        Color(221, 153, 204):   "<:d9c:764039997417979914>",
-        Color(221, 153, 221):   "<:d9d:764040001167949824>",
-        Color(221, 153, 238):   "<:d9e:764040003634069505>",
-        Color(221, 153, 255):   "<:d9f:764040007756677130>",
-        Color(221, 170, 0):     "<:da0:764040010864787467>",
-        Color(221, 170, 17):    "<:da1:764040014098857995>",
-        Color(221, 170, 34):    "<:da2:764040017567547392>",
-        Color(221, 170, 51):    "<:da3:764040020658094092>",
-        Color(221, 170, 68):    "<:da4:764040023926374400>",
-        Color(221, 170, 85):    "<:da5:764040027575418881>",
-        Color(221, 170, 102):   "<:da6:764040030581817365>",
-        Color(221, 170, 119):   "<:da7:764040034054832128>",
-        Color(221, 170, 136):   "<:da8:764040036931993600>",
-        Color(221, 170, 153):   "<:da9:764040040640413717>",
-        Color(221, 170, 170):   "<:daa:764040043324637196>",
-        Color(221, 170, 187):   "<:dab:764040047434399744>",
-        Color(221, 170, 204):   "<:dac:764040050429394944>",
-        Color(221, 170, 221):   "<:dad:764040053914599464>",
-        Color(221, 170, 238):   "<:dae:764040056876564510>",
-        Color(221, 170, 255):   "<:daf:764040060436873216>",
-        Color(221, 187, 0):     "<:db0:764040063360827413>",
-        Color(221, 187, 17):    "<:db1:764040067273719848>",
-        Color(221, 187, 34):    "<:db2:764040069921112075>",
-        Color(221, 187, 51):    "<:db3:764040073703718932>",
-        Color(221, 187, 68):    "<:db4:764040076694781992>",
-        Color(221, 187, 85):    "<:db5:764040080284319754>",
-        Color(221, 187, 102):   "<:db6:764040083174326302>",
-        Color(221, 187, 119):   "<:db7:764040086940942336>",
-        Color(221, 187, 136):   "<:db8:764040089424101377>",
-        Color(221, 187, 153):   "<:db9:764040093509877790>",
-        Color(221, 187, 170):   "<:dba:764040096311017472>",
-        Color(221, 187, 187):   "<:dbb:764040099662528533>",
-        Color(221, 187, 204):   "<:dbc:764040102586220545>",
-        Color(221, 187, 221):   "<:dbd:764040105684893696>",
-        Color(221, 187, 238):   "<:dbe:764040108524961803>",
-        Color(221, 187, 255):   "<:dbf:764040111561375754>",
-        Color(221, 204, 0):     "<:dc0:764040114405113876>",
-        Color(221, 204, 17):    "<:dc1:764040117584134154>",
-        Color(221, 204, 34):    "<:dc2:764040120361418752>",
-        Color(221, 204, 51):    "<:dc3:764040123310145546>",
-        Color(221, 204, 68):    "<:dc4:764040126363074561>",
-        Color(221, 204, 85):    "<:dc5:764040129538949161>",
-        Color(221, 204, 102):   "<:dc6:764040132642471988>",
-        Color(221, 204, 119):   "<:dc7:764040135570096179>",
-        Color(221, 204, 136):   "<:dc8:764040139592433684>",
-        Color(221, 204, 153):   "<:dc9:764040142490828820>",
-        Color(221, 204, 170):   "<:dca:764040146567168001>",
-        Color(221, 204, 187):   "<:dcb:764040149369618432>",
-        Color(221, 204, 204):   "<:dcc:764040153274515476>",
-        Color(221, 204, 221):   "<:dcd:764040156214722560>",
-        Color(221, 204, 238):   "<:dce:764040159485886484>",
-        Color(221, 204, 255):   "<:dcf:764040162493071400>",
-        Color(221, 221, 0):     "<:dd0:764040166158499850>",
-        Color(221, 221, 17):    "<:dd1:764040169267396608>",
-        Color(221, 221, 34):    "<:dd2:764040172823380029>",
-        Color(221, 221, 51):    "<:dd3:764040175700934666>",
-        Color(221, 221, 68):    "<:dd4:764040179278544897>",
-        Color(221, 221, 85):    "<:dd5:764040182512353280>",
-        Color(221, 221, 102):   "<:dd6:764040185943687178>",
-        Color(221, 221, 119):   "<:dd7:764040188966993920>",
-        Color(221, 221, 136):   "<:dd8:764040192155058187>",
-        Color(221, 221, 153):   "<:dd9:764040195191472158>",
-        Color(221, 221, 170):   "<:dda:764040198781796373>",
-        Color(221, 221, 187):   "<:ddb:764040201948889088>",
-        Color(221, 221, 204):   "<:ddc:764040205376159758>",
-        Color(221, 221, 221):   "<:ddd:764040208064315425>",
-        Color(221, 221, 238):   "<:dde:764040212396507136>",
-        Color(221, 221, 255):   "<:ddf:764040215404216326>",
-        Color(221, 238, 0):     "<:de0:764040218818510858>",
-        Color(221, 238, 17):    "<:de1:764040221683613716>",
-        Color(221, 238, 34):    "<:de2:764040225176551465>",
-        Color(221, 238, 51):    "<:de3:764040228431200316>",
-        Color(221, 238, 68):    "<:de4:764040231933837342>",
-        Color(221, 238, 85):    "<:de5:764040234798153728>",
-        Color(221, 238, 102):   "<:de6:764040238598848532>",
-        Color(221, 238, 119):   "<:de7:764040241531060254>",
-        Color(221, 238, 136):   "<:de8:764040244881522709>",
-        Color(221, 238, 153):   "<:de9:764040247956078592>",
-        Color(221, 238, 170):   "<:dea:764040251810512896>",
-        Color(221, 238, 187):   "<:deb:764040254725816320>",
-        Color(221, 238, 204):   "<:dec:764040258500296734>",
-        Color(221, 238, 221):   "<:ded:764040261340233728>",
-        Color(221, 238, 238):   "<:dee:764040264989147166>",
-        Color(221, 238, 255):   "<:def:764040267984011314>",
-        Color(221, 255, 0):     "<:df0:764040271234072637>",
-        Color(221, 255, 17):    "<:df1:764040274296832031>",
-        Color(221, 255, 34):    "<:df2:764040278159130624>",
-        Color(221, 255, 51):    "<:df3:764040281158844416>",
-        Color(221, 255, 68):    "<:df4:764040284802777108>",
-        Color(221, 255, 85):    "<:df5:764040287382929420>",
-        Color(221, 255, 102):   "<:df6:764040291442229258>",
-        Color(221, 255, 119):   "<:df7:764040294064717825>",
-        Color(221, 255, 136):   "<:df8:764040297897525258>",
-        Color(221, 255, 153):   "<:df9:764040300997246976>",
-        Color(221, 255, 170):   "<:dfa:764040304793223198>",
-        Color(221, 255, 187):   "<:dfb:764040308982939668>",
-        Color(221, 255, 204):   "<:dfc:764040312036524073>",
-        Color(221, 255, 221):   "<:dfd:764040315564326912>",
-        Color(221, 255, 238):   "<:dfe:764040318496407562>",
-        Color(221, 255, 255):   "<:dff:764040322216755240>",
-        Color(238, 0, 0):       "<:e00:764040324833607685>",
-        Color(238, 0, 17):      "<:e01:764040328336375829>",
-        Color(238, 0, 34):      "<:e02:764040331108286495>",
-        Color(238, 0, 51):      "<:e03:764040335197339670>",
-        Color(238, 0, 68):      "<:e04:764040338373214209>",
-        Color(238, 0, 85):      "<:e05:764040341660893186>",
-        Color(238, 0, 102):     "<:e06:764040344659689483>",
-        Color(238, 0, 119):     "<:e07:764040348560523284>",
-        Color(238, 0, 136):     "<:e08:764040351484084244>",
-        Color(238, 0, 153):     "<:e09:764040354865086485>",
-        Color(238, 0, 170):     "<:e0a:764040357997838377>",
-        Color(238, 0, 187):     "<:e0b:764040361953591296>",
-        Color(238, 0, 204):     "<:e0c:764040364951601172>",
-        Color(238, 0, 221):     "<:e0d:764040368311369728>",
-        Color(238, 0, 238):     "<:e0e:764040371121946654>",
-        Color(238, 0, 255):     "<:e0f:764040374972055553>",
-        Color(238, 17, 0):      "<:e10:764040377769918515>",
-        Color(238, 17, 17):     "<:e11:764040381545185310>",
-        Color(238, 17, 34):     "<:e12:764040383927025685>",
-        Color(238, 17, 51):     "<:e13:764040387152576542>",
-        Color(238, 17, 68):     "<:e14:764040390323601408>",
-        Color(238, 17, 85):     "<:e15:764040393116483605>",
-        Color(238, 17, 102):    "<:e16:764040397000802314>",
-        Color(238, 17, 119):    "<:e17:764040399924232192>",
-        Color(238, 17, 136):    "<:e18:764040403640909884>",
-        Color(238, 17, 153):    "<:e19:764040406462889984>",
-        Color(238, 17, 170):    "<:e1a:764040410129498162>",
-        Color(238, 17, 187):    "<:e1b:764040412791832577>",
-        Color(238, 17, 204):    "<:e1c:764040416668024832>",
-        Color(238, 17, 221):    "<:e1d:764040419486072852>",
-        Color(238, 17, 238):    "<:e1e:764040422263095336>",
-        Color(238, 17, 255):    "<:e1f:764040425479602206>",
-        Color(238, 34, 0):      "<:e20:764040428030656533>",
-        Color(238, 34, 17):     "<:e21:764040432178036757>",
-        Color(238, 34, 34):     "<:e22:764040434892013569>",
-        Color(238, 34, 51):     "<:e23:764040438692315136>",
-        Color(238, 34, 68):     "<:e24:764040441473269771>",
-        Color(238, 34, 85):     "<:e25:764040445310795797>",
-        Color(238, 34, 102):    "<:e26:764040448166985728>",
-        Color(238, 34, 119):    "<:e27:764040451585605643>",
-        Color(238, 34, 136):    "<:e28:764040454579683350>",
-        Color(238, 34, 153):    "<:e29:764040458694557716>",
-        Color(238, 34, 170):    "<:e2a:764040461567393822>",
-        Color(238, 34, 187):    "<:e2b:764040465099390996>",
-        Color(238, 34, 204):    "<:e2c:764040468018888734>",
-        Color(238, 34, 221):    "<:e2d:764040471721803807>",
-        Color(238, 34, 238):    "<:e2e:764040474792034314>",
-        Color(238, 34, 255):    "<:e2f:764040478260723712>",
-        Color(238, 51, 0):      "<:e30:764040481218101248>",
-        Color(238, 51, 17):     "<:e31:764040484934385694>",
-        Color(238, 51, 34):     "<:e32:764040487849033728>",
-        Color(238, 51, 51):     "<:e33:764040491536089089>",
-        Color(238, 51, 68):     "<:e34:764040494887469116>",
-        Color(238, 51, 85):     "<:e35:764040498091524096>",
-        Color(238, 51, 102):    "<:e36:764040500701298690>",
-        Color(238, 51, 119):    "<:e37:764040504597020672>",
-        Color(238, 51, 136):    "<:e38:764040507092500481>",
-        Color(238, 51, 153):    "<:e39:764040510435229716>",
-        Color(238, 51, 170):    "<:e3a:764040513446871060>",
-        Color(238, 51, 187):    "<:e3b:764040516122968075>",
-        Color(238, 51, 204):    "<:e3c:764040520073871370>",
-        Color(238, 51, 221):    "<:e3d:764040522905681921>",
-        Color(238, 51, 238):    "<:e3e:764040526441086997>",
-        Color(238, 51, 255):    "<:e3f:764040529578164234>",
-        Color(238, 68, 0):      "<:e40:764040533328003082>",
-        Color(238, 68, 17):     "<:e41:764040536222203924>",
-        Color(238, 68, 34):     "<:e42:764040540047540264>",
-        Color(238, 68, 51):     "<:e43:764040542975426580>",
-        Color(238, 68, 68):     "<:e44:764040546465087490>",
-        Color(238, 68, 85):     "<:e45:764040549715017738>",
-        Color(238, 68, 102):    "<:e46:764040553003483136>",
-        Color(238, 68, 119):    "<:e47:764040556086951946>",
-        Color(238, 68, 136):    "<:e48:764040559794716682>",
-        Color(238, 68, 153):    "<:e49:764040562583666690>",
-        Color(238, 68, 170):    "<:e4a:764040565972533273>",
-        Color(238, 68, 187):    "<:e4b:764040569214861343>",
-        Color(238, 68, 204):    "<:e4c:764040572850929664>",
-        Color(238, 68, 221):    "<:e4d:764040575808307200>",
-        Color(238, 68, 238):    "<:e4e:764040579386441758>",
-        Color(238, 68, 255):    "<:e4f:764040582405947413>",
-        Color(238, 85, 0):      "<:e50:764040585718792242>",
-        Color(238, 85, 17):     "<:e51:764040588927827979>",
-        Color(238, 85, 34):     "<:e52:764040592023617566>",
-        Color(238, 85, 51):     "<:e53:764040595575799818>",
-        Color(238, 85, 68):     "<:e54:764040598311141387>",
-        Color(238, 85, 85):     "<:e55:764040602027032626>",
-        Color(238, 85, 102):    "<:e56:764040604946268170>",
-        Color(238, 85, 119):    "<:e57:764040607772966913>",
-        Color(238, 85, 136):    "<:e58:764040610809905153>",
-        Color(238, 85, 153):    "<:e59:764040614097715200>",
-        Color(238, 85, 170):    "<:e5a:764040618049011762>",
-        Color(238, 85, 187):    "<:e5b:764040620921847808>",
-        Color(238, 85, 204):    "<:e5c:764040624324214784>",
-        Color(238, 85, 221):    "<:e5d:764040627204653126>",
-        Color(238, 85, 238):    "<:e5e:764040630946365461>",
-        Color(238, 85, 255):    "<:e5f:764040633588645890>",
-        Color(238, 102, 0):     "<:e60:764040637669834793>",
-        Color(238, 102, 17):    "<:e61:764040640542670849>",
-        Color(238, 102, 34):    "<:e62:764040644045438977>",
-        Color(238, 102, 51):    "<:e63:764040647111475210>",
-        Color(238, 102, 68):    "<:e64:764040650655662120>",
-        Color(238, 102, 85):    "<:e65:764040653561659422>",
-        Color(238, 102, 102):   "<:e66:764040657638522891>",
-        Color(238, 102, 119):   "<:e67:764040660759216157>",
-        Color(238, 102, 136):   "<:e68:764040663897079818>",
-        Color(238, 102, 153):   "<:e69:764040667730018324>",
-        Color(238, 102, 170):   "<:e6a:764040672763314186>",
-        Color(238, 102, 187):   "<:e6b:764040675649781780>",
-        Color(238, 102, 204):   "<:e6c:764040679197638667>",
-        Color(238, 102, 221):   "<:e6d:764040682225795083>",
-        Color(238, 102, 238):   "<:e6e:764040685887291422>",
-        Color(238, 102, 255):   "<:e6f:764040688853450762>",
-        Color(238, 119, 0):     "<:e70:764040692480868374>",
-        Color(238, 119, 17):    "<:e71:764040696947671040>",
-        Color(238, 119, 34):    "<:e72:764040699795865600>",
-        Color(238, 119, 51):    "<:e73:764040703440453642>",
-        Color(238, 119, 68):    "<:e74:764040706272264212>",
-        Color(238, 119, 85):    "<:e75:764040710244532244>",
-        Color(238, 119, 102):   "<:e76:764040713196404736>",
-        Color(238, 119, 119):   "<:e77:764040717001031680>",
-        Color(238, 119, 136):   "<:e78:764040719928262656>",
-        Color(238, 119, 153):   "<:e79:764040723476643870>",
-        Color(238, 119, 170):   "<:e7a:764040726405185536>",
-        Color(238, 119, 187):   "<:e7b:764040730099449856>",
-        Color(238, 119, 204):   "<:e7c:764040733388177408>",
-        Color(238, 119, 221):   "<:e7d:764040736508870687>",
-        Color(238, 119, 238):   "<:e7e:764040739059007490>",
-        Color(238, 119, 255):   "<:e7f:764040743030620171>",
-        Color(238, 136, 0):     "<:e80:764040745937928212>",
-        Color(238, 136, 17):    "<:e81:764040749716733962>",
-        Color(238, 136, 34):    "<:e82:764040752627449886>",
-        Color(238, 136, 51):    "<:e83:764040756314505236>",
-        Color(238, 136, 68):    "<:e84:764040759246585866>",
-        Color(238, 136, 85):    "<:e85:764040763087781919>",
-        Color(238, 136, 102):   "<:e86:764040765898489887>",
-        Color(238, 136, 119):   "<:e87:764040769463779338>",
-        Color(238, 136, 136):   "<:e88:764040772311187466>",
-        Color(238, 136, 153):   "<:e89:764040776157626388>",
-        Color(238, 136, 170):   "<:e8a:764040779160879136>",
-        Color(238, 136, 187):   "<:e8b:764040782465859605>",
-        Color(238, 136, 204):   "<:e8c:764040786156978176>",
-        Color(238, 136, 221):   "<:e8d:764040789302837298>",
-        Color(238, 136, 238):   "<:e8e:764040792238850048>",
-        Color(238, 136, 255):   "<:e8f:764040795820916756>",
-        Color(238, 153, 0):     "<:e90:764040798694014986>",
-        Color(238, 153, 17):    "<:e91:764040801482309652>",
-        Color(238, 153, 34):    "<:e92:764040804569972736>",
-        Color(238, 153, 51):    "<:e93:764040807560773632>",
-        Color(238, 153, 68):    "<:e94:764040811276402708>",
-        Color(238, 153, 85):    "<:e95:764040813754974229>",
-        Color(238, 153, 102):   "<:e96:764040817798283274>",
-        Color(238, 153, 119):   "<:e97:764040820730494976>",
-        Color(238, 153, 136):   "<:e98:764040824484790272>",
-        Color(238, 153, 153):   "<:e99:764040827403501580>",
-        Color(238, 153, 170):   "<:e9a:764040830964727838>",
-        Color(238, 153, 187):   "<:e9b:764040833824587806>",
-        Color(238, 153, 204):   "<:e9c:764040837507579935>",
-        Color(238, 153, 221):   "<:e9d:764040840603107328>",
-        Color(238, 153, 238):   "<:e9e:764040844356878376>",
-        Color(238, 153, 255):   "<:e9f:764040847200354315>",
-        Color(238, 170, 0):     "<:ea0:764040850858573854>",
-        Color(238, 170, 17):    "<:ea1:764040853853044746>",
-        Color(238, 170, 34):    "<:ea2:764040857375604756>",
-        Color(238, 170, 51):    "<:ea3:764040860320661504>",
-        Color(238, 170, 68):    "<:ea4:764040864196460564>",
-        Color(238, 170, 85):    "<:ea5:764040867102326784>",
-        Color(238, 170, 102):   "<:ea6:764040870865010709>",
-        Color(238, 170, 119):   "<:ea7:764040875042406410>",
-        Color(238, 170, 136):   "<:ea8:764040877953777674>",
-        Color(238, 170, 153):   "<:ea9:764040881686052894>",
-        Color(238, 170, 170):   "<:eaa:764040884596899851>",
-        Color(238, 170, 187):   "<:eab:764040888216322059>",
-        Color(238, 170, 204):   "<:eac:764040891445805086>",
-        Color(238, 170, 221):   "<:ead:764040894717362198>",
-        Color(238, 170, 238):   "<:eae:764040897872265226>",
-        Color(238, 170, 255):   "<:eaf:764040901176721419>",
-        Color(238, 187, 0):     "<:eb0:764040904176435211>",
-        Color(238, 187, 17):    "<:eb1:764040908022218793>",
-        Color(238, 187, 34):    "<:eb2:764040910857830420>",
-        Color(238, 187, 51):    "<:eb3:764040914506088451>",
-        Color(238, 187, 68):    "<:eb4:764040919124672522>",
-        Color(238, 187, 85):    "<:eb5:764040923217657856>",
-        Color(238, 187, 102):   "<:eb6:764040927844761601>",
-        Color(238, 187, 119):   "<:eb7:764040931031646259>",
-        Color(238, 187, 136):   "<:eb8:764040935037599754>",
-        Color(238, 187, 153):   "<:eb9:764040939294425109>",
-        Color(238, 187, 170):   "<:eba:764040942231355392>",
-        Color(238, 187, 187):   "<:ebb:764040946001117195>",
-        Color(238, 187, 204):   "<:ebc:764040950359916554>",
-        Color(238, 187, 221):   "<:ebd:764040953392267264>",
-        Color(238, 187, 238):   "<:ebe:764040956390408252>",
-        Color(238, 187, 255):   "<:ebf:764040959246991360>",
-        Color(238, 204, 0):     "<:ec0:764040962963144704>",
-        Color(238, 204, 17):    "<:ec1:764040965803474964>",
-        Color(238, 204, 34):    "<:ec2:764040969602465792>",
-        Color(238, 204, 51):    "<:ec3:764040972346327062>",
-        Color(238, 204, 68):    "<:ec4:764040975759966209>",
-        Color(238, 204, 85):    "<:ec5:764040979048169482>",
-        Color(238, 204, 102):   "<:ec6:764040982772973569>",
-        Color(238, 204, 119):   "<:ec7:764040985792610314>",
-        Color(238, 204, 136):   "<:ec8:764040989428940850>",
-        Color(238, 204, 153):   "<:ec9:764040991916949505>",
-        Color(238, 204, 170):   "<:eca:764040996015046657>",
-        Color(238, 204, 187):   "<:ecb:764040998799802378>",
-        Color(238, 204, 204):   "<:ecc:764041002519887892>",
-        Color(238, 204, 221):   "<:ecd:764041005539524638>",
-        Color(238, 204, 238):   "<:ece:764041009235492884>",
-        Color(238, 204, 255):   "<:ecf:764041012200210432>",
-        Color(238, 221, 0):     "<:ed0:764041015786864640>",
-        Color(238, 221, 17):    "<:ed1:764041018697318420>",
-        Color(238, 221, 34):    "<:ed2:764041022442307586>",
-        Color(238, 221, 51):    "<:ed3:764041025131118655>",
-        Color(238, 221, 68):    "<:ed4:764041028743069717>",
-        Color(238, 221, 85):    "<:ed5:764041032072953857>",
-        Color(238, 221, 102):   "<:ed6:764041035638374421>",
-        Color(238, 221, 119):   "<:ed7:764041038481588234>",
-        Color(238, 221, 136):   "<:ed8:764041042881544202>",
-        Color(238, 221, 153):   "<:ed9:764041046195306497>",
-        Color(238, 221, 170):   "<:eda:764041049530171402>",
-        Color(238, 221, 187):   "<:edb:764041053350133770>",
-        Color(238, 221, 204):   "<:edc:764041056152190997>",
-        Color(238, 221, 221):   "<:edd:764041059743039488>",
-        Color(238, 221, 238):   "<:ede:764041062640779314>",
-        Color(238, 221, 255):   "<:edf:764041066281173014>",
-        Color(238, 238, 0):     "<:ee0:764041069490470932>",
-        Color(238, 238, 17):    "<:ee1:764041072920756224>",
-        Color(238, 238, 34):    "<:ee2:764041075974209566>",
-        Color(238, 238, 51):    "<:ee3:764041079245766687>",
-        Color(238, 238, 68):    "<:ee4:764041082232242197>",
-        Color(238, 238, 85):    "<:ee5:764041086196776960>",
-        Color(238, 238, 102):   "<:ee6:764041088989396994>",
-        Color(238, 238, 119):   "<:ee7:764041092785635328>",
-        Color(238, 238, 136):   "<:ee8:764041095700414475>",
-        Color(238, 238, 153):   "<:ee9:764041099290476544>",
-        Color(238, 238, 170):   "<:eea:764041102248247296>",
-        Color(238, 238, 187):   "<:eeb:764041105582456834>",
-        Color(238, 238, 204):   "<:eec:764041108769603584>",
-        Color(238, 238, 221):   "<:eed:764041112385486851>",
-        Color(238, 238, 238):   "<:eee:764041115111784449>",
-        Color(238, 238, 255):   "<:eef:764041119129534464>",
-        Color(238, 255, 0):     "<:ef0:764041122036973578>",
-        Color(238, 255, 17):    "<:ef1:764041125429379073>",
-        Color(238, 255, 34):    "<:ef2:764041128756379678>",
-        Color(238, 255, 51):    "<:ef3:764041132521947146>",
-        Color(238, 255, 68):    "<:ef4:764041137018896384>",
-        Color(238, 255, 85):    "<:ef5:764041140005502976>",
-        Color(238, 255, 102):   "<:ef6:764041143654154260>",
-        Color(238, 255, 119):   "<:ef7:764041146505756692>",
-        Color(238, 255, 136):   "<:ef8:764041149614391317>",
-        Color(238, 255, 153):   "<:ef9:764041152957382656>",
-        Color(238, 255, 170):   "<:efa:764041156581261322>",
-        Color(238, 255, 187):   "<:efb:764041159466942494>",
-        Color(238, 255, 204):   "<:efc:764041163304730634>",
-        Color(238, 255, 221):   "<:efd:764041166336426025>",
-        Color(238, 255, 238):   "<:efe:764041169667358720>",
-        Color(238, 255, 255):   "<:eff:764041172522893332>",
-        Color(255, 0, 0):       "<:f00:764041176134975530>",
-        Color(255, 0, 17):      "<:f01:764041179418591242>",
-        Color(255, 0, 34):      "<:f02:764041182933942312>",
-        Color(255, 0, 51):      "<:f03:764041185480146956>",
-        Color(255, 0, 68):      "<:f04:764041189505892362>",
-        Color(255, 0, 85):      "<:f05:764041191989313547>",
-        Color(255, 0, 102):     "<:f06:764041196091211816>",
-        Color(255, 0, 119):     "<:f07:764041198985150504>",
-        Color(255, 0, 136):     "<:f08:764041202688589824>",
-        Color(255, 0, 153):     "<:f09:764041205569814559>",
-        Color(255, 0, 170):     "<:f0a:764041209257656360>",
-        Color(255, 0, 187):     "<:f0b:764041212189474836>",
-        Color(255, 0, 204):     "<:f0c:764041215699976213>",
-        Color(255, 0, 221):     "<:f0d:764041218736390154>",
-        Color(255, 0, 238):     "<:f0e:764041222444548137>",
-        Color(255, 0, 255):     "<:f0f:764041225347006514>",
-        Color(255, 17, 0):      "<:f10:764041228492472330>",
-        Color(255, 17, 17):     "<:f11:764041231591931924>",
-        Color(255, 17, 34):     "<:f12:764041235714670594>",
-        Color(255, 17, 51):     "<:f13:764041238591569931>",
-        Color(255, 17, 68):     "<:f14:764041242731479071>",
-        Color(255, 17, 85):     "<:f15:764041245265231874>",
-        Color(255, 17, 102):    "<:f16:764041249106952202>",
-        Color(255, 17, 119):    "<:f17:764041252160798720>",
-        Color(255, 17, 136):    "<:f18:764041255504052264>",
-        Color(255, 17, 153):    "<:f19:764041258103865366>",
-        Color(255, 17, 170):    "<:f1a:764041262243905579>",
-        Color(255, 17, 187):    "<:f1b:764041266148540438>",
-        Color(255, 17, 204):    "<:f1c:764041269437267988>",
-        Color(255, 17, 221):    "<:f1d:764041272801230869>",
-        Color(255, 17, 238):    "<:f1e:764041275674198028>",
-        Color(255, 17, 255):    "<:f1f:764041279470043147>",
-        Color(255, 34, 0):      "<:f20:764041282493743114>",
-        Color(255, 34, 17):     "<:f21:764041286188662786>",
-        Color(255, 34, 34):     "<:f22:764041288885469185>",
-        Color(255, 34, 51):     "<:f23:764041292748423169>",
-        Color(255, 34, 68):     "<:f24:764041295705800704>",
-        Color(255, 34, 85):     "<:f25:764041299522617354>",
-        Color(255, 34, 102):    "<:f26:764041302416818206>",
-        Color(255, 34, 119):    "<:f27:764041306074644500>",
-        Color(255, 34, 136):    "<:f28:764041309102538752>",
-        Color(255, 34, 153):    "<:f29:764041312336085003>",
-        Color(255, 34, 170):    "<:f2a:764041315540795393>",
-        Color(255, 34, 187):    "<:f2b:764041319110279170>",
-        Color(255, 34, 204):    "<:f2c:764041321836838913>",
-        Color(255, 34, 221):    "<:f2d:764041326010171402>",
-        Color(255, 34, 238):    "<:f2e:764041328891396106>",
-        Color(255, 34, 255):    "<:f2f:764041331978403874>",
-        Color(255, 51, 0):      "<:f30:764041335111548938>",
-        Color(255, 51, 17):     "<:f31:764041338172735498>",
-        Color(255, 51, 34):     "<:f32:764041341058678804>",
-        Color(255, 51, 51):     "<:f33:764041343957729290>",
-        Color(255, 51, 68):     "<:f34:764041346557935657>",
-        Color(255, 51, 85):     "<:f35:764041349846007809>",
-        Color(255, 51, 102):    "<:f36:764041352991735848>",
-        Color(255, 51, 119):    "<:f37:764041356200640512>",
-        Color(255, 51, 136):    "<:f38:764041359031926824>",
-        Color(255, 51, 153):    "<:f39:764041361866489876>",
-        Color(255, 51, 170):    "<:f3a:764041364710096896>",
-        Color(255, 51, 187):    "<:f3b:764041369164447774>",
-        Color(255, 51, 204):    "<:f3c:764041371778285589>",
-        Color(255, 51, 221):    "<:f3d:764041375401377803>",
-        Color(255, 51, 238):    "<:f3e:764041378820259850>",
-        Color(255, 51, 255):    "<:f3f:764041382109118474>",
-        Color(255, 68, 0):      "<:f40:764041384846950401>",
-        Color(255, 68, 17):     "<:f41:764041388668223488>",
-        Color(255, 68, 34):     "<:f42:764041391592046632>",
-        Color(255, 68, 51):     "<:f43:764041395002146828>",
-        Color(255, 68, 68):     "<:f44:764041398173171732>",
-        Color(255, 68, 85):     "<:f45:764041401474220044>",
-        Color(255, 68, 102):    "<:f46:764041404803973130>",
-        Color(255, 68, 119):    "<:f47:764041408221806603>",
-        Color(255, 68, 136):    "<:f48:764041411376185375>",
-        Color(255, 68, 153):    "<:f49:764041415083819008>",
-        Color(255, 68, 170):    "<:f4a:764041417990864926>",
-        Color(255, 68, 187):    "<:f4b:764041421682114580>",
-        Color(255, 68, 204):    "<:f4c:764041424366207008>",
-        Color(255, 68, 221):    "<:f4d:764041428358791218>",
-        Color(255, 68, 238):    "<:f4e:764041431223369728>",
-        Color(255, 68, 255):    "<:f4f:764041434881458196>",
-        Color(255, 85, 0):      "<:f50:764041437771071488>",
-        Color(255, 85, 17):     "<:f51:764041441302413353>",
-        Color(255, 85, 34):     "<:f52:764041444327030804>",
-        Color(255, 85, 51):     "<:f53:764041448030076938>",
-        Color(255, 85, 68):     "<:f54:764041452366987285>",
-        Color(255, 85, 85):     "<:f55:764041455625830430>",
-        Color(255, 85, 102):    "<:f56:764041459028459520>",
-        Color(255, 85, 119):    "<:f57:764041461603106848>",
-        Color(255, 85, 136):    "<:f58:764041465915506699>",
-        Color(255, 85, 153):    "<:f59:764041468914434068>",
-        Color(255, 85, 170):    "<:f5a:764041472008781825>",
-        Color(255, 85, 187):    "<:f5b:764041475830186004>",
-        Color(255, 85, 204):    "<:f5c:764041478904479744>",
-        Color(255, 85, 221):    "<:f5d:764041482004332584>",
-        Color(255, 85, 238):    "<:f5e:764041485511032842>",
-        Color(255, 85, 255):    "<:f5f:764041488367222804>",
-        Color(255, 102, 0):     "<:f60:764041491932643329>",
-        Color(255, 102, 17):    "<:f61:764041495471718410>",
-        Color(255, 102, 34):    "<:f62:764041498332626965>",
-        Color(255, 102, 51):    "<:f63:764041501583081483>",
-        Color(255, 102, 68):    "<:f64:764041505328594964>",
-        Color(255, 102, 85):    "<:f65:764041508227121182>",
-        Color(255, 102, 102):   "<:f66:764041511448346625>",
-        Color(255, 102, 119):   "<:f67:764041514657251328>",
-        Color(255, 102, 136):   "<:f68:764041518494384169>",
-        Color(255, 102, 153):   "<:f69:764041521464213514>",
-        Color(255, 102, 170):   "<:f6a:764041524681637889>",
-        Color(255, 102, 187):   "<:f6b:764041527931568148>",
-        Color(255, 102, 204):   "<:f6c:764041531287273493>",
-        Color(255, 102, 221):   "<:f6d:764041534714413076>",
-        Color(255, 102, 238):   "<:f6e:764041538140766209>",
-        Color(255, 102, 255):   "<:f6f:764041541017665537>",
-        Color(255, 119, 0):     "<:f70:764041544411381791>",
-        Color(255, 119, 17):    "<:f71:764041547670749184>",
-        Color(255, 119, 34):    "<:f72:764041551176925185>",
-        Color(255, 119, 51):    "<:f73:764041554360008725>",
-        Color(255, 119, 68):    "<:f74:764041557979824148>",
-        Color(255, 119, 85):    "<:f75:764041560781357066>",
-        Color(255, 119, 102):   "<:f76:764041564648374272>",
-        Color(255, 119, 119):   "<:f77:764041567262212108>",
-        Color(255, 119, 136):   "<:f78:764041571125166081>",
-        Color(255, 119, 153):   "<:f79:764041574052528158>",
-        Color(255, 119, 170):   "<:f7a:764041577861087252>",
-        Color(255, 119, 187):   "<:f7b:764041581077987329>",
-        Color(255, 119, 204):   "<:f7c:764041584370647050>",
-        Color(255, 119, 221):   "<:f7d:764041587344277504>",
-        Color(255, 119, 238):   "<:f7e:764041591115087912>",
-        Color(255, 119, 255):   "<:f7f:764041594071810068>",
-        Color(255, 136, 0):     "<:f80:764041597506945044>",
-        Color(255, 136, 17):    "<:f81:764041600431030292>",
-        Color(255, 136, 34):    "<:f82:764041604146397214>",
-        Color(255, 136, 51):    "<:f83:764041607007043584>",
-        Color(255, 136, 68):    "<:f84:764041610413211669>",
-        Color(255, 136, 85):    "<:f85:764041613542162462>",
-        Color(255, 136, 102):   "<:f86:764041616133849129>",
-        Color(255, 136, 119):   "<:f87:764041619065929770>",
-        Color(255, 136, 136):   "<:f88:764041622387425310>",
-        Color(255, 136, 153):   "<:f89:764041626317488138>",
-        Color(255, 136, 170):   "<:f8a:764041629233315851>",
-        Color(255, 136, 187):   "<:f8b:764041632626114592>",
-        Color(255, 136, 204):   "<:f8c:764041635881287690>",
-        Color(255, 136, 221):   "<:f8d:764041638460522500>",
-        Color(255, 136, 238):   "<:f8e:764041642561896458>",
-        Color(255, 136, 255):   "<:f8f:764041645406289940>",
-        Color(255, 153, 0):     "<:f90:764041649038819328>",
-        Color(255, 153, 17):    "<:f91:764041651990822912>",
-        Color(255, 153, 34):    "<:f92:764041655401316363>",
-        Color(255, 153, 51):    "<:f93:764041658689519656>",
-        Color(255, 153, 68):    "<:f94:764041662397546496>",
-        Color(255, 153, 85):    "<:f95:764041665148485633>",
-        Color(255, 153, 102):   "<:f96:764041668890066954>",
-        Color(255, 153, 119):   "<:f97:764041671545323531>",
-        Color(255, 153, 136):   "<:f98:764041675487051786>",
-        Color(255, 153, 153):   "<:f99:764041678188183553>",
-        Color(255, 153, 170):   "<:f9a:764041682232410112>",
-        Color(255, 153, 187):   "<:f9b:764041684928430101>",
-        Color(255, 153, 204):   "<:f9c:764041688678924288>",
-        Color(255, 153, 221):   "<:f9d:764041691744829440>",
-        Color(255, 153, 238):   "<:f9e:764041695293472768>",
-        Color(255, 153, 255):   "<:f9f:764041698014658572>",
-        Color(255, 170, 0):     "<:fa0:764041701546655746>",
-        Color(255, 170, 17):    "<:fa1:764041704818343986>",
-        Color(255, 170, 34):    "<:fa2:764041708782092288>",
-        Color(255, 170, 51):    "<:fa3:764041711692939295>",
-        Color(255, 170, 68):    "<:fa4:764041714708512779>",
-        Color(255, 170, 85):    "<:fa5:764041718134865930>",
-        Color(255, 170, 102):   "<:fa6:764041721842499614>",
-        Color(255, 170, 119):   "<:fa7:764041724699344926>",
-        Color(255, 170, 136):   "<:fa8:764041728268435456>",
-        Color(255, 170, 153):   "<:fa9:764041731510501386>",
-        Color(255, 170, 170):   "<:faa:764041734963068968>",
-        Color(255, 170, 187):   "<:fab:764041737449766916>",
-        Color(255, 170, 204):   "<:fac:764041741426229248>",
-        Color(255, 170, 221):   "<:fad:764041744122642454>",
-        Color(255, 170, 238):   "<:fae:764041747092733972>",
-        Color(255, 170, 255):   "<:faf:764041749928476703>",
-        Color(255, 187, 0):     "<:fb0:764041753321668618>",
-        Color(255, 187, 17):    "<:fb1:764041756756541460>",
-        Color(255, 187, 34):    "<:fb2:764041759881429052>",
-        Color(255, 187, 51):    "<:fb3:764041762725429258>",
-        Color(255, 187, 68):    "<:fb4:764041765619236895>",
-        Color(255, 187, 85):    "<:fb5:764041768861040650>",
-        Color(255, 187, 102):   "<:fb6:764041771482218508>",
-        Color(255, 187, 119):   "<:fb7:764041774795718666>",
-        Color(255, 187, 136):   "<:fb8:764041777706565632>",
-        Color(255, 187, 153):   "<:fb9:764041780689502208>",
-        Color(255, 187, 170):   "<:fba:764041783591043082>",
-        Color(255, 187, 187):   "<:fbb:764041786477117480>",
-        Color(255, 187, 204):   "<:fbc:764041789346676758>",
-        Color(255, 187, 221):   "<:fbd:764041792445612053>",
-        Color(255, 187, 238):   "<:fbe:764041795499327488>",
-        Color(255, 187, 255):   "<:fbf:764041798376751104>",
-        Color(255, 204, 0):     "<:fc0:764041800809578498>",
-        Color(255, 204, 17):    "<:fc1:764041804433457152>",
-        Color(255, 204, 34):    "<:fc2:764041807721267220>",
-        Color(255, 204, 51):    "<:fc3:764041810993479690>",
-        Color(255, 204, 68):    "<:fc4:764041813396160514>",
-        Color(255, 204, 85):    "<:fc5:764041816441880577>",
-        Color(255, 204, 102):   "<:fc6:764041819771633664>",
-        Color(255, 204, 119):   "<:fc7:764041822673960980>",
-        Color(255, 204, 136):   "<:fc8:764041825832271872>",
-        Color(255, 204, 153):   "<:fc9:764041829137252362>",
-        Color(255, 204, 170):   "<:fca:764041832006025216>",
-        Color(255, 204, 187):   "<:fcb:764041834992500736>",
-        Color(255, 204, 204):   "<:fcc:764041837937164318>",
-        Color(255, 204, 221):   "<:fcd:764041840868589578>",
-        Color(255, 204, 238):   "<:fce:764041843839074314>",
-        Color(255, 204, 255):   "<:fcf:764041846719774720>",
-        Color(255, 221, 0):     "<:fd0:764041849589465100>",
-        Color(255, 221, 17):    "<:fd1:764041854143954944>",
-        Color(255, 221, 34):    "<:fd2:764041857017184276>",
-        Color(255, 221, 51):    "<:fd3:764041860515627018>",
-        Color(255, 221, 68):    "<:fd4:764041863103512617>",
-        Color(255, 221, 85):    "<:fd5:764041866823335956>",
-        Color(255, 221, 102):   "<:fd6:764041869524074497>",
-        Color(255, 221, 119):   "<:fd7:764041873283088415>",
-        Color(255, 221, 136):   "<:fd8:764041876243742743>",
-        Color(255, 221, 153):   "<:fd9:764041880022941717>",
-        Color(255, 221, 170):   "<:fda:764041883005222935>",
-        Color(255, 221, 187):   "<:fdb:764041887203590155>",
-        Color(255, 221, 204):   "<:fdc:764041890969550848>",
-        Color(255, 221, 221):   "<:fdd:764041893973458944>",
-        Color(255, 221, 238):   "<:fde:764041897361932309>",
-        Color(255, 221, 255):   "<:fdf:764041900553928724>",
-        Color(255, 238, 0):     "<:fe0:764041904160636928>",
-        Color(255, 238, 17):    "<:fe1:764041907176734760>",
-        Color(255, 238, 34):    "<:fe2:764041911094607872>",
-        Color(255, 238, 51):    "<:fe3:764041913853804595>",
-        Color(255, 238, 68):    "<:fe4:764041917045538817>",
-        Color(255, 238, 85):    "<:fe5:764041920343048212>",
-        Color(255, 238, 102):   "<:fe6:764041923983573002>",
-        Color(255, 238, 119):   "<:fe7:764041927032569856>",
-        Color(255, 238, 136):   "<:fe8:764041930484350976>",
-        Color(255, 238, 153):   "<:fe9:764041933093732363>",
-        Color(255, 238, 170):   "<:fea:764041936217964574>",
-        Color(255, 238, 187):   "<:feb:764041939690455050>",
-        Color(255, 238, 204):   "<:fec:764041942623322122>",
-        Color(255, 238, 221):   "<:fed:764041946015989760>",
-        Color(255, 238, 238):   "<:fee:764041949035626507>",
-        Color(255, 238, 255):   "<:fef:764041952446251009>",
-        Color(255, 255, 0):     "<:ff0:764041955503636511>",
-        Color(255, 255, 17):    "<:ff1:764041959261995008>",
-        Color(255, 255, 34):    "<:ff2:764041962243751987>",
-        Color(255, 255, 51):    "<:ff3:764041965754515466>",
-        Color(255, 255, 68):    "<:ff4:764041968799973386>",
-        Color(255, 255, 85):    "<:ff5:764041972385972226>",
-        Color(255, 255, 102):   "<:ff6:764041975044243457>",
-        Color(255, 255, 119):   "<:ff7:764041978920828950>",
-        Color(255, 255, 136):   "<:ff8:764041981897736202>",
-        Color(255, 255, 153):   "<:ff9:764041985584791552>",
-        Color(255, 255, 170):   "<:ffa:764041988324065281>",
-        Color(255, 255, 187):   "<:ffb:764041992064729109>",
-        Color(255, 255, 204):   "<:ffc:764041994804002837>",
-        Color(255, 255, 221):   "<:ffd:764041998801043456>",
-        Color(255, 255, 238):   "<:ffe:764042001712676905>",
-        Color(255, 255, 255):   "<:fff:764042005423849482>",
+from mosaic_bot import DATA_PATH
+from mosaic_bot.color import approx_12bit_code
+
+# the emojis are stored one per line, indexed by the code of their color in
+# the palette, with the background emoji last. For the 12-bit palette the code
+# is (r >> 4) << 8 | (g >> 4) << 4 | b >> 4 of the approximated color, with
+# the background emoji at BACKGROUND_CODE. The VGA emojis are uploaded
+# separately for each deployment, so their file lives in DATA_PATH
+EMOJI_FILES = {
+    '12bit': pathlib.Path(__file__).resolve().parent / 'emojis.txt',
+    'vga'  : DATA_PATH / 'emojis_vga.txt',
 }
+BACKGROUND_CODE = 4096
+
+
+@lru_cache(2 * len(EMOJI_FILES))
+def get_emoji_table(encoded: bool = False, palette: str = '12bit') -> list:
+    '''
+    Return the emoji table of the palette, read from its file on first use.
+    The emojis are utf-8 encoded bytes if encoded is True
+
+    :raises: FileNotFoundError if the emojis of the palette are not available
+    '''
+    if not encoded:
+        return [e.decode('utf8') for e in get_emoji_table(True, palette)]
+    with open(EMOJI_FILES[palette], 'rb') as f:
+        return f.read().splitlines()
 
 
 def get_emoji_by_rgb(r: int, g: int, b: int):
@@ -4107,7 +37,8 @@ def get_emoji_by_rgb(r: int, g: int, b: int):
     the background emoji
     '''
     if r == -1 and g == -1 and b == -1:
-        return "<:bg:800553150922752032>"
-    return EMOJIS[Color(r, g, b).approx_12bit()]
+        return get_emoji_table()[BACKGROUND_CODE]
+    return get_emoji_table()[approx_12bit_code(r, g, b)]
+
 
-__all__ = ['get_emoji_by_rgb']
+__all__ = ['get_emoji_by_rgb', 'get_emoji_table', 'BACKGROUND_CODE', 'EMOJI_FILES']
@@ -1,18 +1,31 @@
 import base64
 import io
+from functools import lru_cache, partial
+from typing import Union
 
 import numpy as np
 from PIL import Image
 
-from mosaic_bot.color import Color
-from mosaic_bot.cv import find_scale
-from mosaic_bot.emojis import get_emoji_by_rgb
+from mosaic_bot.color import approx_12bit_array
+from mosaic_bot.cv import Grid, find_grid
+from mosaic_bot.dither import floyd_steinberg, ordered
+from mosaic_bot.emojis import get_emoji_table
+from mosaic_bot.lut import perceptual_codes, vga_codes
+from mosaic_bot.palette import background_code, palette_colors
 
 
-def downsample(img: Image.Image, scale: int = None) -> Image.Image:
+def downsample(img: Image.Image, scale: Union[int, Grid] = None) -> Image.Image:
     if not scale:
-        scale = find_scale(img)
-    return img.resize((img.size[0] // scale, img.size[1] // scale), Image.NEAREST)
+        scale = find_grid(img)
+    elif not isinstance(scale, Grid):
+        scale = Grid(scale, scale)
+    # the center of every pixel of the grid that is at least half in the
+    # image is sampled. an offset found a hair after the edge doesn't cost
+    # the last pixel that way
+    w = round((img.width - scale.offset_x) / scale.scale_x)
+    h = round((img.height - scale.offset_y) / scale.scale_y)
+    return img.transform((w, h), Image.AFFINE,
+                         (scale.scale_x, 0, scale.offset_x, 0, scale.scale_y, scale.offset_y), Image.NEAREST)
 
 
 def crop(img: Image.Image) -> Image.Image:
@@ -22,9 +35,9 @@ def crop(img: Image.Image) -> Image.Image:
 def preprocess(img: Image.Image, debug: bool = False, scale = None):
     if scale is None:
         if debug:
-            scale, data = find_scale(img, True)
+            scale, data = find_grid(img, True)
         else:
-            scale = find_scale(img)
+            scale = find_grid(img)
     img = crop(downsample(img, scale)).convert('RGBA')
     try:
         return img, data
@@ -32,39 +45,72 @@ def preprocess(img: Image.Image, debug: bool = False, scale = None):
         return img
 
 
+# rough distance between neighboring colors of each palette in a channel,
+# used to scale the threshold of ordered dithering
+DITHER_SPREAD = {
+    '12bit': 17,
+    'vga'  : 20,
+}
+
+
+def gen_emoji_codes(img: Image.Image, perceptual = False, dither: str = None, palette = '12bit') -> np.ndarray:
+    """
+    the code of every pixel in the palette, with transparent pixels
+    set to the background code. If perceptual is True, the 12-bit codes
+    come from the perceptual lookup table instead of rounding each
+    channel, see mosaic_bot.lut. The VGA palette is always matched
+    perceptually. dither can be either floyd-steinberg or ordered,
+    see mosaic_bot.dither. Without dithering, img can also be an
+    array of any number of frames
+
+    :raises: FileNotFoundError if perceptual is True but the lookup table hasn't been built
+    """
+    arr = np.asarray(img)
+    if palette == 'vga':
+        quantize = vga_codes
+    elif perceptual:
+        quantize = perceptual_codes
+    else:
+        quantize = partial(approx_12bit_array, codes = True)
+
+    if dither is None:
+        codes = quantize(arr)
+    elif dither == 'floyd-steinberg':
+        codes = floyd_steinberg(arr[..., :3], quantize, palette_colors(palette), arr[..., 3] != 0)
+    elif dither == 'ordered':
+        codes = ordered(arr[..., :3], quantize, DITHER_SPREAD[palette])
+    else:
+        raise ValueError(f'Unknown dithering method {dither}')
+    codes[arr[..., 3] == 0] = background_code(palette)
+    return codes
+
+
+@lru_cache(4)
+def _emoji_lookup(with_space: bool, palette = '12bit') -> np.ndarray:
+    if with_space:
+        return np.array([e + ' ' for e in get_emoji_table(palette = palette)], dtype = object)
+    return np.array(get_emoji_table(palette = palette), dtype = object)
+
+
+def codes_to_emoji_sequence(codes: np.ndarray, large = False, with_space = False, palette = '12bit'):
+    end = '\n' if large else '\u200b\n'
+    return ''.join(''.join(row) + end for row in _emoji_lookup(with_space, palette)[codes].tolist())
+
+
 # single line emojis will be rendered small >= 28
 
 def gen_emoji_sequence(img: Image.Image, large = False, with_space = False):
     # all images passed in should be preprocessed images
     # ie. RGBA, downsampled
-    res = ''
-    arr = np.array(img)
-    for row in arr:
-        for col in row:
-            r, g, b, a = col
-            if a == 0:
-                emoji = get_emoji_by_rgb(-1, -1, -1)
-            else:
-                emoji = get_emoji_by_rgb(r, g, b)
-            res += emoji
-            if with_space:
-                res += ' '
-        if not large:
-            res += '\u200b'
-        res += '\n'
-    return res
+    return codes_to_emoji_sequence(gen_emoji_codes(img), large, with_space)
 
 
 def gen_image_12bit_approx(img: Image.Image):
-    new_image = Image.new('RGBA', img.size)
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
-    arr = np.array(img)
-    for y, row in enumerate(arr):
-        for x, col in enumerate(row):
-            r, g, b, a = col
-            new_image.putpixel((x, y), (*Color(r, g, b).approx_12bit(), 255 if a else 0))
-    return new_image
+    arr = approx_12bit_array(np.asarray(img))
+    arr[..., 3] = np.where(arr[..., 3], 255, 0)
+    return Image.fromarray(arr, 'RGBA')
 
 
 def gen_image_preview(img: Image.Image):
@@ -73,6 +119,39 @@ def gen_image_preview(img: Image.Image):
     return preview.resize((img.width * scale, img.height * scale), Image.NEAREST)
 
 
+# approximately how discord lays out emojis, in pixels
+EMOJI_SIZE = 22
+EMOJI_SIZE_LARGE = 48
+SPACE_WIDTH = 4
+LINE_GAP_LARGE = 4  # every line of a large image is a message of its own
+
+
+@lru_cache(8)
+def _tile_atlas(large: bool, with_space: bool, palette = '12bit') -> np.ndarray:
+    # the emojis are the solid swatches made by bot/gen_emojis.py, so a swatch
+    # downscaled to the emoji size is a tile of its color. every tile includes
+    # the transparent space to its right and below it, and the background
+    # emoji is fully transparent
+    size = EMOJI_SIZE_LARGE if large else EMOJI_SIZE
+    gap_x = SPACE_WIDTH if with_space else 0
+    gap_y = LINE_GAP_LARGE if large else 0
+    colors = palette_colors(palette)
+    atlas = np.zeros((len(colors) + 1, size + gap_y, size + gap_x, 4), dtype = np.uint8)
+    atlas[:-1, :size, :size, :3] = colors[:, None, None, :]
+    atlas[:-1, :size, :size, 3] = 255
+    return atlas
+
+
+def gen_emoji_preview(codes: np.ndarray, large = False, with_space = False, palette = '12bit') -> Image.Image:
+    """
+    what the image of the code array looks like once sent
+    """
+    tiles = _tile_atlas(large, with_space, palette)[codes]
+    h, w, th, tw = tiles.shape[:4]
+    # (row, column, y, x) to (row, y, column, x) puts every tile in its block
+    return Image.fromarray(tiles.transpose(0, 2, 1, 3, 4).reshape(h * th, w * tw, 4), 'RGBA')
+
+
 def image_to_data(img: Image.Image, approx_12bit: bool):
     if approx_12bit:
         img = gen_image_12bit_approx(img)
@@ -84,19 +163,13 @@ def image_to_data(img: Image.Image, approx_12bit: bool):
 
 
 def gen_icon():
-    img = Image.new("RGBA", (128, 128))
-
-    for x in range(128):
-        for y in range(128):
-            x_eff = x // 8
-            y_eff = 15 - y // 8  # flip y-axis to math mode
-
-            r = x_eff
-            g = 9
-            b = y_eff
-
-            img.putpixel((x, y), ((r << 4) + r, (g << 4) + g, (b << 4) + b, 255))
-    return img
+    arr = np.empty((128, 128, 4), dtype = np.uint8)
+    levels = np.arange(128) // 8 * 17
+    arr[..., 0] = levels[None, :]
+    arr[..., 1] = 9 * 17
+    arr[..., 2] = levels[::-1, None]  # flip y-axis to math mode
+    arr[..., 3] = 255
+    return Image.fromarray(arr, 'RGBA')
 
 
 def gen_gradient(r: int = None, g: int = None, b: int = None, x = '+', y = '+'):
@@ -104,48 +177,38 @@ def gen_gradient(r: int = None, g: int = None, b: int = None, x = '+', y = '+'):
     Using math coordinate. When either x or y or both is -, the the axis
     is flipped and the origin is recalculated accordingly
     """
-    img = Image.new("RGBA", (16, 16))
-
-    r0 = r
-    g0 = g
-    b0 = b
-
-    x_pos = x == '+'
-    y_pos = y == '+'
-
-    for x in range(16):
-        for y in range(16):
-            x_eff = x
-            y_eff = 15 - y  # flip y-axis to match math coordinate
-
-            if r0 is not None:
-                g = x_eff if x_pos else 15 - x
-                b = y_eff if y_pos else 15 - y
-            elif g0 is not None:
-                r = x_eff if x_pos else 15 - x
-                b = y_eff if y_pos else 15 - y
-            elif b0 is not None:
-                r = x_eff if x_pos else 15 - x
-                g = y_eff if y_pos else 15 - y
-            else:
-                raise ValueError("At least one of the r,g,b must be specified")
-            img.putpixel((x, y), ((r << 4) + r, (g << 4) + g, (b << 4) + b, 255))
-    return img
+    if r is not None:
+        fixed, horizontal, vertical = 0, 1, 2
+    elif g is not None:
+        fixed, horizontal, vertical = 1, 0, 2
+    elif b is not None:
+        fixed, horizontal, vertical = 2, 0, 1
+    else:
+        raise ValueError("At least one of the r,g,b must be specified")
+
+    levels = np.arange(16) * 17
+    arr = np.empty((16, 16, 4), dtype = np.uint8)
+    arr[..., fixed] = (r, g, b)[fixed] * 17
+    arr[..., horizontal] = (levels if x == '+' else levels[::-1])[None, :]
+    # flip y-axis to match math coordinate
+    arr[..., vertical] = (levels[::-1] if y == '+' else levels)[:, None]
+    arr[..., 3] = 255
+    return Image.fromarray(arr, 'RGBA')
 
 
 def gen_pride_flag(*colors: tuple):
     height = len(colors)
     width = round(height * 16 / 9)
-    img = Image.new('RGBA', (width, height))
-    for y, color in enumerate(colors):
-        for x in range(width):
-            img.putpixel((x, y), color)
-    return img
+    stripes = np.array([tuple(c) + (255,) * (4 - len(c)) for c in colors], dtype = np.uint8)
+    return Image.fromarray(np.repeat(stripes[:, None, :], width, axis = 1), 'RGBA')
 
 
 __all__ = [
     'gen_image_preview',
+    'gen_emoji_preview',
     'gen_emoji_sequence',
+    'gen_emoji_codes',
+    'codes_to_emoji_sequence',
     'downsample',
     'crop',
     'image_to_data',
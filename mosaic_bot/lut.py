@@ -0,0 +1,204 @@
+"""
+Nearest-emoji lookup tables.
+
+The perceptual table maps every 24-bit RGB value, (r << 16) | (g << 8) | b,
+to the 12-bit code of the emoji closest to it by CIEDE2000 distance, as far
+as a search of the emojis around the color can tell. A search of all 4096
+emojis picks a different one for about 0.4% of the colors, which are never
+more than 0.06 further away than the one in the table. It is a
+32 MiB uint16 array stored as a .npy file and memory-mapped on first use,
+so every process shares the same page-cache copy and a lookup is a single
+fancy-index. Build it with
+
+    python -m mosaic_bot.lut [--processes N]
+
+The VGA table maps every 18-bit color of the VGA DAC to the closest color of
+palette.VGA_13H. It is small enough to be built in memory on first use.
+
+The perceptual table is kept at LUT_PATH, which can be moved with the
+PERCEPTUAL_LUT_PATH environment variable, for both building and loading it.
+"""
+
+import argparse
+import multiprocessing
+import os
+import pathlib
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from mosaic_bot import DATA_PATH
+from mosaic_bot.palette import palette_colors
+
+LUT_PATH = pathlib.Path(os.environ.get('PERCEPTUAL_LUT_PATH', DATA_PATH / 'perceptual_lut.npy')).resolve()
+
+# white point of sRGB
+D65 = np.array([0.95047, 1.0, 1.08883])
+RGB_TO_XYZ = np.array([[0.4124564, 0.3575761, 0.1804375],
+                       [0.2126729, 0.7151522, 0.0721750],
+                       [0.0193339, 0.1191920, 0.9503041]])
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """
+    converts an array of sRGB colors (0-255) in the last axis to CIELAB
+    """
+    c = np.asarray(rgb, dtype = np.float64) / 255
+    c = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = c @ RGB_TO_XYZ.T / D65
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack((116 * f[..., 1] - 16,
+                     500 * (f[..., 0] - f[..., 1]),
+                     200 * (f[..., 1] - f[..., 2])), axis = -1)
+
+
+def ciede2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    CIEDE2000 color difference of two broadcastable arrays of CIELAB colors.
+    Implemented after Sharma, Wu and Dalal, "The CIEDE2000 color-difference
+    formula: implementation notes, supplementary test data, and mathematical
+    observations" (2005)
+    """
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c7 / (c7 + 25 ** 7)))
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = np.hypot(a1p, b1)
+    c2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    achromatic = c1p * c2p == 0
+
+    dlp = L2 - L1
+    dcp = c2p - c1p
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(achromatic, 0, dhp)
+    dhp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dhp / 2))
+
+    lbarp = (L1 + L2) / 2
+    cbarp = (c1p + c2p) / 2
+    hsum = h1p + h2p
+    hbarp = np.where(np.abs(h1p - h2p) <= 180, hsum / 2,
+                     np.where(hsum < 360, (hsum + 360) / 2, (hsum - 360) / 2))
+    hbarp = np.where(achromatic, hsum, hbarp)
+
+    t = (1 - 0.17 * np.cos(np.radians(hbarp - 30))
+         + 0.24 * np.cos(np.radians(2 * hbarp))
+         + 0.32 * np.cos(np.radians(3 * hbarp + 6))
+         - 0.20 * np.cos(np.radians(4 * hbarp - 63)))
+    dtheta = 30 * np.exp(-((hbarp - 275) / 25) ** 2)
+    cbarp7 = cbarp ** 7
+    rc = 2 * np.sqrt(cbarp7 / (cbarp7 + 25 ** 7))
+    sl = 1 + 0.015 * (lbarp - 50) ** 2 / np.sqrt(20 + (lbarp - 50) ** 2)
+    sc = 1 + 0.045 * cbarp
+    sh = 1 + 0.015 * cbarp * t
+    rt = -np.sin(np.radians(2 * dtheta)) * rc
+
+    return np.sqrt((dlp / sl) ** 2 + (dcp / sc) ** 2 + (dhp / sh) ** 2 + rt * (dcp / sc) * (dhp / sh))
+
+
+@lru_cache(1)
+def _palette_lab() -> np.ndarray:
+    levels = np.arange(16) * 17
+    r, g, b = np.meshgrid(levels, levels, levels, indexing = 'ij')
+    return rgb_to_lab(np.stack((r, g, b), axis = -1).reshape(4096, 3))
+
+
+def _nearest_codes(r: int, g0: int) -> np.ndarray:
+    # nearest emojis of the 16 * 256 colors with red r and green g0 to g0 + 15.
+    # the emojis are a regular 16x16x16 grid in RGB, so the perceptually
+    # nearest one is searched among the 4x4x4 grid points surrounding the color.
+    # CIEDE2000 isn't monotonic in RGB, so this is only an approximation of a
+    # search of the whole palette, see the module docstring
+    g, b = np.meshgrid(np.arange(g0, g0 + 16), np.arange(256), indexing = 'ij')
+    rgb = np.stack((np.full(g.shape, r), g, b), axis = -1).reshape(-1, 3)
+    offsets = np.stack(np.meshgrid(*[np.arange(-1, 3)] * 3, indexing = 'ij'), axis = -1).reshape(-1, 3)
+    levels = np.clip(rgb[:, None, :] // 17 + offsets, 0, 15)
+    candidates = (levels[..., 0] << 8) | (levels[..., 1] << 4) | levels[..., 2]
+    dist = ciede2000(rgb_to_lab(rgb)[:, None, :], _palette_lab()[candidates])
+    return candidates[np.arange(len(rgb)), np.argmin(dist, axis = 1)].astype(np.uint16)
+
+
+def _build_chunk(args: tuple[int, int]) -> tuple[int, np.ndarray]:
+    r, g0 = args
+    return (r << 16) | (g0 << 8), _nearest_codes(r, g0)
+
+
+def build_lut(path = LUT_PATH, processes: int = None) -> None:
+    tmp = path.with_suffix('.tmp')
+    lut = np.lib.format.open_memmap(tmp, mode = 'w+', dtype = np.uint16, shape = (1 << 24,))
+    with multiprocessing.Pool(processes) as pool:
+        chunks = [(r, g0) for r in range(256) for g0 in range(0, 256, 16)]
+        for start, codes in pool.imap_unordered(_build_chunk, chunks, chunksize = 16):
+            lut[start:start + len(codes)] = codes
+    lut.flush()
+    del lut
+    os.replace(tmp, path)
+
+
+@lru_cache(1)
+def load_lut() -> np.ndarray:
+    """
+    memory-maps the table built by build_lut
+
+    :raises: FileNotFoundError if the table hasn't been built
+    """
+    return np.load(LUT_PATH, mmap_mode = 'r')
+
+
+def perceptual_codes(arr: np.ndarray) -> np.ndarray:
+    """
+    the 12-bit code of the perceptually nearest emoji of every pixel in an
+    HxWx3 or HxWx4 uint8 array
+
+    :raises: FileNotFoundError if the table hasn't been built
+    """
+    lut = load_lut()
+    rgb = arr[..., :3].astype(np.int32)
+    return lut[(rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]].astype(np.int16)
+
+
+@lru_cache(1)
+def _vga_lut() -> np.ndarray:
+    # the VGA DAC only has 6 bits per channel, so every color of the palette
+    # can be told apart with the top 6 bits of each channel. each cell is
+    # represented by its center and matched by CIELAB distance
+    palette = rgb_to_lab(palette_colors('vga'))
+    palette_sq = np.sum(palette ** 2, axis = 1)
+    levels = (np.arange(64) << 2) | 2
+    g, b = np.meshgrid(levels, levels, indexing = 'ij')
+    lut = np.empty(1 << 18, dtype = np.int16)
+    for r in range(64):
+        # one red level at a time so that the distance matrix stays small
+        lab = rgb_to_lab(np.stack((np.full(g.shape, levels[r]), g, b), axis = -1).reshape(-1, 3))
+        # squared distances expanded as |p|^2 - 2 p.c + |c|^2, the |p|^2
+        # term doesn't change the argmin so it's left out
+        lut[r << 12:(r + 1) << 12] = np.argmin(palette_sq - 2 * lab @ palette.T, axis = 1)
+    return lut
+
+
+def vga_codes(arr: np.ndarray) -> np.ndarray:
+    """
+    the index in palette.VGA_13H of the nearest color of every pixel in an
+    HxWx3 or HxWx4 uint8 array
+    """
+    rgb = arr[..., :3].astype(np.int32) >> 2
+    return _vga_lut()[(rgb[..., 0] << 12) | (rgb[..., 1] << 6) | rgb[..., 2]]
+
+
+__all__ = ['LUT_PATH', 'rgb_to_lab', 'ciede2000', 'build_lut', 'load_lut', 'perceptual_codes', 'vga_codes']
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Build the perceptual nearest-emoji lookup table',
+                                     prog = 'mosaic_bot.lut')
+    parser.add_argument('--processes', type = int, default = None,
+                        help = 'number of worker processes, defaults to the number of CPUs')
+    args = parser.parse_args()
+    start = time.time()
+    build_lut(LUT_PATH, args.processes)
+    print(f'Lookup table written to {LUT_PATH} in {round(time.time() - start, 1)}s')
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+import numpy as np
+
 VGA_13H = [0x000000, 0x0000a8, 0x00a800, 0x00a8a8, 0xa80000, 0xa800a8, 0xa85400, 0xa8a8a8, 0x545454, 0x5454fc, 0x54fc54,
            0x54fcfc, 0xfc5454, 0xfc54fc, 0xfcfc54, 0xfcfcfc, 0x000000, 0x141414, 0x202020, 0x2c2c2c, 0x383838, 0x444444,
            0x505050, 0x606060, 0x707070, 0x808080, 0x909090, 0xa0a0a0, 0xb4b4b4, 0xc8c8c8, 0xe0e0e0, 0xfcfcfc, 0x0000fc,
@@ -31,4 +35,25 @@ for r in range(16):
             RGB_4096.append((r << 20) + (r << 16) + (g << 12) + (g << 8) + (b << 4) + b)
 RGB_4096.sort()
 
-__all__ = ['RGB_4096', 'VGA_13H']
+# the code of an emoji is the index of its color in the palette,
+# and the background emoji comes right after the last color
+PALETTES = {
+    '12bit': RGB_4096,
+    'vga'  : VGA_13H,
+}
+
+
+@lru_cache(len(PALETTES))
+def palette_colors(palette: str) -> np.ndarray:
+    """
+    the Kx3 array of the RGB values of every color in the palette
+    """
+    colors = np.array(PALETTES[palette])
+    return np.stack((colors >> 16, colors >> 8 & 0xff, colors & 0xff), axis = -1)
+
+
+def background_code(palette: str) -> int:
+    return len(PALETTES[palette])
+
+
+__all__ = ['RGB_4096', 'VGA_13H', 'PALETTES', 'palette_colors', 'background_code']
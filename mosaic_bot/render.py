@@ -0,0 +1,504 @@
+import json
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+from mosaic_bot import IMAGE_DIR
+from mosaic_bot.emojis import get_emoji_table
+from mosaic_bot.hash import compute_image_path_from_hash, encode_hash
+from mosaic_bot.image import _emoji_lookup, codes_to_emoji_sequence, gen_emoji_codes, gen_emoji_preview
+from mosaic_bot.palette import background_code
+
+# bump this whenever the content of the render artifacts changes,
+# artifacts of an older version are ignored and rendered again
+RENDER_VERSION = 3
+
+MAX_WIDTH = 79
+MAX_WIDTH_WITH_SPACE = 76
+MAX_WIDTH_LARGE = 27
+# discord displays all lines above 27 emojis as inline, according
+# to trial and error.
+
+# rows quantized at once by MessageStream, a multiple of the size of the Bayer matrix
+BAND_HEIGHT = 8
+
+# all (large, with_space) combinations of previews
+PREVIEW_OPTIONS = [(large, with_space) for large in (False, True) for with_space in (False, True)]
+
+# all (large, with_space, multiline) combinations
+RENDER_OPTIONS = [(large, with_space, multiline)
+                  for large in (False, True)
+                  for with_space in (False, True)
+                  for multiline in (False, True)]
+
+
+class EmojiSequenceTooLong(Exception): pass
+
+
+@lru_cache(4)
+def _emoji_lengths(with_space: bool, palette = '12bit') -> np.ndarray:
+    return np.array([len(e) + with_space for e in get_emoji_table(palette = palette)])
+
+
+def pack_messages(codes: np.ndarray, with_space = False, limit = 2000, palette = '12bit') -> list[str]:
+    """
+    packs the rows of the code array into as few messages as possible.
+    Trailing transparent pixels of each row are trimmed, and the length of
+    every row is known from the emoji lengths before any string is built
+
+    :raises: EmojiSequenceTooLong
+    """
+    ends, row_lengths = _trimmed_rows(codes, with_space, palette)
+    if (row_lengths > limit).any():
+        raise EmojiSequenceTooLong
+
+    lookup = _emoji_lookup(with_space, palette)
+    return ['\n'.join(''.join(lookup[codes[y, :ends[y]]].tolist()) + '\u200b' for y in range(start, end))
+            for start, end in _pack(row_lengths, limit)]
+
+
+def _trimmed_rows(codes: np.ndarray, with_space: bool, palette: str) -> tuple[np.ndarray, np.ndarray]:
+    # the number of pixels left in each row of the code array once trailing
+    # transparent pixels are trimmed, and the length of each trimmed row
+    # followed by a zero width space. rows are along the last two axes
+    w = codes.shape[-1]
+    opaque = codes != background_code(palette)
+    ends = np.where(opaque.any(axis = -1), w - np.argmax(opaque[..., ::-1], axis = -1), 0)
+    lengths = np.cumsum(_emoji_lengths(with_space, palette)[codes], axis = -1)
+    last = np.take_along_axis(lengths, np.maximum(ends - 1, 0)[..., None], axis = -1)[..., 0]
+    return ends, np.where(ends > 0, last, 0) + 1
+
+
+def pack_lines(lines: list[str], limit = 2000) -> list[str]:
+    """
+    packs already rendered lines into as few messages as possible, in order
+
+    :raises: EmojiSequenceTooLong
+    """
+    lengths = np.array([len(l) for l in lines])
+    if (lengths > limit).any():
+        raise EmojiSequenceTooLong
+    return ['\n'.join(lines[start:end]) for start, end in _pack(lengths, limit)]
+
+
+def iter_embeds(lines: Iterable[str], limit = 4096, total_limit = 6000, max_embeds = 10) -> Iterator[list[str]]:
+    """
+    packs rendered lines into embed descriptions of at most limit characters
+    each, and the embeds into webhook messages of at most max_embeds embeds
+    and total_limit characters. Yields the descriptions of each message
+
+    :raises: EmojiSequenceTooLong
+    """
+    embeds = []
+    description = []
+    size = -1  # no newline before the first line
+    total = 0
+    for line in lines:
+        if len(line) > limit:
+            raise EmojiSequenceTooLong
+        if size + 1 + len(line) > min(limit, total_limit - total):
+            if description:
+                embeds.append('\n'.join(description))
+                total += size
+                description = []
+                size = -1
+            if len(line) > total_limit - total or len(embeds) == max_embeds:
+                yield embeds
+                embeds = []
+                total = 0
+        description.append(line)
+        size += 1 + len(line)
+    if description:
+        embeds.append('\n'.join(description))
+    if embeds:
+        yield embeds
+
+
+def _pack(line_lengths: np.ndarray, limit: int):
+    # bounds[i] is the length of the lines before line i, each followed by a newline.
+    # lines i to j - 1 fit in a message if bounds[j] - bounds[i] - 1 <= limit
+    bounds = np.concatenate(([0], np.cumsum(line_lengths + 1)))
+    start = 0
+    while start < len(line_lengths):
+        end = np.searchsorted(bounds, bounds[start] + limit + 1, 'right') - 1
+        yield start, end
+        start = end
+
+
+def render_messages(codes: np.ndarray, large = False, with_space = False, multiline = False,
+                    palette = '12bit') -> list[str]:
+    """
+    turns the code array of an image into the messages to be sent
+
+    :raises: EmojiSequenceTooLong
+    """
+    if large or multiline:
+        messages = codes_to_emoji_sequence(codes, large, with_space, palette).splitlines()
+        for m in messages:
+            if len(m) > 2000:
+                raise EmojiSequenceTooLong
+        return messages
+    return pack_messages(codes, with_space, palette = palette)
+
+
+def iter_messages(rows: Iterable[np.ndarray], large = False, with_space = False, multiline = False,
+                  palette = '12bit', limit = 2000) -> Iterator[str]:
+    """
+    the same messages as render_messages, built from an iterable of code rows
+    and yielded as soon as each of them is complete
+
+    :raises: EmojiSequenceTooLong
+    """
+    lookup = _emoji_lookup(with_space, palette)
+    if large or multiline:
+        end = '' if large else '\u200b'
+        for row in rows:
+            line = ''.join(lookup[row].tolist()) + end
+            if len(line) > limit:
+                raise EmojiSequenceTooLong
+            yield line
+        return
+
+    background = background_code(palette)
+    pending = []
+    size = -1  # no newline before the first line
+    for row in rows:
+        opaque = np.flatnonzero(row != background)
+        line = ''.join(lookup[row[:opaque[-1] + 1 if len(opaque) else 0]].tolist()) + '\u200b'
+        if len(line) > limit:
+            raise EmojiSequenceTooLong
+        if size + 1 + len(line) > limit:
+            yield '\n'.join(pending)
+            pending = []
+            size = -1
+        pending.append(line)
+        size += 1 + len(line)
+    if pending:
+        yield '\n'.join(pending)
+
+
+def size_flags(width: int) -> dict[str, bool]:
+    """
+    whether an image of the given width can be sent at all, with space and as large
+    """
+    return {
+        'sendable'  : width <= MAX_WIDTH,
+        'with_space': width <= MAX_WIDTH_WITH_SPACE,
+        'large'     : width <= MAX_WIDTH_LARGE,
+    }
+
+
+def _option_key(large: bool, with_space: bool, multiline: bool) -> str:
+    return f'{int(large)}{int(with_space)}{int(multiline)}'
+
+
+class RenderArtifacts:
+    """
+    everything |show needs to serve an image without touching PIL: the code
+    array, the size flags, the messages of every option combination and the
+    number of frames, so that animated images are known without opening them.
+    The messages of a combination are None if the image is too wide for it
+    or if it produces a message that is too long. For animated images they
+    are of the first frame
+    """
+
+    def __init__(self, codes: np.ndarray, flags: dict[str, bool], messages: dict[str, Optional[list[str]]],
+                 n_frames: int = 1):
+        self.codes = codes
+        self.flags = flags
+        self._messages = messages
+        self.n_frames = n_frames
+
+    @property
+    def width(self):
+        return self.codes.shape[1]
+
+    @property
+    def height(self):
+        return self.codes.shape[0]
+
+    def get_messages(self, large = False, with_space = False, multiline = False) -> Optional[list[str]]:
+        return self._messages[_option_key(large, with_space, multiline)]
+
+    def __repr__(self):
+        return f'<RenderArtifacts {self.width}x{self.height}, {self.n_frames} frames>'
+
+
+class MessageStream:
+    """
+    the messages of an image for one option combination, rendered a few rows
+    at a time while they are being consumed. Every message is kept in
+    messages, and on_complete(messages) is called once the last one has been
+    yielded. The size flags and the number of frames of the image are known
+    before anything is rendered. Only the first frame is rendered
+    """
+
+    def __init__(self, img: Image.Image, large = False, with_space = False, multiline = False,
+                 palette = '12bit', on_complete: Callable[[list[str]], None] = None, **quantizer):
+        self.n_frames = getattr(img, 'n_frames', 1)
+        self.img = img.convert('RGBA')
+        self.large = large
+        self.with_space = with_space
+        self.multiline = multiline
+        self.palette = palette
+        self.quantizer = quantizer
+        self.flags = size_flags(self.img.width)
+        self.on_complete = on_complete
+        self.messages: list[str] = []
+
+    @property
+    def width(self):
+        return self.img.width
+
+    @property
+    def height(self):
+        return self.img.height
+
+    def _code_rows(self) -> Iterator[np.ndarray]:
+        if self.quantizer.get('dither') == 'floyd-steinberg':
+            # the error diffuses down the whole image
+            yield from gen_emoji_codes(self.img, palette = self.palette, **self.quantizer)
+            return
+        for y in range(0, self.height, BAND_HEIGHT):
+            band = self.img.crop((0, y, self.width, min(y + BAND_HEIGHT, self.height)))
+            yield from gen_emoji_codes(band, palette = self.palette, **self.quantizer)
+
+    def __iter__(self) -> Iterator[str]:
+        for m in iter_messages(self._code_rows(), self.large, self.with_space, self.multiline, self.palette):
+            self.messages.append(m)
+            yield m
+        if self.on_complete is not None:
+            self.on_complete(self.messages)
+
+    def __length_hint__(self):
+        # estimated from the length of the background emoji
+        if self.large or self.multiline:
+            return self.height
+        emoji_length = len(get_emoji_table(palette = self.palette)[-1]) + self.with_space
+        rows_per_message = max(1, 2001 // (self.width * emoji_length + 2))
+        return -(-self.height // rows_per_message)
+
+    def __repr__(self):
+        return f'<MessageStream {self.width}x{self.height}, {len(self.messages)} messages rendered>'
+
+
+class Animation:
+    """
+    the frames of an animated image for one option combination. Every frame
+    is split into messages the same way, so that playing the animation only
+    takes editing the messages whose content differs from the frame before
+    """
+
+    def __init__(self, codes: np.ndarray, durations: list[int], large = False, with_space = False,
+                 multiline = False, palette = '12bit', limit = 2000):
+        self.codes = codes
+        self.durations = durations
+        self.large = large
+        self.with_space = with_space
+        self.multiline = multiline
+        self.palette = palette
+        if large or multiline:
+            lengths = _emoji_lengths(with_space, palette)[codes].sum(axis = -1) + (not large)
+            self.groups = [(y, y + 1) for y in range(self.height)]
+        else:
+            self.ends, lengths = _trimmed_rows(codes, with_space, palette)
+            # the rows are packed by their longest version in any frame
+            self.groups = list(_pack(lengths.max(axis = 0), limit))
+        if (lengths > limit).any():
+            raise EmojiSequenceTooLong
+        # frames with the same content are only compared once
+        self.hashes = [hash(frame.tobytes()) for frame in codes]
+
+    @property
+    def width(self):
+        return self.codes.shape[2]
+
+    @property
+    def height(self):
+        return self.codes.shape[1]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def message(self, frame: int, i: int) -> str:
+        lookup = _emoji_lookup(self.with_space, self.palette)
+        start, end = self.groups[i]
+        codes = self.codes[frame]
+        if self.large or self.multiline:
+            return ''.join(lookup[codes[start]].tolist()) + ('' if self.large else '\u200b')
+        ends = self.ends[frame]
+        return '\n'.join(''.join(lookup[codes[y, :ends[y]]].tolist()) + '\u200b' for y in range(start, end))
+
+    def messages(self, frame: int = 0) -> list[str]:
+        return [self.message(frame, i) for i in range(len(self.groups))]
+
+    def deltas(self) -> Iterator[tuple[int, list[tuple[int, str]]]]:
+        """
+        (delay, edits) of every frame after the first one that changes anything,
+        where delay is how long the frame before is shown in ms and edits are
+        the (message index, content) of the messages that changed
+        """
+        shown = 0
+        delay = self.durations[0]
+        for frame in range(1, len(self)):
+            if self.hashes[frame] == self.hashes[shown]:
+                delay += self.durations[frame]
+                continue
+            changed = [i for i, (start, end) in enumerate(self.groups)
+                       if not np.array_equal(self.codes[frame, start:end], self.codes[shown, start:end])]
+            yield delay, [(i, self.message(frame, i)) for i in changed]
+            shown = frame
+            delay = self.durations[frame]
+
+    def __repr__(self):
+        return f'<Animation {self.width}x{self.height}, {len(self)} frames>'
+
+
+def gen_animation(img: Image.Image, large = False, with_space = False, multiline = False, palette = '12bit',
+                  max_frames: int = None, **quantizer) -> Animation:
+    """
+    decodes up to max_frames frames of an animated image and quantizes them together
+
+    :raises: EmojiSequenceTooLong
+    """
+    durations = []
+    frames = []
+    # the iterator seeks the same image object, so every frame is copied out right away
+    for frame in islice(ImageSequence.Iterator(img), max_frames):
+        durations.append(int(frame.info.get('duration', 100)))
+        frames.append(np.asarray(frame.convert('RGBA')))
+    arr = np.stack(frames)
+    if quantizer.get('dither'):
+        # dithering works on one frame at a time
+        codes = np.stack([gen_emoji_codes(frame, palette = palette, **quantizer) for frame in arr])
+    else:
+        codes = gen_emoji_codes(arr, palette = palette, **quantizer)
+    return Animation(codes, durations, large, with_space, multiline, palette)
+
+
+def gen_render_artifacts(img: Image.Image, options = RENDER_OPTIONS, palette = '12bit',
+                         **quantizer) -> RenderArtifacts:
+    """
+    renders the image, or the first frame of an animated one, for every
+    (large, with_space, multiline) combination in options. quantizer is
+    passed on to gen_emoji_codes. Only artifacts of the default palette
+    and quantizer with all options should be saved
+
+    :raises: FileNotFoundError if the perceptual lookup table is requested but hasn't
+        been built, or if the emojis of the palette are not available
+    """
+    codes = gen_emoji_codes(img.convert('RGBA'), palette = palette, **quantizer)
+    flags = size_flags(codes.shape[1])
+    messages = {}
+    for large, with_space, multiline in options:
+        key = _option_key(large, with_space, multiline)
+        if not flags['sendable'] or large and not flags['large'] or with_space and not flags['with_space']:
+            messages[key] = None
+            continue
+        try:
+            messages[key] = render_messages(codes, large, with_space, multiline, palette)
+        except EmojiSequenceTooLong:
+            messages[key] = None
+    return RenderArtifacts(codes, flags, messages, getattr(img, 'n_frames', 1))
+
+
+def compute_render_path(hash: int):
+    return IMAGE_DIR / (encode_hash(hash) + '.render.npz')
+
+
+def save_render_artifacts(hash: int, artifacts: RenderArtifacts) -> None:
+    meta = {
+        'version' : RENDER_VERSION,
+        'flags'   : artifacts.flags,
+        'messages': artifacts._messages,
+        'n_frames': artifacts.n_frames,
+    }
+    path = compute_render_path(hash)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(f, codes = artifacts.codes,
+                            meta = np.frombuffer(json.dumps(meta).encode('utf8'), np.uint8))
+    # the bot might be reading the artifacts at the same time
+    os.replace(tmp, path)
+
+
+def load_render_artifacts(hash: int) -> Optional[RenderArtifacts]:
+    """
+    :return: the render artifacts of the image, or None if they
+        don't exist or are of an older RENDER_VERSION
+    """
+    try:
+        with np.load(compute_render_path(hash)) as data:
+            meta = json.loads(data['meta'].tobytes())
+            if meta['version'] != RENDER_VERSION:
+                return None
+            return RenderArtifacts(data['codes'], meta['flags'], meta['messages'], meta['n_frames'])
+    except FileNotFoundError:
+        return None
+
+
+def delete_render_artifacts(hash: int) -> None:
+    try:
+        os.remove(compute_render_path(hash))
+    except FileNotFoundError:
+        pass
+    for large, with_space in PREVIEW_OPTIONS:
+        try:
+            os.remove(compute_preview_path(hash, large, with_space))
+        except FileNotFoundError:
+            pass
+
+
+def compute_preview_path(hash: int, large = False, with_space = False):
+    return IMAGE_DIR / (encode_hash(hash) + f'.preview{int(large)}{int(with_space)}.png')
+
+
+def get_emoji_preview(hash: int, large = False, with_space = False):
+    """
+    the path to the emoji preview of an image, which is rendered from the
+    render artifacts and kept on disk next to them
+
+    :raises: FileNotFoundError if the image doesn't exist
+    """
+    path = compute_preview_path(hash, large, with_space)
+    if path.exists():
+        return path
+    artifacts = load_render_artifacts(hash)
+    if artifacts is None:
+        artifacts = gen_render_artifacts(Image.open(compute_image_path_from_hash(hash)))
+        save_render_artifacts(hash, artifacts)
+    save_emoji_preview(hash, artifacts.codes, large, with_space)
+    return path
+
+
+def save_emoji_preview(hash: int, codes: np.ndarray, large = False, with_space = False) -> None:
+    path = compute_preview_path(hash, large, with_space)
+    tmp = path.with_suffix('.tmp')
+    gen_emoji_preview(codes, large, with_space).save(tmp, 'png')
+    os.replace(tmp, path)
+
+
+__all__ = [
+    'EmojiSequenceTooLong',
+    'RenderArtifacts',
+    'RENDER_VERSION',
+    'pack_messages',
+    'pack_lines',
+    'iter_embeds',
+    'render_messages',
+    'iter_messages',
+    'MessageStream',
+    'Animation',
+    'gen_animation',
+    'size_flags',
+    'gen_render_artifacts',
+    'save_render_artifacts',
+    'load_render_artifacts',
+    'delete_render_artifacts',
+    'get_emoji_preview',
+    'save_emoji_preview',
+]
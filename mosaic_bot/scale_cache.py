@@ -0,0 +1,89 @@
+"""
+Persistent memo of cv.find_scale.
+
+The candidates found for an image, with the offset of the grid of each of
+them, are stored in a small SQLite database next to the image database,
+keyed by a digest of the cropped RGBA pixels and the revision of the
+algorithm, so that an image uploaded or ingested again skips the whole
+pipeline. The digest is of the pixels rather than the file, so the
+same art saved by a different encoder is a hit too.
+"""
+
+import hashlib
+import json
+import sqlite3
+from contextlib import closing
+from typing import Optional
+
+import numpy as np
+
+from mosaic_bot import DATA_PATH
+
+CACHE_PATH = DATA_PATH / 'scale_cache.sqlite3'
+
+# whether the table has been created by this process
+_schema_created = False
+
+# (scale, score, align, offset_x, offset_y) of every candidate
+Candidates = list[tuple[int, float, float, int, int]]
+
+
+def image_digest(color_img: np.ndarray, engine: str = 'contour', area: tuple[int, int, int, int] = None) -> bytes:
+    """
+    the digest of an HxWx4 array of pixels searched with an engine of
+    find_scale, on the (y, x, h, w) area of it that was searched if it
+    isn't the whole image
+    """
+    if area is None:
+        area = (0, 0, *color_img.shape[:2])
+    h = hashlib.blake2b(digest_size = 20, person = engine.encode())
+    h.update(np.array((*color_img.shape, *area), dtype = np.int64).tobytes())
+    h.update(np.ascontiguousarray(color_img).data)
+    return h.digest()
+
+
+def _connect() -> sqlite3.Connection:
+    global _schema_created
+    conn = sqlite3.connect(CACHE_PATH, timeout = 5)
+    if not _schema_created:
+        try:
+            with conn:
+                conn.execute('CREATE TABLE IF NOT EXISTS candidates ('
+                             'digest BLOB NOT NULL, '
+                             'revision INTEGER NOT NULL, '
+                             'candidates TEXT NOT NULL, '
+                             'PRIMARY KEY (digest, revision))')
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _schema_created = True
+    return conn
+
+
+def get_scale(digest: bytes, revision: int) -> Optional[Candidates]:
+    """
+    the candidates stored for a digest, or None if there aren't any for
+    this revision
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute('SELECT candidates FROM candidates '
+                               'WHERE digest = ? AND revision = ?', (digest, revision)).fetchone()
+    except sqlite3.Error:
+        # the cache is only an optimization, an unusable one is a miss
+        return None
+    if row is None:
+        return None
+    return [tuple(c) for c in json.loads(row[0])]
+
+
+def save_scale(digest: bytes, revision: int, candidates: Candidates) -> None:
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute('INSERT OR REPLACE INTO candidates VALUES (?, ?, ?)',
+                         (digest, revision, json.dumps(candidates)))
+    except sqlite3.Error:
+        pass
+
+
+__all__ = ['CACHE_PATH', 'image_digest', 'get_scale', 'save_scale']
@@ -1,6 +1,6 @@
 from PIL import Image
 from mosaic_bot.image import downsample, gen_emoji_sequence
-from mosaic_bot.cv import find_scale
+from mosaic_bot.cv import find_grid
 from mosaic_bot.credentials import MOSAIC_BOT_TOKEN
 import requests
 from mosaic_bot.emojis import get_emoji_by_rgb
@@ -11,9 +11,9 @@ API_ENDPOINT = 'https://discord.com/api/v8'
 name = input('Image filename? ')
 
 img = Image.open(DATA_PATH / 'images' / name)
-scale = find_scale(img)
-print(f'Downsampling at {scale}x')
-img = downsample(img.crop(img.getbbox()), find_scale(img))
+grid = find_grid(img)
+print(f'Downsampling at {grid.scale_x}x{grid.scale_y}')
+img = downsample(img, grid)
 channel = input('Channel id? ')
 token = 'Bot ' + MOSAIC_BOT_TOKEN
 
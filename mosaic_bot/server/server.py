@@ -2,11 +2,11 @@ import os
 import secrets
 
 import requests
-from flask import abort, Flask, jsonify, redirect, render_template, request, session, send_from_directory
+from flask import abort, Flask, jsonify, redirect, render_template, request, session, send_file, send_from_directory
 from PIL import Image
 
 import mosaic_bot.hash
-from mosaic_bot import db, image, DATA_PATH
+from mosaic_bot import db, image, render, DATA_PATH
 from mosaic_bot.credentials import MOSAIC_CLIENT_ID, MOSAIC_CLIENT_SECRET, OAUTH_REDIRECT_URI, SERVER_SECRET_KEY
 
 JSONIFY_PRETTYPRINT_REGULAR = False
@@ -127,15 +127,27 @@ def api_gallery():
     for name, h, width, height, time in db.list_images():
         path = 'image/' + mosaic_bot.hash.encode_hash(h) + '.png'
         res.append({
-            'name'  : name,
-            'path'  : path,
-            'time'  : time,
-            'width' : width,
-            'height': height,
-            'id'    : str(h)  # js number precision is...problematic for 144 bit integers
+            'name'   : name,
+            'path'   : path,
+            'time'   : time,
+            'width'  : width,
+            'height' : height,
+            'id'     : str(h),  # js number precision is...problematic for 144 bit integers
+            'preview': f'preview/{h}',
         })
     return jsonify(res)
 
+
+@app.route('/preview/<int:h>', methods = ['GET'])
+def preview(h):
+    # what the image looks like once sent, e.g. /preview/<id>?large=1&with_space=1
+    try:
+        db.get_image_path(h)
+    except db.NoResultFound:
+        abort(404)
+    path = render.get_emoji_preview(h, request.args.get('large') == '1', request.args.get('with_space') == '1')
+    return send_file(path, mimetype = 'image/png', max_age = 86400)
+
 @app.route('/static/<filename>')
 def static_files(filename):
     if not app.debug: